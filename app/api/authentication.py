@@ -2,12 +2,54 @@
 API 认证类
 """
 
+import hmac
+from typing import Any
+
 from ninja.security import HttpBearer
+from ninja_jwt.authentication import JWTAuth
+from django.conf import settings
 from django.http import HttpRequest
 
+from app.common.principal import set_request_principal
+from app.domain.models.base_model import set_current_user
+
 
 class TokenAuth(HttpBearer):
     def authenticate(self, request: HttpRequest, token: str):
         # 简化的认证实现
         # 实际项目中需要实现基于 Token 的认证逻辑
-        return None  # 简化实现
\ No newline at end of file
+        return None  # 简化实现
+
+
+# 指标抓取令牌认证成功时 request.auth 的值
+METRICS_SCRAPER = "metrics-scraper"
+
+
+class MetricsTokenAuth(HttpBearer):
+    """
+    指标抓取令牌认证，对应 Prometheus 抓取配置中的 bearer_token
+    未配置 METRICS_TOKEN 时不接受任何令牌
+    """
+
+    def authenticate(self, request: HttpRequest, token: str) -> Any:
+        expected = getattr(settings, "METRICS", {}).get("TOKEN", "")
+        if expected and hmac.compare_digest(token.encode(), expected.encode()):
+            return METRICS_SCRAPER
+        return None
+
+
+class PrincipalJWTAuth(JWTAuth):
+    """
+    JWT认证，并把认证结果保存到 request 上
+    操作日志中间件等组件直接复用该结果，每个请求只校验一次 Token、查询一次用户
+    """
+
+    def authenticate(self, request: HttpRequest, token: str) -> Any:
+        try:
+            user = self.jwt_authenticate(request, token)
+        except Exception:
+            set_request_principal(request, None)
+            raise
+        set_request_principal(request, user)
+        set_current_user(user.get_username())
+        return user
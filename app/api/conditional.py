@@ -0,0 +1,88 @@
+"""
+条件请求（ETag）
+列表接口先用一次聚合查询得到集合版本 (最后修改时间, 记录数)，
+请求携带的 If-None-Match 与之匹配时直接返回 304，不读取数据也不序列化。
+新增和修改会更新 updated_time，删除会减少记录数，所以集合的任何变化都会改变 ETag。
+不输出 Last-Modified：删除一条非最新的记录时最后修改时间不变，只按时间判断会错误地返回 304
+"""
+
+import functools
+import hashlib
+import inspect
+from datetime import datetime
+from typing import Any, Callable, Optional, Tuple
+
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+
+# 集合版本：(最后修改时间, 记录数)
+CollectionVersion = Tuple[Optional[datetime], int]
+
+# 接口需要认证，只允许浏览器缓存，且每次使用前都要重新验证
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(request: HttpRequest, version: CollectionVersion) -> str:
+    """弱 ETag：同一集合版本下，不同的查询参数（分页、过滤、排序）对应不同的 ETag"""
+    last_modified, count = version
+    stamp = last_modified.isoformat() if last_modified else ""
+    source = f"{request.get_full_path()}|{stamp}|{count}"
+    return f'W/"{hashlib.md5(source.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+def _not_modified(request: HttpRequest, etag: str) -> Optional[HttpResponse]:
+    """If-None-Match 匹配时返回带验证头的 304 响应，否则返回 None；If-Modified-Since 不参与判断"""
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        _set_headers(response, etag)
+    return response
+
+
+def _set_headers(response: HttpResponse, etag: str) -> None:
+    response["ETag"] = etag
+    response["Cache-Control"] = CACHE_CONTROL
+
+
+def _with_validators(controller: Any, result: Any, etag: str) -> Any:
+    """成功的响应带上 ETag；业务错误（code >= 400）不带，避免客户端缓存错误结果"""
+    if isinstance(result, HttpResponse):
+        if 200 <= result.status_code < 300:
+            _set_headers(result, etag)
+    elif getattr(result, "code", 200) < 400:
+        # 返回值由 ninja 渲染到本次请求的临时响应上，头部设置在临时响应上即可保留
+        _set_headers(controller.context.response, etag)
+    return result
+
+
+def conditional_get(version: Callable[[Any], Any]):
+    """
+    列表接口的条件请求装饰器，用于 api_controller 的同步或异步方法，放在 http_get 之下
+
+    Args:
+        version: 接收控制器实例，返回集合版本；装饰异步方法时返回可等待对象
+    """
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                etag = make_etag(self.context.request, await version(self))
+                not_modified = _not_modified(self.context.request, etag)
+                if not_modified is not None:
+                    return not_modified
+                return _with_validators(self, await func(self, *args, **kwargs), etag)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            etag = make_etag(self.context.request, version(self))
+            not_modified = _not_modified(self.context.request, etag)
+            if not_modified is not None:
+                return not_modified
+            return _with_validators(self, func(self, *args, **kwargs), etag)
+
+        return wrapper
+
+    return decorator
@@ -2,17 +2,24 @@
 部门管理 API Controller
 """
 
+from typing import List, Optional
+
+from ninja import Query
 from ninja_extra import api_controller, http_get, http_post, http_put, http_delete
-from ninja_jwt.authentication import JWTAuth
+from app.api.authentication import PrincipalJWTAuth
+from app.api.conditional import conditional_get
+from app.api.permissions import HasRoutePermission
 
 from app.application.services.department_service import DepartmentService
 from app.common.exception.exceptions import BusinessException
+from app.common.response_cache import cache_response
+from app.domain.models.department import Department
 from app.infrastructure.persistence.repos.department_repo_impl import DjangoORMDepartmentRepository
-from app.api.schemas import DepartmentOut, DepartmentCreate, DepartmentUpdate, ApiResponse
+from app.api.schemas import DepartmentOut, DepartmentCreate, DepartmentUpdate, ApiResponse, PageOut, PageParams, DepartmentFilter, DepartmentTreeNode, BulkResultOut, BulkDeleteIn, DepartmentBulkCreate, DepartmentBulkUpdate
 from app.common.api_response import success, error
 
 
-@api_controller("/departments", auth=JWTAuth())
+@api_controller("/departments", auth=PrincipalJWTAuth(), permissions=[HasRoutePermission])
 class DepartmentsController:
     def __init__(self):
         # 实例化仓储实现
@@ -20,6 +27,51 @@ class DepartmentsController:
         # 实例化应用服务
         self.service = DepartmentService(department_repo)
 
+    # 批量接口需定义在 /{department_id} 之前，避免 "bulk" 被当作ID匹配
+    @http_post("/bulk", response=ApiResponse[BulkResultOut])
+    def bulk_create_departments(self, payload: DepartmentBulkCreate):
+        try:
+            result = self.service.bulk_create_departments([item.dict() for item in payload.items])
+            return success(result, "Bulk create departments finished")
+        except BusinessException as e:
+            return error(str(e), 400)
+
+    @http_put("/bulk", response=ApiResponse[BulkResultOut])
+    def bulk_update_departments(self, payload: DepartmentBulkUpdate):
+        try:
+            result = self.service.bulk_update_departments([item.dict() for item in payload.items])
+            return success(result, "Bulk update departments finished")
+        except BusinessException as e:
+            return error(str(e), 400)
+
+    @http_post("/bulk-delete", response=ApiResponse[BulkResultOut])
+    def bulk_delete_departments(self, payload: BulkDeleteIn):
+        try:
+            result = self.service.bulk_delete_departments(payload.ids)
+            return success(result, "Bulk delete departments finished")
+        except BusinessException as e:
+            return error(str(e), 400)
+
+    # 树形接口同样需定义在 /{department_id} 之前
+    @http_get("/tree", response=ApiResponse[List[DepartmentTreeNode]])
+    @conditional_get(lambda self: self.service.collection_version())
+    @cache_response(Department)
+    def get_department_tree(self, root_id: Optional[str] = None):
+        try:
+            tree = self.service.get_department_tree(root_id)
+            return success(tree, "Department tree retrieved successfully")
+        except BusinessException as e:
+            return error(str(e), 400)
+
+    @http_get("/{department_id}/descendants", response=ApiResponse[List[DepartmentOut]])
+    @cache_response(Department)
+    def list_department_descendants(self, department_id: str, include_self: bool = False):
+        try:
+            departments = self.service.list_descendants(department_id, include_self)
+            return success(departments, "Department descendants retrieved successfully")
+        except BusinessException as e:
+            return error(str(e), 400)
+
     @http_post("/", response=ApiResponse[DepartmentOut])
     def create_department(self, payload: DepartmentCreate):
         try:
@@ -40,20 +92,23 @@ class DepartmentsController:
             return error(str(e), 400)
 
     @http_get("/{department_id}", response=ApiResponse[DepartmentOut])
-    def get_department(self, department_id: str):
+    @cache_response(Department)
+    async def get_department(self, department_id: str):
         try:
-            department_data = self.service.get_department(department_id)
+            department_data = await self.service.aget_department(department_id)
             return success(department_data, "Department retrieved successfully")
         except BusinessException as e:
             return error(str(e), 400)
         except Exception as e:
             return error(str(e), 400)
 
-    @http_get("/", response=ApiResponse[list[DepartmentOut]])
-    def list_departments(self):
+    @http_get("/", response=ApiResponse[PageOut[DepartmentOut]])
+    @conditional_get(lambda self: self.service.acollection_version())
+    @cache_response(Department)
+    async def list_departments(self, params: Query[PageParams], filters: Query[DepartmentFilter]):
         try:
-            departments_data = self.service.list_departments()
-            return success(departments_data, "Departments retrieved successfully")
+            page = await self.service.alist_departments_page(params.to_page_request(filters))
+            return success(page.to_dict(), "Departments retrieved successfully")
         except Exception as e:
             return error(str(e), 400)
 
@@ -5,9 +5,13 @@
 import platform
 import socket
 import sys
+import time
+import uuid
 from datetime import datetime
 
 import psutil
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
 from django.db import connections
 from django.db.utils import OperationalError
 from django.http import HttpRequest
@@ -19,6 +23,7 @@ from app.api.schemas import (
     ApiResponse
 )
 from app.common.api_response import success
+from app.common.cache import shared_cache_stats
 
 
 @api_controller("/health", auth=None)
@@ -42,19 +47,30 @@ class HealthController:
         # 检查数据库连接
         db_status = self._check_database()
 
+        # 检查缓存，缓存不可用时各缓存回退到直接计算，服务仍可用
+        cache_status = self._check_cache()
+
         # 获取系统信息
         system_info = self._get_system_info()
 
         # 获取依赖信息
         dependencies = self._get_dependencies()
 
+        if db_status != "connected":
+            status = "unhealthy"
+        elif cache_status["status"] == "disconnected":
+            status = "degraded"
+        else:
+            status = "healthy"
+
         detailed_data = {
-            "status": "healthy" if db_status == "connected" else "unhealthy",
+            "status": status,
             "timestamp": datetime.now(),
             "service": "Hello-Django-Ninja",
             "version": "1.0.0",
             "system_info": system_info,
             "database_status": db_status,
+            "cache": cache_status,
             "dependencies": dependencies
         }
         return success(detailed_data, "Detailed health check successful")
@@ -68,6 +84,26 @@ class HealthController:
         except (OperationalError, Exception):
             return "disconnected"
 
+    def _check_cache(self) -> dict:
+        """
+        检查缓存：写入、读取、删除一个探测键的总耗时，
+        以及本进程读取权限缓存和接口响应缓存的命中率
+        """
+        cache = caches["default"]
+        if isinstance(cache, DummyCache):
+            status, latency_ms = "disabled", None
+        else:
+            key = f"health-check:{uuid.uuid4().hex}"
+            started = time.perf_counter()
+            try:
+                cache.set(key, "ok", timeout=10)
+                status = "connected" if cache.get(key) == "ok" else "disconnected"
+                cache.delete(key)
+            except Exception:
+                status = "disconnected"
+            latency_ms = round((time.perf_counter() - started) * 1000, 3)
+        return {"status": status, "backend": type(cache).__name__, "latency_ms": latency_ms, **shared_cache_stats.stats()}
+
     def _get_system_info(self) -> dict:
         """获取系统信息"""
         # 获取内存信息
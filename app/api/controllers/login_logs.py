@@ -2,18 +2,21 @@
 用户登录日志管理 API Controller
 """
 
+from ninja import Query
 from ninja_extra import api_controller, http_get, http_post, http_put, http_delete
-from ninja_jwt.authentication import JWTAuth
+from app.api.authentication import PrincipalJWTAuth
+from app.api.permissions import HasRoutePermission
 
-from app.api.schemas import LoginLogOut, LoginLogCreate, LoginLogUpdate, ApiResponse
-from app.application.services.login_log_service import LoginLogService
-from app.common.api_response import success, error
+from app.api.schemas import LoginLogOut, LoginLogCreate, LoginLogUpdate, ApiResponse, PageOut, PageParams, LoginLogFilter
+from app.application.services.login_log_service import EXPORT_FIELDS, LoginLogService
+from app.common.api_response import success, error, fast_success
+from app.common.export import export_response
 from app.common.exception.exceptions import BusinessException
 from app.infrastructure.persistence.repos.login_log_repo_impl import DjangoORMLoginLogRepository
 from app.infrastructure.persistence.repos.user_repo_impl import DjangoORMUserRepository
 
 
-@api_controller("/login-logs", auth=JWTAuth())
+@api_controller("/login-logs", auth=PrincipalJWTAuth(), permissions=[HasRoutePermission])
 class LoginLogsController:
     def __init__(self):
         # 实例化仓储实现
@@ -41,27 +44,34 @@ class LoginLogsController:
         except Exception as e:
             return error(str(e), 400)
 
+    @http_get("/export")
+    def export_login_logs(self, filters: Query[LoginLogFilter], export_format: str = Query("ndjson", alias="format")):
+        """流式导出，format 为 ndjson 或 csv，可按 created_after / created_before 限定时间范围"""
+        rows = self.service.export_login_logs(filters.dict(exclude_none=True))
+        return export_response(rows, EXPORT_FIELDS, export_format, "login_logs")
+
     @http_get("/{login_log_id}", response=ApiResponse[LoginLogOut])
-    def get_login_log(self, request, login_log_id: int):
+    async def get_login_log(self, request, login_log_id: int):
         # 如果需要基于用户权限控制访问，可以在这里检查
         current_user = request.user
         try:
-            log_data = self.service.get_login_log(login_log_id)
+            log_data = await self.service.aget_login_log(login_log_id)
             return success(log_data, "Login log retrieved successfully")
         except BusinessException as e:
             return error(str(e), 400)
         except Exception as e:
             return error(str(e), 400)
 
-    @http_get("/", response=ApiResponse[list[LoginLogOut]])
-    def list_login_logs(self, request):
+    @http_get("/", response=ApiResponse[PageOut[LoginLogOut]])
+    async def list_login_logs(self, request, params: Query[PageParams], filters: Query[LoginLogFilter]):
         # 如果需要基于用户权限过滤结果，可以在这里处理
         current_user = request.user
         try:
-            logs_data = self.service.list_login_logs()
-            return success(logs_data, "Login logs retrieved successfully")
+            page = await self.service.alist_login_logs_values_page(params.to_page_request(filters))
         except Exception as e:
             return error(str(e), 400)
+        # 大列表走快速路径，直接编码，不再经过响应模型校验
+        return fast_success(page.to_dict(), "Login logs retrieved successfully", schema=ApiResponse[PageOut[LoginLogOut]])
 
     @http_put("/{login_log_id}", response=ApiResponse[LoginLogOut])
     def update_login_log(self, request, login_log_id: int, payload: LoginLogUpdate):
@@ -2,20 +2,26 @@
 菜单元数据管理 API Controller
 """
 
+from ninja import Query
 from ninja_extra import api_controller, http_get, http_post, http_put, http_delete
-from ninja_jwt.authentication import JWTAuth
+from app.api.authentication import PrincipalJWTAuth
+from app.api.conditional import conditional_get
+from app.api.permissions import HasRoutePermission
 
 from app.application.services.menu_meta_service import MenuMetaService
 from app.common.exception.exceptions import BusinessException
-from app.api.schemas import MenuMetaOut, MenuMetaCreate, MenuMetaUpdate, ApiResponse
+from app.common.response_cache import cache_response
+from app.domain.models.menu_meta import MenuMeta
+from app.infrastructure.persistence.repos.menu_meta_repo_impl import DjangoORMMenuMetaRepository
+from app.api.schemas import MenuMetaOut, MenuMetaCreate, MenuMetaUpdate, ApiResponse, PageOut, PageParams, MenuMetaFilter
 from app.common.api_response import success, error
 
 
-@api_controller("/menu-metas", auth=JWTAuth())
+@api_controller("/menu-metas", auth=PrincipalJWTAuth(), permissions=[HasRoutePermission])
 class MenuMetasController:
     def __init__(self):
         # 实例化应用服务
-        self.service = MenuMetaService()
+        self.service = MenuMetaService(menu_meta_repo=DjangoORMMenuMetaRepository())
 
     @http_post("/", response=ApiResponse[MenuMetaOut])
     def create_menu_meta(self, payload: MenuMetaCreate):
@@ -42,6 +48,7 @@ class MenuMetasController:
             return error(str(e), 400)
 
     @http_get("/{menu_meta_id}", response=ApiResponse[MenuMetaOut])
+    @cache_response(MenuMeta)
     def get_menu_meta(self, menu_meta_id: str):
         try:
             menu_meta_data = self.service.get_menu_meta(menu_meta_id)
@@ -51,11 +58,13 @@ class MenuMetasController:
         except Exception as e:
             return error(str(e), 400)
 
-    @http_get("/", response=ApiResponse[list[MenuMetaOut]])
-    def list_menu_metas(self):
+    @http_get("/", response=ApiResponse[PageOut[MenuMetaOut]])
+    @conditional_get(lambda self: self.service.collection_version())
+    @cache_response(MenuMeta)
+    def list_menu_metas(self, params: Query[PageParams], filters: Query[MenuMetaFilter]):
         try:
-            menu_metas_data = self.service.list_menu_metas()
-            return success(menu_metas_data, "Menu metas retrieved successfully")
+            page = self.service.list_menu_metas_page(params.to_page_request(filters))
+            return success(page.to_dict(), "Menu metas retrieved successfully")
         except Exception as e:
             return error(str(e), 400)
 
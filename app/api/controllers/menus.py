@@ -2,20 +2,60 @@
 菜单管理 API Controller
 """
 
+from typing import List
+
+from ninja import Query
 from ninja_extra import api_controller, http_get, http_post, http_put, http_delete
-from ninja_jwt.authentication import JWTAuth
+from app.api.authentication import PrincipalJWTAuth
+from app.api.conditional import conditional_get
+from app.api.permissions import HasRoutePermission, IsAuthenticated
 
 from app.application.services.menu_service import MenuService
 from app.common.exception.exceptions import BusinessException
-from app.api.schemas import MenuOut, MenuCreate, MenuUpdate, ApiResponse
+from app.common.response_cache import cache_response
+from app.domain.models.menu import Menu
+from app.infrastructure.persistence.repos.menu_repo_impl import DjangoORMMenuRepository
+from app.infrastructure.persistence.repos.user_repo_impl import DjangoORMUserRepository
+from app.api.schemas import MenuOut, MenuCreate, MenuUpdate, ApiResponse, PageOut, PageParams, MenuFilter, BulkResultOut, BulkDeleteIn, MenuBulkCreate, MenuBulkUpdate, MenuTreeNode
 from app.common.api_response import success, error
 
 
-@api_controller("/menus", auth=JWTAuth())
+@api_controller("/menus", auth=PrincipalJWTAuth(), permissions=[HasRoutePermission])
 class MenusController:
     def __init__(self):
         # 实例化应用服务
-        self.service = MenuService()
+        self.service = MenuService(menu_repo=DjangoORMMenuRepository(), user_repo=DjangoORMUserRepository())
+
+    # 批量接口需定义在 /{menu_id} 之前，避免 "bulk" 被当作ID匹配
+    @http_post("/bulk", response=ApiResponse[BulkResultOut])
+    def bulk_create_menus(self, payload: MenuBulkCreate):
+        try:
+            result = self.service.bulk_create_menus([item.dict() for item in payload.items])
+            return success(result, "Bulk create menus finished")
+        except BusinessException as e:
+            return error(str(e), 400)
+
+    @http_put("/bulk", response=ApiResponse[BulkResultOut])
+    def bulk_update_menus(self, payload: MenuBulkUpdate):
+        try:
+            result = self.service.bulk_update_menus([item.dict() for item in payload.items])
+            return success(result, "Bulk update menus finished")
+        except BusinessException as e:
+            return error(str(e), 400)
+
+    @http_post("/bulk-delete", response=ApiResponse[BulkResultOut])
+    def bulk_delete_menus(self, payload: BulkDeleteIn):
+        try:
+            result = self.service.bulk_delete_menus(payload.ids)
+            return success(result, "Bulk delete menus finished")
+        except BusinessException as e:
+            return error(str(e), 400)
+
+    # 当前用户自己的菜单树，登录即可访问，不做路由权限检查
+    @http_get("/my-tree", response=ApiResponse[List[MenuTreeNode]], permissions=[IsAuthenticated])
+    def get_my_menu_tree(self, request):
+        menu_tree = self.service.get_user_menu_tree(request.user)
+        return success(menu_tree, "Menu tree retrieved successfully")
 
     @http_post("/", response=ApiResponse[MenuOut])
     def create_menu(self, payload: MenuCreate):
@@ -38,20 +78,23 @@ class MenusController:
             return error(str(e), 400)
 
     @http_get("/{menu_id}", response=ApiResponse[MenuOut])
-    def get_menu(self, menu_id: str):
+    @cache_response(Menu)
+    async def get_menu(self, menu_id: str):
         try:
-            menu_data = self.service.get_menu(menu_id)
+            menu_data = await self.service.aget_menu(menu_id)
             return success(menu_data, "Menu retrieved successfully")
         except BusinessException as e:
             return error(str(e), 400)
         except Exception as e:
             return error(str(e), 400)
 
-    @http_get("/", response=ApiResponse[list[MenuOut]])
-    def list_menus(self):
+    @http_get("/", response=ApiResponse[PageOut[MenuOut]])
+    @conditional_get(lambda self: self.service.acollection_version())
+    @cache_response(Menu)
+    async def list_menus(self, params: Query[PageParams], filters: Query[MenuFilter]):
         try:
-            menus_data = self.service.list_menus()
-            return success(menus_data, "Menus retrieved successfully")
+            page = await self.service.alist_menus_page(params.to_page_request(filters))
+            return success(page.to_dict(), "Menus retrieved successfully")
         except Exception as e:
             return error(str(e), 400)
 
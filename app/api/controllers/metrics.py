@@ -0,0 +1,25 @@
+"""
+接口指标 API Controller
+"""
+
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+from ninja_extra import api_controller, http_get
+
+from app.api.authentication import MetricsTokenAuth, PrincipalJWTAuth
+from app.api.permissions import CanReadMetrics
+from app.common.metrics import get_metrics_registry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@api_controller("/metrics", auth=[MetricsTokenAuth(), PrincipalJWTAuth()], permissions=[CanReadMetrics])
+class MetricsController:
+    """Prometheus 指标控制器，需要 METRICS_TOKEN 或超级用户的 JWT"""
+
+    @http_get("", include_in_schema=False)
+    def metrics(self, request: HttpRequest):
+        """按路由聚合的请求数、延迟、SQL查询数和耗时、响应渲染耗时和响应大小，Prometheus 文本格式"""
+        if not getattr(settings, "METRICS", {}).get("ENABLED", True):
+            raise Http404()
+        return HttpResponse(get_metrics_registry().render(), content_type=PROMETHEUS_CONTENT_TYPE)
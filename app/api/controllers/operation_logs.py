@@ -2,20 +2,36 @@
 操作日志管理 API Controller
 """
 
+from datetime import timedelta
+
+from django.utils import timezone
+from ninja import Query
 from ninja_extra import api_controller, http_get, http_post, http_put, http_delete
-from ninja_jwt.authentication import JWTAuth
+from app.api.authentication import PrincipalJWTAuth
+from app.api.permissions import HasRoutePermission
 
-from app.application.services.operation_log_service import OperationLogService
+from app.application.services.operation_log_service import EXPORT_FIELDS, OperationLogService
 from app.common.exception.exceptions import BusinessException
-from app.api.schemas import OperationLogOut, OperationLogCreate, OperationLogUpdate, ApiResponse
-from app.common.api_response import success, error
+from app.infrastructure.persistence.repos.operation_log_repo_impl import DjangoORMOperationLogRepository
+from app.infrastructure.persistence.repos.operation_log_rollup_repo_impl import (
+    DjangoORMOperationLogRollupRepository,
+)
+from app.api.schemas import (
+    OperationLogOut, OperationLogCreate, OperationLogUpdate, ApiResponse, PageOut, PageParams,
+    OperationLogFilter, OperationLogStatsOut, OperationLogStatsQuery,
+)
+from app.common.api_response import success, error, fast_success
+from app.common.export import export_response
 
 
-@api_controller("/operation-logs", auth=JWTAuth())
+@api_controller("/operation-logs", auth=PrincipalJWTAuth(), permissions=[HasRoutePermission])
 class OperationLogsController:
     def __init__(self):
         # 实例化应用服务
-        self.service = OperationLogService()
+        self.service = OperationLogService(
+            operation_log_repo=DjangoORMOperationLogRepository(),
+            rollup_repo=DjangoORMOperationLogRollupRepository(),
+        )
 
     @http_post("/", response=ApiResponse[OperationLogOut])
     def create_operation_log(self, payload: OperationLogCreate):
@@ -39,23 +55,50 @@ class OperationLogsController:
         except Exception as e:
             return error(str(e), 400)
 
+    @http_get("/stats", response=ApiResponse[OperationLogStatsOut])
+    def get_operation_log_stats(self, query: Query[OperationLogStatsQuery]):
+        """按模块、业务类型、请求方法、状态统计请求量、错误率和耗时分位数"""
+        try:
+            end = query.end or timezone.now()
+            start = query.start or end - timedelta(hours=24)
+            group_by = [name.strip() for name in (query.group_by or "").split(",") if name.strip()]
+            filters = {
+                "module": query.module,
+                "business_type": query.business_type,
+                "request_method": query.request_method,
+                "status": query.status,
+            }
+            stats = self.service.get_operation_log_stats(start, end, query.granularity, group_by, filters)
+            return success(stats, "Operation log stats retrieved successfully")
+        except Exception as e:
+            return error(str(e), 400)
+
+    @http_get("/export")
+    def export_operation_logs(self, filters: Query[OperationLogFilter], export_format: str = Query("ndjson", alias="format")):
+        """流式导出，format 为 ndjson 或 csv，可按 created_after / created_before 限定时间范围"""
+        rows = self.service.export_operation_logs(filters.dict(exclude_none=True))
+        return export_response(rows, EXPORT_FIELDS, export_format, "operation_logs")
+
     @http_get("/{operation_log_id}", response=ApiResponse[OperationLogOut])
-    def get_operation_log(self, operation_log_id: int):
+    async def get_operation_log(self, operation_log_id: int):
         try:
-            log_data = self.service.get_operation_log(operation_log_id)
+            log_data = await self.service.aget_operation_log(operation_log_id)
             return success(log_data, "Operation log retrieved successfully")
         except BusinessException as e:
             return error(str(e), 400)
         except Exception as e:
             return error(str(e), 400)
 
-    @http_get("/", response=ApiResponse[list[OperationLogOut]])
-    def list_operation_logs(self):
+    @http_get("/", response=ApiResponse[PageOut[OperationLogOut]])
+    async def list_operation_logs(self, params: Query[PageParams], filters: Query[OperationLogFilter]):
         try:
-            logs_data = self.service.list_operation_logs()
-            return success(logs_data, "Operation logs retrieved successfully")
+            page = await self.service.alist_operation_logs_values_page(params.to_page_request(filters))
         except Exception as e:
             return error(str(e), 400)
+        # 大列表走快速路径，直接编码，不再经过响应模型校验
+        return fast_success(
+            page.to_dict(), "Operation logs retrieved successfully", schema=ApiResponse[PageOut[OperationLogOut]]
+        )
 
     @http_put("/{operation_log_id}", response=ApiResponse[OperationLogOut])
     def update_operation_log(self, operation_log_id: int, payload: OperationLogUpdate):
@@ -2,19 +2,21 @@
 权限管理 API Controller
 """
 
+from ninja import Query
 from ninja_extra import api_controller, http_get, http_post, http_put, http_delete
-from ninja_jwt.authentication import JWTAuth
+from app.api.authentication import PrincipalJWTAuth
+from app.api.permissions import HasRoutePermission
 
 from app.application.services.permission_service import PermissionService
 from app.common.exception.exceptions import BusinessException
 from app.infrastructure.persistence.repos.permission_repo_impl import (
     DjangoORMPermissionRepository,
 )
-from app.api.schemas import PermissionOut, PermissionCreate, PermissionUpdate, ApiResponse
+from app.api.schemas import PermissionOut, PermissionCreate, PermissionUpdate, ApiResponse, PageOut, PageParams, PermissionFilter
 from app.common.api_response import success, error
 
 
-@api_controller("/permissions", auth=JWTAuth())
+@api_controller("/permissions", auth=PrincipalJWTAuth(), permissions=[HasRoutePermission])
 class PermissionsController:
     def __init__(self):
         # 实例化仓储实现
@@ -30,12 +32,12 @@ class PermissionsController:
         except BusinessException as e:
             return error(str(e), 400)
 
-    @http_get("/", response=ApiResponse[list[PermissionOut]])
-    def list_permissions(self):
-        # 通过service层获取所有权限数据
+    @http_get("/", response=ApiResponse[PageOut[PermissionOut]])
+    def list_permissions(self, params: Query[PageParams], filters: Query[PermissionFilter]):
+        # 通过service层分页获取权限数据
         try:
-            permissions_data = self.service.list_permissions()
-            return success(permissions_data, "Permissions retrieved successfully")
+            page = self.service.list_permissions_page(params.to_page_request(filters))
+            return success(page.to_dict(), "Permissions retrieved successfully")
         except Exception as e:
             return error(str(e), 400)
 
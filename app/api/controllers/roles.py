@@ -2,17 +2,22 @@
 角色管理 API Controller
 """
 
+from ninja import Query
 from ninja_extra import api_controller, http_get, http_post, http_put, http_delete
-from ninja_jwt.authentication import JWTAuth
+from app.api.authentication import PrincipalJWTAuth
+from app.api.conditional import conditional_get
+from app.api.permissions import HasRoutePermission
 
 from app.application.services.role_service import RoleService
 from app.common.exception.exceptions import BusinessException
+from app.common.response_cache import cache_response
+from app.domain.models.role import Role
 from app.infrastructure.persistence.repos.role_repo_impl import DjangoORMRoleRepository
-from app.api.schemas import RoleOut, RoleCreate, RoleUpdate, ApiResponse
+from app.api.schemas import RoleOut, RoleCreate, RoleUpdate, ApiResponse, PageOut, PageParams, RoleFilter, BulkResultOut, BulkDeleteIn, RoleBulkCreate, RoleBulkUpdate
 from app.common.api_response import success
 
 
-@api_controller("/roles", auth=JWTAuth())
+@api_controller("/roles", auth=PrincipalJWTAuth(), permissions=[HasRoutePermission])
 class RolesController:
     def __init__(self):
         # 实例化仓储实现
@@ -20,26 +25,45 @@ class RolesController:
         # 实例化应用服务
         self.service = RoleService(role_repo)
 
+    # 批量接口需定义在 /{role_id} 之前，避免 "bulk" 被当作ID匹配
+    @http_post("/bulk", response=ApiResponse[BulkResultOut])
+    def bulk_create_roles(self, payload: RoleBulkCreate):
+        result = self.service.bulk_create_roles([item.dict() for item in payload.items])
+        return success(result, "Bulk create roles finished")
+
+    @http_put("/bulk", response=ApiResponse[BulkResultOut])
+    def bulk_update_roles(self, payload: RoleBulkUpdate):
+        result = self.service.bulk_update_roles([item.dict() for item in payload.items])
+        return success(result, "Bulk update roles finished")
+
+    @http_post("/bulk-delete", response=ApiResponse[BulkResultOut])
+    def bulk_delete_roles(self, payload: BulkDeleteIn):
+        result = self.service.bulk_delete_roles(payload.ids)
+        return success(result, "Bulk delete roles finished")
+
     @http_post("/", response=ApiResponse[RoleOut])
     def create_role(self, payload: RoleCreate):
         role_data = self.service.create_role(payload.name, payload.description)
         return success(role_data, "Role created successfully", 201)
 
     @http_get("/{role_id}", response=ApiResponse[RoleOut])
-    def get_role(self, role_id: str):
+    @cache_response(Role)
+    async def get_role(self, role_id: str):
         # 通过service层获取角色数据
-        role_data = self.service.get_role(role_id)
+        role_data = await self.service.aget_role(role_id)
         if role_data:
             return success(role_data, "Role retrieved successfully")
         else:
             # 这个异常将由全局异常处理器处理
             raise BusinessException("Role not found")
 
-    @http_get("/", response=ApiResponse[list[RoleOut]])
-    def list_roles(self):
-        # 通过service层获取所有角色数据
-        roles_data = self.service.list_roles()
-        return success(roles_data, "Roles retrieved successfully")
+    @http_get("/", response=ApiResponse[PageOut[RoleOut]])
+    @conditional_get(lambda self: self.service.acollection_version())
+    @cache_response(Role)
+    async def list_roles(self, params: Query[PageParams], filters: Query[RoleFilter]):
+        # 通过service层分页获取角色数据
+        page = await self.service.alist_roles_page(params.to_page_request(filters))
+        return success(page.to_dict(), "Roles retrieved successfully")
 
     @http_put("/{role_id}", response=ApiResponse[RoleOut])
     def update_role(self, role_id: str, payload: RoleUpdate):
@@ -2,20 +2,26 @@
 系统配置管理 API Controller
 """
 
+from ninja import Query
 from ninja_extra import api_controller, http_get, http_post, http_put, http_delete
-from ninja_jwt.authentication import JWTAuth
+from app.api.authentication import PrincipalJWTAuth
+from app.api.conditional import conditional_get
+from app.api.permissions import HasRoutePermission
 
-from app.api.schemas import SystemConfigOut, SystemConfigCreate, SystemConfigUpdate, ApiResponse
+from app.api.schemas import SystemConfigOut, SystemConfigCreate, SystemConfigUpdate, ApiResponse, PageOut, PageParams, SystemConfigFilter, SystemConfigKeysQuery, SystemConfigValuesOut
 from app.application.services.system_config_service import SystemConfigService
 from app.common.api_response import success, error
 from app.common.exception.exceptions import BusinessException
+from app.common.response_cache import cache_response
+from app.domain.models.system_config import SystemConfig
+from app.infrastructure.persistence.repos.system_config_repo_impl import DjangoORMSystemConfigRepository
 
 
-@api_controller("/system-configs", auth=JWTAuth())
+@api_controller("/system-configs", auth=PrincipalJWTAuth(), permissions=[HasRoutePermission])
 class SystemConfigsController:
     def __init__(self):
         # 实例化应用服务
-        self.service = SystemConfigService()
+        self.service = SystemConfigService(system_config_repo=DjangoORMSystemConfigRepository())
 
     @http_post("/", response=ApiResponse[SystemConfigOut])
     def create_system_config(self, payload: SystemConfigCreate):
@@ -34,21 +40,30 @@ class SystemConfigsController:
         except Exception as e:
             return error(str(e), 400)
 
+    # 需定义在 /{config_id} 之前，避免 "by-keys" 被当作ID匹配
+    @http_get("/by-keys", response=ApiResponse[SystemConfigValuesOut])
+    def get_system_config_values(self, query: Query[SystemConfigKeysQuery]):
+        config_values = self.service.get_config_values(query.keys)
+        return success(config_values, "System config values retrieved successfully")
+
     @http_get("/{config_id}", response=ApiResponse[SystemConfigOut])
-    def get_system_config(self, config_id: str):
+    @cache_response(SystemConfig)
+    async def get_system_config(self, config_id: str):
         try:
-            config_data = self.service.get_system_config(config_id)
+            config_data = await self.service.aget_system_config(config_id)
             return success(config_data, "System config retrieved successfully")
         except BusinessException as e:
             return error(str(e), 400)
         except Exception as e:
             return error(str(e), 400)
 
-    @http_get("/", response=ApiResponse[list[SystemConfigOut]])
-    def list_system_configs(self):
+    @http_get("/", response=ApiResponse[PageOut[SystemConfigOut]])
+    @conditional_get(lambda self: self.service.acollection_version())
+    @cache_response(SystemConfig)
+    async def list_system_configs(self, params: Query[PageParams], filters: Query[SystemConfigFilter]):
         try:
-            configs_data = self.service.list_system_configs()
-            return success(configs_data, "System configs retrieved successfully")
+            page = await self.service.alist_system_configs_page(params.to_page_request(filters))
+            return success(page.to_dict(), "System configs retrieved successfully")
         except Exception as e:
             return error(str(e), 400)
 
@@ -2,17 +2,19 @@
 用户管理 API Controller
 """
 
+from ninja import Query
 from ninja_extra import api_controller, http_get, http_post, http_put, http_delete
-from ninja_jwt.authentication import JWTAuth
+from app.api.authentication import PrincipalJWTAuth
+from app.api.permissions import HasRoutePermission
 
 from app.application.services.user_service import UserService
 from app.common.exception.exceptions import BusinessException
 from app.infrastructure.persistence.repos.user_repo_impl import DjangoORMUserRepository
-from app.api.schemas import UserOut, UserCreate, UserUpdate, ApiResponse
+from app.api.schemas import UserOut, UserCreate, UserUpdate, ApiResponse, PageOut, PageParams, UserFilter, BulkResultOut, BulkDeleteIn, UserBulkCreate, UserBulkUpdate
 from app.common.api_response import success
 
 
-@api_controller("/users", auth=JWTAuth())
+@api_controller("/users", auth=PrincipalJWTAuth(), permissions=[HasRoutePermission])
 class UsersController:
     def __init__(self):
         # 实例化仓储实现
@@ -20,6 +22,22 @@ class UsersController:
         # 实例化应用服务
         self.service = UserService(user_repo)
 
+    # 批量接口需定义在 /{user_id} 之前，避免 "bulk" 被当作ID匹配
+    @http_post("/bulk", response=ApiResponse[BulkResultOut])
+    def bulk_create_users(self, payload: UserBulkCreate):
+        result = self.service.bulk_create_users([item.dict() for item in payload.items])
+        return success(result, "Bulk create users finished")
+
+    @http_put("/bulk", response=ApiResponse[BulkResultOut])
+    def bulk_update_users(self, payload: UserBulkUpdate):
+        result = self.service.bulk_update_users([item.dict() for item in payload.items])
+        return success(result, "Bulk update users finished")
+
+    @http_post("/bulk-delete", response=ApiResponse[BulkResultOut])
+    def bulk_delete_users(self, payload: BulkDeleteIn):
+        result = self.service.bulk_delete_users(payload.ids)
+        return success(result, "Bulk delete users finished")
+
     @http_post("/", response=ApiResponse[UserOut])
     def create_user(self, payload: UserCreate):
         user_data = self.service.create_user(
@@ -28,20 +46,20 @@ class UsersController:
         return success(user_data, "User created successfully", 201)
 
     @http_get("/{user_id}", response=ApiResponse[UserOut])
-    def get_user(self, user_id: int):
+    async def get_user(self, user_id: int):
         # 通过service层获取用户数据
-        user_data = self.service.get_user(user_id)
+        user_data = await self.service.aget_user(user_id)
         if user_data:
             return success(user_data, "User retrieved successfully")
         else:
             # 这个异常将由全局异常处理器处理
             raise BusinessException("User not found")
 
-    @http_get("/", response=ApiResponse[list[UserOut]])
-    def list_users(self):
-        # 通过service层获取所有用户数据
-        users_data = self.service.list_users()
-        return success(users_data, "Users retrieved successfully")
+    @http_get("/", response=ApiResponse[PageOut[UserOut]])
+    async def list_users(self, params: Query[PageParams], filters: Query[UserFilter]):
+        # 通过service层分页获取用户数据
+        page = await self.service.alist_users_page(params.to_page_request(filters))
+        return success(page.to_dict(), "Users retrieved successfully")
 
     @http_put("/{user_id}", response=ApiResponse[UserOut])
     def update_user(self, user_id: int, payload: UserUpdate):
@@ -0,0 +1,25 @@
+"""
+API 请求体解析器
+与渲染器一样由 API_JSON_BACKEND 选择实现，解析失败时 ninja 返回 400
+"""
+
+from typing import cast
+
+from django.http import HttpRequest
+from ninja.parser import Parser
+from ninja.types import DictStrAny
+
+from app.api.renderers import get_json_backend
+from app.common.serialization import loads
+
+
+class ORJSONParser(Parser):
+    """基于 orjson 的请求体解析器，查询参数的解析与默认解析器相同"""
+
+    def parse_body(self, request: HttpRequest) -> DictStrAny:
+        return cast(DictStrAny, loads(request.body))
+
+
+def get_json_parser() -> Parser:
+    """按 API_JSON_BACKEND 创建解析器"""
+    return ORJSONParser() if get_json_backend() == "orjson" else Parser()
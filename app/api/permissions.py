@@ -4,7 +4,32 @@ API 权限类
 
 from ninja_extra.permissions import BasePermission
 from ninja_extra.controllers.base import ControllerBase
-from typing import Any
+from typing import Any, Optional
+
+from django.conf import settings
+
+from app.api.authentication import METRICS_SCRAPER
+
+from app.domain.services.rbac_service import RBACService
+from app.domain.services.route_matcher import route_matcher_registry
+from app.infrastructure.persistence.repos.permission_repo_impl import DjangoORMPermissionRepository
+from app.infrastructure.persistence.repos.role_repo_impl import DjangoORMRoleRepository
+from app.infrastructure.persistence.repos.user_repo_impl import DjangoORMUserRepository
+
+
+_rbac_service: Optional[RBACService] = None
+
+
+def get_rbac_service() -> RBACService:
+    """获取共享的RBAC服务实例"""
+    global _rbac_service
+    if _rbac_service is None:
+        _rbac_service = RBACService(
+            DjangoORMUserRepository(),
+            DjangoORMRoleRepository(),
+            DjangoORMPermissionRepository(),
+        )
+    return _rbac_service
 
 
 class IsAuthenticated(BasePermission):
@@ -26,13 +51,39 @@ class HasPermission(BasePermission):
     def has_permission(self, request, controller: ControllerBase) -> bool:
         # 检查用户是否有特定权限
         user = getattr(request, "user", None)
-        if not user or not hasattr(user, 'has_perm'):
+        if not user or not getattr(user, 'is_authenticated', False):
             return False
-        
-        # 在实际项目中，这里会检查用户是否具有指定的权限
-        # 示例：return user.has_perm(self.permission_code)
-        # 目前简化实现，假设认证用户就有权限
-        return True
+
+        # 超级用户拥有所有权限
+        if getattr(user, 'is_superuser', False):
+            return True
+
+        # 有效权限集合经过缓存，角色/菜单变更时自动失效
+        permissions = get_rbac_service().get_effective_permissions(user.pk)
+        return permissions.has_menu(self.permission_code)
+
+
+class HasRoutePermission(BasePermission):
+    """
+    基于接口类菜单的路由权限检查类
+    通过编译好的路由前缀树找到请求所需的菜单权限码，再检查用户的有效权限；
+    多个菜单配置了同一路由时，拥有其中任意一个即可访问
+    """
+    def has_permission(self, request, controller: ControllerBase) -> bool:
+        user = getattr(request, "user", None)
+        if not user or not getattr(user, 'is_authenticated', False):
+            return False
+
+        if getattr(user, 'is_superuser', False):
+            return True
+
+        permission_codes = route_matcher_registry.match_codes(request.method, request.path_info)
+        if not permission_codes:
+            # 未配置为接口权限的路由，按配置决定是否放行
+            return getattr(settings, "ROUTE_PERMISSION_DEFAULT_ALLOW", True)
+
+        permissions = get_rbac_service().get_effective_permissions(user.pk)
+        return any(permissions.has_menu(code) for code in permission_codes)
 
 
 class IsSuperUser(BasePermission):
@@ -43,4 +94,15 @@ class IsSuperUser(BasePermission):
         user = getattr(request, "user", None)
         if not user:
             return False
-        return getattr(user, 'is_superuser', False)
\ No newline at end of file
+        return getattr(user, 'is_superuser', False)
+
+
+class CanReadMetrics(BasePermission):
+    """
+    指标接口的权限类：通过 METRICS_TOKEN 认证的抓取请求或超级用户
+    """
+    def has_permission(self, request, controller: ControllerBase) -> bool:
+        if getattr(request, "auth", None) == METRICS_SCRAPER:
+            return True
+        user = getattr(request, "user", None)
+        return bool(user and getattr(user, 'is_superuser', False))
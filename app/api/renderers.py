@@ -0,0 +1,51 @@
+"""
+API 响应渲染器
+API_JSON_BACKEND 选择 JSON 编码实现：
+- orjson（默认）: ORJSONRenderer，输出与 ninja 默认渲染器一致，编码更快
+- json: MetricsJSONRenderer，ninja 默认的标准库编码
+两者都把序列化耗时计入当前请求的指标
+"""
+
+from typing import Any
+
+from django.conf import settings
+from django.http import HttpRequest
+from ninja.renderers import BaseRenderer, JSONRenderer
+
+from app.common.metrics import measure_render
+from app.common.serialization import dumps
+
+JSON_BACKENDS = ("orjson", "json")
+
+
+class MetricsJSONRenderer(JSONRenderer):
+    """JSON渲染器，把序列化耗时累加到当前请求的指标"""
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
+        with measure_render():
+            return super().render(request, data, response_status=response_status)
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    基于 orjson 的渲染器
+    日期时间、Decimal、pydantic 模型等交给 NinjaJSONEncoder，格式与默认渲染器相同
+    """
+
+    media_type = "application/json"
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
+        with measure_render():
+            return dumps(data)
+
+
+def get_json_backend() -> str:
+    backend = getattr(settings, "API_JSON_BACKEND", "orjson")
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"Invalid API_JSON_BACKEND: {backend}, expected one of {', '.join(JSON_BACKENDS)}")
+    return backend
+
+
+def get_json_renderer() -> BaseRenderer:
+    """按 API_JSON_BACKEND 创建渲染器"""
+    return ORJSONRenderer() if get_json_backend() == "orjson" else MetricsJSONRenderer()
@@ -2,11 +2,16 @@
 API 输入输出 Schema (DTOs)
 """
 
-from ninja import Schema
-from typing import List, Optional, TypeVar, Generic
+from ninja import Schema, Field
+from typing import Any, Dict, List, Optional, TypeVar, Generic
 from datetime import datetime
 from typing import TypeVar, Generic, Union
 
+from app.domain.repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageRequest
+
+# 批量接口单次请求的最大条数
+BULK_MAX_ITEMS = 1000
+
 
 # 定义泛型类型变量
 T = TypeVar('T')
@@ -19,6 +24,155 @@ class ApiResponse(Schema, Generic[T]):
     timestamp: datetime
 
 
+class PageOut(Schema, Generic[T]):
+    """统一分页结果格式"""
+    items: List[T]
+    page_size: int
+    page: Optional[int] = None
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class BulkItemOut(Schema):
+    """批量操作中单项的结果，index 为该项在请求中的下标"""
+    index: int
+    success: bool
+    id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkResultOut(Schema):
+    """统一批量操作结果格式"""
+    total: int
+    succeeded: int
+    failed: int
+    items: List[BulkItemOut]
+
+
+class BulkDeleteIn(Schema):
+    ids: List[str] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class PageParams(Schema):
+    """统一分页查询参数，带 cursor 时使用游标分页并忽略 page"""
+    page: int = Field(1, ge=1)
+    page_size: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    cursor: Optional[str] = None
+    ordering: Optional[str] = None
+
+    def to_page_request(self, filters: Optional[Schema] = None) -> PageRequest:
+        return PageRequest(
+            page=self.page,
+            page_size=self.page_size,
+            cursor=self.cursor,
+            ordering=self.ordering,
+            filters=filters.dict(exclude_none=True) if filters is not None else {},
+        )
+
+
+class UserFilter(Schema):
+    username: Optional[str] = None
+    email: Optional[str] = None
+    is_active: Optional[bool] = None
+    dept_id: Optional[str] = None
+    search: Optional[str] = None
+
+
+class RoleFilter(Schema):
+    name: Optional[str] = None
+    code: Optional[str] = None
+    is_active: Optional[bool] = None
+
+
+class PermissionFilter(Schema):
+    name: Optional[str] = None
+    codename: Optional[str] = None
+    content_type_id: Optional[int] = None
+
+
+class DepartmentFilter(Schema):
+    name: Optional[str] = None
+    code: Optional[str] = None
+    is_active: Optional[bool] = None
+    parent_id: Optional[str] = None
+    mode_type: Optional[int] = None
+
+
+class MenuFilter(Schema):
+    name: Optional[str] = None
+    code: Optional[str] = None
+    menu_type: Optional[int] = None
+    is_active: Optional[bool] = None
+    parent_id: Optional[str] = None
+    method: Optional[str] = None
+
+
+class MenuMetaFilter(Schema):
+    title: Optional[str] = None
+    is_show_menu: Optional[bool] = None
+
+
+class SystemConfigFilter(Schema):
+    key: Optional[str] = None
+    is_active: Optional[bool] = None
+    access: Optional[bool] = None
+
+
+class LoginLogFilter(Schema):
+    status: Optional[bool] = None
+    login_type: Optional[int] = None
+    ipaddress: Optional[str] = None
+    creator_id: Optional[str] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+
+class OperationLogFilter(Schema):
+    module: Optional[str] = None
+    oper_name: Optional[str] = None
+    business_type: Optional[str] = None
+    request_method: Optional[str] = None
+    status: Optional[bool] = None
+    oper_ip: Optional[str] = None
+    user_id: Optional[str] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+
+class OperationLogStatsQuery(Schema):
+    """操作日志统计查询参数，默认统计最近24小时"""
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    granularity: str = "hour"
+    # 逗号分隔的分组字段：bucket, module, business_type, request_method, status
+    group_by: Optional[str] = None
+    module: Optional[str] = None
+    business_type: Optional[str] = None
+    request_method: Optional[str] = None
+    status: Optional[bool] = None
+
+
+class OperationLogStatsItem(Schema):
+    key: dict
+    count: int
+    error_count: int
+    error_rate: float
+    avg_cost_time: Optional[float] = None
+    max_cost_time: Optional[int] = None
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+
+
+class OperationLogStatsOut(Schema):
+    start: datetime
+    end: datetime
+    granularity: str
+    group_by: List[str]
+    total: OperationLogStatsItem
+    groups: List[OperationLogStatsItem]
+
+
 class RoleCreate(Schema):
     name: str
     description: str
@@ -35,8 +189,24 @@ class RoleOut(Schema):
     description: str
 
 
-class PermissionOut(Schema):
+class RoleBulkCreateItem(RoleCreate):
+    code: Optional[str] = None
+
+
+class RoleBulkCreate(Schema):
+    items: List[RoleBulkCreateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class RoleBulkUpdateItem(RoleUpdate):
     id: str
+
+
+class RoleBulkUpdate(Schema):
+    items: List[RoleBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class PermissionOut(Schema):
+    id: int
     name: str
     codename: str
 
@@ -71,6 +241,18 @@ class UserOut(Schema):
     email: str
 
 
+class UserBulkCreate(Schema):
+    items: List[UserCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class UserBulkUpdateItem(UserUpdate):
+    id: str
+
+
+class UserBulkUpdate(Schema):
+    items: List[UserBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class DepartmentCreate(Schema):
     name: str
     code: str
@@ -107,6 +289,33 @@ class DepartmentOut(Schema):
     creator_id: Optional[int] = None
     modifier_id: Optional[int] = None
     parent_id: Optional[str] = None
+    depth: int = 0
+
+
+class DepartmentTreeNode(Schema):
+    id: str
+    name: str
+    code: str
+    rank: int
+    is_active: bool
+    parent_id: Optional[str] = None
+    depth: int
+    children: List["DepartmentTreeNode"] = []
+
+
+DepartmentTreeNode.model_rebuild()
+
+
+class DepartmentBulkCreate(Schema):
+    items: List[DepartmentCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class DepartmentBulkUpdateItem(DepartmentUpdate):
+    id: str
+
+
+class DepartmentBulkUpdate(Schema):
+    items: List[DepartmentBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
 
 
 class MenuCreate(Schema):
@@ -151,6 +360,56 @@ class MenuOut(Schema):
     meta_id: str
 
 
+class MenuTreeMeta(Schema):
+    title: Optional[str] = None
+    icon: Optional[str] = None
+    r_svg_name: Optional[str] = None
+    is_show_menu: bool
+    is_show_parent: bool
+    is_keepalive: bool
+    frame_url: Optional[str] = None
+    frame_loading: bool
+    transition_enter: Optional[str] = None
+    transition_leave: Optional[str] = None
+    is_hidden_tag: bool
+    fixed_tag: bool
+    dynamic_level: int
+
+
+class MenuTreeNode(Schema):
+    id: str
+    name: str
+    code: str
+    menu_type: int
+    rank: int
+    path: Optional[str] = None
+    component: Optional[str] = None
+    redirect: Optional[str] = None
+    method: Optional[str] = None
+    parent_id: Optional[str] = None
+    meta: Optional[MenuTreeMeta] = None
+    children: List["MenuTreeNode"] = []
+
+
+MenuTreeNode.model_rebuild()
+
+
+class MenuBulkCreateItem(MenuCreate):
+    code: Optional[str] = None
+
+
+class MenuBulkCreate(Schema):
+    items: List[MenuBulkCreateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class MenuBulkUpdateItem(MenuUpdate):
+    id: str
+
+
+class MenuBulkUpdate(Schema):
+    items: List[MenuBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class MenuMetaCreate(Schema):
     title: Optional[str] = None
     icon: Optional[str] = None
@@ -205,6 +464,16 @@ class MenuMetaOut(Schema):
     modifier_id: Optional[int] = None
 
 
+class SystemConfigKeysQuery(Schema):
+    # 同时支持 keys=a&keys=b 和 keys=a,b
+    keys: List[str] = Field(..., min_length=1, max_length=200)
+
+
+class SystemConfigValuesOut(Schema):
+    values: Dict[str, Any]
+    missing: List[str]
+
+
 class SystemConfigCreate(Schema):
     key: str
     value: str
@@ -244,8 +513,8 @@ class LoginLogCreate(Schema):
     system: Optional[str] = None
     agent: Optional[str] = None
     login_type: int
-    creator_id: Optional[int] = None
-    modifier_id: Optional[int] = None
+    creator_id: Optional[str] = None
+    modifier_id: Optional[str] = None
 
 
 class LoginLogUpdate(Schema):
@@ -270,8 +539,8 @@ class LoginLogOut(Schema):
     system: Optional[str] = None
     agent: Optional[str] = None
     login_type: int
-    creator_id: Optional[int] = None
-    modifier_id: Optional[int] = None
+    creator_id: Optional[str] = None
+    modifier_id: Optional[str] = None
 
 
 class OperationLogCreate(Schema):
@@ -319,8 +588,8 @@ class OperationLogOut(Schema):
     response_code: Optional[int] = None
     response_result: Optional[str] = None
     status_code: Optional[int] = None
-    creator_id: Optional[int] = None
-    modifier_id: Optional[int] = None
+    creator_id: Optional[str] = None
+    modifier_id: Optional[str] = None
 
 
 class HealthCheckSchema(Schema):
@@ -342,6 +611,16 @@ class SystemInfoSchema(Schema):
     disk_free_gb: Optional[float] = None
 
 
+class CacheHealthSchema(Schema):
+    """缓存状态Schema"""
+    status: str
+    backend: str
+    latency_ms: Optional[float] = None
+    hits: int
+    misses: int
+    hit_ratio: Optional[float] = None
+
+
 class DetailedHealthCheckSchema(Schema):
     """详细健康检查响应Schema"""
     status: str
@@ -350,4 +629,5 @@ class DetailedHealthCheckSchema(Schema):
     version: str
     system_info: SystemInfoSchema
     database_status: str
+    cache: Optional[CacheHealthSchema] = None
     dependencies: dict
\ No newline at end of file
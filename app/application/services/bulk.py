@@ -0,0 +1,109 @@
+"""
+批量操作结果
+按输入顺序记录每一项的成败，已失败的项不再参与后续校验和写入
+"""
+
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Collection, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple, Type
+
+from django.db import IntegrityError, transaction
+
+
+@dataclass
+class BulkItemResult:
+    index: int
+    success: bool
+    id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkResult:
+    def __init__(self, size: int):
+        self._items: List[Optional[BulkItemResult]] = [None] * size
+
+    def pending(self) -> List[int]:
+        """尚未确定结果的项的下标"""
+        return [index for index, item in enumerate(self._items) if item is None]
+
+    def succeed(self, index: int, entity_id: Any) -> None:
+        self._items[index] = BulkItemResult(index=index, success=True, id=str(entity_id))
+
+    def fail(self, index: int, error: str, entity_id: Any = None) -> None:
+        if self._items[index] is None:
+            self._items[index] = BulkItemResult(
+                index=index, success=False, id=None if entity_id is None else str(entity_id), error=error
+            )
+
+    def reject_duplicates(self, keys: Sequence[Optional[Hashable]], label: str) -> None:
+        """同一批次内重复的值全部判为失败，值为None的项不参与比较"""
+        counts = Counter(key for index, key in enumerate(keys) if key is not None and self._items[index] is None)
+        for index in self.pending():
+            key = keys[index]
+            if key is not None and counts[key] > 1:
+                self.fail(index, f"Duplicate {label} '{key}' in request.")
+
+    def reject_existing(
+        self,
+        keys: Sequence[Optional[Hashable]],
+        owners: Mapping[Any, Any],
+        message: str,
+        entity_ids: Optional[Sequence[Any]] = None,
+    ) -> None:
+        """
+        值已被占用的项判为失败，message 中的 {} 替换为该值
+        更新时传入 entity_ids，占用者是记录自身的不算冲突
+        """
+        for index in self.pending():
+            owner = owners.get(keys[index])
+            if owner is None or (entity_ids is not None and owner == entity_ids[index]):
+                continue
+            self.fail(index, message.format(keys[index]))
+
+    def reject_missing(self, keys: Sequence[Optional[Hashable]], found: Collection[Any], message: str) -> None:
+        """引用的记录不存在的项判为失败，值为None的项不检查"""
+        for index in self.pending():
+            key = keys[index]
+            if key is not None and key not in found:
+                self.fail(index, message.format(key))
+
+    def write_pending(
+        self,
+        entities: Sequence[Any],
+        write: Callable[[List[Any]], Any],
+        errors: Tuple[Type[Exception], ...] = (IntegrityError,),
+    ) -> None:
+        """
+        写入与 pending 项一一对应的实体，成功的项记录实体主键
+        先整批写入（仓储在事务中写入，失败时整批回滚）；违反约束（如并发请求写入了相同的唯一值）时
+        逐项重试，每项一个保存点，只有出错的项判为失败
+        """
+        pending = self.pending()
+        try:
+            write(list(entities))
+        except errors:
+            for index, entity in zip(pending, entities):
+                try:
+                    with transaction.atomic():
+                        write([entity])
+                except errors as e:
+                    self.fail(index, str(e))
+                else:
+                    self.succeed(index, entity.pk)
+            return
+        for index, entity in zip(pending, entities):
+            self.succeed(index, entity.pk)
+
+    def succeed_pending(self, entity_ids: Sequence[Any]) -> None:
+        for index in self.pending():
+            self.succeed(index, entity_ids[index])
+
+    def to_dict(self) -> Dict[str, Any]:
+        items = [asdict(item) for item in self._items if item is not None]
+        succeeded = sum(1 for item in items if item["success"])
+        return {
+            "total": len(self._items),
+            "succeeded": succeeded,
+            "failed": len(items) - succeeded,
+            "items": items,
+        }
@@ -4,8 +4,12 @@
 
 from app.domain.models.department import Department
 from app.domain.repositories.department_repository import DepartmentRepository
+from app.domain.repositories.pagination import Page, PageRequest
+from app.application.services.bulk import BulkResult
 from app.common.exception.exceptions import BusinessException
-from typing import List, Optional
+from django.db import IntegrityError
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 
 class DepartmentService:
@@ -47,7 +51,7 @@ class DepartmentService:
         if description is not None:
             department.description = description  # type: ignore
         if parent_id is not None:
-            department.parent_id = parent_id  # type: ignore
+            department.parent = parent_department  # type: ignore
         self.department_repo.save(department)
         return self._department_to_dict(department)
 
@@ -79,11 +83,13 @@ class DepartmentService:
         if not department:
             raise BusinessException(f"Department with id '{department_id}' not found.")
         
-        # 如果提供了parent_id，验证父部门是否存在
+        # 如果提供了parent_id，验证父部门是否存在，且不能是自身或子孙部门
         if parent_id is not None and parent_id != "":
             parent_department = self.department_repo.find_by_id(parent_id)
             if not parent_department:
                 raise BusinessException(f"Parent department with id '{parent_id}' not found.")
+            if parent_department.id == department.id or department.is_ancestor_of(parent_department):
+                raise BusinessException("Department cannot be moved under itself or its descendants.")
         
         if name is not None:
             department.name = name  # type: ignore
@@ -129,6 +135,163 @@ class DepartmentService:
         departments = self.department_repo.list_all()
         return [self._department_to_dict(dept) for dept in departments]
 
+    def list_departments_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取部门列表
+        """
+        return self.department_repo.list_page(page_request).map(self._department_to_dict)
+
+    async def aget_department(self, department_id: str) -> dict:
+        """
+        根据ID获取部门（异步）
+        """
+        department = await self.department_repo.afind_by_id(department_id)
+        if not department:
+            raise BusinessException(f"Department with id '{department_id}' not found.")
+        return self._department_to_dict(department)
+
+    async def alist_departments_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取部门列表（异步）
+        """
+        return (await self.department_repo.alist_page(page_request)).map(self._department_to_dict)
+
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        部门集合的版本（最后修改时间, 记录数），用于列表接口的条件请求
+        """
+        return self.department_repo.collection_version()
+
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        部门集合的版本（异步）
+        """
+        return await self.department_repo.acollection_version()
+
+    def bulk_create_departments(self, items: List[dict]) -> dict:
+        """
+        批量创建部门，编码唯一性和父部门是否存在各用一次 IN 查询校验
+        """
+        result = BulkResult(len(items))
+        codes = [item["code"] for item in items]
+        parent_ids = [item.get("parent_id") for item in items]
+        result.reject_duplicates(codes, "code")
+        result.reject_existing(
+            codes, self.department_repo.find_ids_by_values("code", codes),
+            "Department with code '{}' already exists.",
+        )
+        result.reject_missing(
+            parent_ids, self.department_repo.find_ids_by_values("id", parent_ids),
+            "Parent department with id '{}' not found.",
+        )
+
+        pending = result.pending()
+        departments = [
+            Department(
+                name=items[index]["name"],
+                code=codes[index],
+                description=items[index].get("description"),
+                rank=items[index].get("rank", 0),
+                auto_bind=items[index].get("auto_bind", False),
+                is_active=items[index].get("is_active", True),
+                mode_type=items[index].get("mode_type", 0),
+                parent_id=parent_ids[index],
+            )
+            for index in pending
+        ]
+        result.write_pending(departments, self.department_repo.bulk_create)
+        return result.to_dict()
+
+    def bulk_update_departments(self, items: List[dict]) -> dict:
+        """
+        批量更新部门，值为None的字段不更新，parent_id 为空字符串时清除父部门
+        """
+        result = BulkResult(len(items))
+        ids = [str(item["id"]) for item in items]
+        codes = [item.get("code") for item in items]
+        parent_ids = [item.get("parent_id") or None for item in items]
+        result.reject_duplicates(ids, "id")
+        departments = self.department_repo.find_by_ids(ids)
+        result.reject_missing(ids, departments, "Department with id '{}' not found.")
+        result.reject_duplicates(codes, "code")
+        result.reject_existing(
+            codes, self.department_repo.find_ids_by_values("code", codes),
+            "Department with code '{}' already exists.", ids,
+        )
+        parents = self.department_repo.find_by_ids({parent_id for parent_id in parent_ids if parent_id})
+        result.reject_missing(parent_ids, parents, "Parent department with id '{}' not found.")
+        for index in result.pending():
+            parent = parents.get(parent_ids[index])
+            if parent is not None and (parent.id == ids[index] or departments[ids[index]].is_ancestor_of(parent)):
+                result.fail(index, "Department cannot be moved under itself or its descendants.")
+
+        fields = set()
+        entities = []
+        for index in result.pending():
+            department, item = departments[ids[index]], items[index]
+            for name in ("name", "code", "description", "rank", "auto_bind", "is_active", "mode_type"):
+                if item.get(name) is not None:
+                    setattr(department, name, item[name])
+                    fields.add(name)
+            if item.get("parent_id") is not None:
+                department.parent_id = parent_ids[index]  # type: ignore
+                fields.add("parent")
+            entities.append(department)
+        result.write_pending(
+            entities, lambda batch: self.department_repo.bulk_update(batch, sorted(fields)), (IntegrityError, ValueError)
+        )
+        return result.to_dict()
+
+    def bulk_delete_departments(self, department_ids: List[str]) -> dict:
+        """
+        批量删除部门
+        """
+        result = BulkResult(len(department_ids))
+        ids = [str(department_id) for department_id in department_ids]
+        result.reject_duplicates(ids, "id")
+        deleted = self.department_repo.bulk_delete([ids[index] for index in result.pending()])
+        result.reject_missing(ids, deleted, "Department with id '{}' not found.")
+        result.succeed_pending(ids)
+        return result.to_dict()
+
+    def get_department_tree(self, root_id: Optional[str] = None) -> List[dict]:
+        """
+        获取部门树，root_id 为空时返回整棵树
+        一次查询取出子树，按 parent_id 挂到父节点下，同级按 rank、name 排序
+        """
+        departments = self.department_repo.list_subtree(root_id)
+        if root_id is not None and not departments:
+            raise BusinessException(f"Department with id '{root_id}' not found.")
+
+        nodes = {department.id: self._department_to_tree_node(department) for department in departments}
+        roots = []
+        for department in departments:
+            parent = nodes.get(department.parent_id) if department.id != root_id else None
+            (parent["children"] if parent is not None else roots).append(nodes[department.id])
+        return roots
+
+    def list_descendants(self, department_id: str, include_self: bool = False) -> List[dict]:
+        """
+        获取部门的全部子孙部门，按层级和 rank 排序
+        """
+        departments = self.department_repo.list_subtree(department_id, include_self)
+        if not departments and not self.department_repo.find_by_id(department_id):
+            raise BusinessException(f"Department with id '{department_id}' not found.")
+        departments.sort(key=lambda department: department.depth)
+        return [self._department_to_dict(department) for department in departments]
+
+    def _department_to_tree_node(self, department: Department) -> dict:
+        return {
+            "id": department.id,
+            "name": department.name,
+            "code": department.code,
+            "rank": department.rank,
+            "is_active": department.is_active,
+            "parent_id": department.parent_id,
+            "depth": department.depth,
+            "children": [],
+        }
+
     def _department_to_dict(self, department: Department) -> dict:
         """
         将Department对象转换为字典
@@ -143,6 +306,7 @@ class DepartmentService:
             "is_active": department.is_active,
             "mode_type": department.mode_type,
             "parent_id": getattr(department, 'parent_id', None),
+            "depth": getattr(department, 'depth', 0),
             "created_time": department.created_time,
             "updated_time": department.updated_time
         }
\ No newline at end of file
@@ -1,14 +1,28 @@
 """
 登录日志相关应用服务
 """
+from django.conf import settings
 from django.utils import timezone
 
 from app.domain.models.login_log import LoginLog
 from app.domain.models.user import User
 from app.domain.repositories.login_log_repository import LoginLogRepository
 from app.domain.repositories.user_repository import UserRepository
+from app.domain.repositories.pagination import Page, PageRequest
 from app.common.exception.exceptions import BusinessException
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+# 导出的字段，与数据表列一一对应
+EXPORT_FIELDS = (
+    "id", "created_time", "creator_id", "status", "login_type",
+    "ipaddress", "browser", "system", "agent",
+)
+
+# 列表快速路径读取的字段
+LIST_FIELDS = (
+    "id", "created_time", "updated_time", "status", "ipaddress",
+    "browser", "system", "agent", "login_type", "creator_id",
+)
 
 
 class LoginLogService:
@@ -108,6 +122,47 @@ class LoginLogService:
         logs = self.login_log_repo.list_all()
         return [self._login_log_to_dict(log) for log in logs]
 
+    def list_login_logs_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取登录日志列表
+        """
+        return self.login_log_repo.list_page(page_request).map(self._login_log_to_dict)
+
+    async def aget_login_log(self, log_id: Union[int, str]) -> dict:
+        """
+        根据ID获取登录日志（异步）
+        """
+        log = await self.login_log_repo.afind_by_id(log_id)
+        if not log:
+            raise BusinessException(f"LoginLog with id '{log_id}' not found.")
+        return self._login_log_to_dict(log)
+
+    async def alist_login_logs_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取登录日志列表（异步）
+        """
+        return (await self.login_log_repo.alist_page(page_request)).map(self._login_log_to_dict)
+
+    def list_login_logs_values_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取登录日志列表的快速路径：只读取列表字段，不构造模型实例
+        """
+        return self.login_log_repo.list_page_values(page_request, LIST_FIELDS).map(self._login_log_values_to_dict)
+
+    async def alist_login_logs_values_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取登录日志列表的快速路径（异步）
+        """
+        page = await self.login_log_repo.alist_page_values(page_request, LIST_FIELDS)
+        return page.map(self._login_log_values_to_dict)
+
+    def export_login_logs(self, filters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        按创建时间顺序逐批读取登录日志，用于流式导出
+        """
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return self.login_log_repo.iter_values(filters or {}, EXPORT_FIELDS, chunk_size)
+
     def _login_log_to_dict(self, log: LoginLog) -> dict:
         """
         将LoginLog对象转换为字典
@@ -121,7 +176,28 @@ class LoginLogService:
             "system": log.system,
             "agent": log.agent,
             # description字段不存在于模型中,
-            "creator_id": log.creator.id if log.creator else None,
+            # 只读取外键列，不需要关联查询用户表；访问 log.creator 会为每条日志查询一次用户
+            "creator_id": log.creator_id,
             "created_time": log.created_time,
             "updated_time": log.updated_time
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def _login_log_values_to_dict(row: Dict[str, Any]) -> dict:
+        """
+        将 LIST_FIELDS 读取的一行转换为与 _login_log_to_dict 相同的字典，键顺序与 LoginLogOut 一致
+        """
+        return {
+            "id": row["id"],
+            "created_time": row["created_time"],
+            "updated_time": row["updated_time"],
+            "description": None,
+            "status": row["status"],
+            "ipaddress": row["ipaddress"],
+            "browser": row["browser"],
+            "system": row["system"],
+            "agent": row["agent"],
+            "login_type": row["login_type"],
+            "creator_id": row["creator_id"],
+            "modifier_id": None,
+        }
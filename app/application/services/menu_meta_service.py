@@ -3,13 +3,17 @@
 """
 
 from app.domain.models.menu_meta import MenuMeta
+from app.domain.repositories.menu_meta_repository import MenuMetaRepository
+from app.domain.repositories.pagination import Page, PageRequest
 from app.common.exception.exceptions import BusinessException
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 
 class MenuMetaService:
-    def __init__(self):
-        pass
+    def __init__(self, menu_meta_repo: Optional[MenuMetaRepository] = None):
+        # 分页查询通过仓储实现，其余操作仍直接使用模型
+        self.menu_meta_repo = menu_meta_repo
 
     def create_menu_meta(
         self,
@@ -131,6 +135,24 @@ class MenuMetaService:
         menu_metas = MenuMeta.objects.all()
         return [self._menu_meta_to_dict(meta) for meta in menu_metas]
 
+    def list_menu_metas_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取菜单元数据列表
+        """
+        return self.menu_meta_repo.list_page(page_request).map(self._menu_meta_to_dict)
+
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        菜单元数据集合的版本（最后修改时间, 记录数），用于列表接口的条件请求
+        """
+        return self.menu_meta_repo.collection_version()
+
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        菜单元数据集合的版本（异步）
+        """
+        return await self.menu_meta_repo.acollection_version()
+
     def _menu_meta_to_dict(self, menu_meta: MenuMeta) -> dict:
         """
         将MenuMeta对象转换为字典
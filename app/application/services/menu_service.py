@@ -4,14 +4,29 @@
 
 from app.domain.models.menu import Menu
 from app.domain.models.menu_meta import MenuMeta
+from app.domain.repositories.menu_repository import MenuRepository
+from app.domain.repositories.user_repository import UserRepository
+from app.domain.services.permission_cache import PermissionCache, get_menu_tree_cache
+from app.domain.repositories.pagination import Page, PageRequest
+from app.application.services.bulk import BulkResult
 from app.common.exception.exceptions import BusinessException
-from typing import List, Optional
+import hashlib
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
 from django.core.exceptions import ObjectDoesNotExist
 
 
 class MenuService:
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        menu_repo: Optional[MenuRepository] = None,
+        user_repo: Optional[UserRepository] = None,
+        menu_tree_cache: Optional[PermissionCache] = None,
+    ):
+        # 分页查询通过仓储实现，其余操作仍直接使用模型
+        self.menu_repo = menu_repo
+        self.user_repo = user_repo
+        self.menu_tree_cache = menu_tree_cache or get_menu_tree_cache()
 
     def create_menu(
         self,
@@ -132,6 +147,175 @@ class MenuService:
         menus = Menu.objects.all()  # type: ignore
         return [self._menu_to_dict(menu) for menu in menus]
 
+    def list_menus_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取菜单列表
+        """
+        return self.menu_repo.list_page(page_request).map(self._menu_to_dict)
+
+    async def aget_menu(self, menu_id: str) -> dict:
+        """
+        根据ID获取菜单（异步）
+        """
+        menu = await self.menu_repo.afind_by_id(menu_id)
+        if not menu:
+            raise BusinessException(f"Menu with id '{menu_id}' not found.")
+        return self._menu_to_dict(menu)
+
+    async def alist_menus_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取菜单列表（异步）
+        """
+        return (await self.menu_repo.alist_page(page_request)).map(self._menu_to_dict)
+
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        菜单集合的版本（最后修改时间, 记录数），用于列表接口的条件请求
+        """
+        return self.menu_repo.collection_version()
+
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        菜单集合的版本（异步）
+        """
+        return await self.menu_repo.acollection_version()
+
+    def get_user_menu_tree(self, user: Any) -> List[dict]:
+        """
+        获取用户可见的菜单树，超级用户可见全部启用菜单
+        按角色集合缓存；未命中时菜单和元数据各一次查询，按ID索引一次遍历组装，同级按 rank 排序
+        """
+        role_ids = None if user.is_superuser else sorted(self.user_repo.list_active_role_ids(user.pk))
+        if role_ids is None:
+            role_set = "*"
+        else:
+            role_set = hashlib.sha1(",".join(role_ids).encode("utf-8")).hexdigest()
+        return self.menu_tree_cache.get(role_set, lambda _: self._build_menu_tree(role_ids))
+
+    def _build_menu_tree(self, role_ids: Optional[List[str]]) -> List[dict]:
+        if role_ids is not None and not role_ids:
+            return []
+        menus = self.menu_repo.list_active_by_roles(role_ids)
+        metas = self.menu_repo.find_metas(menu.meta_id for menu in menus)
+        nodes = {menu.id: self._menu_to_tree_node(menu, metas.get(menu.meta_id)) for menu in menus}
+        roots = []
+        for menu in menus:
+            # 父菜单不可见时挂到根上
+            parent = nodes.get(menu.parent_id) if menu.parent_id != menu.id else None
+            (parent["children"] if parent is not None else roots).append(nodes[menu.id])
+        return roots
+
+    def bulk_create_menus(self, items: List[dict]) -> dict:
+        """
+        批量创建菜单，名称、编码唯一性和元数据是否存在各用一次 IN 查询校验，未提供编码时使用名称
+        """
+        result = BulkResult(len(items))
+        names = [item["name"] for item in items]
+        codes = [item.get("code") or item["name"] for item in items]
+        meta_ids = [item.get("meta_id") for item in items]
+        result.reject_duplicates(names, "name")
+        result.reject_duplicates(codes, "code")
+        result.reject_existing(names, self.menu_repo.find_ids_by_values("name", names), "Menu with name '{}' already exists.")
+        result.reject_existing(codes, self.menu_repo.find_ids_by_values("code", codes), "Menu with code '{}' already exists.")
+        result.reject_missing(meta_ids, self._find_meta_ids(meta_ids), "MenuMeta with id '{}' not found.")
+
+        pending = result.pending()
+        menus = [
+            Menu(
+                menu_type=items[index]["menu_type"],
+                name=names[index],
+                code=codes[index],
+                rank=items[index].get("rank", 0),
+                path=items[index].get("path"),
+                component=items[index].get("component"),
+                is_active=items[index].get("is_active", True),
+                method=items[index].get("method"),
+                parent_id=items[index].get("parent_id"),
+                meta_id=meta_ids[index],
+            )
+            for index in pending
+        ]
+        result.write_pending(menus, self.menu_repo.bulk_create)
+        return result.to_dict()
+
+    def bulk_update_menus(self, items: List[dict]) -> dict:
+        """
+        批量更新菜单，值为None的字段不更新
+        """
+        result = BulkResult(len(items))
+        ids = [str(item["id"]) for item in items]
+        names = [item.get("name") for item in items]
+        meta_ids = [item.get("meta_id") for item in items]
+        result.reject_duplicates(ids, "id")
+        menus = self.menu_repo.find_by_ids(ids)
+        result.reject_missing(ids, menus, "Menu with id '{}' not found.")
+        result.reject_duplicates(names, "name")
+        result.reject_existing(
+            names, self.menu_repo.find_ids_by_values("name", names), "Menu with name '{}' already exists.", ids
+        )
+        result.reject_missing(meta_ids, self._find_meta_ids(meta_ids), "MenuMeta with id '{}' not found.")
+
+        fields = set()
+        entities = []
+        for index in result.pending():
+            menu, item = menus[ids[index]], items[index]
+            for name in ("menu_type", "name", "rank", "path", "component", "is_active", "method", "parent_id", "meta_id"):
+                if item.get(name) is not None:
+                    setattr(menu, name, item[name])
+                    fields.add(name)
+            entities.append(menu)
+        result.write_pending(entities, lambda batch: self.menu_repo.bulk_update(batch, sorted(fields)))
+        return result.to_dict()
+
+    def bulk_delete_menus(self, menu_ids: List[str]) -> dict:
+        """
+        批量删除菜单
+        """
+        result = BulkResult(len(menu_ids))
+        ids = [str(menu_id) for menu_id in menu_ids]
+        result.reject_duplicates(ids, "id")
+        deleted = self.menu_repo.bulk_delete([ids[index] for index in result.pending()])
+        result.reject_missing(ids, deleted, "Menu with id '{}' not found.")
+        result.succeed_pending(ids)
+        return result.to_dict()
+
+    def _find_meta_ids(self, meta_ids: List[Optional[str]]) -> set:
+        """一次查询返回存在的菜单元数据ID"""
+        wanted = {meta_id for meta_id in meta_ids if meta_id}
+        if not wanted:
+            return set()
+        return set(MenuMeta.objects.filter(id__in=wanted).values_list("id", flat=True))  # type: ignore
+
+    def _menu_to_tree_node(self, menu: Menu, meta: Optional[MenuMeta]) -> dict:
+        return {
+            "id": menu.id,
+            "name": menu.name,
+            "code": menu.code,
+            "menu_type": menu.menu_type,
+            "rank": menu.rank,
+            "path": menu.path,
+            "component": menu.component,
+            "redirect": menu.redirect,
+            "method": menu.method,
+            "parent_id": menu.parent_id,
+            "meta": None if meta is None else {
+                "title": meta.title,
+                "icon": meta.icon,
+                "r_svg_name": meta.r_svg_name,
+                "is_show_menu": meta.is_show_menu,
+                "is_show_parent": meta.is_show_parent,
+                "is_keepalive": meta.is_keepalive,
+                "frame_url": meta.frame_url,
+                "frame_loading": meta.frame_loading,
+                "transition_enter": meta.transition_enter,
+                "transition_leave": meta.transition_leave,
+                "is_hidden_tag": meta.is_hidden_tag,
+                "fixed_tag": meta.fixed_tag,
+                "dynamic_level": meta.dynamic_level,
+            },
+            "children": [],
+        }
+
     def _menu_to_dict(self, menu: Menu) -> dict:
         """
         将Menu对象转换为字典
@@ -4,14 +4,45 @@
 
 from app.domain.models.operation_log import OperationLog
 from app.domain.models.user import User
-from app.common.exception.exceptions import BusinessException
-from typing import List, Optional
+from app.domain.repositories.operation_log_repository import OperationLogRepository
+from app.domain.repositories.operation_log_rollup_repository import OperationLogRollupRepository
+from app.domain.repositories.pagination import Page, PageRequest
+from app.common.exception.exceptions import BusinessException, ValidationException
+from app.common.sketch import QuantileSketch
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 
+# 导出的字段，与数据表列一一对应
+EXPORT_FIELDS = (
+    "id", "created_time", "user_id", "oper_name", "dept_name", "module", "title",
+    "business_type", "method", "request_method", "operator_type", "oper_url",
+    "oper_ip", "oper_location", "status", "error_msg", "cost_time",
+    "description", "oper_param", "json_result",
+)
+
+# 列表快速路径读取的字段
+LIST_FIELDS = (
+    "id", "created_time", "description", "module", "oper_url", "oper_param",
+    "request_method", "oper_ip", "json_result", "status", "user_id",
+)
+
+# 统计接口允许的聚合粒度和分组字段
+STATS_GRANULARITIES = ("minute", "hour")
+STATS_GROUP_FIELDS = ("bucket", "module", "business_type", "request_method", "status")
+STATS_QUANTILES = (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+
 
 class OperationLogService:
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        operation_log_repo: Optional[OperationLogRepository] = None,
+        rollup_repo: Optional[OperationLogRollupRepository] = None,
+    ):
+        # 分页查询通过仓储实现，其余操作仍直接使用模型
+        self.operation_log_repo = operation_log_repo
+        self.rollup_repo = rollup_repo
 
     def create_operation_log(
         self,
@@ -133,14 +164,96 @@ class OperationLogService:
         logs = OperationLog.objects.all()  # type: ignore
         return [self._operation_log_to_dict(log) for log in logs]
 
+    def list_operation_logs_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取操作日志列表
+        """
+        return self.operation_log_repo.list_page(page_request).map(self._operation_log_to_dict)
+
+    async def aget_operation_log(self, log_id: Union[int, str]) -> dict:
+        """
+        根据ID获取操作日志（异步）
+        """
+        log = await self.operation_log_repo.afind_by_id(log_id)
+        if not log:
+            raise BusinessException(f"OperationLog with id '{log_id}' not found.")
+        return self._operation_log_to_dict(log)
+
+    async def alist_operation_logs_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取操作日志列表（异步）
+        """
+        return (await self.operation_log_repo.alist_page(page_request)).map(self._operation_log_to_dict)
+
+    def list_operation_logs_values_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取操作日志列表的快速路径：只读取列表字段，不构造模型实例，结果与 list_operation_logs_page 相同
+        """
+        page = self.operation_log_repo.list_page_values(page_request, LIST_FIELDS)
+        return page.map(self._operation_log_values_to_dict)
+
+    async def alist_operation_logs_values_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取操作日志列表的快速路径（异步）
+        """
+        page = await self.operation_log_repo.alist_page_values(page_request, LIST_FIELDS)
+        return page.map(self._operation_log_values_to_dict)
+
+    def export_operation_logs(self, filters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        按创建时间顺序逐批读取操作日志，用于流式导出
+        """
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return self.operation_log_repo.iter_values(filters or {}, EXPORT_FIELDS, chunk_size)
+
+    def get_operation_log_stats(
+        self,
+        start: datetime,
+        end: datetime,
+        granularity: str = "hour",
+        group_by: Sequence[str] = (),
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> dict:
+        """
+        基于预聚合数据统计操作日志，统计范围为起点落在 [start, end) 内的聚合桶
+        """
+        if granularity not in STATS_GRANULARITIES:
+            raise ValidationException(f"Unsupported granularity: {granularity}")
+        unknown = [name for name in group_by if name not in STATS_GROUP_FIELDS]
+        if unknown:
+            raise ValidationException(f"Unsupported group_by: {', '.join(unknown)}")
+        if start >= end:
+            raise ValidationException("start must be earlier than end.")
+
+        total = _StatsAccumulator()
+        groups: Dict[tuple, _StatsAccumulator] = {}
+        for row in self.rollup_repo.iter_rollups(granularity, start, end, filters):
+            key = tuple(row[name] for name in group_by)
+            accumulator = groups.get(key)
+            if accumulator is None:
+                accumulator = groups[key] = _StatsAccumulator()
+            sketch = QuantileSketch.from_json(row["sketch"])
+            accumulator.add(row, sketch)
+            total.add(row, sketch)
+
+        return {
+            "start": start,
+            "end": end,
+            "granularity": granularity,
+            "group_by": list(group_by),
+            "total": total.summary({}),
+            "groups": [
+                groups[key].summary(dict(zip(group_by, key)))
+                for key in sorted(groups, key=lambda k: tuple(str(v) for v in k))
+            ],
+        }
+
     def _operation_log_to_dict(self, log: OperationLog) -> dict:
         """
         将OperationLog对象转换为字典
         """
-        # 获取用户ID，处理可能的外键关系
-        creator_id = None
-        if hasattr(log, 'user') and log.user:
-            creator_id = getattr(log.user, 'id', None)
+        # 只读取外键列，不需要关联查询用户表；访问 log.user 会为每条日志查询一次用户
+        creator_id = log.user_id
         
         # 处理状态码转换
         status_code = None
@@ -164,4 +277,61 @@ class OperationLogService:
             "creator_id": creator_id,  # 对应字段
             "created_time": log.created_time,
             "updated_time": getattr(log, 'updated_time', log.created_time)  # 可能不存在的字段
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def _operation_log_values_to_dict(row: Dict[str, Any]) -> dict:
+        """
+        将 LIST_FIELDS 读取的一行转换为与 _operation_log_to_dict 相同的字典，键顺序与 OperationLogOut 一致
+        """
+        status = row["status"]
+        return {
+            "id": row["id"],
+            "created_time": row["created_time"],
+            "updated_time": row["created_time"],
+            "description": row["description"],
+            "module": row["module"],
+            "path": row["oper_url"],
+            "body": row["oper_param"],
+            "method": row["request_method"],
+            "ipaddress": row["oper_ip"],
+            "browser": None,
+            "system": None,
+            "response_code": None,
+            "response_result": row["json_result"],
+            "status_code": None if status is None else int(status),
+            "creator_id": row["user_id"],
+            "modifier_id": None,
+        }
+
+
+class _StatsAccumulator:
+    """合并多个聚合行的计数、耗时和分位数草图"""
+
+    def __init__(self):
+        self.count = 0
+        self.error_count = 0
+        self.cost_sum = 0
+        self.cost_max = 0
+        self.sketch = QuantileSketch()
+
+    def add(self, row: Dict[str, Any], sketch: QuantileSketch) -> None:
+        self.count += row["count"]
+        if not row["status"]:
+            self.error_count += row["count"]
+        self.cost_sum += row["cost_sum"]
+        self.cost_max = max(self.cost_max, row["cost_max"])
+        self.sketch.merge(sketch)
+
+    def summary(self, key: Dict[str, Any]) -> dict:
+        data = {
+            "key": key,
+            "count": self.count,
+            "error_count": self.error_count,
+            "error_rate": self.error_count / self.count if self.count else 0.0,
+            "avg_cost_time": self.cost_sum / self.count if self.count else None,
+            "max_cost_time": self.cost_max if self.count else None,
+        }
+        for name, q in STATS_QUANTILES:
+            data[name] = self.sketch.quantile(q)
+        return data
@@ -4,6 +4,7 @@
 
 from app.domain.repositories.permission_repository import PermissionRepository
 from django.contrib.auth.models import Permission
+from app.domain.repositories.pagination import Page, PageRequest
 from app.common.exception.exceptions import BusinessException
 from typing import List
 
@@ -77,11 +78,20 @@ class PermissionService:
         获取所有权限列表
         """
         permissions = self.permission_repo.list_all()
-        return [
-            {
-                "id": permission.pk,
-                "name": permission.name,
-                "codename": permission.codename,
-            }
-            for permission in permissions
-        ]
\ No newline at end of file
+        return [self._permission_to_dict(permission) for permission in permissions]
+
+    def list_permissions_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取权限列表
+        """
+        return self.permission_repo.list_page(page_request).map(self._permission_to_dict)
+
+    def _permission_to_dict(self, permission: Permission) -> dict:
+        """
+        将Permission对象转换为字典
+        """
+        return {
+            "id": permission.pk,
+            "name": permission.name,
+            "codename": permission.codename,
+        }
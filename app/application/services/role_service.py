@@ -4,8 +4,11 @@
 
 from app.domain.repositories.role_repository import RoleRepository
 from app.domain.models.role import Role
+from app.domain.repositories.pagination import Page, PageRequest
+from app.application.services.bulk import BulkResult
 from app.common.exception.exceptions import BusinessException
-from typing import List, Union, Optional
+from datetime import datetime
+from typing import List, Union, Optional, Tuple
 
 
 class RoleService:
@@ -81,6 +84,99 @@ class RoleService:
         roles = self.role_repo.list_all()
         return [{"id": role.id, "name": role.name, "description": role.description} for role in roles]
 
+    def list_roles_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取角色列表
+        """
+        return self.role_repo.list_page(page_request).map(lambda role: {"id": role.id, "name": role.name, "description": role.description})
+
+    async def aget_role(self, role_id: Union[str, int]) -> dict:
+        """
+        根据ID获取角色（异步）
+        """
+        role = await self.role_repo.afind_by_id(role_id)
+        if not role:
+            raise BusinessException(f"Role with id '{role_id}' not found.")
+        return {"id": role.id, "name": role.name, "description": role.description}
+
+    async def alist_roles_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取角色列表（异步）
+        """
+        page = await self.role_repo.alist_page(page_request)
+        return page.map(lambda role: {"id": role.id, "name": role.name, "description": role.description})
+
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        角色集合的版本（最后修改时间, 记录数），用于列表接口的条件请求
+        """
+        return self.role_repo.collection_version()
+
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        角色集合的版本（异步）
+        """
+        return await self.role_repo.acollection_version()
+
+    def bulk_create_roles(self, items: List[dict]) -> dict:
+        """
+        批量创建角色，名称和编码各用一次 IN 查询校验唯一性，未提供编码时使用名称
+        """
+        result = BulkResult(len(items))
+        names = [item["name"] for item in items]
+        codes = [item.get("code") or item["name"] for item in items]
+        result.reject_duplicates(names, "name")
+        result.reject_duplicates(codes, "code")
+        result.reject_existing(names, self.role_repo.find_ids_by_values("name", names), "Role with name '{}' already exists.")
+        result.reject_existing(codes, self.role_repo.find_ids_by_values("code", codes), "Role with code '{}' already exists.")
+
+        pending = result.pending()
+        roles = [
+            Role(name=names[index], code=codes[index], description=items[index]["description"], is_active=True)
+            for index in pending
+        ]
+        result.write_pending(roles, self.role_repo.bulk_create)
+        return result.to_dict()
+
+    def bulk_update_roles(self, items: List[dict]) -> dict:
+        """
+        批量更新角色，值为None的字段不更新
+        """
+        result = BulkResult(len(items))
+        ids = [str(item["id"]) for item in items]
+        names = [item.get("name") for item in items]
+        result.reject_duplicates(ids, "id")
+        roles = self.role_repo.find_by_ids(ids)
+        result.reject_missing(ids, roles, "Role with id '{}' not found.")
+        result.reject_duplicates(names, "name")
+        result.reject_existing(
+            names, self.role_repo.find_ids_by_values("name", names), "Role with name '{}' already exists.", ids
+        )
+
+        fields = set()
+        entities = []
+        for index in result.pending():
+            role, item = roles[ids[index]], items[index]
+            for name in ("name", "description"):
+                if item.get(name) is not None:
+                    setattr(role, name, item[name])
+                    fields.add(name)
+            entities.append(role)
+        result.write_pending(entities, lambda batch: self.role_repo.bulk_update(batch, sorted(fields)))
+        return result.to_dict()
+
+    def bulk_delete_roles(self, role_ids: List[str]) -> dict:
+        """
+        批量删除角色
+        """
+        result = BulkResult(len(role_ids))
+        ids = [str(role_id) for role_id in role_ids]
+        result.reject_duplicates(ids, "id")
+        deleted = self.role_repo.bulk_delete([ids[index] for index in result.pending()])
+        result.reject_missing(ids, deleted, "Role with id '{}' not found.")
+        result.succeed_pending(ids)
+        return result.to_dict()
+
     def assign_permissions_to_role(
         self, role_id: Union[str, int], permission_ids: List[int]
     ) -> None:
@@ -3,14 +3,24 @@
 """
 
 from app.domain.models.system_config import SystemConfig
+from app.domain.repositories.system_config_repository import SystemConfigRepository
+from app.domain.repositories.pagination import Page, PageRequest
+from app.domain.services.config_snapshot import SystemConfigSnapshot, get_config_snapshot
 from app.common.exception.exceptions import BusinessException
 from django.core.exceptions import ObjectDoesNotExist
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 
 class SystemConfigService:
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        system_config_repo: Optional[SystemConfigRepository] = None,
+        snapshot: Optional[SystemConfigSnapshot] = None,
+    ):
+        # 分页查询通过仓储实现，其余操作仍直接使用模型
+        self.system_config_repo = system_config_repo
+        self.snapshot = snapshot or get_config_snapshot()
 
     def create_system_config(
         self,
@@ -59,6 +69,15 @@ class SystemConfigService:
         except ObjectDoesNotExist:
             raise BusinessException(f"SystemConfig with key '{key}' not found.")
 
+    def get_config_values(self, keys: List[str]) -> dict:
+        """
+        从配置快照批量获取类型化的配置值，不查询数据库
+        keys 中的元素可以是逗号分隔的多个键，不存在或未启用的键放在 missing 中
+        """
+        keys = list(dict.fromkeys(key.strip() for item in keys for key in item.split(",") if key.strip()))
+        values = self.snapshot.get_many(keys)
+        return {"values": values, "missing": [key for key in keys if key not in values]}
+
     def update_system_config(
         self,
         config_id: str,
@@ -114,6 +133,39 @@ class SystemConfigService:
         configs = SystemConfig.objects.all()
         return [self._system_config_to_dict(config) for config in configs]
 
+    def list_system_configs_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取系统配置列表
+        """
+        return self.system_config_repo.list_page(page_request).map(self._system_config_to_dict)
+
+    async def aget_system_config(self, config_id: str) -> dict:
+        """
+        根据ID获取系统配置（异步）
+        """
+        config = await self.system_config_repo.afind_by_id(config_id)
+        if not config:
+            raise BusinessException(f"SystemConfig with id '{config_id}' not found.")
+        return self._system_config_to_dict(config)
+
+    async def alist_system_configs_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取系统配置列表（异步）
+        """
+        return (await self.system_config_repo.alist_page(page_request)).map(self._system_config_to_dict)
+
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        系统配置集合的版本（最后修改时间, 记录数），用于列表接口的条件请求
+        """
+        return self.system_config_repo.collection_version()
+
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        系统配置集合的版本（异步）
+        """
+        return await self.system_config_repo.acollection_version()
+
     def _system_config_to_dict(self, config: SystemConfig) -> dict:
         """
         将SystemConfig对象转换为字典
@@ -4,8 +4,11 @@
 
 from app.domain.repositories.user_repository import UserRepository
 from app.domain.models.user import User
+from app.domain.repositories.pagination import Page, PageRequest
+from app.application.services.bulk import BulkResult
 from app.common.exception.exceptions import BusinessException
-from typing import List
+from app.common.hashing import hash_passwords
+from typing import List, Union
 
 
 class UserService:
@@ -66,6 +69,96 @@ class UserService:
         users = self.user_repo.list_all()
         return [{"id": user.id, "username": user.username, "email": user.email} for user in users]
 
+    def list_users_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取用户列表
+        """
+        return self.user_repo.list_page(page_request).map(lambda user: {"id": user.id, "username": user.username, "email": user.email})
+
+    async def aget_user(self, user_id: Union[int, str]) -> dict:
+        """
+        根据ID获取用户（异步）
+        """
+        user = await self.user_repo.afind_by_id(user_id)
+        if not user:
+            raise BusinessException(f"User with id '{user_id}' not found.")
+        return {"id": user.id, "username": user.username, "email": user.email}
+
+    async def alist_users_page(self, page_request: PageRequest) -> Page[dict]:
+        """
+        分页获取用户列表（异步）
+        """
+        page = await self.user_repo.alist_page(page_request)
+        return page.map(lambda user: {"id": user.id, "username": user.username, "email": user.email})
+
+    def bulk_create_users(self, items: List[dict]) -> dict:
+        """
+        批量创建用户
+        用户名唯一性用一次 IN 查询校验，密码在线程池中并行哈希，通过校验的用户在一个事务中插入
+        """
+        result = BulkResult(len(items))
+        usernames = [item["username"] for item in items]
+        result.reject_duplicates(usernames, "username")
+        result.reject_existing(
+            usernames, self.user_repo.find_ids_by_values("username", usernames),
+            "User with username '{}' already exists.",
+        )
+
+        pending = result.pending()
+        passwords = hash_passwords([items[index]["password"] for index in pending])
+        users = [
+            User(username=items[index]["username"], email=items[index]["email"], password=password)
+            for index, password in zip(pending, passwords)
+        ]
+        result.write_pending(users, self.user_repo.bulk_create)
+        return result.to_dict()
+
+    def bulk_update_users(self, items: List[dict]) -> dict:
+        """
+        批量更新用户，值为None的字段不更新
+        """
+        result = BulkResult(len(items))
+        ids = [str(item["id"]) for item in items]
+        usernames = [item.get("username") for item in items]
+        result.reject_duplicates(ids, "id")
+        users = self.user_repo.find_by_ids(ids)
+        result.reject_missing(ids, users, "User with id '{}' not found.")
+        result.reject_duplicates(usernames, "username")
+        result.reject_existing(
+            usernames, self.user_repo.find_ids_by_values("username", usernames),
+            "User with username '{}' already exists.", ids,
+        )
+
+        pending = result.pending()
+        with_password = [index for index in pending if items[index].get("password") is not None]
+        hashed = dict(zip(with_password, hash_passwords([items[index]["password"] for index in with_password])))
+        fields = set()
+        entities = []
+        for index in pending:
+            user, item = users[ids[index]], items[index]
+            for name in ("username", "email"):
+                if item.get(name) is not None:
+                    setattr(user, name, item[name])
+                    fields.add(name)
+            if index in hashed:
+                user.password = hashed[index]
+                fields.add("password")
+            entities.append(user)
+        result.write_pending(entities, lambda batch: self.user_repo.bulk_update(batch, sorted(fields)))
+        return result.to_dict()
+
+    def bulk_delete_users(self, user_ids: List[str]) -> dict:
+        """
+        批量删除用户
+        """
+        result = BulkResult(len(user_ids))
+        ids = [str(user_id) for user_id in user_ids]
+        result.reject_duplicates(ids, "id")
+        deleted = self.user_repo.bulk_delete([ids[index] for index in result.pending()])
+        result.reject_missing(ids, deleted, "User with id '{}' not found.")
+        result.succeed_pending(ids)
+        return result.to_dict()
+
     def assign_role_to_user(self, user_id: int, role_id: int) -> None:
         """
         为用户分配角色
@@ -3,8 +3,15 @@
 """
 
 from datetime import datetime
-from typing import Optional, TypeVar, Generic, Any
+from typing import Optional, TypeVar, Generic, Any, Type
+
+from django.conf import settings
+from django.http import HttpResponse
+from pydantic import BaseModel
+
 from app.api.schemas import ApiResponse
+from app.common.metrics import measure_render
+from app.common.serialization import dumps
 
 
 T = TypeVar('T')
@@ -20,6 +27,22 @@ def success(data: Optional[T] = None, message: str = "Success", code: int = 200)
     )
 
 
+def fast_success(
+    data: Any = None, message: str = "Success", code: int = 200, schema: Optional[Type[BaseModel]] = None
+) -> HttpResponse:
+    """
+    成功响应的快速路径，用于大列表：直接用 orjson 编码与 success() 相同的 {code, message, data, timestamp}，
+    不经过 ApiResponse 模型和 ninja 的响应校验。
+    FAST_RESPONSE_VALIDATE 开启时（默认跟随 DEBUG）按 schema（接口声明的响应类型）校验，校验失败时抛出异常
+    """
+    payload = {"code": code, "message": message, "data": data, "timestamp": datetime.now()}
+    if schema is not None and getattr(settings, "FAST_RESPONSE_VALIDATE", False):
+        schema.model_validate(payload)
+    with measure_render():
+        content = dumps(payload)
+    return HttpResponse(content, content_type="application/json; charset=utf-8")
+
+
 def error(message: str = "Error", code: int = 400, data: Optional[Any] = None) -> ApiResponse[Any]:
     """错误响应"""
     return ApiResponse(
@@ -0,0 +1,173 @@
+"""
+缓存工具
+- LRUCache: 进程内线程安全的LRU缓存
+- 版本号：基于Django缓存框架的命名空间版本号，数据变更时递增版本号即可让旧缓存整体失效
+- is_shared_cache: 判断缓存后端是否在多进程间共享
+- shared_cache_stats: 本进程对Django缓存中数据条目（权限、接口响应）的命中统计
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from loguru import logger
+
+VERSION_KEY_PREFIX = "cache-version"
+
+
+class LRUCache:
+    """
+    进程内LRU缓存
+    超出 maxsize 时淘汰最久未使用的条目，ttl 大于0时条目过期后视为未命中
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 0):
+        self.maxsize = max(1, int(maxsize))
+        self.ttl = max(0.0, float(ttl))
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            value, expires_at = item
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+class CacheStats:
+    """缓存命中统计，进程内计数"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+# 权限缓存和接口响应缓存读取Django缓存时记录
+shared_cache_stats = CacheStats()
+
+
+# ----------------------------
+# 命名空间版本号
+# ----------------------------
+# 版本号以纳秒时间戳作为初始值，版本键被淘汰后重新初始化也不会回退到旧版本号，
+# 旧版本号下的缓存条目不会再次被命中。共享缓存不可用时使用进程内版本号兜底
+_local_versions: Dict[str, int] = {}
+_versions_lock = threading.Lock()
+
+# 只在本进程内有效的缓存后端，多进程部署时各进程的数据和版本号互不可见
+LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def is_shared_cache(alias: str = "default") -> bool:
+    """缓存后端是否在多个进程间共享（Redis、Memcached、数据库、文件等）"""
+    backend = settings.CACHES.get(alias, {}).get("BACKEND", "")
+    return bool(backend) and backend not in LOCAL_CACHE_BACKENDS
+
+
+def _version_key(namespace: str) -> str:
+    return f"{VERSION_KEY_PREFIX}:{namespace}"
+
+
+def _local_version(namespace: str, bump: bool = False) -> int:
+    with _versions_lock:
+        version = _local_versions.get(namespace, 0)
+        if bump or not version:
+            version = max(version + 1, time.time_ns())
+            _local_versions[namespace] = version
+        return version
+
+
+def get_cache_version(namespace: str, alias: str = "default") -> int:
+    """获取命名空间当前版本号，版本键不存在时以当前时间戳初始化"""
+    key = _version_key(namespace)
+    try:
+        cache = caches[alias]
+        version = cache.get(key)
+        if version is None:
+            # 多个进程同时初始化时只有一个写入成功，再读取一次得到同一个版本号
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+    except Exception as e:
+        logger.warning(f"Failed to read cache version for '{namespace}': {e}")
+        version = None
+    if version is None:
+        return _local_version(namespace)
+    return int(version)
+
+
+def bump_cache_version(namespace: str, alias: str = "default") -> int:
+    """递增命名空间版本号，使该命名空间下的所有缓存失效"""
+    local_version = _local_version(namespace, bump=True)
+    key = _version_key(namespace)
+    try:
+        cache = caches[alias]
+        try:
+            return int(cache.incr(key))
+        except ValueError:
+            # 键不存在（未初始化或已被淘汰）时以当前时间戳初始化，大于此前的任何版本号
+            version = max(local_version, time.time_ns())
+            cache.set(key, version, timeout=None)
+            return version
+    except Exception as e:
+        logger.warning(f"Failed to bump cache version for '{namespace}': {e}")
+        return local_version
@@ -0,0 +1,35 @@
+"""
+密码批量哈希
+PBKDF2 / Argon2 等哈希函数在计算期间会释放 GIL，放到线程池中可以利用多核并行计算，
+批量创建用户时哈希耗时从 N 倍单次耗时降为约 N / 线程数 倍。
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(workers: int) -> ThreadPoolExecutor:
+    """进程内共享的哈希线程池，首次使用时创建"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+    return _executor
+
+
+def hash_passwords(passwords: Sequence[str]) -> List[str]:
+    """
+    按输入顺序返回密码哈希，PASSWORD_HASH_WORKERS 小于等于1或只有一个密码时直接在当前线程计算
+    """
+    workers = int(getattr(settings, "PASSWORD_HASH_WORKERS", 4))
+    if workers <= 1 or len(passwords) <= 1:
+        return [make_password(password) for password in passwords]
+    return list(_get_executor(workers).map(make_password, passwords))
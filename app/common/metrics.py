@@ -0,0 +1,300 @@
+"""
+接口指标
+按路由（ninja-extra 的 operation id）和请求方法聚合请求数、延迟、SQL查询数和耗时、响应渲染耗时和响应大小，
+以 Prometheus 文本格式输出。
+
+- 每个线程写入自己的分片；分片各有一把锁，只有输出时复制该分片才会与写入竞争；
+  线程结束时其分片合并进已退出线程的汇总并移除，分片数不随线程数增长
+- 配置 METRICS_MULTIPROC_DIR 后，每个进程定期把快照写入该目录下的 metrics_<pid>.json，
+  输出时合并目录中所有进程的快照；gunicorn 回收 worker 时由主进程把其快照合并进 metrics_archive.json，
+  计数在 worker 重启后不会丢失
+"""
+
+import glob
+import json
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+# 直方图 -> (说明, 桶上界)
+HISTOGRAMS: Dict[str, Tuple[str, Tuple[float, ...]]] = {
+    "http_request_duration_seconds": (
+        "Request latency in seconds.",
+        (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    ),
+    "http_request_db_queries": (
+        "Database queries executed per request.",
+        (0, 1, 2, 3, 5, 10, 20, 50, 100),
+    ),
+    "http_request_db_seconds": (
+        "Time spent executing SQL per request in seconds.",
+        (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    ),
+    "http_response_render_seconds": (
+        "Time spent serializing the response body in seconds.",
+        (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+    ),
+    "http_response_size_bytes": (
+        "Response body size in bytes.",
+        (128, 512, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+    ),
+}
+
+ARCHIVE_FILE = "metrics_archive.json"
+
+
+class RequestMetrics:
+    """单个请求的计量，由中间件创建，SQL包装器和渲染器累加"""
+
+    __slots__ = ("queries", "db_seconds", "render_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.render_seconds = 0.0
+
+
+# 当前请求的计量；sync_to_async 复制上下文，异步视图中的查询也累加到同一个对象
+current_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("current_request_metrics", default=None)
+
+
+@contextmanager
+def measure_render():
+    """把上下文中的耗时计入当前请求的序列化耗时，不在请求中时不计时"""
+    metrics = current_request_metrics.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.render_seconds += time.perf_counter() - start
+
+
+def _new_series() -> Dict[str, Any]:
+    return {
+        "status": {},
+        "hist": {name: [0] * (len(buckets) + 1) + [0.0] for name, (_, buckets) in HISTOGRAMS.items()},
+    }
+
+
+class _ShardOwner:
+    """线程本地持有的分片句柄，线程结束时随线程本地存储一起释放，触发分片回收"""
+
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self, shard: Tuple[threading.Lock, Dict[Tuple[str, str], Dict[str, Any]]]):
+        self.shard = shard
+
+
+def _bucket_index(buckets: Tuple[float, ...], value: float) -> int:
+    for index, bound in enumerate(buckets):
+        if value <= bound:
+            return index
+    return len(buckets)
+
+
+class MetricsRegistry:
+    """
+    进程内指标
+    series 结构：{(路由, 方法): {"status": {状态码: 次数}, "hist": {名称: [各桶计数..., 溢出桶计数, 总和]}}}
+    """
+
+    def __init__(self, multiproc_dir: str = "", flush_interval: float = 5.0):
+        self.multiproc_dir = multiproc_dir
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Lock, Dict[Tuple[str, str], Dict[str, Any]]]] = []
+        # 已退出线程的计数；_shards_lock 保护分片列表和该汇总，回调可能在持锁的线程中触发，使用可重入锁
+        self._retired: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._shards_lock = threading.RLock()
+        self._next_flush = 0.0
+
+    def _shard(self) -> Tuple[threading.Lock, Dict[Tuple[str, str], Dict[str, Any]]]:
+        owner = getattr(self._local, "owner", None)
+        if owner is None:
+            shard = (threading.Lock(), {})
+            owner = self._local.owner = _ShardOwner(shard)
+            # 线程结束后线程本地存储释放 owner，回收该线程的分片
+            weakref.finalize(owner, self._retire, shard).atexit = False
+            with self._shards_lock:
+                self._shards.append(shard)
+        return owner.shard
+
+    def _retire(self, shard: Tuple[threading.Lock, Dict[Tuple[str, str], Dict[str, Any]]]) -> None:
+        """把已退出线程的分片合并进汇总并移除"""
+        lock, series = shard
+        with self._shards_lock, lock:
+            for key, data in series.items():
+                _merge_series(self._retired, key, data)
+            series.clear()
+            try:
+                self._shards.remove(shard)
+            except ValueError:
+                pass
+
+    def observe(self, route: str, method: str, status: int, values: Dict[str, float]) -> None:
+        """记录一个请求，values 为直方图名称到观测值的映射"""
+        lock, shard = self._shard()
+        status_key = str(status)
+        with lock:
+            series = shard.get((route, method))
+            if series is None:
+                series = shard[(route, method)] = _new_series()
+            series["status"][status_key] = series["status"].get(status_key, 0) + 1
+            for name, value in values.items():
+                buckets = HISTOGRAMS[name][1]
+                hist = series["hist"][name]
+                hist[_bucket_index(buckets, value)] += 1
+                hist[-1] += value
+        if self.multiproc_dir and time.monotonic() >= self._next_flush:
+            self.flush()
+
+    def snapshot(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """合并本进程所有线程的分片和已退出线程的汇总，持有分片的锁时复制，写入线程不会在迭代中途修改"""
+        merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        with self._shards_lock:
+            for key, series in self._retired.items():
+                _merge_series(merged, key, series)
+            for lock, shard in list(self._shards):
+                with lock:
+                    for key, series in shard.items():
+                        _merge_series(merged, key, series)
+        return merged
+
+    def flush(self) -> None:
+        """把本进程的快照写入共享目录，先写临时文件再替换，读取方不会读到写了一半的文件"""
+        self._next_flush = time.monotonic() + self.flush_interval
+        if not self.multiproc_dir:
+            return
+        try:
+            path = os.path.join(self.multiproc_dir, f"metrics_{os.getpid()}.json")
+            _write_series(path, self.snapshot())
+        except OSError as e:
+            logger.warning(f"Failed to write metrics snapshot: {e}")
+
+    def collect(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """需要输出的全部指标：单进程时为本进程快照，多进程时为共享目录中所有快照之和"""
+        if not self.multiproc_dir:
+            return self.snapshot()
+        self.flush()
+        merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for path in glob.glob(os.path.join(self.multiproc_dir, "metrics_*.json")):
+            for key, series in _read_series(path).items():
+                _merge_series(merged, key, series)
+        return merged
+
+    def render(self) -> str:
+        return render_prometheus(self.collect())
+
+
+def _merge_series(merged: Dict[Tuple[str, str], Dict[str, Any]], key: Tuple[str, str], series: Dict[str, Any]) -> None:
+    target = merged.get(key)
+    if target is None:
+        target = merged[key] = _new_series()
+    for status, count in series["status"].items():
+        target["status"][status] = target["status"].get(status, 0) + count
+    for name, values in series["hist"].items():
+        if name in target["hist"] and len(values) == len(target["hist"][name]):
+            target["hist"][name] = [a + b for a, b in zip(target["hist"][name], values)]
+
+
+def _write_series(path: str, series: Dict[Tuple[str, str], Dict[str, Any]]) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump([[route, method, data] for (route, method), data in series.items()], f)
+    os.replace(tmp_path, path)
+
+
+def _read_series(path: str) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {(route, method): data for route, method, data in json.load(f)}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read metrics snapshot {path}: {e}")
+        return {}
+
+
+def archive_process(multiproc_dir: str, pid: int) -> None:
+    """
+    worker 退出后由 gunicorn 主进程调用：把该进程的快照合并进归档文件并删除
+    只有主进程写归档文件，不需要加锁
+    """
+    path = os.path.join(multiproc_dir, f"metrics_{pid}.json")
+    if not os.path.exists(path):
+        return
+    archive_path = os.path.join(multiproc_dir, ARCHIVE_FILE)
+    merged = _read_series(archive_path) if os.path.exists(archive_path) else {}
+    for key, series in _read_series(path).items():
+        _merge_series(merged, key, series)
+    _write_series(archive_path, merged)
+    os.remove(path)
+
+
+def clear_multiproc_dir(multiproc_dir: str) -> None:
+    """服务启动时清空上次运行留下的快照"""
+    os.makedirs(multiproc_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(multiproc_dir, "metrics_*.json")):
+        os.remove(path)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
+
+
+def render_prometheus(series: Dict[Tuple[str, str], Dict[str, Any]]) -> str:
+    """按 Prometheus 文本格式（0.0.4）输出"""
+    keys = sorted(series)
+    lines = ["# HELP http_requests_total Total HTTP requests.", "# TYPE http_requests_total counter"]
+    for route, method in keys:
+        labels = f'route="{_escape_label(route)}",method="{method}"'
+        for status, count in sorted(series[(route, method)]["status"].items()):
+            lines.append(f'http_requests_total{{{labels},status="{status}"}} {count}')
+
+    for name, (help_text, buckets) in HISTOGRAMS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for route, method in keys:
+            labels = f'route="{_escape_label(route)}",method="{method}"'
+            hist = series[(route, method)]["hist"][name]
+            cumulative = 0
+            for bound, count in zip(_bucket_bounds(buckets), hist[:-1]):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {_format_number(hist[-1])}")
+            lines.append(f"{name}_count{{{labels}}} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def _bucket_bounds(buckets: Iterable[float]) -> List[str]:
+    return [_format_number(bound) for bound in buckets] + ["+Inf"]
+
+
+_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """进程内共享的指标注册表"""
+    global _registry
+    if _registry is None:
+        from django.conf import settings
+
+        config = getattr(settings, "METRICS", {})
+        _registry = MetricsRegistry(
+            multiproc_dir=config.get("MULTIPROC_DIR", ""),
+            flush_interval=config.get("FLUSH_INTERVAL", 5.0),
+        )
+    return _registry
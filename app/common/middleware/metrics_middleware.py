@@ -0,0 +1,139 @@
+"""
+接口指标中间件
+统计每个请求的延迟、SQL查询数和耗时、响应大小，按路由（ninja-extra 的 operation id）写入指标注册表
+"""
+
+import re
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpRequest
+from ninja.operation import PathView
+
+from app.common.metrics import RequestMetrics, current_request_metrics, get_metrics_registry
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def record_sql(execute, sql, params, many, context):
+    """SQL执行包装器，把查询数和耗时累加到当前请求的计量"""
+    metrics = current_request_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_seconds += time.perf_counter() - start
+
+
+def install_sql_wrapper(sender, connection, **kwargs):
+    """数据库连接建立时安装SQL包装器；连接对象按线程复用，重连时不重复安装"""
+    if record_sql not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_sql)
+
+
+connection_created.connect(install_sql_wrapper, dispatch_uid="metrics_install_sql_wrapper")
+
+
+# (视图函数, 请求方法) -> operation id
+_operation_ids: Dict[Tuple[Callable, str], Optional[str]] = {}
+
+
+def resolve_operation_id(view_func: Callable, method: str) -> Optional[str]:
+    """
+    从 ninja 的路径视图中找到处理该方法的 operation，返回其 operation id
+    ninja 的视图函数是绑定了 PathView 的闭包，结果按视图函数缓存。
+    ninja-extra 自动生成的 id 带有每个进程随机的后缀（控制器_函数名_随机串），这里去掉后缀，
+    保证多个 worker 和重启前后的标签一致
+    """
+    key = (view_func, method)
+    if key in _operation_ids:
+        return _operation_ids[key]
+    operation_id = None
+    path_view = next(
+        (
+            cell.cell_contents
+            for cell in getattr(view_func, "__closure__", None) or ()
+            if isinstance(cell.cell_contents, PathView)
+        ),
+        None,
+    )
+    if path_view is not None:
+        for operation in path_view.operations:
+            if method in operation.methods:
+                operation_id = operation.operation_id or operation.api.get_openapi_operation_id(operation)
+                func_name = getattr(operation.view_func, "__name__", "")
+                operation_id = re.sub(rf"(_{re.escape(func_name)})_[0-9a-f]{{8}}$", r"\1", operation_id)
+                break
+    _operation_ids[key] = operation_id
+    return operation_id
+
+
+class MetricsMiddleware:
+    """请求计时中间件，同时支持WSGI和ASGI"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response, registry=None):
+        if not getattr(settings, "METRICS", {}).get("ENABLED", True):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.registry = registry or get_metrics_registry()
+        # 中间件加载前已经建立的连接不会再触发 connection_created
+        for connection in connections.all(initialized_only=True):
+            install_sql_wrapper(None, connection)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics, start = RequestMetrics(), time.perf_counter()
+        token = current_request_metrics.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_request_metrics.reset(token)
+        self._finish(request, response, metrics, start)
+        return response
+
+    async def __acall__(self, request: HttpRequest):
+        metrics, start = RequestMetrics(), time.perf_counter()
+        token = current_request_metrics.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_request_metrics.reset(token)
+        self._finish(request, response, metrics, start)
+        return response
+
+    def process_view(self, request: HttpRequest, view_func, view_args, view_kwargs):
+        request._metrics_route = resolve_operation_id(view_func, request.method or "")  # type: ignore[attr-defined]
+        return None
+
+    def _finish(self, request: HttpRequest, response, metrics: RequestMetrics, start: float) -> None:
+        values = {
+            "http_request_duration_seconds": time.perf_counter() - start,
+            "http_request_db_queries": metrics.queries,
+            "http_request_db_seconds": metrics.db_seconds,
+            "http_response_render_seconds": metrics.render_seconds,
+        }
+        if not getattr(response, "streaming", False):
+            values["http_response_size_bytes"] = len(response.content)
+        self.registry.observe(self._route(request), request.method or "", response.status_code, values)
+
+    def _route(self, request: HttpRequest) -> str:
+        route = getattr(request, "_metrics_route", None)
+        if route:
+            return route
+        match = getattr(request, "resolver_match", None)
+        # 非 ninja 视图使用URL模板，未匹配的路径归为一类，避免标签数量无限增长
+        return match.route if match is not None and match.route else UNMATCHED_ROUTE
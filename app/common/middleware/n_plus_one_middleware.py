@@ -0,0 +1,49 @@
+"""
+N+1 查询检测中间件
+仅在 DEBUG 且 N_PLUS_ONE_DETECTION 开启时生效：记录每个请求执行的SQL，
+同一模板执行次数超过 N_PLUS_ONE_THRESHOLD 时输出警告日志，列出模板、次数和触发位置
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest
+from loguru import logger
+
+from app.common.query_inspector import DEFAULT_THRESHOLD, QueryRecorder, detect_queries
+
+
+class NPlusOneMiddleware:
+    """按请求检测重复执行的SQL模板"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not (settings.DEBUG and getattr(settings, "N_PLUS_ONE_DETECTION", False)):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.threshold = getattr(settings, "N_PLUS_ONE_THRESHOLD", DEFAULT_THRESHOLD)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with detect_queries() as recorder:
+            response = self.get_response(request)
+        self._warn(request, recorder)
+        return response
+
+    async def __acall__(self, request: HttpRequest):
+        with detect_queries() as recorder:
+            response = await self.get_response(request)
+        self._warn(request, recorder)
+        return response
+
+    def _warn(self, request: HttpRequest, recorder: QueryRecorder) -> None:
+        if recorder.repeated(self.threshold):
+            logger.warning(
+                f"N+1 queries in {request.method} {request.path} ({recorder.total} queries):\n"
+                f"{recorder.report(self.threshold)}"
+            )
@@ -6,10 +6,15 @@ import json
 import time
 import uuid
 from typing import Optional, Any
+from asgiref.sync import iscoroutinefunction, sync_to_async
 from django.utils.deprecation import MiddlewareMixin
 from django.http import HttpRequest, HttpResponse
 from django.contrib.auth.models import AnonymousUser
+from django.utils import timezone
 from ninja_jwt.authentication import JWTAuth
+from app.common.middleware.operation_log_sink import OperationLogSink, get_operation_log_sink
+from app.common.principal import get_request_principal, has_request_principal, set_request_principal
+from app.domain.models.base_model import set_current_user
 from app.domain.models.operation_log import OperationLog
 from app.domain.models.user import User
 from loguru import logger
@@ -19,7 +24,8 @@ class OperationLogMiddleware(MiddlewareMixin):
     """
     操作日志记录中间件
     记录所有非查询接口的操作并存储到OperationLog数据库中
-    支持白名单配置
+    支持白名单配置，日志通过可插拔的写入通道（Sink）异步批量落库
+    同时支持WSGI和ASGI，ASGI下不会把异步视图退化为同步执行
     """
 
     # 白名单路径（不记录操作日志的路径）
@@ -34,14 +40,30 @@ class OperationLogMiddleware(MiddlewareMixin):
     # 需要记录的HTTP方法（非查询接口）
     RECORD_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
 
-    def __init__(self, get_response):
+    def __init__(self, get_response, sink: Optional[OperationLogSink] = None):
         self.get_response = get_response
+        self.sink = sink or get_operation_log_sink()
         super().__init__(get_response)
 
     def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
         start_time = time.time()
-        response = self.get_response(request)
-        self._record_operation_log(request, response, start_time)
+        try:
+            response = self.get_response(request)
+            self._record_operation_log(request, response, start_time)
+        finally:
+            # 清理认证时设置的线程本地用户，避免泄漏到下一个请求
+            set_current_user(None)
+        return response
+
+    async def __acall__(self, request: HttpRequest):
+        start_time = time.time()
+        response = await self.get_response(request)
+        if self._should_record_log(request):
+            # 构造日志可能需要查询用户，在请求的同步线程中执行；
+            # 该线程随请求结束销毁，认证时设置的线程本地用户不会泄漏
+            await sync_to_async(self._record_operation_log)(request, response, start_time)
         return response
 
     def _should_record_log(self, request: HttpRequest) -> bool:
@@ -52,7 +74,14 @@ class OperationLogMiddleware(MiddlewareMixin):
         )
 
     def _get_current_user(self, request: HttpRequest) -> Optional[User]:
-        """获取当前用户"""
+        """
+        获取当前用户
+        优先使用API层认证时保存的主体，只有请求未经过API认证时才自行解析Token
+        """
+        if has_request_principal(request):
+            principal = get_request_principal(request)
+            return principal if isinstance(principal, User) else None
+
         user_attr = getattr(request, 'user', None)
         if isinstance(user_attr, User):
             return user_attr
@@ -63,9 +92,11 @@ class OperationLogMiddleware(MiddlewareMixin):
                 token = auth_header.split(' ', 1)[1]
                 jwt_auth = JWTAuth()
                 user = jwt_auth.authenticate(request, token)
+                set_request_principal(request, user)
                 if isinstance(user, User):
                     return user
         except Exception as e:
+            set_request_principal(request, None)
             logger.warning(f"Failed to get user from JWT token: {e}")
 
         return None
@@ -136,7 +167,7 @@ class OperationLogMiddleware(MiddlewareMixin):
         }.get(method, '其他')
 
     def _record_operation_log(self, request: HttpRequest, response: HttpResponse, start_time: float):
-        """记录操作日志到数据库"""
+        """构造操作日志并提交到写入通道"""
         if not self._should_record_log(request):
             return
 
@@ -154,6 +185,7 @@ class OperationLogMiddleware(MiddlewareMixin):
 
             operation_log = OperationLog(
                 id=str(uuid.uuid4()).replace('-', ''),
+                created_time=timezone.now(),
                 module=module,
                 title=f"{method} {request.path_info}",
                 business_type=business_type,
@@ -172,8 +204,8 @@ class OperationLogMiddleware(MiddlewareMixin):
                 cost_time=cost_time,
                 user=user
             )
-            operation_log.save()
-            logger.info(f"Operation log recorded: {method} {request.path_info}")
+            self.sink.emit(operation_log)
+            logger.debug(f"Operation log submitted: {method} {request.path_info}")
 
         except Exception as e:
             logger.error(f"Failed to record operation log: {e}")
\ No newline at end of file
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""
+操作日志写入通道（Sink）
+中间件只负责构造 OperationLog 对象，具体的持久化方式由 Sink 决定：
+- SyncOperationLogSink: 在请求线程中同步保存（旧行为）
+- QueuedOperationLogSink: 有界队列 + 后台线程，按批次 bulk_create 写入
+开启 ROLLUP 时，写入成功的日志同时累加到按分钟/小时预聚合的统计表，
+日志插入与预聚合累加在同一事务中提交，与重建预聚合时的行锁互斥，不会重复计数
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils.module_loading import import_string
+from loguru import logger
+
+from app.domain.models.operation_log import OperationLog
+from app.infrastructure.persistence.repos.operation_log_rollup_repo_impl import (
+    DjangoORMOperationLogRollupRepository,
+)
+
+
+class OperationLogSink(ABC):
+    """操作日志写入通道基类"""
+
+    rollup_repo: Optional[DjangoORMOperationLogRollupRepository] = None
+
+    @abstractmethod
+    def emit(self, log: OperationLog) -> None:
+        """提交一条操作日志"""
+        pass
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """将已提交的日志全部写入数据库，返回是否在超时前完成"""
+        return True
+
+    def close(self) -> None:
+        """关闭通道并写入剩余日志"""
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        """获取通道统计信息"""
+        return {}
+
+    def _record_rollups(self, logs: List[OperationLog]) -> None:
+        """累加预聚合统计，失败不影响日志本身的写入"""
+        if self.rollup_repo is None or not logs:
+            return
+        try:
+            self.rollup_repo.record(logs)
+        except Exception as e:
+            logger.error(f"Failed to update operation log rollups: {e}")
+
+    def _save_with_rollups(self, save: Callable[[], None], logs: List[OperationLog]) -> None:
+        """
+        写入日志并累加预聚合统计
+        开启 ROLLUP 时两者放在同一事务中：重建预聚合要么看不到这批日志（随后累加到重建后的行上），
+        要么等待本事务提交后连同累加结果一起重算，避免日志已提交、尚未累加时被重建重复计数
+        """
+        if self.rollup_repo is None:
+            save()
+            return
+        with transaction.atomic():
+            save()
+            self._record_rollups(logs)
+
+
+class SyncOperationLogSink(OperationLogSink):
+    """同步写入通道，每条日志在请求线程中直接保存"""
+
+    def __init__(self, rollup: bool = False, **kwargs):
+        self._written = 0
+        self._failed = 0
+        if rollup:
+            self.rollup_repo = DjangoORMOperationLogRollupRepository()
+
+    def emit(self, log: OperationLog) -> None:
+        try:
+            self._save_with_rollups(lambda: log.save(force_insert=True), [log])
+            self._written += 1
+        except Exception as e:
+            self._failed += 1
+            logger.error(f"Failed to save operation log: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {"written": self._written, "failed": self._failed}
+
+
+class QueuedOperationLogSink(OperationLogSink):
+    """
+    异步批量写入通道
+    请求线程只负责入队，后台线程按 batch_size 或 flush_interval 触发 bulk_create。
+    队列写满时最多等待 put_timeout 秒（背压），仍然写不进去则丢弃并计数。
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        queue_size: int = 10000,
+        put_timeout: float = 0.0,
+        rollup: bool = False,
+        **kwargs
+    ):
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(0.01, float(flush_interval))
+        self.put_timeout = max(0.0, float(put_timeout))
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, int(queue_size)))
+        if rollup:
+            self.rollup_repo = DjangoORMOperationLogRollupRepository()
+
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._closed = False
+
+        self._counters = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "blocked": 0,
+            "failed": 0,
+            "batches": 0,
+        }
+
+    # ----------------------------
+    # 生产者（请求线程）
+    # ----------------------------
+    def emit(self, log: OperationLog) -> None:
+        if self._closed:
+            self._write_batch([log])
+            return
+
+        self._ensure_worker()
+        with self._lock:
+            self._pending += 1
+
+        try:
+            self._queue.put_nowait(log)
+        except queue.Full:
+            if not self._put_with_backpressure(log):
+                with self._idle:
+                    self._pending -= 1
+                    self._counters["dropped"] += 1
+                    self._idle.notify_all()
+                logger.warning("Operation log queue is full, log dropped")
+                return
+
+        with self._lock:
+            self._counters["enqueued"] += 1
+
+    def _put_with_backpressure(self, log: OperationLog) -> bool:
+        """队列已满时阻塞等待，返回是否最终入队成功"""
+        if self.put_timeout <= 0:
+            return False
+        with self._lock:
+            self._counters["blocked"] += 1
+        try:
+            self._queue.put(log, timeout=self.put_timeout)
+            return True
+        except queue.Full:
+            return False
+
+    # ----------------------------
+    # 消费者（后台线程）
+    # ----------------------------
+    def _ensure_worker(self) -> None:
+        """按需启动后台线程；fork 之后（如 gunicorn --preload）在子进程中重新启动"""
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == pid and self._thread.is_alive():
+                return
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name="operation-log-flusher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch, stop = self._collect_batch()
+            if batch:
+                self._write_batch(batch)
+                with self._idle:
+                    self._pending -= len(batch)
+                    self._idle.notify_all()
+            if stop:
+                break
+
+    def _collect_batch(self):
+        """从队列中取出一个批次，直到达到 batch_size 或等待超过 flush_interval"""
+        batch: List[OperationLog] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is self._STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _write_batch(self, batch: List[OperationLog]) -> None:
+        """批量写入，整批失败时逐条重试以隔离坏数据"""
+        close_old_connections()
+        try:
+            self._save_with_rollups(
+                lambda: OperationLog.objects.bulk_create(batch, batch_size=self.batch_size),  # type: ignore
+                batch,
+            )
+            with self._lock:
+                self._counters["written"] += len(batch)
+                self._counters["batches"] += 1
+            return
+        except Exception as e:
+            logger.error(f"Failed to bulk create {len(batch)} operation logs: {e}")
+
+        for log in batch:
+            try:
+                self._save_with_rollups(lambda: log.save(force_insert=True), [log])
+                with self._lock:
+                    self._counters["written"] += 1
+            except Exception as e:
+                with self._lock:
+                    self._counters["failed"] += 1
+                logger.error(f"Failed to record operation log: {e}")
+
+    # ----------------------------
+    # 生命周期
+    # ----------------------------
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        if self._thread is None or not self._thread.is_alive() or self._pid != os.getpid():
+            self._drain()
+            return True
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending <= 0, timeout=timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        thread = self._thread
+        if thread is not None and thread.is_alive() and self._pid == os.getpid():
+            try:
+                self._queue.put(self._STOP, timeout=timeout)
+            except queue.Full:
+                pass
+            thread.join(timeout)
+        self._drain()
+
+    def _drain(self) -> None:
+        """在当前线程中写入队列里剩余的日志"""
+        batch: List[OperationLog] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._STOP:
+                continue
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._write_batch(batch)
+                batch = []
+        if batch:
+            self._write_batch(batch)
+        with self._idle:
+            self._pending = 0
+            self._idle.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            data = dict(self._counters)
+        data["queued"] = self._queue.qsize()
+        data["capacity"] = self._queue.maxsize
+        return data
+
+
+# ----------------------------
+# 通道工厂
+# ----------------------------
+SINK_CLASSES = {
+    "sync": SyncOperationLogSink,
+    "queued": QueuedOperationLogSink,
+}
+
+_sink: Optional[OperationLogSink] = None
+_sink_lock = threading.Lock()
+
+
+def build_operation_log_sink(config: Optional[dict] = None) -> OperationLogSink:
+    """
+    根据配置创建写入通道
+    SINK 可以是 sync / queued，也可以是自定义 Sink 类的导入路径
+    """
+    config = dict(config if config is not None else getattr(settings, "OPERATION_LOG", {}))
+    sink_name = config.pop("SINK", "sync") or "sync"
+    sink_class = SINK_CLASSES.get(sink_name)
+    if sink_class is None:
+        sink_class = import_string(sink_name)
+    options = {key.lower(): value for key, value in config.items()}
+    return sink_class(**options)
+
+
+def get_operation_log_sink() -> OperationLogSink:
+    """获取进程内共享的写入通道，进程退出时自动写入剩余日志"""
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = build_operation_log_sink()
+                atexit.register(_sink.close)
+    return _sink
@@ -0,0 +1,50 @@
+"""
+只读副本路由中间件
+每个请求开始新的路由范围：请求中发生写入后读查询固定使用主库；
+GET/HEAD 请求的路径匹配 DATABASE_REPLICA_READ_PATHS 时，请求期间的读查询路由到只读副本
+"""
+
+import re
+from typing import List
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpRequest
+
+from app.infrastructure.persistence.db_router import request_scope
+
+
+class ReplicaReadMiddleware:
+    """为每个请求设置数据库路由范围，并按请求路径把日志、列表接口的读查询路由到只读副本"""
+
+    sync_capable = True
+    async_capable = True
+
+    READ_METHODS = {"GET", "HEAD"}
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.patterns: List[re.Pattern] = [
+            re.compile(pattern) for pattern in getattr(settings, "DATABASE_REPLICA_READ_PATHS", [])
+        ]
+        self.enabled = bool(self.patterns) and bool(getattr(settings, "DATABASE_REPLICAS", []))
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with request_scope(replica=self.should_use_replica(request)):
+            return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest):
+        # sync_to_async 会复制上下文，同步视图和认证中的查询同样路由到副本
+        with request_scope(replica=self.should_use_replica(request)):
+            return await self.get_response(request)
+
+    def should_use_replica(self, request: HttpRequest) -> bool:
+        return (
+            self.enabled
+            and request.method in self.READ_METHODS
+            and any(pattern.search(request.path_info) for pattern in self.patterns)
+        )
@@ -0,0 +1,29 @@
+"""
+请求主体（Principal）工具
+API层完成认证后把解析出的用户保存在 request 上，
+中间件等后续组件直接读取，避免重复校验 Token 和查询用户
+"""
+
+from typing import Any, Optional
+
+from django.http import HttpRequest
+
+# request 上保存认证主体的属性名
+REQUEST_PRINCIPAL_ATTR = "_auth_principal"
+
+_MISSING = object()
+
+
+def set_request_principal(request: HttpRequest, principal: Optional[Any]) -> None:
+    """保存认证结果，认证失败时保存 None，表示已经认证过"""
+    setattr(request, REQUEST_PRINCIPAL_ATTR, principal)
+
+
+def has_request_principal(request: HttpRequest) -> bool:
+    """判断当前请求是否已经完成过认证"""
+    return getattr(request, REQUEST_PRINCIPAL_ATTR, _MISSING) is not _MISSING
+
+
+def get_request_principal(request: HttpRequest) -> Optional[Any]:
+    """获取当前请求的认证主体，未认证或认证失败时返回 None"""
+    return getattr(request, REQUEST_PRINCIPAL_ATTR, None)
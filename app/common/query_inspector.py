@@ -0,0 +1,122 @@
+"""
+N+1 查询检测
+记录一段代码（一个请求或一个测试）中执行的SQL，按去掉参数后的模板分组，
+同一模板执行次数超过阈值时视为 N+1 查询（通常是循环中访问外键或反向关联）。
+
+- detect_queries(): 上下文管理器，返回记录器，退出后可检查 repeated(threshold)
+- assert_no_n_plus_one(threshold): 上下文管理器，发现重复模板时抛出 NPlusOneError，用于测试
+- NPlusOneMiddleware: DEBUG 模式下按请求检测并输出警告日志
+"""
+
+import os
+import re
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+DEFAULT_THRESHOLD = 5
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:%s|\?)\s*,)*\s*(?:%s|\?)\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def normalize_sql(sql: str) -> str:
+    """把SQL归一化为模板：字面量替换为 ?，IN 列表折叠为 (...)"""
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(...)", sql.replace("%s", "?"))
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def _caller() -> Optional[str]:
+    """触发查询的项目代码位置（跳过本模块和第三方库）"""
+    for frame in reversed(traceback.extract_stack()[:-3]):
+        filename = frame.filename
+        if filename.startswith(_PROJECT_ROOT) and filename != __file__ and "site-packages" not in filename:
+            return f"{os.path.relpath(filename, _PROJECT_ROOT)}:{frame.lineno}"
+    return None
+
+
+class QueryRecorder:
+    """按模板统计SQL执行次数，并记录每个模板第一次执行时的项目代码位置"""
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.callers: Dict[str, Optional[str]] = {}
+
+    def record(self, sql: str) -> None:
+        template = normalize_sql(sql)
+        self.counts[template] += 1
+        if template not in self.callers:
+            self.callers[template] = _caller()
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def repeated(self, threshold: int = DEFAULT_THRESHOLD) -> List[Tuple[str, int]]:
+        """执行次数超过阈值的模板，按次数从多到少排列"""
+        return [(template, count) for template, count in self.counts.most_common() if count > threshold]
+
+    def report(self, threshold: int = DEFAULT_THRESHOLD) -> str:
+        lines = []
+        for template, count in self.repeated(threshold):
+            caller = self.callers.get(template)
+            lines.append(f"{count}x {template}" + (f" (at {caller})" if caller else ""))
+        return "\n".join(lines)
+
+
+# 当前上下文的记录器；sync_to_async 复制上下文，异步视图中的查询同样被记录
+_current_recorder: ContextVar[Optional[QueryRecorder]] = ContextVar("query_recorder", default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    """SQL执行包装器，没有活动的记录器时直接执行"""
+    recorder = _current_recorder.get()
+    if recorder is not None:
+        recorder.record(sql)
+    return execute(sql, params, many, context)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+connection_created.connect(install_query_recorder, dispatch_uid="query_inspector_install_recorder")
+
+
+@contextmanager
+def detect_queries():
+    """在上下文中记录执行的SQL，返回 QueryRecorder"""
+    # 已经建立的连接不会再触发 connection_created
+    for connection in connections.all(initialized_only=True):
+        install_query_recorder(None, connection)
+    recorder = QueryRecorder()
+    token = _current_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current_recorder.reset(token)
+
+
+class NPlusOneError(AssertionError):
+    """同一SQL模板重复执行次数超过阈值"""
+
+
+@contextmanager
+def assert_no_n_plus_one(threshold: int = DEFAULT_THRESHOLD):
+    """测试用：上下文中同一SQL模板执行超过 threshold 次时抛出 NPlusOneError"""
+    with detect_queries() as recorder:
+        yield recorder
+    if recorder.repeated(threshold):
+        raise NPlusOneError(f"Repeated queries detected (threshold {threshold}):\n{recorder.report(threshold)}")
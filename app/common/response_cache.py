@@ -0,0 +1,161 @@
+"""
+接口响应缓存
+读多写少的接口（菜单、部门、角色、系统配置等）把视图的返回值写入 Django 缓存，
+缓存键由路由、路径和查询参数、主体范围以及各标签的版本号组成。
+标签为模型（如 domain.menu），模型保存或删除时递增标签版本号（见 app.domain.signals），
+旧条目不再被命中，随过期时间淘汰。只缓存成功的响应，返回值仍由 ninja 校验和渲染。
+只在缓存后端为多进程共享的后端（Redis 等）时启用，否则各进程的版本号互不可见；
+未命中时视图从主库读取，不会把延迟副本上的旧数据写入新版本号下的缓存
+"""
+
+import functools
+import hashlib
+import inspect
+from typing import Any, Iterable, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+from loguru import logger
+
+from app.common.cache import bump_cache_version, get_cache_version, is_shared_cache, shared_cache_stats
+from app.common.principal import get_request_principal
+from app.infrastructure.persistence.db_router import use_primary
+
+RESPONSE_CACHE_NAMESPACE = "response"
+# 所有响应缓存共用的标签，递增后全部失效
+ALL_TAG = "*"
+
+# 主体范围：shared 表示所有通过权限检查的主体共用一份缓存，user 表示每个用户单独缓存
+SCOPE_SHARED = "shared"
+SCOPE_USER = "user"
+
+
+def _config() -> dict:
+    return getattr(settings, "RESPONSE_CACHE", {})
+
+
+def _alias() -> str:
+    return _config().get("CACHE_ALIAS", "default")
+
+
+def is_response_cache_enabled() -> bool:
+    """开启了 RESPONSE_CACHE_ENABLED 且缓存后端在多进程间共享"""
+    return _config().get("ENABLED", True) and is_shared_cache(_alias())
+
+
+def model_tag(model: Any) -> str:
+    """模型（类或实例）对应的缓存标签，如 domain.menu"""
+    return model._meta.label_lower
+
+
+def _tag_versions(tags: Iterable[str]) -> str:
+    alias = _alias()
+    return ".".join(str(get_cache_version(f"{RESPONSE_CACHE_NAMESPACE}:{tag}", alias)) for tag in (ALL_TAG, *tags))
+
+
+def _bump_tags(tags: Tuple[str, ...]) -> None:
+    alias = _alias()
+    for tag in tags:
+        bump_cache_version(f"{RESPONSE_CACHE_NAMESPACE}:{tag}", alias)
+
+
+def invalidate_response_cache(tags: Iterable[str] = (ALL_TAG,)) -> None:
+    """
+    使带有这些标签的响应缓存失效
+    提交后再失效一次，避免其他请求在事务提交前用旧数据写入了新版本号下的缓存
+    """
+    tags = tuple(tags)
+    _bump_tags(tags)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _bump_tags(tags))
+
+
+def _principal_scope(request: HttpRequest, scope: str) -> str:
+    if scope == SCOPE_SHARED:
+        return SCOPE_SHARED
+    principal = get_request_principal(request)
+    return f"user-{principal.pk}" if principal is not None else "anonymous"
+
+
+def make_cache_key(request: HttpRequest, route: str, tags: Iterable[str], scope: str = SCOPE_SHARED) -> str:
+    """缓存键：路由、主体范围、标签版本号，以及路径和排序后的查询参数的摘要"""
+    query = sorted((name, value) for name, values in request.GET.lists() for value in values)
+    digest = hashlib.md5(f"{request.path}?{query}".encode(), usedforsecurity=False).hexdigest()
+    return f"{RESPONSE_CACHE_NAMESPACE}:{route}:{_principal_scope(request, scope)}:{_tag_versions(tags)}:{digest}"
+
+
+def _is_cacheable(result: Any) -> bool:
+    """只缓存成功的业务响应；HttpResponse（流式导出、快速路径等）不缓存"""
+    return not isinstance(result, HttpResponse) and getattr(result, "code", 200) < 400
+
+
+def _lookup(request: HttpRequest, route: str, tags: Tuple[str, ...], scope: str) -> Tuple[Optional[str], Any]:
+    """返回 (缓存键, 缓存的返回值)，缓存不可用时返回 (None, None)，请求照常处理"""
+    try:
+        key = make_cache_key(request, route, tags, scope)
+        cached = caches[_alias()].get(key)
+    except Exception as e:
+        logger.warning(f"Failed to read response cache: {e}")
+        return None, None
+    shared_cache_stats.record(cached is not None)
+    return key, cached
+
+
+def _store(key: Optional[str], result: Any, timeout: Optional[int]) -> None:
+    if key is None or not _is_cacheable(result):
+        return
+    try:
+        caches[_alias()].set(key, result, timeout=timeout if timeout is not None else _config().get("TIMEOUT", 300))
+    except Exception as e:
+        logger.warning(f"Failed to write response cache: {e}")
+
+
+def cache_response(*tag_models: Any, scope: str = SCOPE_SHARED, timeout: Optional[int] = None):
+    """
+    响应缓存装饰器，用于 api_controller 的同步或异步方法，放在 http_get 之下。
+    权限检查在视图之前完成，缓存命中时同样经过认证和权限检查
+
+    Args:
+        tag_models: 返回值依赖的模型，任一模型保存或删除时缓存失效
+        scope: 主体范围，SCOPE_SHARED 或 SCOPE_USER
+        timeout: 过期时间（秒），默认使用 RESPONSE_CACHE_TIMEOUT
+    """
+    tags = tuple(model if isinstance(model, str) else model_tag(model) for model in tag_models)
+
+    def decorator(func):
+        route = func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                if not is_response_cache_enabled():
+                    return await func(self, *args, **kwargs)
+                key, cached = await sync_to_async(_lookup)(self.context.request, route, tags, scope)
+                if cached is not None:
+                    return cached
+                with use_primary():
+                    result = await func(self, *args, **kwargs)
+                await sync_to_async(_store)(key, result, timeout)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not is_response_cache_enabled():
+                return func(self, *args, **kwargs)
+            key, cached = _lookup(self.context.request, route, tags, scope)
+            if cached is not None:
+                return cached
+            with use_primary():
+                result = func(self, *args, **kwargs)
+            _store(key, result, timeout)
+            return result
+
+        return wrapper
+
+    return decorator
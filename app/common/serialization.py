@@ -0,0 +1,24 @@
+"""
+JSON 编码
+基于 orjson，输出与 ninja 默认渲染器（NinjaJSONEncoder）一致：
+日期时间交给 NinjaJSONEncoder 处理（ISO 8601、毫秒精度、UTC 写作 "Z"），
+Decimal、pydantic 模型等 orjson 不支持的类型同样由它处理
+"""
+
+from typing import Any
+
+import orjson
+from ninja.responses import NinjaJSONEncoder
+
+_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+json_default = NinjaJSONEncoder().default
+
+
+def dumps(obj: Any) -> bytes:
+    """编码为 UTF-8 的 JSON 字节串"""
+    return orjson.dumps(obj, default=json_default, option=_OPTIONS)
+
+
+def loads(data: Any) -> Any:
+    return orjson.loads(data)
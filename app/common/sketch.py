@@ -0,0 +1,83 @@
+"""
+可合并的分位数草图
+采用 DDSketch 的对数分桶：值 x 落入第 ceil(log_gamma(x)) 个桶，gamma = (1 + a) / (1 - a)，
+任意分位数的相对误差不超过 a。两个草图合并只需按桶累加计数，适合按分钟/小时预聚合后再汇总。
+"""
+
+import json
+import math
+from typing import Dict, Optional
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+
+class QuantileSketch:
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1.")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = {}
+        # 小于等于0的值单独计数
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, count: int = 1) -> None:
+        if count <= 0:
+            return
+        if value <= 0:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.count += count
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """把另一个草图合并到当前草图"""
+        if not math.isclose(other.relative_accuracy, self.relative_accuracy):
+            raise ValueError("Cannot merge sketches with different relative accuracy.")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """返回近似分位数，q 取值 [0, 1]，草图为空时返回 None"""
+        if self.count == 0:
+            return None
+        rank = min(max(q, 0.0), 1.0) * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        cumulative = self.zero_count
+        for key in sorted(self.bins):
+            cumulative += self.bins[key]
+            if cumulative > rank:
+                # 取桶区间 (gamma^(k-1), gamma^k] 的相对误差中点
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+    def to_dict(self) -> dict:
+        return {
+            "a": self.relative_accuracy,
+            "z": self.zero_count,
+            "b": {str(key): count for key, count in self.bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "QuantileSketch":
+        sketch = cls(data.get("a", DEFAULT_RELATIVE_ACCURACY))
+        sketch.zero_count = int(data.get("z", 0))
+        sketch.bins = {int(key): int(count) for key, count in data.get("b", {}).items()}
+        sketch.count = sketch.zero_count + sum(sketch.bins.values())
+        return sketch
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, raw: Optional[str]) -> "QuantileSketch":
+        if not raw:
+            return cls()
+        return cls.from_dict(json.loads(raw))
@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class DomainConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app.domain"
-    label = "domain"
\ No newline at end of file
+    label = "domain"
+
+    def ready(self):
+        # 注册模型信号处理（缓存失效等）
+        from app.domain import signals  # noqa: F401
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0003_fix_login_log_creator_field"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="operationlog",
+            index=models.Index(fields=["created_time", "id"], name="oper_log_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="operationlog",
+            index=models.Index(fields=["oper_name", "created_time"], name="oper_log_oper_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="operationlog",
+            index=models.Index(fields=["module", "created_time"], name="oper_log_module_idx"),
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0004_operation_log_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OperationLogRollup",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("granularity", models.CharField(choices=[("minute", "分钟"), ("hour", "小时")], max_length=10)),
+                ("bucket", models.DateTimeField()),
+                ("module", models.CharField(max_length=128)),
+                ("business_type", models.CharField(max_length=128)),
+                ("request_method", models.CharField(max_length=10)),
+                ("status", models.BooleanField()),
+                ("count", models.BigIntegerField(default=0)),
+                ("cost_sum", models.BigIntegerField(default=0)),
+                ("cost_max", models.BigIntegerField(default=0)),
+                ("sketch", models.TextField(default="")),
+            ],
+            options={
+                "db_table": "system_operation_log_rollup",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("granularity", "bucket", "module", "business_type", "request_method", "status"),
+                        name="oper_log_rollup_key_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
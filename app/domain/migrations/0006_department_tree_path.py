@@ -0,0 +1,49 @@
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def backfill_tree_paths(apps, schema_editor):
+    # 迁移中不引用业务模块，路径计算按迁移编写时的规则内联：父部门不存在时按根部门处理，环上取一个部门作为根
+    Department = apps.get_model("domain", "Department")
+    parents = dict(Department.objects.values_list("id", "parent_id"))
+    children = defaultdict(list)
+    for node_id, parent_id in parents.items():
+        children[parent_id if parent_id in parents else None].append(node_id)
+
+    paths = {}
+    stack = [(node_id, "/", 0) for node_id in children[None]]
+    while stack or len(paths) < len(parents):
+        if not stack:
+            node_id = next(node_id for node_id in parents if node_id not in paths)
+            stack.append((node_id, "/", 0))
+        node_id, prefix, depth = stack.pop()
+        if node_id in paths:
+            continue
+        path = f"{prefix}{node_id}/"
+        paths[node_id] = (path, depth)
+        stack.extend((child_id, path, depth + 1) for child_id in children[node_id])
+
+    departments = [Department(id=node_id, tree_path=path, depth=depth) for node_id, (path, depth) in paths.items()]
+    Department.objects.bulk_update(departments, ["tree_path", "depth"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0005_operation_log_rollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="department",
+            name="tree_path",
+            field=models.CharField(db_index=True, default="", max_length=700),
+        ),
+        migrations.AddField(
+            model_name="department",
+            name="depth",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_tree_paths, migrations.RunPython.noop),
+    ]
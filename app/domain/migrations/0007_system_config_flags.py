@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """补齐 SystemConfig 模型已有但迁移中缺失的字段，配置快照按 is_active 加载"""
+
+    dependencies = [
+        ("domain", "0006_department_tree_path"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="systemconfig",
+            name="access",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name="systemconfig",
+            name="inherit",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name="systemconfig",
+            name="is_active",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AlterField(
+            model_name="systemconfig",
+            name="status",
+            field=models.BooleanField(default=False),
+        ),
+    ]
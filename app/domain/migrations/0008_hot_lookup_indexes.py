@@ -0,0 +1,63 @@
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def delete_duplicate_links(apps, schema_editor):
+    """添加唯一约束前删除重复的关联，每组保留ID最小的一条"""
+    for model_name, fields in (("UserRole", ("user_id", "role_id")), ("RoleMenu", ("role_id", "menu_id"))):
+        model = apps.get_model("domain", model_name)
+        duplicates = (
+            model.objects.values(*fields).annotate(count=Count("id"), keep_id=Min("id")).filter(count__gt=1)
+        )
+        for row in duplicates:
+            model.objects.filter(**{field: row[field] for field in fields}).exclude(id=row["keep_id"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0007_system_config_flags"),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_links, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="userrole",
+            constraint=models.UniqueConstraint(fields=("user", "role"), name="uniq_user_role"),
+        ),
+        migrations.AddConstraint(
+            model_name="rolemenu",
+            constraint=models.UniqueConstraint(fields=("role", "menu"), name="uniq_role_menu"),
+        ),
+        # 列表按 (created_time, id) 排序，索引补上 id 后排序不再需要额外的临时B树
+        migrations.RemoveIndex(model_name="operationlog", name="oper_log_oper_name_idx"),
+        migrations.RemoveIndex(model_name="operationlog", name="oper_log_module_idx"),
+        migrations.AddIndex(
+            model_name="operationlog",
+            index=models.Index(fields=["oper_name", "created_time", "id"], name="oper_log_oper_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="operationlog",
+            index=models.Index(fields=["module", "created_time", "id"], name="oper_log_module_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="operationlog",
+            index=models.Index(fields=["user", "created_time", "id"], name="oper_log_user_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="loginlog",
+            index=models.Index(fields=["created_time", "id"], name="login_log_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="loginlog",
+            index=models.Index(fields=["creator", "created_time", "id"], name="login_log_creator_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="menu",
+            index=models.Index(fields=["parent_id", "rank"], name="menu_parent_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="menu",
+            index=models.Index(fields=["meta_id"], name="menu_meta_idx"),
+        ),
+    ]
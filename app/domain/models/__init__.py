@@ -7,5 +7,6 @@ from .user_role import UserRole
 from .role_menu import RoleMenu
 from .system_config import SystemConfig
 from .operation_log import OperationLog
+from .operation_log_rollup import OperationLogRollup
 from .login_log import LoginLog
 from .base_model import BaseModel
\ No newline at end of file
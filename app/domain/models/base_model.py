@@ -6,6 +6,7 @@ import threading
 from typing import Optional
 
 from django.db import models
+from django.dispatch import Signal
 from django.utils import timezone
 
 
@@ -14,11 +15,16 @@ def generate_uuid_pk():
     return str(uuid.uuid4()).replace('-', '')
 
 
+# 批量写入（bulk_create / bulk_update）不会触发 post_save，由仓储或模型在写入完成后发送
+# 参数：sender 为模型类，instances 为写入的实例列表
+bulk_saved = Signal()
+
+
 # 线程本地存储，用于保存当前用户信息
 _thread_locals = threading.local()
 
 
-def set_current_user(username: str):
+def set_current_user(username: Optional[str]):
     """设置当前用户"""
     _thread_locals.user = username
 
@@ -44,6 +50,16 @@ class BaseModel(models.Model):
         abstract = True
 
     def save(self, *args, **kwargs):
+        self.stamp_audit_fields()
+
+        # 调用父类的save方法
+        super().save(*args, **kwargs)
+
+    def stamp_audit_fields(self) -> None:
+        """
+        设置创建/更新时间和创建人/修改人
+        bulk_create / bulk_update 不经过 save，批量写入前需要显式调用
+        """
         # 更新updated_time为当前时间
         self.updated_time = timezone.now()
 
@@ -69,6 +85,3 @@ class BaseModel(models.Model):
             except ValueError:
                 # 如果直接赋值失败，保持原样
                 pass
-
-        # 调用父类的save方法
-        super().save(*args, **kwargs)
\ No newline at end of file
@@ -1,10 +1,72 @@
 """
 部门领域模型
+部门树用物化路径维护：tree_path 为从根到本部门的ID序列，如 /根ID/父ID/本部门ID/，
+任意子树都可以用 tree_path 前缀匹配一次查出，新增、移动、删除时自动维护。
 """
 
-from django.db import models
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 
-from .base_model import BaseModel, generate_uuid_pk
+from django.db import models, transaction
+from django.db.models import Value
+from django.db.models.functions import Concat, Substr
+from django.utils import timezone
+
+from .base_model import BaseModel, bulk_saved, generate_uuid_pk
+
+TREE_PATH_SEPARATOR = "/"
+# MySQL utf8mb4 下索引长度上限为 3072 字节，700 个字符可容纳约 21 层
+TREE_PATH_MAX_LENGTH = 700
+
+# 批量删除期间不逐条改写子孙部门的路径，删除完成后由调用方统一重算
+_tree_rebase_deferred: ContextVar[bool] = ContextVar("tree_rebase_deferred", default=False)
+
+
+@contextmanager
+def defer_tree_rebase() -> Iterator[None]:
+    """
+    暂停部门删除后的子树路径维护（见 app.domain.signals）
+    同一批次同时删除父子部门时，按删除前的路径逐条改写会使孙部门的路径和层级出错
+    """
+    token = _tree_rebase_deferred.set(True)
+    try:
+        yield
+    finally:
+        _tree_rebase_deferred.reset(token)
+
+
+def is_tree_rebase_deferred() -> bool:
+    return _tree_rebase_deferred.get()
+
+
+def build_tree_paths(rows: Iterable[Tuple[str, Optional[str]]], strict: bool = False) -> Dict[str, Tuple[str, int]]:
+    """
+    根据 (id, parent_id) 计算每个部门的 (tree_path, depth)
+    父部门不存在时按根部门处理；存在环时 strict 为 True 则抛出 ValueError，否则取环上一个部门作为根
+    """
+    parents = dict(rows)
+    children = defaultdict(list)
+    for node_id, parent_id in parents.items():
+        children[parent_id if parent_id in parents else None].append(node_id)
+
+    result: Dict[str, Tuple[str, int]] = {}
+    stack = [(node_id, TREE_PATH_SEPARATOR, 0) for node_id in children[None]]
+    while stack or len(result) < len(parents):
+        if not stack:
+            if strict:
+                raise ValueError("Department tree contains a cycle.")
+            # 剩余的部门在环上，取其中一个作为根打断环
+            node_id = next(node_id for node_id in parents if node_id not in result)
+            stack.append((node_id, TREE_PATH_SEPARATOR, 0))
+        node_id, prefix, depth = stack.pop()
+        if node_id in result:
+            continue
+        path = f"{prefix}{node_id}{TREE_PATH_SEPARATOR}"
+        result[node_id] = (path, depth)
+        stack.extend((child_id, path, depth + 1) for child_id in children[node_id])
+    return result
 
 
 class Department(BaseModel):
@@ -18,9 +80,80 @@ class Department(BaseModel):
     # 外键关系
     parent = models.ForeignKey('self', on_delete=models.SET_NULL, null=True, blank=True, related_name='children')
 
+    # 物化路径和层级（根部门为0），由 save / rebuild_tree 维护
+    tree_path = models.CharField(max_length=TREE_PATH_MAX_LENGTH, default="", db_index=True)
+    depth = models.PositiveSmallIntegerField(default=0)
+
     def __str__(self) -> str:
         return str(self.name)
 
     class Meta:
         db_table = 'system_department'
         app_label = 'domain'
+
+    def save(self, *args, **kwargs):
+        old_path, old_depth = self.tree_path, self.depth
+        parent = self.parent if self.parent_id else None
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "tree_path", "depth"}
+        with transaction.atomic():
+            self.place_under(parent)
+            super().save(*args, **kwargs)
+            if old_path and old_path != self.tree_path:
+                # 部门被移动，子孙部门的路径整体替换前缀
+                rebase_subtree(old_path, self.tree_path, self.depth - old_depth, exclude_id=self.pk)
+
+    def place_under(self, parent: Optional["Department"]) -> None:
+        """根据父部门计算本部门的路径和层级"""
+        if parent is None:
+            prefix, depth = TREE_PATH_SEPARATOR, 0
+        else:
+            if self.tree_path and parent.tree_path.startswith(self.tree_path):
+                raise ValueError("Department cannot be moved under itself or its descendants.")
+            prefix, depth = parent.tree_path or f"{TREE_PATH_SEPARATOR}{parent.pk}{TREE_PATH_SEPARATOR}", parent.depth + 1
+        path = f"{prefix}{self.pk}{TREE_PATH_SEPARATOR}"
+        if len(path) > TREE_PATH_MAX_LENGTH:
+            raise ValueError("Department tree is too deep.")
+        self.tree_path, self.depth = path, depth
+
+    def is_ancestor_of(self, other: "Department") -> bool:
+        return bool(self.tree_path) and other.tree_path.startswith(self.tree_path) and other.pk != self.pk
+
+    @classmethod
+    def subtree(cls, root_id: str, include_self: bool = True) -> models.QuerySet:
+        """根部门及其全部子孙部门，根部门的路径通过子查询获取，整体只有一次查询"""
+        root_path = cls.objects.filter(pk=root_id).values("tree_path")[:1]  # type: ignore
+        queryset = cls.objects.filter(tree_path__startswith=models.Subquery(root_path))  # type: ignore
+        if not include_self:
+            queryset = queryset.exclude(pk=root_id)
+        return queryset
+
+    @classmethod
+    def rebuild_tree(cls, strict: bool = False) -> int:
+        """全量重算所有部门的路径，返回更新的行数"""
+        rows = list(cls.objects.values_list("id", "parent_id", "tree_path", "depth"))  # type: ignore
+        paths = build_tree_paths(((row[0], row[1]) for row in rows), strict=strict)
+        # 层级变化同样更新 updated_time，列表接口的集合版本随之变化
+        now = timezone.now()
+        changed = [
+            cls(id=node_id, tree_path=paths[node_id][0], depth=paths[node_id][1], updated_time=now)
+            for node_id, _, tree_path, depth in rows
+            if paths[node_id] != (tree_path, depth)
+        ]
+        cls.objects.bulk_update(changed, ["tree_path", "depth", "updated_time"], batch_size=500)  # type: ignore
+        if changed:
+            # bulk_update 不发送 post_save，补发 bulk_saved 使部门接口的响应缓存失效
+            bulk_saved.send(sender=cls, instances=changed)
+        return len(changed)
+
+
+def rebase_subtree(old_prefix: str, new_prefix: str, depth_delta: int, exclude_id: Optional[str] = None) -> int:
+    """把路径以 old_prefix 开头的部门改为以 new_prefix 开头，一条UPDATE完成"""
+    queryset = Department.objects.filter(tree_path__startswith=old_prefix)  # type: ignore
+    if exclude_id is not None:
+        queryset = queryset.exclude(pk=exclude_id)
+    return queryset.update(
+        tree_path=Concat(Value(new_prefix), Substr("tree_path", len(old_prefix) + 1), output_field=models.CharField()),
+        depth=models.F("depth") + depth_delta,
+        updated_time=timezone.now(),
+    )
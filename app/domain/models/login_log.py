@@ -29,4 +29,9 @@ class LoginLog(BaseModel):
 
     class Meta(BaseModel.Meta):
         db_table = 'system_login_log'
-        app_label = 'domain'
\ No newline at end of file
+        app_label = 'domain'
+        indexes = [
+            # 列表、导出和游标分页按 (created_time, id) 排序
+            models.Index(fields=['created_time', 'id'], name='login_log_created_idx'),
+            models.Index(fields=['creator', 'created_time', 'id'], name='login_log_creator_idx'),
+        ]
\ No newline at end of file
@@ -34,4 +34,9 @@ class Menu(BaseModel):
 
     class Meta(BaseModel.Meta):
         db_table = 'system_menu'
-        app_label = 'domain'
\ No newline at end of file
+        app_label = 'domain'
+        indexes = [
+            # parent_id、meta_id 不是外键，没有自动创建的索引
+            models.Index(fields=['parent_id', 'rank'], name='menu_parent_idx'),
+            models.Index(fields=['meta_id'], name='menu_meta_idx'),
+        ]
\ No newline at end of file
@@ -39,3 +39,11 @@ class OperationLog(models.Model):
     class Meta:
         db_table = 'system_operation_log'
         app_label = 'domain'
+        indexes = [
+            # 保留策略按创建时间批量删除，列表和导出按创建时间排序
+            models.Index(fields=['created_time', 'id'], name='oper_log_created_idx'),
+            # 按操作人、模块、用户过滤并按 (created_time, id) 排序，排序直接使用索引顺序
+            models.Index(fields=['oper_name', 'created_time', 'id'], name='oper_log_oper_name_idx'),
+            models.Index(fields=['module', 'created_time', 'id'], name='oper_log_module_idx'),
+            models.Index(fields=['user', 'created_time', 'id'], name='oper_log_user_idx'),
+        ]
@@ -0,0 +1,38 @@
+"""
+操作日志预聚合模型
+按分钟/小时 + 模块、业务类型、请求方法、状态聚合操作日志，cost_time 分布以可合并的分位数草图保存
+"""
+
+from django.db import models
+
+
+class OperationLogRollup(models.Model):
+    GRANULARITY_CHOICES = (
+        ("minute", "分钟"),
+        ("hour", "小时"),
+    )
+
+    granularity = models.CharField(max_length=10, choices=GRANULARITY_CHOICES)
+    bucket = models.DateTimeField()
+    module = models.CharField(max_length=128)
+    business_type = models.CharField(max_length=128)
+    request_method = models.CharField(max_length=10)
+    status = models.BooleanField()
+    count = models.BigIntegerField(default=0)
+    cost_sum = models.BigIntegerField(default=0)
+    cost_max = models.BigIntegerField(default=0)
+    # QuantileSketch.to_json()
+    sketch = models.TextField(default="")
+
+    def __str__(self) -> str:
+        return f"OperationLogRollup {self.granularity} {self.bucket} {self.module}"
+
+    class Meta:
+        db_table = 'system_operation_log_rollup'
+        app_label = 'domain'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['granularity', 'bucket', 'module', 'business_type', 'request_method', 'status'],
+                name='oper_log_rollup_key_uniq',
+            ),
+        ]
@@ -17,4 +17,8 @@ class RoleMenu(BaseModel):
     
     class Meta:
         db_table = 'system_role_menu'
-        app_label = 'domain'
\ No newline at end of file
+        app_label = 'domain'
+        constraints = [
+            # 同时是按角色查询菜单ID的覆盖索引
+            models.UniqueConstraint(fields=['role', 'menu'], name='uniq_role_menu'),
+        ]
\ No newline at end of file
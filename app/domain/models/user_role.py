@@ -18,3 +18,7 @@ class UserRole(BaseModel):
     class Meta:
         db_table = 'system_user_role'
         app_label = 'domain'
+        constraints = [
+            # 同时是按用户查询角色ID的覆盖索引
+            models.UniqueConstraint(fields=['user', 'role'], name='uniq_user_role'),
+        ]
@@ -3,8 +3,10 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Union
+from datetime import datetime
+from typing import Optional, List, Union, Any, Dict, Iterable, Sequence, Set, Tuple
 from app.domain.models.department import Department
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class DepartmentRepository(ABC):
@@ -26,4 +28,57 @@ class DepartmentRepository(ABC):
 
     @abstractmethod
     def list_all(self) -> List[Department]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def list_page(self, page_request: PageRequest) -> Page[Department]:
+        pass
+
+    @abstractmethod
+    async def alist_page(self, page_request: PageRequest) -> Page[Department]:
+        """分页查询的异步版本"""
+        pass
+
+    @abstractmethod
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[Department]:
+        pass
+
+    @abstractmethod
+    def list_subtree(self, root_id: Optional[str] = None, include_self: bool = True) -> List[Department]:
+        """一次查询获取子树（root_id 为空时为整棵树），同级按 rank、name 排序"""
+        pass
+
+    @abstractmethod
+    def rebuild_tree(self) -> int:
+        """全量重算部门路径，返回更新的行数"""
+        pass
+
+    @abstractmethod
+    def find_ids_by_values(self, field: str, values: Iterable[Any]) -> Dict[Any, Any]:
+        """一次查询找出字段值已被占用的记录，返回字段值到主键的映射"""
+        pass
+
+    @abstractmethod
+    def find_by_ids(self, entity_ids: Iterable[Union[int, str]]) -> Dict[Any, Department]:
+        pass
+
+    @abstractmethod
+    def bulk_create(self, entities: List[Department], batch_size: int = 500) -> List[Department]:
+        pass
+
+    @abstractmethod
+    def bulk_update(self, entities: List[Department], fields: Sequence[str], batch_size: int = 500) -> int:
+        pass
+
+    @abstractmethod
+    def bulk_delete(self, entity_ids: Iterable[Union[int, str]]) -> Set[Any]:
+        pass
+
+    @abstractmethod
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """集合版本：(最后修改时间, 记录数)"""
+        pass
+
+    @abstractmethod
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        pass
@@ -3,8 +3,10 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Union
+from datetime import datetime
+from typing import Optional, List, Union, Tuple
 from app.domain.models.menu_meta import MenuMeta
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class MenuMetaRepository(ABC):
@@ -22,4 +24,17 @@ class MenuMetaRepository(ABC):
 
     @abstractmethod
     def list_all(self) -> List[MenuMeta]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def list_page(self, page_request: PageRequest) -> Page[MenuMeta]:
+        pass
+
+    @abstractmethod
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """集合版本：(最后修改时间, 记录数)"""
+        pass
+
+    @abstractmethod
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        pass
@@ -3,8 +3,11 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Union
+from datetime import datetime
+from typing import Optional, List, Union, Any, Dict, Iterable, Sequence, Set, Tuple
 from app.domain.models.menu import Menu
+from app.domain.models.menu_meta import MenuMeta
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class MenuRepository(ABC):
@@ -26,4 +29,57 @@ class MenuRepository(ABC):
 
     @abstractmethod
     def list_all(self) -> List[Menu]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def list_page(self, page_request: PageRequest) -> Page[Menu]:
+        pass
+
+    @abstractmethod
+    async def alist_page(self, page_request: PageRequest) -> Page[Menu]:
+        """分页查询的异步版本"""
+        pass
+
+    @abstractmethod
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[Menu]:
+        pass
+
+    @abstractmethod
+    def list_active_by_roles(self, role_ids: Optional[Iterable[str]]) -> List[Menu]:
+        """一次查询获取角色可见的启用菜单，按 rank 排序；role_ids 为 None 时返回全部启用菜单"""
+        pass
+
+    @abstractmethod
+    def find_metas(self, meta_ids: Iterable[str]) -> Dict[str, MenuMeta]:
+        """一次查询获取菜单元数据，返回ID到元数据的映射"""
+        pass
+
+    @abstractmethod
+    def find_ids_by_values(self, field: str, values: Iterable[Any]) -> Dict[Any, Any]:
+        """一次查询找出字段值已被占用的记录，返回字段值到主键的映射"""
+        pass
+
+    @abstractmethod
+    def find_by_ids(self, entity_ids: Iterable[Union[int, str]]) -> Dict[Any, Menu]:
+        pass
+
+    @abstractmethod
+    def bulk_create(self, entities: List[Menu], batch_size: int = 500) -> List[Menu]:
+        pass
+
+    @abstractmethod
+    def bulk_update(self, entities: List[Menu], fields: Sequence[str], batch_size: int = 500) -> int:
+        pass
+
+    @abstractmethod
+    def bulk_delete(self, entity_ids: Iterable[Union[int, str]]) -> Set[Any]:
+        pass
+
+    @abstractmethod
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """集合版本：(最后修改时间, 记录数)"""
+        pass
+
+    @abstractmethod
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        pass
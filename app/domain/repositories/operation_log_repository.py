@@ -3,8 +3,9 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Any, Dict, Iterator, Sequence
 from app.domain.models.operation_log import OperationLog
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class OperationLogRepository(ABC):
@@ -22,4 +23,34 @@ class OperationLogRepository(ABC):
 
     @abstractmethod
     def list_all(self) -> List[OperationLog]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def list_page(self, page_request: PageRequest) -> Page[OperationLog]:
+        pass
+
+    @abstractmethod
+    async def alist_page(self, page_request: PageRequest) -> Page[OperationLog]:
+        """分页查询的异步版本"""
+        pass
+
+    @abstractmethod
+    def list_page_values(self, page_request: PageRequest, fields: Sequence[str]) -> Page[Dict[str, Any]]:
+        """分页查询指定字段，返回字段名到值的字典，用于列表快速路径"""
+        pass
+
+    @abstractmethod
+    async def alist_page_values(self, page_request: PageRequest, fields: Sequence[str]) -> Page[Dict[str, Any]]:
+        """list_page_values 的异步版本"""
+        pass
+
+    @abstractmethod
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[OperationLog]:
+        pass
+
+    @abstractmethod
+    def iter_values(
+        self, filters: Dict[str, Any], fields: Sequence[str], chunk_size: int = 2000
+    ) -> Iterator[Dict[str, Any]]:
+        """按创建时间顺序逐批读取指定字段，用于流式导出"""
+        pass
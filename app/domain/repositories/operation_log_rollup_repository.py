@@ -0,0 +1,27 @@
+"""
+操作日志预聚合仓储接口
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional
+from app.domain.models.operation_log import OperationLog
+
+
+class OperationLogRollupRepository(ABC):
+    @abstractmethod
+    def record(self, logs: Iterable[OperationLog]) -> int:
+        """把一批已写入的操作日志累加到各粒度的聚合行，返回更新的聚合行数"""
+        pass
+
+    @abstractmethod
+    def iter_rollups(
+        self, granularity: str, start: datetime, end: datetime, filters: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """读取 [start, end) 时间范围内的聚合行"""
+        pass
+
+    @abstractmethod
+    def rebuild(self, start: datetime, end: datetime, chunk_size: int = 2000) -> int:
+        """根据原始日志重新计算 [start, end) 范围内的聚合行，返回处理的日志条数"""
+        pass
@@ -0,0 +1,81 @@
+"""
+分页查询参数与结果
+支持两种分页方式：
+- 页码分页：page + page_size，返回总数
+- 游标分页：cursor + page_size，按默认排序字段（如 created_time, id）做键集分页，
+  每页耗时与数据总量无关，不返回总数
+"""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 200
+
+
+@dataclass
+class PageRequest:
+    """分页查询参数"""
+    page: int = 1
+    page_size: int = DEFAULT_PAGE_SIZE
+    cursor: Optional[str] = None
+    # 逗号分隔的排序字段，"-" 前缀表示倒序，如 "-created_time,id"
+    ordering: Optional[str] = None
+    # 过滤条件，键为仓储白名单中的过滤参数名
+    filters: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.page = max(1, int(self.page))
+        self.page_size = min(max(1, int(self.page_size)), MAX_PAGE_SIZE)
+
+
+@dataclass
+class Page(Generic[T]):
+    """分页查询结果"""
+    items: List[T]
+    page_size: int
+    page: Optional[int] = None
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+    def map(self, func: Callable[[T], R]) -> "Page[R]":
+        """转换分页中的每一项，保留分页信息"""
+        return Page(
+            items=[func(item) for item in self.items],
+            page_size=self.page_size,
+            page=self.page,
+            total=self.total,
+            next_cursor=self.next_cursor,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "items": self.items,
+            "page_size": self.page_size,
+            "page": self.page,
+            "total": self.total,
+            "next_cursor": self.next_cursor,
+        }
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """把排序键的值编码为不透明的游标字符串"""
+    raw = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """解码游标，格式不正确时抛出 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(values, list):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return values
@@ -5,6 +5,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from django.contrib.auth.models import Permission
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class PermissionRepository(ABC):
@@ -27,3 +28,7 @@ class PermissionRepository(ABC):
     @abstractmethod
     def list_all(self) -> List[Permission]:
         pass
+
+    @abstractmethod
+    def list_page(self, page_request: PageRequest) -> Page[Permission]:
+        pass
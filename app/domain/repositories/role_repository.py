@@ -3,8 +3,10 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Union
+from datetime import datetime
+from typing import Optional, List, Union, Any, Dict, Iterable, Sequence, Set, Tuple
 from app.domain.models.role import Role
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class RoleRepository(ABC):
@@ -30,4 +32,47 @@ class RoleRepository(ABC):
 
     @abstractmethod
     def assign_permissions(self, role_id: Union[str, int], permission_ids: List[int]) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def list_page(self, page_request: PageRequest) -> Page[Role]:
+        pass
+
+    @abstractmethod
+    async def alist_page(self, page_request: PageRequest) -> Page[Role]:
+        """分页查询的异步版本"""
+        pass
+
+    @abstractmethod
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[Role]:
+        pass
+
+    @abstractmethod
+    def find_ids_by_values(self, field: str, values: Iterable[Any]) -> Dict[Any, Any]:
+        """一次查询找出字段值已被占用的记录，返回字段值到主键的映射"""
+        pass
+
+    @abstractmethod
+    def find_by_ids(self, entity_ids: Iterable[Union[int, str]]) -> Dict[Any, Role]:
+        pass
+
+    @abstractmethod
+    def bulk_create(self, entities: List[Role], batch_size: int = 500) -> List[Role]:
+        pass
+
+    @abstractmethod
+    def bulk_update(self, entities: List[Role], fields: Sequence[str], batch_size: int = 500) -> int:
+        pass
+
+    @abstractmethod
+    def bulk_delete(self, entity_ids: Iterable[Union[int, str]]) -> Set[Any]:
+        pass
+
+    @abstractmethod
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """集合版本：(最后修改时间, 记录数)"""
+        pass
+
+    @abstractmethod
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        pass
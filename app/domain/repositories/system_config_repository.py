@@ -3,8 +3,10 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Union
+from datetime import datetime
+from typing import Optional, List, Union, Tuple
 from app.domain.models.system_config import SystemConfig
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class SystemConfigRepository(ABC):
@@ -26,4 +28,26 @@ class SystemConfigRepository(ABC):
 
     @abstractmethod
     def list_all(self) -> List[SystemConfig]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def list_page(self, page_request: PageRequest) -> Page[SystemConfig]:
+        pass
+
+    @abstractmethod
+    async def alist_page(self, page_request: PageRequest) -> Page[SystemConfig]:
+        """分页查询的异步版本"""
+        pass
+
+    @abstractmethod
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[SystemConfig]:
+        pass
+
+    @abstractmethod
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """集合版本：(最后修改时间, 记录数)"""
+        pass
+
+    @abstractmethod
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        pass
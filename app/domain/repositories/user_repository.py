@@ -3,8 +3,9 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple, Union, Any, Dict, Iterable, Sequence, Set
 from app.domain.models.user import User
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class UserRepository(ABC):
@@ -26,4 +27,48 @@ class UserRepository(ABC):
 
     @abstractmethod
     def list_all(self) -> List[User]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def list_menu_permissions(self, user_id: Union[int, str]) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        """获取用户通过角色获得的菜单权限 (code, method, path)"""
+        pass
+
+    @abstractmethod
+    def list_active_role_ids(self, user_id: Union[int, str]) -> List[str]:
+        """获取用户拥有的启用角色ID"""
+        pass
+
+    @abstractmethod
+    def list_page(self, page_request: PageRequest) -> Page[User]:
+        pass
+
+    @abstractmethod
+    async def alist_page(self, page_request: PageRequest) -> Page[User]:
+        """分页查询的异步版本"""
+        pass
+
+    @abstractmethod
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[User]:
+        pass
+
+    @abstractmethod
+    def find_ids_by_values(self, field: str, values: Iterable[Any]) -> Dict[Any, Any]:
+        """一次查询找出字段值已被占用的记录，返回字段值到主键的映射"""
+        pass
+
+    @abstractmethod
+    def find_by_ids(self, entity_ids: Iterable[Union[int, str]]) -> Dict[Any, User]:
+        pass
+
+    @abstractmethod
+    def bulk_create(self, entities: List[User], batch_size: int = 500) -> List[User]:
+        pass
+
+    @abstractmethod
+    def bulk_update(self, entities: List[User], fields: Sequence[str], batch_size: int = 500) -> int:
+        pass
+
+    @abstractmethod
+    def bulk_delete(self, entity_ids: Iterable[Union[int, str]]) -> Set[Any]:
+        pass
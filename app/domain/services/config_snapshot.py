@@ -0,0 +1,163 @@
+"""
+系统配置快照
+所有启用的 SystemConfig 一次加载到进程内，value 在加载时解析为类型化的值，
+按请求读取功能开关不再产生数据库查询。
+配置变更时递增命名空间版本号：本进程立即重新加载，其他进程在 TTL 到期检查版本号时重新加载。
+重新加载后有值变化的键会通知给 add_listener 注册的回调。
+"""
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+
+from loguru import logger
+
+from app.common.cache import bump_cache_version, get_cache_version
+
+# 系统配置快照的版本号命名空间
+SYSTEM_CONFIG_NAMESPACE = "system-config"
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+_FALSE_VALUES = {"0", "false", "no", "off", ""}
+
+
+def parse_config_value(value: Optional[str]) -> Any:
+    """
+    按 JSON 解析配置值：true/false、数字、null、对象和数组得到对应类型，其余按字符串返回
+    如 "10" -> 10，"true" -> True，'{"a": 1}' -> {"a": 1}，"001" -> "001"
+    """
+    if value is None:
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def to_bool(value: Any) -> bool:
+    """把配置值转换为布尔值，字符串支持 1/0、true/false、yes/no、on/off"""
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if normalized in _TRUE_VALUES:
+            return True
+        if normalized in _FALSE_VALUES:
+            return False
+        raise ValueError(f"Invalid boolean value: {value!r}")
+    return bool(value)
+
+
+class SystemConfigSnapshot:
+    """
+    进程内系统配置快照
+    ttl 秒内直接使用本地数据；到期后读取一次版本号，版本号变化时重新加载全部启用的配置
+    """
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[], Iterable[tuple]]] = None,
+        ttl: float = 5.0,
+        cache_alias: str = "default",
+    ):
+        self.loader = loader or _load_active_configs
+        self.ttl = max(0.0, float(ttl))
+        self.cache_alias = cache_alias
+        # (类型化的值, 原始字符串)，整体替换，读取方无需加锁
+        self._data: tuple = ({}, {})
+        self._listeners: List[Callable[[Set[str]], None]] = []
+        self._version: Optional[int] = None
+        self._loaded = False
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None, cast: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        获取类型化的配置值，配置不存在或未启用时返回 default
+        指定 cast 时对原始字符串调用 cast（cast 为 bool 时使用 to_bool），转换失败抛出 ValueError
+        """
+        values, raw = self._refresh()
+        if key not in values:
+            return default
+        if cast is None:
+            return values[key]
+        return (to_bool if cast is bool else cast)(raw[key])
+
+    def get_raw(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self._refresh()[1].get(key, default)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """批量获取配置值，只返回存在且启用的配置"""
+        values = self._refresh()[0]
+        return {key: values[key] for key in keys if key in values}
+
+    def all(self) -> Dict[str, Any]:
+        return dict(self._refresh()[0])
+
+    def add_listener(self, callback: Callable[[Set[str]], None]) -> None:
+        """注册变更回调，重新加载后以变化（新增、修改、删除）的键集合调用"""
+        self._listeners.append(callback)
+
+    def invalidate(self) -> int:
+        """配置变更时调用：递增版本号，本进程下次读取时立即重新加载"""
+        self._checked_at = 0.0
+        self._version = None
+        return bump_cache_version(SYSTEM_CONFIG_NAMESPACE, self.cache_alias)
+
+    def _refresh(self) -> tuple:
+        if self._version is not None and time.monotonic() - self._checked_at < self.ttl:
+            return self._data
+        changed: Set[str] = set()
+        with self._lock:
+            now = time.monotonic()
+            if self._version is not None and now - self._checked_at < self.ttl:
+                return self._data
+            version = get_cache_version(SYSTEM_CONFIG_NAMESPACE, self.cache_alias)
+            if version != self._version:
+                old_raw = self._data[1]
+                raw = {key: value for key, value in self.loader()}
+                self._data = ({key: parse_config_value(value) for key, value in raw.items()}, raw)
+                self._version = version
+                if self._loaded:
+                    changed = {key for key in old_raw.keys() | raw.keys() if old_raw.get(key) != raw.get(key)}
+                self._loaded = True
+            self._checked_at = now
+            data = self._data
+        if changed:
+            self._notify(changed)
+        return data
+
+    def _notify(self, changed: Set[str]) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(changed)
+            except Exception as e:
+                logger.warning(f"System config listener failed: {e}")
+
+
+def _load_active_configs() -> Iterable[tuple]:
+    from app.domain.models.system_config import SystemConfig
+
+    return SystemConfig.objects.filter(is_active=True).values_list("key", "value")  # type: ignore
+
+
+_snapshot: Optional[SystemConfigSnapshot] = None
+
+
+def get_config_snapshot() -> SystemConfigSnapshot:
+    """获取进程内共享的系统配置快照"""
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = SystemConfigSnapshot(ttl=getattr(settings, "SYSTEM_CONFIG_CACHE_TTL", 5))
+    return _snapshot
+
+
+def get_config(key: str, default: Any = None, cast: Optional[Callable[[Any], Any]] = None) -> Any:
+    """读取系统配置的快捷方式，如 get_config("feature.export", False, cast=bool)"""
+    return get_config_snapshot().get(key, default, cast)
+
+
+def invalidate_config_snapshot() -> int:
+    """SystemConfig 保存或删除后调用"""
+    return get_config_snapshot().invalidate()
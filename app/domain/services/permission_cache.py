@@ -0,0 +1,166 @@
+"""
+用户有效权限缓存
+用户的有效权限（UserRole -> RoleMenu -> Menu）只计算一次，
+缓存在进程内LRU中（条目按 timeout 过期），并可选写入Django缓存供多进程共享。
+角色、菜单及其关联变更时递增版本号，所有旧缓存随之失效。
+版本号保存在Django缓存中，缓存后端不在多进程间共享（locmem）时不启用进程内LRU。
+用户菜单树按角色集合使用同样的两级缓存，菜单元数据变更时也会失效。
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, FrozenSet, Iterable, Optional, Tuple, Union
+
+from django.conf import settings
+from django.core.cache import caches
+from loguru import logger
+
+from app.common.cache import LRUCache, bump_cache_version, get_cache_version, is_shared_cache, shared_cache_stats
+
+# 权限缓存的版本号命名空间
+PERMISSION_CACHE_NAMESPACE = "rbac:permissions"
+# 用户菜单树缓存的版本号命名空间，按角色集合缓存
+MENU_TREE_CACHE_NAMESPACE = "rbac:menu-tree"
+
+
+@dataclass(frozen=True)
+class EffectivePermissions:
+    """用户有效权限集合"""
+    user_id: Union[int, str]
+    menu_codes: FrozenSet[str] = field(default_factory=frozenset)
+    api_permissions: FrozenSet[Tuple[str, str]] = field(default_factory=frozenset)
+
+    @classmethod
+    def from_rows(cls, user_id: Union[int, str], rows: Iterable[Tuple[str, Optional[str], Optional[str]]]) -> "EffectivePermissions":
+        """由 (code, method, path) 行构造权限集合"""
+        menu_codes = set()
+        api_permissions = set()
+        for code, method, path in rows:
+            if code:
+                menu_codes.add(code)
+            if method and path:
+                api_permissions.add((method.upper(), path))
+        return cls(user_id=user_id, menu_codes=frozenset(menu_codes), api_permissions=frozenset(api_permissions))
+
+    def has_menu(self, code: str) -> bool:
+        """是否拥有指定菜单/权限码"""
+        return code in self.menu_codes
+
+    def allows(self, method: str, path: str) -> bool:
+        """是否允许访问指定接口"""
+        return (method.upper(), path) in self.api_permissions
+
+
+class PermissionCache:
+    """
+    两级权限缓存：进程内LRU + 可选的Django共享缓存
+    缓存键包含版本号，版本号递增后旧条目自然失效；namespace 不同的实例版本号互不影响。
+    进程内条目同样在 timeout 秒后过期，即使其他进程的版本号变更未被感知，陈旧权限也不会长期保留
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        timeout: int = 300,
+        use_shared_cache: bool = True,
+        cache_alias: str = "default",
+        namespace: str = PERMISSION_CACHE_NAMESPACE,
+        use_local_cache: bool = True,
+    ):
+        self.local = LRUCache(maxsize=maxsize, ttl=timeout) if use_local_cache else None
+        self.timeout = timeout
+        self.use_shared_cache = use_shared_cache
+        self.cache_alias = cache_alias
+        self.namespace = namespace
+
+    def get(
+        self,
+        user_id: Union[int, str],
+        loader: Callable[[Union[int, str]], Any],
+    ) -> Any:
+        """获取用户有效权限（或菜单树等按键缓存的值），未命中时调用 loader 计算并写入缓存"""
+        version = get_cache_version(self.namespace, self.cache_alias)
+        local_key = (str(user_id), version)
+        permissions = self.local.get(local_key) if self.local is not None else None
+        if permissions is not None:
+            return permissions
+
+        shared_key = f"{self.namespace}:{version}:{user_id}"
+        if self.use_shared_cache:
+            permissions = self._shared_get(shared_key)
+
+        if permissions is None:
+            permissions = loader(user_id)
+            if self.use_shared_cache:
+                self._shared_set(shared_key, permissions)
+
+        if self.local is not None:
+            self.local.set(local_key, permissions)
+        return permissions
+
+    def invalidate(self) -> int:
+        """使所有用户的权限缓存失效，返回新的版本号"""
+        if self.local is not None:
+            self.local.clear()
+        return bump_cache_version(self.namespace, self.cache_alias)
+
+    def _shared_get(self, key: str) -> Any:
+        try:
+            value = caches[self.cache_alias].get(key)
+        except Exception as e:
+            logger.warning(f"Failed to read permission cache: {e}")
+            return None
+        shared_cache_stats.record(value is not None)
+        return value
+
+    def _shared_set(self, key: str, permissions: Any) -> None:
+        try:
+            caches[self.cache_alias].set(key, permissions, timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f"Failed to write permission cache: {e}")
+
+
+_permission_cache: Optional[PermissionCache] = None
+
+
+def get_permission_cache() -> PermissionCache:
+    """获取进程内共享的权限缓存"""
+    global _permission_cache
+    if _permission_cache is None:
+        config = getattr(settings, "PERMISSION_CACHE", {})
+        _permission_cache = PermissionCache(
+            maxsize=config.get("MAXSIZE", 1024),
+            timeout=config.get("TIMEOUT", 300),
+            use_shared_cache=config.get("USE_SHARED_CACHE", True),
+            cache_alias=config.get("CACHE_ALIAS", "default"),
+            use_local_cache=is_shared_cache(config.get("CACHE_ALIAS", "default")),
+        )
+    return _permission_cache
+
+
+def invalidate_permission_cache() -> int:
+    """角色、菜单及关联关系变更时调用"""
+    return get_permission_cache().invalidate()
+
+
+_menu_tree_cache: Optional[PermissionCache] = None
+
+
+def get_menu_tree_cache() -> PermissionCache:
+    """获取进程内共享的菜单树缓存，键为角色集合"""
+    global _menu_tree_cache
+    if _menu_tree_cache is None:
+        config = getattr(settings, "PERMISSION_CACHE", {})
+        _menu_tree_cache = PermissionCache(
+            maxsize=config.get("MAXSIZE", 1024),
+            timeout=config.get("TIMEOUT", 300),
+            use_shared_cache=config.get("USE_SHARED_CACHE", True),
+            cache_alias=config.get("CACHE_ALIAS", "default"),
+            namespace=MENU_TREE_CACHE_NAMESPACE,
+            use_local_cache=is_shared_cache(config.get("CACHE_ALIAS", "default")),
+        )
+    return _menu_tree_cache
+
+
+def invalidate_menu_tree_cache() -> int:
+    """角色、菜单、菜单元数据及角色菜单关联变更时调用"""
+    return get_menu_tree_cache().invalidate()
@@ -2,9 +2,16 @@
 核心 RBAC 逻辑服务
 """
 
+from typing import Optional, Union
+
 from app.domain.repositories.user_repository import UserRepository
 from app.domain.repositories.role_repository import RoleRepository
 from app.domain.repositories.permission_repository import PermissionRepository
+from app.domain.services.permission_cache import (
+    EffectivePermissions,
+    PermissionCache,
+    get_permission_cache,
+)
 
 
 class RBACService:
@@ -13,14 +20,27 @@ class RBACService:
         user_repo: UserRepository,
         role_repo: RoleRepository,
         permission_repo: PermissionRepository,
+        permission_cache: Optional[PermissionCache] = None,
     ):
         self.user_repo = user_repo
         self.role_repo = role_repo
         self.permission_repo = permission_repo
+        self.permission_cache = permission_cache or get_permission_cache()
 
-    def check_user_access(self, user_id: int, resource: str, action: str) -> bool:
+    def get_effective_permissions(self, user_id: Union[int, str]) -> EffectivePermissions:
+        """
+        获取用户有效权限（经过缓存）
+        """
+        return self.permission_cache.get(user_id, self._load_effective_permissions)
+
+    def check_user_access(self, user_id: Union[int, str], resource: str, action: str) -> bool:
         """
         检查用户是否有访问特定资源和操作的权限
+        resource 为接口路径时 action 为HTTP方法；resource 也可以直接是菜单权限码
         """
-        # 实现权限检查逻辑
-        return True  # 简化实现，实际需要查询用户角色和权限
\ No newline at end of file
+        permissions = self.get_effective_permissions(user_id)
+        return permissions.allows(action, resource) or permissions.has_menu(resource)
+
+    def _load_effective_permissions(self, user_id: Union[int, str]) -> EffectivePermissions:
+        rows = self.user_repo.list_menu_permissions(user_id)
+        return EffectivePermissions.from_rows(user_id, rows)
@@ -0,0 +1,241 @@
+"""
+接口路由权限匹配器
+把启用的接口类菜单（同时配置了 method 和 path 的 Menu）按HTTP方法编译成前缀树，
+请求到来时按路径逐段匹配，耗时与菜单数量无关。
+
+路径模式示例：
+- /api/users/             精确匹配
+- /api/users/{user_id}    {xxx} 匹配任意单个路径段
+- /api/system-configs/*   * 匹配剩余的所有路径段
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from app.common.cache import bump_cache_version, get_cache_version
+
+# 路由匹配器的版本号命名空间
+ROUTE_MATCHER_NAMESPACE = "rbac:routes"
+
+PARAM_SEGMENT = "{}"
+WILDCARD_SEGMENT = "*"
+
+
+def split_path(path: str) -> List[str]:
+    """把路径拆分为路径段，忽略首尾斜杠"""
+    return [segment for segment in path.strip("/").split("/") if segment]
+
+
+def normalize_segment(segment: str) -> str:
+    """把模式中的 {param} 统一为参数占位符"""
+    if segment.startswith("{") and segment.endswith("}"):
+        return PARAM_SEGMENT
+    return segment
+
+
+class _TrieNode:
+    __slots__ = ("children", "codes")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # menu_id -> 权限码
+        self.codes: Dict[str, str] = {}
+
+
+class RoutePermissionMatcher:
+    """
+    按HTTP方法划分的路由前缀树
+    匹配优先级：字面量路径段 > {param} > *，高优先级分支走不通时回退到低优先级分支。
+    例如同时配置 /api/users/me 和 /api/users/{id}/roles 时，/api/users/me/roles 匹配后者
+    """
+
+    def __init__(self, routes: Iterable[Tuple[str, str, str, str]] = ()):
+        self._lock = threading.Lock()
+        self._roots: Dict[str, _TrieNode] = {}
+        # menu_id -> (method, path)，用于增量更新
+        self._index: Dict[str, Tuple[str, str]] = {}
+        self.load(routes)
+
+    def load(self, routes: Iterable[Tuple[str, str, str, str]]) -> None:
+        """
+        全量构建
+        routes: (menu_id, code, method, path) 序列
+        """
+        roots: Dict[str, _TrieNode] = {}
+        index: Dict[str, Tuple[str, str]] = {}
+        for menu_id, code, method, path in routes:
+            if not method or not path:
+                continue
+            method = method.upper()
+            self._insert(roots, str(menu_id), code, method, path)
+            index[str(menu_id)] = (method, path)
+        with self._lock:
+            self._roots = roots
+            self._index = index
+
+    def upsert(self, menu_id: str, code: str, method: Optional[str], path: Optional[str]) -> None:
+        """增量更新一条路由，method 或 path 为空时视为移除"""
+        menu_id = str(menu_id)
+        with self._lock:
+            self._remove_locked(menu_id)
+            if method and path:
+                method = method.upper()
+                self._insert(self._roots, menu_id, code, method, path)
+                self._index[menu_id] = (method, path)
+
+    def remove(self, menu_id: str) -> None:
+        """增量移除一条路由"""
+        with self._lock:
+            self._remove_locked(str(menu_id))
+
+    def match(self, method: str, path: str) -> Optional[str]:
+        """返回请求需要的权限码（多个菜单对应同一路由时取排序后的第一个），未配置权限的路由返回 None"""
+        codes = self.match_codes(method, path)
+        return codes[0] if codes else None
+
+    def match_codes(self, method: str, path: str) -> Tuple[str, ...]:
+        """返回路由对应的全部权限码，排序去重；未配置权限的路由返回空元组"""
+        root = self._roots.get(method.upper())
+        if root is None:
+            return ()
+        node = self._match_node(root, split_path(path), 0)
+        if node is None:
+            return ()
+        return tuple(sorted(set(node.codes.values())))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _insert(self, roots: Dict[str, _TrieNode], menu_id: str, code: str, method: str, path: str) -> None:
+        node = roots.setdefault(method, _TrieNode())
+        for segment in split_path(path):
+            node = node.children.setdefault(normalize_segment(segment), _TrieNode())
+            if segment == WILDCARD_SEGMENT:
+                break
+        node.codes[menu_id] = code
+
+    def _remove_locked(self, menu_id: str) -> None:
+        entry = self._index.pop(menu_id, None)
+        if entry is None:
+            return
+        method, path = entry
+        node = self._roots.get(method)
+        for segment in split_path(path):
+            if node is None:
+                return
+            node = node.children.get(normalize_segment(segment))
+            if segment == WILDCARD_SEGMENT:
+                break
+        if node is not None:
+            node.codes.pop(menu_id, None)
+
+    def _match_node(self, node: _TrieNode, segments: List[str], position: int) -> Optional[_TrieNode]:
+        """
+        按优先级逐段匹配：字面量子节点走不通时回退到 {param} 子节点，都走不通时由本层的 * 匹配剩余路径段。
+        每层最多尝试两个子节点，回溯只发生在同一层同时存在字面量和参数分支时
+        """
+        if position == len(segments):
+            if node.codes:
+                return node
+            wildcard = node.children.get(WILDCARD_SEGMENT)
+            return wildcard if wildcard is not None and wildcard.codes else None
+
+        for key in (segments[position], PARAM_SEGMENT):
+            child = node.children.get(key)
+            if child is not None:
+                found = self._match_node(child, segments, position + 1)
+                if found is not None:
+                    return found
+
+        wildcard = node.children.get(WILDCARD_SEGMENT)
+        if wildcard is not None and wildcard.codes:
+            return wildcard
+        return None
+
+
+class RouteMatcherRegistry:
+    """
+    进程内共享的路由匹配器
+    本进程内的菜单变更增量更新前缀树；其他进程的变更通过版本号感知后全量重建
+    """
+
+    def __init__(self, check_interval: float = 5.0):
+        self.check_interval = check_interval
+        self._matcher: Optional[RoutePermissionMatcher] = None
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_matcher(self) -> RoutePermissionMatcher:
+        now = time.monotonic()
+        if self._matcher is not None and now - self._checked_at < self.check_interval:
+            return self._matcher
+        with self._lock:
+            version = get_cache_version(ROUTE_MATCHER_NAMESPACE)
+            if self._matcher is None or version != self._version:
+                routes = self._load_routes()
+                self._matcher = RoutePermissionMatcher(routes or ())
+                # 加载失败时不记录版本号，下次检查时重试
+                self._version = version if routes is not None else None
+            self._checked_at = now
+            return self._matcher
+
+    def match(self, method: str, path: str) -> Optional[str]:
+        return self.get_matcher().match(method, path)
+
+    def match_codes(self, method: str, path: str) -> Tuple[str, ...]:
+        return self.get_matcher().match_codes(method, path)
+
+    def on_menu_saved(self, menu) -> None:
+        """菜单保存后增量更新"""
+        self.on_menus_saved([menu])
+
+    def on_menus_saved(self, menus) -> None:
+        """菜单批量保存后增量更新，只递增一次版本号"""
+        def update(matcher: RoutePermissionMatcher) -> None:
+            for menu in menus:
+                method = menu.method if menu.is_active else None
+                matcher.upsert(menu.id, menu.code, method, menu.path)
+
+        self._apply(update)
+
+    def on_menu_deleted(self, menu) -> None:
+        """菜单删除后增量更新"""
+        self._apply(lambda m: m.remove(menu.id))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._matcher = None
+            self._version = None
+
+    def _apply(self, update) -> None:
+        with self._lock:
+            up_to_date = self._version is not None and get_cache_version(ROUTE_MATCHER_NAMESPACE) == self._version
+            version = bump_cache_version(ROUTE_MATCHER_NAMESPACE)
+            if self._matcher is not None and up_to_date:
+                update(self._matcher)
+                self._version = version
+            else:
+                # 本地前缀树已落后于其他进程的变更，下次访问时全量重建
+                self._matcher = None
+                self._version = None
+
+    def _load_routes(self) -> Optional[List[Tuple[str, str, str, str]]]:
+        from app.domain.models.menu import Menu
+
+        try:
+            return list(
+                Menu.objects.filter(is_active=True)  # type: ignore
+                .exclude(method__isnull=True).exclude(method="")
+                .exclude(path__isnull=True).exclude(path="")
+                .values_list("id", "code", "method", "path")
+            )
+        except Exception as e:
+            logger.error(f"Failed to load route permissions: {e}")
+            return None
+
+
+route_matcher_registry = RouteMatcherRegistry()
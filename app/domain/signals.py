@@ -0,0 +1,151 @@
+"""
+领域模型信号处理
+角色、菜单及其关联关系变更时使相关缓存（权限、用户菜单树）失效，并增量更新路由权限匹配器；
+部门删除后维护子孙部门的物化路径；系统配置变更时使配置快照失效；
+菜单、菜单元数据、部门、角色、系统配置变更时使对应的接口响应缓存失效
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from app.common.response_cache import invalidate_response_cache, model_tag
+from app.domain.models.base_model import bulk_saved
+from app.domain.models.department import Department, TREE_PATH_SEPARATOR, is_tree_rebase_deferred, rebase_subtree
+from app.domain.models.menu import Menu
+from app.domain.models.menu_meta import MenuMeta
+from app.domain.models.role import Role
+from app.domain.models.role_menu import RoleMenu
+from app.domain.models.system_config import SystemConfig
+from app.domain.models.user_role import UserRole
+from app.domain.services.config_snapshot import invalidate_config_snapshot
+from app.domain.services.permission_cache import invalidate_menu_tree_cache, invalidate_permission_cache
+from app.domain.services.route_matcher import route_matcher_registry
+
+# 影响用户有效权限的模型
+PERMISSION_MODELS = (UserRole, RoleMenu, Role, Menu)
+
+
+def invalidate_permissions_on_change(sender, **kwargs):
+    """
+    权限相关模型保存或删除后递增权限缓存版本号
+    提交后再递增一次，避免其他请求在事务提交前用旧的授权写入了新版本号下的缓存
+    """
+    invalidate_permission_cache()
+    transaction.on_commit(invalidate_permission_cache)
+
+
+for _model in PERMISSION_MODELS:
+    post_save.connect(
+        invalidate_permissions_on_change, sender=_model,
+        dispatch_uid=f"invalidate_permissions_{_model.__name__}_save",
+    )
+    post_delete.connect(
+        invalidate_permissions_on_change, sender=_model,
+        dispatch_uid=f"invalidate_permissions_{_model.__name__}_delete",
+    )
+    bulk_saved.connect(
+        invalidate_permissions_on_change, sender=_model,
+        dispatch_uid=f"invalidate_permissions_{_model.__name__}_bulk",
+    )
+
+
+# 影响用户菜单树的模型；用户角色变更会改变角色集合，不需要使菜单树失效
+MENU_TREE_MODELS = (Role, RoleMenu, Menu, MenuMeta)
+
+
+def invalidate_menu_tree_on_change(sender, **kwargs):
+    """
+    菜单树相关模型保存或删除后递增菜单树缓存版本号
+    提交后再递增一次，避免其他请求在事务提交前用旧数据写入了新版本号下的缓存
+    """
+    invalidate_menu_tree_cache()
+    transaction.on_commit(invalidate_menu_tree_cache)
+
+
+for _model in MENU_TREE_MODELS:
+    post_save.connect(
+        invalidate_menu_tree_on_change, sender=_model,
+        dispatch_uid=f"invalidate_menu_tree_{_model.__name__}_save",
+    )
+    post_delete.connect(
+        invalidate_menu_tree_on_change, sender=_model,
+        dispatch_uid=f"invalidate_menu_tree_{_model.__name__}_delete",
+    )
+    bulk_saved.connect(
+        invalidate_menu_tree_on_change, sender=_model,
+        dispatch_uid=f"invalidate_menu_tree_{_model.__name__}_bulk",
+    )
+
+
+def update_route_matcher_on_save(sender, instance, **kwargs):
+    """菜单保存后增量更新路由权限匹配器"""
+    route_matcher_registry.on_menu_saved(instance)
+
+
+def update_route_matcher_on_delete(sender, instance, **kwargs):
+    """菜单删除后增量更新路由权限匹配器"""
+    route_matcher_registry.on_menu_deleted(instance)
+
+
+post_save.connect(update_route_matcher_on_save, sender=Menu, dispatch_uid="update_route_matcher_save")
+post_delete.connect(update_route_matcher_on_delete, sender=Menu, dispatch_uid="update_route_matcher_delete")
+
+
+def update_route_matcher_on_bulk_save(sender, instances, **kwargs):
+    """菜单批量写入后一次性增量更新路由权限匹配器"""
+    route_matcher_registry.on_menus_saved(instances)
+
+
+bulk_saved.connect(update_route_matcher_on_bulk_save, sender=Menu, dispatch_uid="update_route_matcher_bulk")
+
+
+def detach_department_subtree_on_delete(sender, instance, **kwargs):
+    """部门删除后子部门的 parent 被置空，子孙部门的路径去掉已删除部门及其祖先；批量删除时由仓储统一重算"""
+    if instance.tree_path and not is_tree_rebase_deferred():
+        rebase_subtree(instance.tree_path, TREE_PATH_SEPARATOR, -(instance.depth + 1))
+
+
+post_delete.connect(
+    detach_department_subtree_on_delete, sender=Department, dispatch_uid="detach_department_subtree_delete"
+)
+
+
+def invalidate_config_snapshot_on_change(sender, **kwargs):
+    """
+    系统配置保存或删除后使配置快照失效
+    提交后再失效一次，避免其他进程在事务提交前用旧数据加载了新版本号
+    """
+    invalidate_config_snapshot()
+    transaction.on_commit(invalidate_config_snapshot)
+
+
+post_save.connect(
+    invalidate_config_snapshot_on_change, sender=SystemConfig, dispatch_uid="invalidate_config_snapshot_save"
+)
+post_delete.connect(
+    invalidate_config_snapshot_on_change, sender=SystemConfig, dispatch_uid="invalidate_config_snapshot_delete"
+)
+
+
+# 接口响应缓存以模型为标签，模型保存、删除或批量写入后使带有该标签的缓存失效
+RESPONSE_CACHE_MODELS = (Menu, MenuMeta, Department, Role, SystemConfig)
+
+
+def invalidate_response_cache_on_change(sender, **kwargs):
+    """接口响应缓存相关模型保存或删除后递增该模型标签的版本号"""
+    invalidate_response_cache([model_tag(sender)])
+
+
+for _model in RESPONSE_CACHE_MODELS:
+    post_save.connect(
+        invalidate_response_cache_on_change, sender=_model,
+        dispatch_uid=f"invalidate_response_cache_{_model.__name__}_save",
+    )
+    post_delete.connect(
+        invalidate_response_cache_on_change, sender=_model,
+        dispatch_uid=f"invalidate_response_cache_{_model.__name__}_delete",
+    )
+    bulk_saved.connect(
+        invalidate_response_cache_on_change, sender=_model,
+        dispatch_uid=f"invalidate_response_cache_{_model.__name__}_bulk",
+    )
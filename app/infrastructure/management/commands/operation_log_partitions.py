@@ -0,0 +1,42 @@
+"""
+管理操作日志的按月分区（仅 PostgreSQL）
+
+示例：
+    python manage.py operation_log_partitions --convert          # 一次性把现有表转换为分区表
+    python manage.py operation_log_partitions --months-ahead 3   # 预建当前月及之后3个月的分区
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.domain.models.operation_log import OperationLog
+from app.infrastructure.persistence.partitions import MonthlyPartitionManager
+
+
+class Command(BaseCommand):
+    help = "Convert system_operation_log to monthly PostgreSQL partitions and create upcoming partitions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--convert", action="store_true", help="把普通表转换为按月分区表")
+        parser.add_argument("--months-ahead", type=int, default=3, help="预建未来几个月的分区")
+        parser.add_argument("--database", default="default", help="数据库别名")
+
+    def handle(self, *args, **options):
+        manager = MonthlyPartitionManager(OperationLog, "created_time", using=options["database"])
+        if not manager.is_supported():
+            raise CommandError("Monthly partitioning is only supported on PostgreSQL.")
+
+        try:
+            if options["convert"]:
+                created = manager.convert(months_ahead=options["months_ahead"])
+            else:
+                created = manager.ensure(months_ahead=options["months_ahead"])
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        for name in created:
+            self.stdout.write(f"Created partition {name}")
+        partitions = manager.list_partitions()
+        self.stdout.write(self.style.SUCCESS(
+            f"{manager.table} has {len(partitions)} monthly partitions"
+            + (f" ({partitions[0].name} .. {partitions[-1].name})." if partitions else ".")
+        ))
@@ -0,0 +1,56 @@
+"""
+按保留策略清理操作日志
+
+示例：
+    python manage.py purge_operation_logs                      # 使用 OPERATION_LOG_RETENTION 配置
+    python manage.py purge_operation_logs --days 90 --dry-run  # 只统计过期条数
+    python manage.py purge_operation_logs --interval 86400     # 常驻运行，每天清理一次
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.infrastructure.persistence.retention import OperationLogRetention
+
+
+class Command(BaseCommand):
+    help = "Delete (and optionally archive) operation logs older than the retention policy in bounded batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, help="保留天数，默认取 OPERATION_LOG_RETENTION_DAYS")
+        parser.add_argument("--batch-size", type=int, help="每批删除的条数")
+        parser.add_argument("--archive-dir", help="归档目录，删除前写入 gzip 压缩的 NDJSON 文件")
+        parser.add_argument("--sleep", type=float, help="每批删除后的等待秒数")
+        parser.add_argument("--database", default="default", help="数据库别名")
+        parser.add_argument("--dry-run", action="store_true", help="只统计过期条数，不删除")
+        parser.add_argument("--interval", type=float, default=0, help="大于0时常驻运行，按该间隔（秒）重复清理")
+
+    def handle(self, *args, **options):
+        retention = OperationLogRetention(
+            days=options["days"],
+            batch_size=options["batch_size"],
+            archive_dir=options["archive_dir"],
+            batch_sleep=options["sleep"],
+            using=options["database"],
+        )
+        if retention.days <= 0:
+            raise CommandError("Retention days must be positive.")
+
+        if options["dry_run"]:
+            count = retention.count_expired()
+            self.stdout.write(f"{count} operation logs older than {retention.get_cutoff():%Y-%m-%d %H:%M:%S} would be deleted.")
+            return
+
+        while True:
+            result = retention.run()
+            self.stdout.write(self.style.SUCCESS(
+                f"Deleted {result.deleted} operation logs in {result.batches} batches "
+                f"(cutoff {result.cutoff:%Y-%m-%d %H:%M:%S}, archived {result.archived}, "
+                f"dropped partitions {len(result.dropped_partitions)}, deleted rollups {result.rollups_deleted})."
+            ))
+            if result.archive_file:
+                self.stdout.write(f"Archive: {result.archive_file}")
+            if options["interval"] <= 0:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,21 @@
+"""
+根据 parent 关系全量重算部门物化路径
+用于直接改库或导入数据后修复部门树
+
+示例：
+    python manage.py rebuild_department_tree
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.domain.models.department import Department
+
+
+class Command(BaseCommand):
+    help = "Recompute department tree paths from parent relations."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            updated = Department.rebuild_tree()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt department tree, {updated} departments updated."))
@@ -0,0 +1,31 @@
+"""
+根据原始操作日志重建预聚合统计
+
+示例：
+    python manage.py rebuild_operation_log_rollups --days 30
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from app.infrastructure.persistence.repos.operation_log_rollup_repo_impl import (
+    DjangoORMOperationLogRollupRepository,
+)
+
+
+class Command(BaseCommand):
+    help = "Recompute operation log rollups from raw operation logs for the last N days."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=7, help="重建最近几天的统计")
+        parser.add_argument("--chunk-size", type=int, default=2000, help="每批读取的日志条数")
+
+    def handle(self, *args, **options):
+        if options["days"] <= 0:
+            raise CommandError("--days must be positive.")
+        end = timezone.now()
+        start = end - timedelta(days=options["days"])
+        total = DjangoORMOperationLogRollupRepository().rebuild(start, end, chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt rollups from {total} operation logs since {start:%Y-%m-%d %H:%M}."))
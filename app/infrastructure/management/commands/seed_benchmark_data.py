@@ -0,0 +1,144 @@
+"""
+生成压测数据
+- bench_admin：超级用户
+- bench_operator：普通用户，通过角色拥有压测路由对应的接口类菜单，请求会经过路由前缀树和权限缓存
+- bench_user_*：用户列表数据
+- 操作日志：按时间均匀分布在最近 --days 天内
+数量参数表示目标总数，已存在的数据会保留，只补足差额。
+
+示例：
+    python manage.py seed_benchmark_data --users 10000 --operation-logs 100000
+"""
+
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from app.domain.models.department import Department
+from app.domain.models.menu import Menu
+from app.domain.models.operation_log import OperationLog
+from app.domain.models.role import Role
+from app.domain.models.role_menu import RoleMenu
+from app.domain.models.user import User
+from app.domain.models.user_role import UserRole
+
+BENCH_PASSWORD = "bench123"
+BENCH_USER_PREFIX = "bench_user_"
+# 授予 bench_operator 的接口类菜单 (method, path)
+BENCH_ROUTES = (
+    ("GET", "/api/departments/{department_id}"),
+    ("PUT", "/api/departments/{department_id}"),
+    ("GET", "/api/users/"),
+    ("GET", "/api/operation-logs/"),
+)
+_MODULES = ("用户管理", "角色管理", "部门管理", "菜单管理", "系统配置")
+_METHODS = (("GET", "查询"), ("POST", "新增"), ("PUT", "修改"), ("DELETE", "删除"))
+
+
+def seed_accounts(password: str = BENCH_PASSWORD) -> dict:
+    """创建压测账号、部门、角色和菜单，返回压测用到的ID"""
+    with transaction.atomic():
+        department, _ = Department.objects.get_or_create(  # type: ignore
+            code="bench",
+            defaults={"name": "压测部门", "rank": 0, "auto_bind": False, "is_active": True, "mode_type": 0},
+        )
+        admin = User.objects.filter(username="bench_admin").first()  # type: ignore
+        if admin is None:
+            User.objects.create_superuser("bench_admin", "bench_admin@example.com", password)  # type: ignore
+        operator = User.objects.filter(username="bench_operator").first()  # type: ignore
+        if operator is None:
+            operator = User(username="bench_operator", email="bench_operator@example.com", dept=department)
+            operator.set_password(password)
+            operator.save()
+
+        role, _ = Role.objects.get_or_create(code="bench", defaults={"name": "压测角色", "is_active": True})  # type: ignore
+        UserRole.objects.get_or_create(user=operator, role=role)  # type: ignore
+        for method, path in BENCH_ROUTES:
+            code = f"bench:{method}:{path}"
+            menu, _ = Menu.objects.get_or_create(  # type: ignore
+                code=code,
+                defaults={
+                    "name": code, "menu_type": 2, "rank": 0, "path": path, "method": method,
+                    "is_active": True, "meta_id": "",
+                },
+            )
+            RoleMenu.objects.get_or_create(role=role, menu=menu)  # type: ignore
+    return {"department_id": department.id, "operator_id": operator.id}
+
+
+def seed_users(count: int, batch_size: int = 2000, password: str = BENCH_PASSWORD) -> int:
+    """补足 bench_user_* 用户到 count 个，返回新建数量"""
+    existing = User.objects.filter(username__startswith=BENCH_USER_PREFIX).count()  # type: ignore
+    # 所有压测用户共用一个密码哈希，避免生成数据时逐个计算
+    password_hash = make_password(password)
+    now = timezone.now()
+    created = 0
+    for start in range(existing, count, batch_size):
+        users = [
+            User(
+                username=f"{BENCH_USER_PREFIX}{n:07d}", email=f"{BENCH_USER_PREFIX}{n}@example.com",
+                nickname=f"压测用户{n}", password=password_hash,
+                created_time=now - timedelta(seconds=n), updated_time=now, date_joined=now,
+            )
+            for n in range(start, min(start + batch_size, count))
+        ]
+        User.objects.bulk_create(users, batch_size=batch_size)  # type: ignore
+        created += len(users)
+    return created
+
+
+def seed_operation_logs(count: int, batch_size: int = 2000, days: int = 30, seed: int = 0) -> int:
+    """补足操作日志到 count 条，返回新建数量"""
+    existing = OperationLog.objects.count()  # type: ignore
+    if existing >= count:
+        return 0
+    user = User.objects.filter(username="bench_admin").first() or User.objects.order_by("created_time").first()  # type: ignore
+    if user is None:
+        raise ValueError("Operation logs require at least one user, run seed_accounts first.")
+
+    rng = random.Random(seed + existing)
+    now = timezone.now()
+    span = days * 86400
+    created = 0
+    for start in range(existing, count, batch_size):
+        logs = []
+        for _ in range(start, min(start + batch_size, count)):
+            request_method, business_type = rng.choice(_METHODS)
+            status = rng.random() > 0.05
+            logs.append(OperationLog(
+                created_time=now - timedelta(seconds=rng.randrange(span)),
+                module=rng.choice(_MODULES), title=business_type, business_type=business_type,
+                method="bench", request_method=request_method, operator_type="后台用户",
+                oper_name=user.username, dept_name="", oper_url="/api/bench/", oper_ip="127.0.0.1",
+                oper_location="", oper_param="{}", json_result="{}", status=status,
+                error_msg=None if status else "bench error", cost_time=int(rng.lognormvariate(3, 0.8)),
+                user=user,
+            ))
+        OperationLog.objects.bulk_create(logs, batch_size=batch_size)  # type: ignore
+        created += len(logs)
+    return created
+
+
+class Command(BaseCommand):
+    help = "Seed accounts, users and operation logs for benchmarks and load tests."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10000, help="bench_user_* 用户目标数量")
+        parser.add_argument("--operation-logs", type=int, default=100000, help="操作日志目标数量")
+        parser.add_argument("--days", type=int, default=30, help="操作日志分布在最近几天")
+        parser.add_argument("--batch-size", type=int, default=2000, help="每批插入的行数")
+        parser.add_argument("--password", default=BENCH_PASSWORD, help="压测账号密码")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] <= 0 or options["days"] <= 0:
+            raise CommandError("--batch-size and --days must be positive.")
+        ids = seed_accounts(options["password"])
+        users = seed_users(options["users"], options["batch_size"], options["password"])
+        logs = seed_operation_logs(options["operation_logs"], options["batch_size"], options["days"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {users} users and {logs} operation logs; bench department id: {ids['department_id']}."
+        ))
@@ -0,0 +1,55 @@
+"""
+按 SERVER_* 配置启动生产环境服务器（gunicorn）
+
+示例：
+    python manage.py serve                          # 使用 SERVER_* 配置
+    python manage.py serve --worker-class uvicorn   # ASGI，异步视图在事件循环中并发处理
+    python manage.py serve --workers 2 --threads 8 --print  # 只输出启动命令
+"""
+
+import os
+import shlex
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from service.server import WORKER_CLASSES, build_server_config, describe
+
+
+class Command(BaseCommand):
+    help = "Run gunicorn with the worker model configured by the SERVER_* settings."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--worker-class", choices=list(WORKER_CLASSES), help="worker类型，默认取 SERVER_WORKER_CLASS")
+        parser.add_argument("--workers", type=int, help="进程数，0 表示根据CPU数计算")
+        parser.add_argument("--threads", type=int, help="gthread 每个进程的线程数，0 表示使用默认值")
+        parser.add_argument("--bind", help="监听地址，如 0.0.0.0:8000")
+        parser.add_argument("--no-preload", dest="preload", action="store_const", const=False, help="不预加载应用")
+        parser.add_argument("--print", dest="print_only", action="store_true", help="只输出启动命令，不启动")
+
+    def handle(self, *args, **options):
+        try:
+            config = build_server_config(
+                worker_class=options["worker_class"],
+                workers=options["workers"],
+                threads=options["threads"],
+                bind=options["bind"],
+                preload=options["preload"],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        # 命令行参数通过环境变量传给 gunicorn 配置文件，与 SERVER_* 配置使用同一套计算规则
+        overrides = {
+            f"SERVER_{key.upper()}": str(options[key]).lower() if key == "preload" else str(options[key])
+            for key in ("worker_class", "workers", "threads", "bind", "preload")
+            if options[key] is not None
+        }
+        argv = [sys.executable, "-m", "gunicorn", "-c", "python:service.gunicorn_conf"]
+        self.stdout.write(f"Server profile: {describe(config)}")
+        if options["print_only"]:
+            self.stdout.write(shlex.join([f"{key}={value}" for key, value in overrides.items()] + argv))
+            return
+        self.stdout.flush()
+        # 替换当前进程，gunicorn 主进程直接接收容器的信号
+        os.execve(sys.executable, argv, {**os.environ, **overrides})
@@ -0,0 +1,191 @@
+"""
+数据库路由（读写分离）
+写入和迁移始终使用主库；读查询在以下情况下路由到只读副本：
+- 请求被标记为副本读取（use_replica，由 ReplicaReadMiddleware 按请求路径设置）
+- 仓储声明 replica_reads 后的列表和导出查询
+多个副本按轮询选择，定期检查连接，不可用的副本在下次检查前跳过，全部不可用时回到主库。
+同一请求中发生写入后，后续读查询固定使用主库，保证读到自己的写入。
+"""
+
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Sequence
+
+from django.conf import settings
+from django.db import connections
+
+from loguru import logger
+
+# 当前上下文（请求线程或协程）的读查询是否使用副本
+_use_replica: ContextVar[bool] = ContextVar("use_replica", default=False)
+# 当前请求的路由状态，由 request_scope 设置；sync_to_async 复制上下文时共享同一个字典
+_request_state: ContextVar[Optional[Dict[str, bool]]] = ContextVar("db_request_state", default=None)
+
+
+def replica_reads_enabled() -> bool:
+    return _use_replica.get()
+
+
+@contextmanager
+def use_replica(enabled: bool = True):
+    """在上下文中把读查询路由到副本，可嵌套"""
+    token = _use_replica.set(enabled)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+@contextmanager
+def request_scope(replica: bool = False):
+    """一个请求的路由范围：开始时未固定主库，结束时丢弃状态"""
+    state_token = _request_state.set({"pinned": False})
+    replica_token = _use_replica.set(replica)
+    try:
+        yield
+    finally:
+        _use_replica.reset(replica_token)
+        _request_state.reset(state_token)
+
+
+def pin_primary() -> None:
+    """当前请求后续的读查询固定使用主库，在请求范围外调用无效"""
+    state = _request_state.get()
+    if state is not None:
+        state["pinned"] = True
+
+
+def is_pinned_to_primary() -> bool:
+    state = _request_state.get()
+    return bool(state and state["pinned"])
+
+
+@contextmanager
+def use_primary():
+    """
+    在上下文中读查询使用主库，用于结果会被缓存的读取，避免把延迟副本上的旧数据写入缓存
+    请求范围内同时固定主库，本请求后续的读查询也使用主库
+    """
+    pin_primary()
+    with use_replica(False):
+        yield
+
+
+def check_connection(alias: str) -> bool:
+    """执行一次简单查询检查连接是否可用"""
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute("SELECT 1")
+        return True
+    except Exception as e:
+        logger.warning(f"Database replica {alias} is unavailable: {e}")
+        return False
+
+
+class ReplicaPool:
+    """
+    只读副本池，轮询选择可用的副本
+    每个副本最多每 check_interval 秒检查一次连接，结果在检查之间复用
+    """
+
+    def __init__(
+        self,
+        aliases: Sequence[str],
+        check_interval: float = 30.0,
+        checker: Callable[[str], bool] = check_connection,
+    ):
+        self.aliases: List[str] = list(aliases)
+        self.check_interval = check_interval
+        self.checker = checker
+        self._counter = itertools.count()
+        self._healthy: Dict[str, bool] = {}
+        self._next_check: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def choose(self) -> Optional[str]:
+        """返回下一个可用的副本，没有可用副本时返回 None"""
+        count = len(self.aliases)
+        if not count:
+            return None
+        start = next(self._counter)
+        for offset in range(count):
+            alias = self.aliases[(start + offset) % count]
+            if self.is_healthy(alias):
+                return alias
+        return None
+
+    def is_healthy(self, alias: str) -> bool:
+        now = time.monotonic()
+        if now < self._next_check.get(alias, 0.0):
+            return self._healthy[alias]
+        with self._lock:
+            if now < self._next_check.get(alias, 0.0):
+                return self._healthy[alias]
+            # 先推迟下次检查，避免并发请求同时检查同一个副本
+            self._next_check[alias] = now + self.check_interval
+            self._healthy.setdefault(alias, True)
+        healthy = self.checker(alias)
+        if healthy != self._healthy.get(alias):
+            logger.info(f"Database replica {alias} is {'available' if healthy else 'unavailable'}.")
+        self._healthy[alias] = healthy
+        return healthy
+
+
+_replica_pool: Optional[ReplicaPool] = None
+
+
+def get_replica_pool() -> ReplicaPool:
+    """进程内共享的副本池，副本列表来自 DATABASE_REPLICAS"""
+    global _replica_pool
+    if _replica_pool is None:
+        _replica_pool = ReplicaPool(
+            getattr(settings, "DATABASE_REPLICAS", []),
+            check_interval=getattr(settings, "DATABASE_REPLICA_HEALTH_CHECK_INTERVAL", 30.0),
+        )
+    return _replica_pool
+
+
+def replica_for_read() -> Optional[str]:
+    """本次读查询应使用的副本；当前请求已写入或没有可用副本时返回 None（使用主库）"""
+    if is_pinned_to_primary():
+        return None
+    return get_replica_pool().choose()
+
+
+# 数据库缓存表（CACHE_URL=db://...）的 app_label
+CACHE_APP_LABEL = "django_cache"
+
+
+class ReplicaRouter:
+    """主库写、副本读的数据库路由"""
+
+    def __init__(self, pool: Optional[ReplicaPool] = None):
+        self._pool = pool
+
+    @property
+    def pool(self) -> ReplicaPool:
+        return self._pool or get_replica_pool()
+
+    def db_for_read(self, model, **hints):
+        # 缓存表（版本号等）必须读到最新值，始终使用主库
+        if model._meta.app_label == CACHE_APP_LABEL:
+            return "default"
+        if replica_reads_enabled() and not is_pinned_to_primary():
+            return self.pool.choose()
+        return None
+
+    def db_for_write(self, model, **hints):
+        # 写入缓存表不是业务写入，不把请求固定到主库
+        if model._meta.app_label != CACHE_APP_LABEL:
+            pin_primary()
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 副本是主库的复制，两边的对象可以互相关联
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in self.pool.aliases
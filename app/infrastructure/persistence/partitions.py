@@ -0,0 +1,171 @@
+"""
+按月分区管理（仅 PostgreSQL 声明式分区）
+分区命名为 <表名>_pYYYYMM，范围为 [月初, 下月初)；分区键为空的数据进入 <表名>_default 分区。
+其他数据库上 is_partitioned() 恒为 False，保留策略退化为按批删除。
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from typing import List, Optional, Type
+
+from django.db import connections, models, transaction
+from django.utils import timezone
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class Partition:
+    name: str
+    start: datetime
+    end: datetime
+
+
+def month_start(value: datetime) -> datetime:
+    """取所在月份的月初（UTC）"""
+    value = value.astimezone(dt_timezone.utc) if timezone.is_aware(value) else value.replace(tzinfo=dt_timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+class MonthlyPartitionManager:
+    def __init__(self, model: Type[models.Model], column: str, using: str = "default"):
+        self.model = model
+        self.table = model._meta.db_table
+        self.column = column
+        self.using = using
+        self._name_pattern = re.compile(rf"^{re.escape(self.table)}_p(\d{{4}})(\d{{2}})$")
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    def is_supported(self) -> bool:
+        return self.connection.vendor == "postgresql"
+
+    def is_partitioned(self) -> bool:
+        if not self.is_supported():
+            return False
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid "
+                "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+                [self.table],
+            )
+            return cursor.fetchone() is not None
+
+    def partition_name(self, month: datetime) -> str:
+        return f"{self.table}_p{month:%Y%m}"
+
+    def list_partitions(self) -> List[Partition]:
+        """按时间顺序列出月分区，不含默认分区"""
+        if not self.is_partitioned():
+            return []
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT child.relname FROM pg_inherits i "
+                "JOIN pg_class parent ON parent.oid = i.inhparent "
+                "JOIN pg_class child ON child.oid = i.inhrelid "
+                "WHERE parent.relname = %s AND pg_table_is_visible(parent.oid)",
+                [self.table],
+            )
+            names = [row[0] for row in cursor.fetchall()]
+        partitions = []
+        for name in names:
+            match = self._name_pattern.match(name)
+            if match:
+                start = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=dt_timezone.utc)
+                partitions.append(Partition(name, start, add_months(start, 1)))
+        return sorted(partitions, key=lambda p: p.start)
+
+    def ensure(self, months_ahead: int = 3, now: Optional[datetime] = None) -> List[str]:
+        """创建当前月份及之后 months_ahead 个月的分区，返回新建的分区名"""
+        self._require_partitioned()
+        existing = {p.name for p in self.list_partitions()}
+        current = month_start(now or timezone.now())
+        created = []
+        for offset in range(max(0, months_ahead) + 1):
+            start = add_months(current, offset)
+            name = self.partition_name(start)
+            if name not in existing:
+                self._create_partition(start)
+                created.append(name)
+        return created
+
+    def drop(self, name: str) -> None:
+        """先 DETACH 再 DROP，避免长时间持有父表的排他锁"""
+        qn = self.connection.ops.quote_name
+        with transaction.atomic(using=self.using):
+            with self.connection.cursor() as cursor:
+                cursor.execute(f"ALTER TABLE {qn(self.table)} DETACH PARTITION {qn(name)}")
+                cursor.execute(f"DROP TABLE {qn(name)}")
+        logger.info(f"Dropped partition {name}")
+
+    def convert(self, months_ahead: int = 3, now: Optional[datetime] = None) -> List[str]:
+        """
+        把普通表转换为按月分区表（一次性操作，在单个事务中完成，期间阻塞写入）
+        分区表的唯一约束必须包含分区键，因此主键改为 (id, 分区键) 唯一索引；
+        外键约束不再在数据库层声明，级联删除仍由 Django 处理。
+        """
+        if not self.is_supported():
+            raise RuntimeError("Declarative partitioning requires PostgreSQL.")
+        if self.is_partitioned():
+            raise RuntimeError(f"Table {self.table} is already partitioned.")
+
+        qn = self.connection.ops.quote_name
+        table, column, legacy = qn(self.table), qn(self.column), qn(f"{self.table}_legacy")
+        with transaction.atomic(using=self.using):
+            with self.connection.cursor() as cursor:
+                cursor.execute(f"SELECT MIN({column}) FROM {table}")
+                oldest = cursor.fetchone()[0]
+                cursor.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+                cursor.execute(
+                    f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE ({column})"
+                )
+                cursor.execute(f"CREATE TABLE {qn(self.table + '_default')} PARTITION OF {table} DEFAULT")
+
+            current = month_start(now or timezone.now())
+            start = month_start(oldest) if oldest else current
+            created = []
+            while start <= add_months(current, max(0, months_ahead)):
+                self._create_partition(start)
+                created.append(self.partition_name(start))
+                start = add_months(start, 1)
+
+            with self.connection.cursor() as cursor:
+                cursor.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+                cursor.execute(f"DROP TABLE {legacy}")
+                cursor.execute(
+                    f"CREATE UNIQUE INDEX {qn(self.table + '_pk_idx')} ON {table} "
+                    f"({qn(self.model._meta.pk.column)}, {column})"
+                )
+            with self.connection.schema_editor(atomic=False) as editor:
+                for index in self.model._meta.indexes:
+                    editor.add_index(self.model, index)
+                for field in self.model._meta.concrete_fields:
+                    if field.db_index and not field.primary_key and not field.unique:
+                        editor.execute(
+                            f"CREATE INDEX {qn(self.table + '_' + field.column + '_idx')} "
+                            f"ON {table} ({qn(field.column)})"
+                        )
+        logger.info(f"Converted {self.table} to monthly partitions: {created}")
+        return created
+
+    def _create_partition(self, start: datetime) -> None:
+        qn = self.connection.ops.quote_name
+        end = add_months(start, 1)
+        # 边界值由本模块生成，直接内联，兼容不支持DDL参数绑定的驱动
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {qn(self.partition_name(start))} PARTITION OF {qn(self.table)} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+
+    def _require_partitioned(self) -> None:
+        if not self.is_partitioned():
+            raise RuntimeError(f"Table {self.table} is not partitioned.")
@@ -3,9 +3,15 @@
 """
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
-from django.db.models import QuerySet
-from typing import TypeVar, Generic, Optional, List, Type, Union, Dict, Any
+from django.db import models, transaction
+from django.db.models import Count, Max, Q, QuerySet
+from datetime import datetime
+from typing import TypeVar, Generic, Optional, List, Type, Union, Dict, Any, Iterable, Iterator, Sequence, Set, Tuple
+
+from app.common.exception.exceptions import ValidationException
+from app.domain.repositories.pagination import Page, PageRequest, decode_cursor, encode_cursor
+from app.domain.signals import bulk_saved
+from app.infrastructure.persistence.db_router import replica_for_read
 
 # 定义一个绑定到Django模型的泛型类型变量
 T = TypeVar('T', bound=models.Model)  # 泛型类型变量，代表Django模型类
@@ -13,6 +19,15 @@ T = TypeVar('T', bound=models.Model)  # 泛型类型变量，代表Django模型
 
 class BaseRepository(Generic[T]):
     model_class: Type[T]
+
+    # 允许的过滤参数 -> ORM查找表达式；值为元组时表示多个字段的模糊搜索（OR）
+    filter_fields: Dict[str, Union[str, Tuple[str, ...]]] = {}
+    # 允许排序的字段
+    ordering_fields: Tuple[str, ...] = ("created_time", "id")
+    # 默认排序，同时作为游标分页的键
+    default_ordering: Tuple[str, ...] = ("-created_time", "-id")
+    # 列表和导出查询是否从只读副本读取（当前请求已写入或副本不可用时使用主库）
+    replica_reads: bool = False
     
     def __init__(self, model_class: Type[T]):
         """
@@ -79,6 +94,95 @@ class BaseRepository(Generic[T]):
         """
         return list(self.model_class.objects.all())  # type: ignore
     
+    def find_ids_by_values(self, field: str, values: Iterable[Any]) -> Dict[Any, Any]:
+        """
+        一次 IN 查询找出字段值已被占用的记录
+
+        Returns:
+            字段值到主键的映射
+        """
+        values = {value for value in values if value is not None}
+        if not values:
+            return {}
+        rows = self.model_class.objects.filter(**{f"{field}__in": values}).values_list(field, "pk")  # type: ignore
+        return dict(rows)
+
+    def find_by_ids(self, entity_ids: Iterable[Union[int, str]]) -> Dict[Any, T]:
+        """
+        一次查询按主键批量获取实体
+
+        Returns:
+            主键到实体的映射，不存在的主键不在结果中
+        """
+        return self.model_class.objects.in_bulk(list(entity_ids))  # type: ignore
+
+    def bulk_create(self, entities: List[T], batch_size: int = 500) -> List[T]:
+        """
+        在一个事务中批量插入实体
+        bulk_create 不触发 save 和 post_save，这里补齐审计字段并在写入后发送 bulk_saved 信号
+        """
+        if not entities:
+            return []
+        for entity in entities:
+            if hasattr(entity, "stamp_audit_fields"):
+                entity.stamp_audit_fields()
+        with transaction.atomic():
+            created = self.model_class.objects.bulk_create(entities, batch_size=batch_size)  # type: ignore
+        bulk_saved.send(sender=self.model_class, instances=created)
+        return created
+
+    def bulk_update(self, entities: List[T], fields: Sequence[str], batch_size: int = 500) -> int:
+        """
+        在一个事务中批量更新实体的指定字段，同时更新审计字段
+
+        Returns:
+            更新的行数
+        """
+        if not entities or not fields:
+            return 0
+        fields = list(dict.fromkeys(fields))
+        if hasattr(entities[0], "stamp_audit_fields"):
+            for entity in entities:
+                entity.stamp_audit_fields()
+            fields += [name for name in ("updated_time", "modifier") if name not in fields]
+        with transaction.atomic():
+            updated = self.model_class.objects.bulk_update(entities, fields, batch_size=batch_size)  # type: ignore
+        bulk_saved.send(sender=self.model_class, instances=entities)
+        return updated
+
+    def bulk_delete(self, entity_ids: Iterable[Union[int, str]]) -> Set[Any]:
+        """
+        在一个事务中按主键批量删除，级联和 post_delete 信号与单条删除一致
+
+        Returns:
+            实际删除的主键集合
+        """
+        entity_ids = list(entity_ids)
+        if not entity_ids:
+            return set()
+        with transaction.atomic():
+            queryset = self.model_class.objects.filter(pk__in=entity_ids)  # type: ignore
+            existing = set(queryset.values_list("pk", flat=True))
+            queryset.delete()
+        return existing
+
+    def get_queryset(self) -> QuerySet[T]:
+        """
+        获取基础查询集，子类可覆盖以添加 select_related 等优化
+        """
+        return self.model_class.objects.all()  # type: ignore
+
+    def get_read_queryset(self) -> QuerySet[T]:
+        """
+        列表和导出使用的查询集，声明了 replica_reads 时固定到本次选中的只读副本
+        """
+        queryset = self.get_queryset()
+        if self.replica_reads:
+            alias = replica_for_read()
+            if alias is not None:
+                queryset = queryset.using(alias)
+        return queryset
+
     def list_with_pagination(
         self, 
         page: int = 1, 
@@ -102,22 +206,204 @@ class BaseRepository(Generic[T]):
         Returns:
             分页后的查询集
         """
-        queryset = self.model_class.objects.all()  # type: ignore
+        queryset = self.get_queryset()
         
         # 应用过滤条件
         if filters:
             queryset = queryset.filter(**filters)
         
-        # 应用搜索条件
+        # 应用搜索条件（任一字段匹配即可）
         if search and search_fields:
-            # 构建搜索条件
-            search_filters = {}
+            search_query = Q()
             for field in search_fields:
-                search_filters[f"{field}__icontains"] = search
-            queryset = queryset.filter(**search_filters)
+                search_query |= Q(**{f"{field}__icontains": search})
+            queryset = queryset.filter(search_query)
         
         # 应用排序
         if order_by:
             queryset = queryset.order_by(*order_by)
-            
-        return queryset
\ No newline at end of file
+
+        # 应用分页
+        page = max(1, page)
+        offset = (page - 1) * page_size
+        return queryset[offset:offset + page_size]
+
+    def list_page(self, page_request: PageRequest) -> Page[T]:
+        """
+        分页查询，过滤和排序字段只能使用白名单中的字段
+        带游标时按默认排序键做键集分页（排序键为空的记录不参与游标翻页），否则按页码分页
+
+        Args:
+            page_request: 分页查询参数
+
+        Returns:
+            分页结果
+        """
+        queryset, ordering, window = self._prepare_page(page_request)
+        rows = list(queryset[window])
+        total = None if page_request.cursor else queryset.count()
+        return self._make_page(page_request, ordering, rows, total)
+
+    async def alist_page(self, page_request: PageRequest) -> Page[T]:
+        """
+        分页查询的异步版本，使用异步ORM，参数和结果与 list_page 相同
+        """
+        queryset, ordering, window = self._prepare_page(page_request)
+        rows = [row async for row in queryset[window]]
+        total = None if page_request.cursor else await queryset.acount()
+        return self._make_page(page_request, ordering, rows, total)
+
+    def list_page_values(self, page_request: PageRequest, fields: Sequence[str]) -> Page[Dict[str, Any]]:
+        """
+        与 list_page 相同的分页查询，但只读取指定字段，返回字段名到值的字典，不构造模型实例。
+        排序字段不在 fields 中时一并读取（用于生成游标）
+        """
+        queryset, ordering, window = self._prepare_page(page_request)
+        rows = list(queryset.values(*self._value_fields(fields, ordering))[window])
+        total = None if page_request.cursor else queryset.count()
+        return self._make_page(page_request, ordering, rows, total)
+
+    async def alist_page_values(self, page_request: PageRequest, fields: Sequence[str]) -> Page[Dict[str, Any]]:
+        """
+        list_page_values 的异步版本
+        """
+        queryset, ordering, window = self._prepare_page(page_request)
+        rows = [row async for row in queryset.values(*self._value_fields(fields, ordering))[window]]
+        total = None if page_request.cursor else await queryset.acount()
+        return self._make_page(page_request, ordering, rows, total)
+
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[T]:
+        """
+        根据ID查找实体的异步版本
+        """
+        try:
+            return await self.get_queryset().aget(pk=str(entity_id) if isinstance(entity_id, int) else entity_id)
+        except ObjectDoesNotExist:
+            return None
+
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        集合版本：(最后修改时间, 记录数)，一次聚合查询，用于列表接口的条件请求
+        新增和修改会更新 updated_time，删除会减少记录数
+        """
+        result = self.get_read_queryset().aggregate(last_modified=Max("updated_time"), count=Count("pk"))
+        return result["last_modified"], result["count"]
+
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        collection_version 的异步版本
+        """
+        result = await self.get_read_queryset().aaggregate(last_modified=Max("updated_time"), count=Count("pk"))
+        return result["last_modified"], result["count"]
+
+    def _prepare_page(self, page_request: PageRequest) -> Tuple[QuerySet[T], Tuple[str, ...], slice]:
+        """构造分页查询集，返回 (查询集, 排序, 读取范围)，读取范围多取一条用于判断是否有下一页"""
+        queryset = self.apply_filters(self.get_read_queryset(), page_request.filters)
+        ordering = self._resolve_ordering(page_request.ordering)
+        queryset = queryset.order_by(*ordering)
+        page_size = page_request.page_size
+
+        if page_request.cursor:
+            if not self._is_keyset_ordering(ordering):
+                raise ValidationException("Cursor pagination only supports the default ordering.")
+            try:
+                values = decode_cursor(page_request.cursor)
+            except ValueError as e:
+                raise ValidationException(str(e))
+            if len(values) != len(ordering):
+                raise ValidationException(f"Invalid cursor: {page_request.cursor}")
+            return queryset.filter(self._keyset_filter(ordering, values)), ordering, slice(0, page_size + 1)
+        offset = (page_request.page - 1) * page_size
+        return queryset, ordering, slice(offset, offset + page_size + 1)
+
+    @staticmethod
+    def _value_fields(fields: Sequence[str], ordering: Tuple[str, ...]) -> List[str]:
+        return list(dict.fromkeys([*fields, *(name.lstrip("-") for name in ordering)]))
+
+    def _make_page(
+        self, page_request: PageRequest, ordering: Tuple[str, ...], rows: List[Any], total: Optional[int]
+    ) -> Page[Any]:
+        page_size = page_request.page_size
+        items = rows[:page_size]
+        next_cursor = None
+        if self._is_keyset_ordering(ordering) and len(rows) > page_size:
+            last = items[-1]
+            # rows 为模型实例，或 list_page_values 读取的字典
+            get = last.get if isinstance(last, dict) else lambda name: getattr(last, name)
+            next_cursor = encode_cursor([get(name.lstrip("-")) for name in ordering])
+        page = None if page_request.cursor else page_request.page
+        return Page(items=items, page_size=page_size, page=page, total=total, next_cursor=next_cursor)
+
+    def iter_values(
+        self, filters: Optional[Dict[str, Any]], fields: Sequence[str], chunk_size: int = 2000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        按默认排序键升序逐批读取指定字段，不构造模型实例也不缓存结果集，
+        内存占用与数据总量无关。过滤条件在调用时校验，读取在迭代时才开始。
+
+        Args:
+            filters: 过滤条件，键为白名单中的过滤参数名
+            fields: 需要读取的字段
+            chunk_size: 每次从数据库读取的行数
+
+        Returns:
+            字段名到值的字典迭代器
+        """
+        queryset = self.apply_filters(self.get_read_queryset(), filters)
+        ordering = tuple(name.lstrip("-") for name in self.default_ordering)
+        return queryset.order_by(*ordering).values(*fields).iterator(chunk_size=chunk_size)
+
+    def apply_filters(self, queryset: QuerySet[T], filters: Optional[Dict[str, Any]]) -> QuerySet[T]:
+        """
+        按白名单应用过滤条件，值为None的条件忽略
+        """
+        for name, value in (filters or {}).items():
+            if value is None or value == "":
+                continue
+            lookup = self.filter_fields.get(name)
+            if lookup is None:
+                raise ValidationException(f"Unsupported filter: {name}")
+            if isinstance(lookup, tuple):
+                search_query = Q()
+                for field in lookup:
+                    search_query |= Q(**{field: value})
+                queryset = queryset.filter(search_query)
+            else:
+                queryset = queryset.filter(**{lookup: value})
+        return queryset
+
+    def _resolve_ordering(self, ordering: Optional[str]) -> Tuple[str, ...]:
+        """解析并校验排序字段，末尾补充主键保证顺序稳定"""
+        if not ordering:
+            return self.default_ordering
+        fields = [item.strip() for item in ordering.split(",") if item.strip()]
+        if not fields:
+            raise ValidationException(f"Unsupported ordering: {ordering}")
+        for item in fields:
+            if item.lstrip("-") not in self.ordering_fields:
+                raise ValidationException(f"Unsupported ordering: {item}")
+        if not any(item.lstrip("-") in ("id", "pk") for item in fields):
+            fields.append("-id" if fields[-1].startswith("-") else "id")
+        return tuple(fields)
+
+    def _is_keyset_ordering(self, ordering: Tuple[str, ...]) -> bool:
+        """排序为默认排序或其完全反序时可以使用游标分页"""
+        reversed_default = tuple(
+            name[1:] if name.startswith("-") else f"-{name}" for name in self.default_ordering
+        )
+        return ordering in (self.default_ordering, reversed_default)
+
+    def _keyset_filter(self, ordering: Tuple[str, ...], values: List[Any]) -> Q:
+        """
+        构造键集分页条件，如 (created_time, id) 倒序时：
+        created_time < v1 OR (created_time = v1 AND id < v2)
+        """
+        keyset_query = Q()
+        for index, name in enumerate(ordering):
+            field = name.lstrip("-")
+            operator = "lt" if name.startswith("-") else "gt"
+            condition = {ordering[i].lstrip("-"): values[i] for i in range(index)}
+            condition[f"{field}__{operator}"] = values[index]
+            keyset_query |= Q(**condition)
+        not_null = Q(**{f"{name.lstrip('-')}__isnull": False for name in ordering})
+        return not_null & keyset_query
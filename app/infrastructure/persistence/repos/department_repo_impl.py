@@ -3,14 +3,26 @@
 """
 
 from app.domain.repositories.department_repository import DepartmentRepository
-from app.domain.models.department import Department
+from app.domain.models.department import Department, defer_tree_rebase
 from django.core.exceptions import ObjectDoesNotExist
-from typing import Optional, List, Union
+from datetime import datetime
+from typing import Optional, List, Union, Any, Dict, Iterable, Sequence, Set, Tuple
 from django.apps import apps
+from django.db import transaction
 from .base_repository import BaseRepository
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class DjangoORMDepartmentRepository(DepartmentRepository, BaseRepository[Department]):
+    filter_fields = {
+        "name": "name__icontains",
+        "code": "code",
+        "is_active": "is_active",
+        "parent_id": "parent_id",
+        "mode_type": "mode_type",
+    }
+    ordering_fields = ("created_time", "id", "name", "code", "rank")
+
     def __init__(self):
         # 获取实际的 Django 模型类
         self.DepartmentModel = apps.get_model("domain", "Department")
@@ -48,3 +60,80 @@ class DjangoORMDepartmentRepository(DepartmentRepository, BaseRepository[Departm
 
     def list_all(self) -> List[Department]:
         return list(self.DepartmentModel.objects.all())
+
+    def list_page(self, page_request: PageRequest) -> Page[Department]:
+        return BaseRepository.list_page(self, page_request)
+
+    async def alist_page(self, page_request: PageRequest) -> Page[Department]:
+        return await BaseRepository.alist_page(self, page_request)
+
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[Department]:
+        return await BaseRepository.afind_by_id(self, entity_id)
+
+    def list_subtree(self, root_id: Optional[str] = None, include_self: bool = True) -> List[Department]:
+        if root_id is None:
+            queryset = self.DepartmentModel.objects.all()
+        else:
+            queryset = self.DepartmentModel.subtree(root_id, include_self)
+        return list(queryset.order_by("rank", "name", "id"))
+
+    def rebuild_tree(self) -> int:
+        return self.DepartmentModel.rebuild_tree()
+
+    def find_ids_by_values(self, field: str, values: Iterable[Any]) -> Dict[Any, Any]:
+        return BaseRepository.find_ids_by_values(self, field, values)
+
+    def find_by_ids(self, entity_ids: Iterable[Union[int, str]]) -> Dict[Any, Department]:
+        return BaseRepository.find_by_ids(self, entity_ids)
+
+    def bulk_create(self, entities: List[Department], batch_size: int = 500) -> List[Department]:
+        # bulk_create 不经过 save，插入前按父部门计算路径
+        self._place_new(entities)
+        return BaseRepository.bulk_create(self, entities, batch_size)
+
+    def bulk_update(self, entities: List[Department], fields: Sequence[str], batch_size: int = 500) -> int:
+        if "parent" not in fields:
+            return BaseRepository.bulk_update(self, entities, fields, batch_size)
+        # 批量移动时逐个改前缀可能互相覆盖，直接全量重算，出现环时整体回滚
+        with transaction.atomic():
+            updated = BaseRepository.bulk_update(self, entities, fields, batch_size)
+            self.DepartmentModel.rebuild_tree(strict=True)
+        return updated
+
+    def bulk_delete(self, entity_ids: Iterable[Union[int, str]]) -> Set[Any]:
+        # 同一批次可能同时删除父子部门，逐条改写子孙路径会用到已失效的路径，删除后全量重算
+        with transaction.atomic(), defer_tree_rebase():
+            deleted = BaseRepository.bulk_delete(self, entity_ids)
+            if deleted:
+                self.DepartmentModel.rebuild_tree()
+        return deleted
+
+    def _place_new(self, entities: List[Department]) -> None:
+        """计算新部门的路径，父部门可以在同一批次中，也可以已存在"""
+        batch = {entity.pk: entity for entity in entities}
+        parents = self.DepartmentModel.objects.in_bulk(
+            [entity.parent_id for entity in entities if entity.parent_id and entity.parent_id not in batch]
+        )
+        placed: Set[Any] = set()
+
+        def place(entity: Department, visiting: Set[Any]) -> None:
+            if entity.pk in placed:
+                return
+            if entity.pk in visiting:
+                raise ValueError("Department tree contains a cycle.")
+            parent = batch.get(entity.parent_id)
+            if parent is not None:
+                place(parent, visiting | {entity.pk})
+            else:
+                parent = parents.get(entity.parent_id)
+            entity.place_under(parent)
+            placed.add(entity.pk)
+
+        for entity in entities:
+            place(entity, set())
+
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        return BaseRepository.collection_version(self)
+
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        return await BaseRepository.acollection_version(self)
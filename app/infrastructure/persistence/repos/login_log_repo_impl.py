@@ -5,12 +5,25 @@
 from app.domain.repositories.login_log_repository import LoginLogRepository
 from app.domain.models.login_log import LoginLog
 from django.core.exceptions import ObjectDoesNotExist
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Any, Dict, Iterator, Sequence
 from django.apps import apps
 from .base_repository import BaseRepository
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class DjangoORMLoginLogRepository(LoginLogRepository, BaseRepository[LoginLog]):
+    filter_fields = {
+        "status": "status",
+        "login_type": "login_type",
+        "ipaddress": "ipaddress",
+        "creator_id": "creator_id",
+        "created_after": "created_time__gte",
+        "created_before": "created_time__lt",
+    }
+    # 日志列表和导出是大量读取，从只读副本读取，避免与写入争用主库
+    replica_reads = True
+    ordering_fields = ("created_time", "id")
+
     def __init__(self):
         # 获取实际的 Django 模型类
         self.LoginLogModel = apps.get_model("domain", "LoginLog")
@@ -41,4 +54,24 @@ class DjangoORMLoginLogRepository(LoginLogRepository, BaseRepository[LoginLog]):
             return False
 
     def list_all(self) -> List[LoginLog]:
-        return list(self.LoginLogModel.objects.all())
\ No newline at end of file
+        return list(self.LoginLogModel.objects.all())
+
+    def list_page(self, page_request: PageRequest) -> Page[LoginLog]:
+        return BaseRepository.list_page(self, page_request)
+
+    async def alist_page(self, page_request: PageRequest) -> Page[LoginLog]:
+        return await BaseRepository.alist_page(self, page_request)
+
+    def list_page_values(self, page_request: PageRequest, fields: Sequence[str]) -> Page[Dict[str, Any]]:
+        return BaseRepository.list_page_values(self, page_request, fields)
+
+    async def alist_page_values(self, page_request: PageRequest, fields: Sequence[str]) -> Page[Dict[str, Any]]:
+        return await BaseRepository.alist_page_values(self, page_request, fields)
+
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[LoginLog]:
+        return await BaseRepository.afind_by_id(self, entity_id)
+
+    def iter_values(
+        self, filters: Dict[str, Any], fields: Sequence[str], chunk_size: int = 2000
+    ) -> Iterator[Dict[str, Any]]:
+        return BaseRepository.iter_values(self, filters, fields, chunk_size)
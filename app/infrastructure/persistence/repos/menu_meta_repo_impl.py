@@ -5,12 +5,20 @@
 from app.domain.repositories.menu_meta_repository import MenuMetaRepository
 from app.domain.models.menu_meta import MenuMeta
 from django.core.exceptions import ObjectDoesNotExist
-from typing import Optional, List, Union
+from datetime import datetime
+from typing import Optional, List, Union, Tuple
 from django.apps import apps
 from .base_repository import BaseRepository
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class DjangoORMMenuMetaRepository(MenuMetaRepository, BaseRepository[MenuMeta]):
+    filter_fields = {
+        "title": "title__icontains",
+        "is_show_menu": "is_show_menu",
+    }
+    ordering_fields = ("created_time", "id", "title")
+
     def __init__(self):
         # 获取实际的 Django 模型类
         self.MenuMetaModel = apps.get_model("domain", "MenuMeta")
@@ -41,4 +49,13 @@ class DjangoORMMenuMetaRepository(MenuMetaRepository, BaseRepository[MenuMeta]):
             return False
 
     def list_all(self) -> List[MenuMeta]:
-        return list(self.MenuMetaModel.objects.all())
\ No newline at end of file
+        return list(self.MenuMetaModel.objects.all())
+
+    def list_page(self, page_request: PageRequest) -> Page[MenuMeta]:
+        return BaseRepository.list_page(self, page_request)
+
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        return BaseRepository.collection_version(self)
+
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        return await BaseRepository.acollection_version(self)
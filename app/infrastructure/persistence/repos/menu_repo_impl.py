@@ -4,13 +4,26 @@
 
 from app.domain.repositories.menu_repository import MenuRepository
 from app.domain.models.menu import Menu
+from app.domain.models.menu_meta import MenuMeta
 from django.core.exceptions import ObjectDoesNotExist
-from typing import Optional, List, Union
+from datetime import datetime
+from typing import Optional, List, Union, Any, Dict, Iterable, Sequence, Set, Tuple
 from django.apps import apps
 from .base_repository import BaseRepository
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class DjangoORMMenuRepository(MenuRepository, BaseRepository[Menu]):
+    filter_fields = {
+        "name": "name__icontains",
+        "code": "code",
+        "menu_type": "menu_type",
+        "is_active": "is_active",
+        "parent_id": "parent_id",
+        "method": "method",
+    }
+    ordering_fields = ("created_time", "id", "name", "rank")
+
     def __init__(self):
         # 获取实际的 Django 模型类
         self.MenuModel = apps.get_model("domain", "Menu")
@@ -47,4 +60,47 @@ class DjangoORMMenuRepository(MenuRepository, BaseRepository[Menu]):
             return False
 
     def list_all(self) -> List[Menu]:
-        return list(self.MenuModel.objects.all())
\ No newline at end of file
+        return list(self.MenuModel.objects.all())
+
+    def list_page(self, page_request: PageRequest) -> Page[Menu]:
+        return BaseRepository.list_page(self, page_request)
+
+    async def alist_page(self, page_request: PageRequest) -> Page[Menu]:
+        return await BaseRepository.alist_page(self, page_request)
+
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[Menu]:
+        return await BaseRepository.afind_by_id(self, entity_id)
+
+    def list_active_by_roles(self, role_ids: Optional[Iterable[str]]) -> List[Menu]:
+        queryset = self.MenuModel.objects.filter(is_active=True)
+        if role_ids is not None:
+            queryset = queryset.filter(role_menus__role_id__in=list(role_ids)).distinct()
+        return list(queryset.order_by("rank", "id"))
+
+    def find_metas(self, meta_ids: Iterable[str]) -> Dict[str, MenuMeta]:
+        wanted = {meta_id for meta_id in meta_ids if meta_id}
+        if not wanted:
+            return {}
+        MenuMetaModel = apps.get_model("domain", "MenuMeta")
+        return MenuMetaModel.objects.in_bulk(wanted)
+
+    def find_ids_by_values(self, field: str, values: Iterable[Any]) -> Dict[Any, Any]:
+        return BaseRepository.find_ids_by_values(self, field, values)
+
+    def find_by_ids(self, entity_ids: Iterable[Union[int, str]]) -> Dict[Any, Menu]:
+        return BaseRepository.find_by_ids(self, entity_ids)
+
+    def bulk_create(self, entities: List[Menu], batch_size: int = 500) -> List[Menu]:
+        return BaseRepository.bulk_create(self, entities, batch_size)
+
+    def bulk_update(self, entities: List[Menu], fields: Sequence[str], batch_size: int = 500) -> int:
+        return BaseRepository.bulk_update(self, entities, fields, batch_size)
+
+    def bulk_delete(self, entity_ids: Iterable[Union[int, str]]) -> Set[Any]:
+        return BaseRepository.bulk_delete(self, entity_ids)
+
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        return BaseRepository.collection_version(self)
+
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        return await BaseRepository.acollection_version(self)
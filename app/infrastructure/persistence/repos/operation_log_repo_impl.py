@@ -5,12 +5,28 @@
 from app.domain.repositories.operation_log_repository import OperationLogRepository
 from app.domain.models.operation_log import OperationLog
 from django.core.exceptions import ObjectDoesNotExist
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Any, Dict, Iterator, Sequence
 from django.apps import apps
 from .base_repository import BaseRepository
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class DjangoORMOperationLogRepository(OperationLogRepository, BaseRepository[OperationLog]):
+    filter_fields = {
+        "module": "module",
+        "oper_name": "oper_name",
+        "business_type": "business_type",
+        "request_method": "request_method",
+        "status": "status",
+        "oper_ip": "oper_ip",
+        "user_id": "user_id",
+        "created_after": "created_time__gte",
+        "created_before": "created_time__lt",
+    }
+    # 日志列表和导出是大量读取，从只读副本读取，避免与写入争用主库
+    replica_reads = True
+    ordering_fields = ("created_time", "id", "cost_time")
+
     def __init__(self):
         # 获取实际的 Django 模型类
         self.OperationLogModel = apps.get_model("domain", "OperationLog")
@@ -41,4 +57,24 @@ class DjangoORMOperationLogRepository(OperationLogRepository, BaseRepository[Ope
             return False
 
     def list_all(self) -> List[OperationLog]:
-        return list(self.OperationLogModel.objects.all())
\ No newline at end of file
+        return list(self.OperationLogModel.objects.all())
+
+    def list_page(self, page_request: PageRequest) -> Page[OperationLog]:
+        return BaseRepository.list_page(self, page_request)
+
+    async def alist_page(self, page_request: PageRequest) -> Page[OperationLog]:
+        return await BaseRepository.alist_page(self, page_request)
+
+    def list_page_values(self, page_request: PageRequest, fields: Sequence[str]) -> Page[Dict[str, Any]]:
+        return BaseRepository.list_page_values(self, page_request, fields)
+
+    async def alist_page_values(self, page_request: PageRequest, fields: Sequence[str]) -> Page[Dict[str, Any]]:
+        return await BaseRepository.alist_page_values(self, page_request, fields)
+
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[OperationLog]:
+        return await BaseRepository.afind_by_id(self, entity_id)
+
+    def iter_values(
+        self, filters: Dict[str, Any], fields: Sequence[str], chunk_size: int = 2000
+    ) -> Iterator[Dict[str, Any]]:
+        return BaseRepository.iter_values(self, filters, fields, chunk_size)
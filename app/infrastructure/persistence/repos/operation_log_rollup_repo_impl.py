@@ -0,0 +1,166 @@
+"""
+操作日志预聚合仓储实现
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+
+from app.common.sketch import QuantileSketch
+from app.domain.models.operation_log import OperationLog
+from app.domain.models.operation_log_rollup import OperationLogRollup
+from app.domain.repositories.operation_log_rollup_repository import OperationLogRollupRepository
+
+GRANULARITIES = ("minute", "hour")
+DIMENSIONS = ("module", "business_type", "request_method", "status")
+KEY_FIELDS = ("granularity", "bucket") + DIMENSIONS
+
+
+def truncate(value: datetime, granularity: str) -> datetime:
+    """把时间截断到聚合粒度的起点"""
+    if granularity == "minute":
+        return value.replace(second=0, microsecond=0)
+    if granularity == "hour":
+        return value.replace(minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unsupported granularity: {granularity}")
+
+
+class _Delta:
+    __slots__ = ("count", "cost_sum", "cost_max", "sketch")
+
+    def __init__(self):
+        self.count = 0
+        self.cost_sum = 0
+        self.cost_max = 0
+        self.sketch = QuantileSketch()
+
+    def add(self, cost_time: int) -> None:
+        self.count += 1
+        self.cost_sum += cost_time
+        self.cost_max = max(self.cost_max, cost_time)
+        self.sketch.add(cost_time)
+
+
+class DjangoORMOperationLogRollupRepository(OperationLogRollupRepository):
+    filter_fields = DIMENSIONS
+
+    def record(self, logs: Iterable[OperationLog]) -> int:
+        deltas = self._collect(logs)
+        # 调用方可能把整批累加放在一个事务中，按聚合键排序加锁，避免并发批次交叉加锁死锁
+        for key, delta in sorted(deltas.items(), key=lambda item: [str(value) for value in item[0]]):
+            self._merge(dict(zip(KEY_FIELDS, key)), delta)
+        return len(deltas)
+
+    @staticmethod
+    def _collect(logs: Iterable[OperationLog], deltas: Optional[Dict[Tuple, _Delta]] = None) -> Dict[Tuple, _Delta]:
+        """按聚合键累加日志，返回 聚合键 -> 增量"""
+        deltas = {} if deltas is None else deltas
+        for log in logs:
+            if log.created_time is None:
+                continue
+            dimensions = (log.module, log.business_type, log.request_method, bool(log.status))
+            for granularity in GRANULARITIES:
+                key = (granularity, truncate(log.created_time, granularity)) + dimensions
+                delta = deltas.get(key)
+                if delta is None:
+                    delta = deltas[key] = _Delta()
+                delta.add(int(log.cost_time or 0))
+        return deltas
+
+    def _merge(self, lookup: Dict[str, Any], delta: _Delta) -> None:
+        # 每个聚合键一个短事务；并发首次插入同一键时唯一约束冲突，重试一次走更新分支
+        for attempt in range(2):
+            try:
+                with transaction.atomic():
+                    row = OperationLogRollup.objects.select_for_update().filter(**lookup).first()  # type: ignore
+                    if row is None:
+                        OperationLogRollup.objects.create(  # type: ignore
+                            count=delta.count,
+                            cost_sum=delta.cost_sum,
+                            cost_max=delta.cost_max,
+                            sketch=delta.sketch.to_json(),
+                            **lookup,
+                        )
+                    else:
+                        row.count += delta.count
+                        row.cost_sum += delta.cost_sum
+                        row.cost_max = max(row.cost_max, delta.cost_max)
+                        row.sketch = QuantileSketch.from_json(row.sketch).merge(delta.sketch).to_json()
+                        row.save(update_fields=["count", "cost_sum", "cost_max", "sketch"])
+                return
+            except IntegrityError:
+                if attempt:
+                    raise
+
+    def iter_rollups(
+        self, granularity: str, start: datetime, end: datetime, filters: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = OperationLogRollup.objects.filter(  # type: ignore
+            granularity=granularity, bucket__gte=start, bucket__lt=end
+        )
+        for name, value in (filters or {}).items():
+            if name not in self.filter_fields:
+                raise ValueError(f"Unsupported filter: {name}")
+            if value is not None:
+                queryset = queryset.filter(**{name: value})
+        return (
+            queryset.order_by("bucket")
+            .values("bucket", "count", "cost_sum", "cost_max", "sketch", *DIMENSIONS)
+            .iterator(chunk_size=2000)
+        )
+
+    def rebuild(self, start: datetime, end: datetime, chunk_size: int = 2000) -> int:
+        # 按小时边界对齐，保证重建范围内的分钟和小时聚合都完整
+        start = truncate(start, "hour")
+        if truncate(end, "hour") < end:
+            end = truncate(end, "hour") + timedelta(hours=1)
+        # 并发批次首次插入的聚合键与重建写入冲突时整个重建已回滚，重试即可
+        for attempt in range(3):
+            try:
+                return self._rebuild_range(start, end, chunk_size)
+            except IntegrityError:
+                if attempt == 2:
+                    raise
+        return 0
+
+    def _rebuild_range(self, start: datetime, end: datetime, chunk_size: int) -> int:
+        buckets = OperationLogRollup.objects.filter(bucket__gte=start, bucket__lt=end)  # type: ignore
+        logs = (
+            OperationLog.objects.filter(created_time__gte=start, created_time__lt=end)  # type: ignore
+            .only("created_time", "cost_time", *DIMENSIONS)
+            .order_by("created_time", "id")
+            .iterator(chunk_size=chunk_size)
+        )
+        # 删除和重新写入在同一事务中完成，并先锁住范围内已有的聚合行。
+        # 写入通道的日志插入与累加同属一个事务：已持有行锁的批次提交后才开始读取日志，连同其累加一起重算；
+        # 等待行锁的批次尚未提交，其日志不在本次读取结果中，提交后累加到重建后的行上。两种情况都只计数一次
+        with transaction.atomic():
+            list(buckets.select_for_update().values_list("pk", flat=True))
+            buckets.delete()
+            total = 0
+            deltas: Dict[Tuple, _Delta] = {}
+            batch: List[OperationLog] = []
+            for log in logs:
+                batch.append(log)
+                if len(batch) >= chunk_size:
+                    total += len(batch)
+                    self._collect(batch, deltas)
+                    batch = []
+            total += len(batch)
+            self._collect(batch, deltas)
+            OperationLogRollup.objects.bulk_create(  # type: ignore
+                (
+                    OperationLogRollup(
+                        count=delta.count,
+                        cost_sum=delta.cost_sum,
+                        cost_max=delta.cost_max,
+                        sketch=delta.sketch.to_json(),
+                        **dict(zip(KEY_FIELDS, key)),
+                    )
+                    for key, delta in deltas.items()
+                ),
+                batch_size=chunk_size,
+            )
+        return total
+
@@ -7,9 +7,19 @@ from django.contrib.auth.models import Permission
 from django.core.exceptions import ObjectDoesNotExist
 from typing import Optional, List
 from .base_repository import BaseRepository
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class DjangoORMPermissionRepository(PermissionRepository, BaseRepository[Permission]):
+    filter_fields = {
+        "name": "name__icontains",
+        "codename": "codename__icontains",
+        "content_type_id": "content_type_id",
+    }
+    ordering_fields = ("id", "name", "codename")
+    # Django内置权限模型没有 created_time，按主键排序和翻页
+    default_ordering = ("id",)
+
     def __init__(self):
         # 初始化基类
         BaseRepository.__init__(self, Permission)
@@ -38,4 +48,7 @@ class DjangoORMPermissionRepository(PermissionRepository, BaseRepository[Permiss
             return False
 
     def list_all(self) -> List[Permission]:
-        return list(Permission.objects.all())
\ No newline at end of file
+        return list(Permission.objects.all())
+
+    def list_page(self, page_request: PageRequest) -> Page[Permission]:
+        return BaseRepository.list_page(self, page_request)
@@ -5,12 +5,21 @@
 from app.domain.repositories.role_repository import RoleRepository
 from app.domain.models.role import Role
 from django.core.exceptions import ObjectDoesNotExist
-from typing import Optional, List, Union
+from datetime import datetime
+from typing import Optional, List, Union, Any, Dict, Iterable, Sequence, Set, Tuple
 from django.apps import apps
 from .base_repository import BaseRepository
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class DjangoORMRoleRepository(RoleRepository, BaseRepository[Role]):
+    filter_fields = {
+        "name": "name__icontains",
+        "code": "code",
+        "is_active": "is_active",
+    }
+    ordering_fields = ("created_time", "id", "name", "code")
+
     def __init__(self):
         # 获取实际的 Django 模型类
         self.RoleModel = apps.get_model("domain", "Role")
@@ -57,4 +66,34 @@ class DjangoORMRoleRepository(RoleRepository, BaseRepository[Role]):
             role = self.RoleModel.objects.get(pk=role_id)
             role.permissions.set(permission_ids)
         except ObjectDoesNotExist:
-            pass  # 或抛出异常
\ No newline at end of file
+            pass  # 或抛出异常
+
+    def list_page(self, page_request: PageRequest) -> Page[Role]:
+        return BaseRepository.list_page(self, page_request)
+
+    async def alist_page(self, page_request: PageRequest) -> Page[Role]:
+        return await BaseRepository.alist_page(self, page_request)
+
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[Role]:
+        return await BaseRepository.afind_by_id(self, entity_id)
+
+    def find_ids_by_values(self, field: str, values: Iterable[Any]) -> Dict[Any, Any]:
+        return BaseRepository.find_ids_by_values(self, field, values)
+
+    def find_by_ids(self, entity_ids: Iterable[Union[int, str]]) -> Dict[Any, Role]:
+        return BaseRepository.find_by_ids(self, entity_ids)
+
+    def bulk_create(self, entities: List[Role], batch_size: int = 500) -> List[Role]:
+        return BaseRepository.bulk_create(self, entities, batch_size)
+
+    def bulk_update(self, entities: List[Role], fields: Sequence[str], batch_size: int = 500) -> int:
+        return BaseRepository.bulk_update(self, entities, fields, batch_size)
+
+    def bulk_delete(self, entity_ids: Iterable[Union[int, str]]) -> Set[Any]:
+        return BaseRepository.bulk_delete(self, entity_ids)
+
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        return BaseRepository.collection_version(self)
+
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        return await BaseRepository.acollection_version(self)
@@ -5,12 +5,21 @@
 from app.domain.repositories.system_config_repository import SystemConfigRepository
 from app.domain.models.system_config import SystemConfig
 from django.core.exceptions import ObjectDoesNotExist
-from typing import Optional, List, Union
+from datetime import datetime
+from typing import Optional, List, Union, Tuple
 from django.apps import apps
 from .base_repository import BaseRepository
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class DjangoORMSystemConfigRepository(SystemConfigRepository, BaseRepository[SystemConfig]):
+    filter_fields = {
+        "key": "key__icontains",
+        "is_active": "is_active",
+        "access": "access",
+    }
+    ordering_fields = ("created_time", "id", "key")
+
     def __init__(self):
         # 获取实际的 Django 模型类
         self.SystemConfigModel = apps.get_model("domain", "SystemConfig")
@@ -47,4 +56,19 @@ class DjangoORMSystemConfigRepository(SystemConfigRepository, BaseRepository[Sys
             return False
 
     def list_all(self) -> List[SystemConfig]:
-        return list(self.SystemConfigModel.objects.all())
\ No newline at end of file
+        return list(self.SystemConfigModel.objects.all())
+
+    def list_page(self, page_request: PageRequest) -> Page[SystemConfig]:
+        return BaseRepository.list_page(self, page_request)
+
+    async def alist_page(self, page_request: PageRequest) -> Page[SystemConfig]:
+        return await BaseRepository.alist_page(self, page_request)
+
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[SystemConfig]:
+        return await BaseRepository.afind_by_id(self, entity_id)
+
+    def collection_version(self) -> Tuple[Optional[datetime], int]:
+        return BaseRepository.collection_version(self)
+
+    async def acollection_version(self) -> Tuple[Optional[datetime], int]:
+        return await BaseRepository.acollection_version(self)
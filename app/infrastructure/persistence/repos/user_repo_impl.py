@@ -5,12 +5,22 @@
 from app.domain.repositories.user_repository import UserRepository
 from app.domain.models.user import User
 from django.core.exceptions import ObjectDoesNotExist
-from typing import Optional, List
+from typing import Optional, List, Tuple, Union, Any, Dict, Iterable, Sequence, Set
 from django.apps import apps
 from .base_repository import BaseRepository
+from app.domain.repositories.pagination import Page, PageRequest
 
 
 class DjangoORMUserRepository(UserRepository, BaseRepository[User]):
+    filter_fields = {
+        "username": "username__icontains",
+        "email": "email__icontains",
+        "is_active": "is_active",
+        "dept_id": "dept_id",
+        "search": ("username__icontains", "email__icontains", "nickname__icontains"),
+    }
+    ordering_fields = ("created_time", "id", "username", "date_joined")
+
     def __init__(self):
         # 获取实际的 Django 模型类
         self.UserModel = apps.get_model("domain", "User")
@@ -41,4 +51,49 @@ class DjangoORMUserRepository(UserRepository, BaseRepository[User]):
             return False
 
     def list_all(self) -> List[User]:
-        return list(self.UserModel.objects.all())
\ No newline at end of file
+        return list(self.UserModel.objects.all())
+
+    def list_menu_permissions(self, user_id: Union[int, str]) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        # UserRole -> RoleMenu -> Menu 一次联表查询
+        MenuModel = apps.get_model("domain", "Menu")
+        return list(
+            MenuModel.objects.filter(
+                is_active=True,
+                role_menus__role__is_active=True,
+                role_menus__role__user_roles__user_id=user_id,
+            )
+            .values_list("code", "method", "path")
+            .distinct()
+        )
+
+    def list_active_role_ids(self, user_id: Union[int, str]) -> List[str]:
+        UserRoleModel = apps.get_model("domain", "UserRole")
+        return list(
+            UserRoleModel.objects.filter(user_id=user_id, role__is_active=True)
+            .values_list("role_id", flat=True)
+            .distinct()
+        )
+
+    def list_page(self, page_request: PageRequest) -> Page[User]:
+        return BaseRepository.list_page(self, page_request)
+
+    async def alist_page(self, page_request: PageRequest) -> Page[User]:
+        return await BaseRepository.alist_page(self, page_request)
+
+    async def afind_by_id(self, entity_id: Union[int, str]) -> Optional[User]:
+        return await BaseRepository.afind_by_id(self, entity_id)
+
+    def find_ids_by_values(self, field: str, values: Iterable[Any]) -> Dict[Any, Any]:
+        return BaseRepository.find_ids_by_values(self, field, values)
+
+    def find_by_ids(self, entity_ids: Iterable[Union[int, str]]) -> Dict[Any, User]:
+        return BaseRepository.find_by_ids(self, entity_ids)
+
+    def bulk_create(self, entities: List[User], batch_size: int = 500) -> List[User]:
+        return BaseRepository.bulk_create(self, entities, batch_size)
+
+    def bulk_update(self, entities: List[User], fields: Sequence[str], batch_size: int = 500) -> int:
+        return BaseRepository.bulk_update(self, entities, fields, batch_size)
+
+    def bulk_delete(self, entity_ids: Iterable[Union[int, str]]) -> Set[Any]:
+        return BaseRepository.bulk_delete(self, entity_ids)
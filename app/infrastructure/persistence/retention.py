@@ -0,0 +1,161 @@
+"""
+操作日志保留策略
+按保留天数清理过期的操作日志：
+- 按 (created_time, id) 顺序每次取一批主键，在独立事务中删除，单次事务和锁的范围有上限
+- 配置了归档目录时，删除前先把该批数据以 NDJSON 追加写入 gzip 归档文件
+- PostgreSQL 上表已按月分区时，整月过期的分区直接 DETACH + DROP，剩余部分再分批删除
+- 操作日志的预聚合行按同一截止时间分批删除
+"""
+
+import gzip
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import IO, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from loguru import logger
+
+from app.common.export import iter_ndjson
+from app.domain.models.operation_log import OperationLog
+from app.domain.models.operation_log_rollup import OperationLogRollup
+from app.infrastructure.persistence.partitions import MonthlyPartitionManager
+
+
+@dataclass
+class RetentionResult:
+    """一次清理的统计结果"""
+    cutoff: datetime
+    deleted: int = 0
+    archived: int = 0
+    batches: int = 0
+    rollups_deleted: int = 0
+    dropped_partitions: List[str] = field(default_factory=list)
+    archive_file: Optional[str] = None
+
+
+class OperationLogRetention:
+    """
+    操作日志清理器
+    未传入的参数取自 settings.OPERATION_LOG_RETENTION
+    """
+
+    def __init__(
+        self,
+        days: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        batch_sleep: Optional[float] = None,
+        using: str = "default",
+    ):
+        config = getattr(settings, "OPERATION_LOG_RETENTION", {})
+        self.days = int(days if days is not None else config.get("DAYS", 180))
+        self.batch_size = max(1, int(batch_size if batch_size is not None else config.get("BATCH_SIZE", 1000)))
+        self.archive_dir = archive_dir if archive_dir is not None else config.get("ARCHIVE_DIR", "")
+        self.batch_sleep = max(0.0, float(batch_sleep if batch_sleep is not None else config.get("BATCH_SLEEP", 0)))
+        self.using = using
+        self.partitions = MonthlyPartitionManager(OperationLog, "created_time", using=using)
+        self._archive: Optional[IO[bytes]] = None
+
+    def get_cutoff(self, now: Optional[datetime] = None) -> datetime:
+        """早于该时间的日志视为过期"""
+        return (now or timezone.now()) - timedelta(days=self.days)
+
+    def count_expired(self, now: Optional[datetime] = None) -> int:
+        return self._expired(self.get_cutoff(now)).count()
+
+    def run(self, now: Optional[datetime] = None) -> RetentionResult:
+        """执行一次清理"""
+        if self.days <= 0:
+            raise ValueError("Retention days must be positive.")
+
+        result = RetentionResult(cutoff=self.get_cutoff(now))
+        self._archive = None
+        try:
+            if self.partitions.is_partitioned():
+                self._drop_partitions(result)
+
+            while True:
+                ids = list(
+                    self._expired(result.cutoff)
+                    .order_by("created_time", "id")
+                    .values_list("id", flat=True)[:self.batch_size]
+                )
+                if not ids:
+                    break
+                if self.archive_dir:
+                    result.archived += self._write_archive(result, self._rows(id__in=ids))
+                with transaction.atomic(using=self.using):
+                    deleted, _ = OperationLog.objects.using(self.using).filter(id__in=ids).delete()  # type: ignore
+                result.deleted += deleted
+                result.batches += 1
+                if self.batch_sleep:
+                    # 给其他写入让出数据库资源
+                    time.sleep(self.batch_sleep)
+            result.rollups_deleted = self._purge_rollups(result.cutoff)
+        finally:
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+
+        logger.info(
+            f"Operation log retention finished: cutoff={result.cutoff.isoformat()}, "
+            f"deleted={result.deleted}, archived={result.archived}, rollups={result.rollups_deleted}, "
+            f"partitions={result.dropped_partitions}"
+        )
+        return result
+
+    def _drop_partitions(self, result: RetentionResult) -> None:
+        """整月都已过期的分区先归档再直接删除"""
+        for partition in self.partitions.list_partitions():
+            if partition.end > result.cutoff:
+                continue
+            if self.archive_dir:
+                rows = self._rows(created_time__gte=partition.start, created_time__lt=partition.end)
+                result.archived += self._write_archive(result, rows)
+            self.partitions.drop(partition.name)
+            result.dropped_partitions.append(partition.name)
+
+    def _purge_rollups(self, cutoff: datetime) -> int:
+        """删除整个桶都早于截止时间的聚合行；小时桶覆盖整个小时，按小时截断截止时间"""
+        before = cutoff.replace(minute=0, second=0, microsecond=0)
+        rollups = OperationLogRollup.objects.using(self.using).filter(bucket__lt=before)  # type: ignore
+        deleted = 0
+        while True:
+            ids = list(rollups.order_by("bucket", "id").values_list("id", flat=True)[:self.batch_size])
+            if not ids:
+                return deleted
+            with transaction.atomic(using=self.using):
+                count, _ = OperationLogRollup.objects.using(self.using).filter(id__in=ids).delete()  # type: ignore
+            deleted += count
+
+    def _expired(self, cutoff: datetime):
+        return OperationLog.objects.using(self.using).filter(created_time__lt=cutoff)  # type: ignore
+
+    def _rows(self, **filters):
+        fields = [f.attname for f in OperationLog._meta.concrete_fields]
+        return (
+            OperationLog.objects.using(self.using)  # type: ignore
+            .filter(**filters)
+            .order_by("created_time", "id")
+            .values(*fields)
+            .iterator(chunk_size=self.batch_size)
+        )
+
+    def _write_archive(self, result: RetentionResult, rows) -> int:
+        """把数据追加写入本次清理的归档文件，返回写入行数"""
+        if self._archive is None:
+            os.makedirs(self.archive_dir, exist_ok=True)
+            filename = f"operation_log_before_{result.cutoff:%Y%m%d}_{timezone.now():%Y%m%d%H%M%S}.ndjson.gz"
+            result.archive_file = os.path.join(self.archive_dir, filename)
+            self._archive = gzip.open(result.archive_file, "ab")
+        count = 0
+        for line in iter_ndjson(rows):
+            self._archive.write(line.encode("utf-8"))
+            count += 1
+        # 删除前确保归档已写出
+        self._archive.flush()
+        return count
@@ -27,6 +27,19 @@ class Settings(BaseSettings):
     
     # 数据库配置
     database_url: str = Field(default="", alias="DATABASE_URL")
+    # 只读副本，逗号分隔的多个连接URL，为空时所有查询使用主库；DATABASE_REPLICA_URL 为单个副本的写法
+    database_replica_urls: str = Field(default="", alias="DATABASE_REPLICA_URLS")
+    database_replica_url: str = Field(default="", alias="DATABASE_REPLICA_URL")
+    database_replica_health_check_interval: float = Field(default=30.0, alias="DATABASE_REPLICA_HEALTH_CHECK_INTERVAL")
+    # GET 请求路径匹配任一正则时从副本读取，默认为日志接口和列表接口
+    database_replica_read_paths: str = Field(
+        default=r"^/api/(operation-logs|login-logs)/,^/api/[\w-]+/$", alias="DATABASE_REPLICA_READ_PATHS"
+    )
+
+    # 缓存配置，CACHE_URL 为空时使用进程内缓存
+    cache_url: str = Field(default="", alias="CACHE_URL")
+    cache_key_prefix: str = Field(default="hello-django-ninja", alias="CACHE_KEY_PREFIX")
+    cache_version: int = Field(default=1, alias="CACHE_VERSION")
     
     # JWT配置
     jwt_access_token_lifetime: int = Field(default=3600, alias="JWT_ACCESS_TOKEN_LIFETIME")
@@ -34,12 +47,84 @@ class Settings(BaseSettings):
     
     # 日志配置
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
+
+    # 操作日志写入配置
+    operation_log_sink: str = Field(default="queued", alias="OPERATION_LOG_SINK")
+    operation_log_batch_size: int = Field(default=200, alias="OPERATION_LOG_BATCH_SIZE")
+    operation_log_flush_interval: float = Field(default=1.0, alias="OPERATION_LOG_FLUSH_INTERVAL")
+    operation_log_queue_size: int = Field(default=10000, alias="OPERATION_LOG_QUEUE_SIZE")
+    operation_log_put_timeout: float = Field(default=0.0, alias="OPERATION_LOG_PUT_TIMEOUT")
+    operation_log_rollup: bool = Field(default=True, alias="OPERATION_LOG_ROLLUP")
+
+    # 操作日志保留策略
+    operation_log_retention_days: int = Field(default=180, alias="OPERATION_LOG_RETENTION_DAYS")
+    operation_log_retention_batch_size: int = Field(default=1000, alias="OPERATION_LOG_RETENTION_BATCH_SIZE")
+    operation_log_retention_batch_sleep: float = Field(default=0.0, alias="OPERATION_LOG_RETENTION_BATCH_SLEEP")
+    operation_log_archive_dir: str = Field(default="", alias="OPERATION_LOG_ARCHIVE_DIR")
+
+    # 权限缓存配置
+    permission_cache_size: int = Field(default=1024, alias="PERMISSION_CACHE_SIZE")
+    permission_cache_timeout: int = Field(default=300, alias="PERMISSION_CACHE_TIMEOUT")
+    permission_cache_shared: bool = Field(default=True, alias="PERMISSION_CACHE_SHARED")
+    route_permission_default_allow: bool = Field(default=True, alias="ROUTE_PERMISSION_DEFAULT_ALLOW")
+
+    # 接口响应缓存配置
+    response_cache_enabled: bool = Field(default=True, alias="RESPONSE_CACHE_ENABLED")
+    response_cache_timeout: int = Field(default=300, alias="RESPONSE_CACHE_TIMEOUT")
+
+    # 日志导出配置
+    export_chunk_size: int = Field(default=2000, alias="EXPORT_CHUNK_SIZE")
+
+    # 批量接口密码哈希线程数
+    password_hash_workers: int = Field(default=4, alias="PASSWORD_HASH_WORKERS")
+
+    # 系统配置快照检查版本号的间隔（秒）
+    system_config_cache_ttl: float = Field(default=5.0, alias="SYSTEM_CONFIG_CACHE_TTL")
+
+    # 接口指标配置
+    metrics_enabled: bool = Field(default=True, alias="METRICS_ENABLED")
+    metrics_multiproc_dir: str = Field(default="", alias="METRICS_MULTIPROC_DIR")
+    metrics_flush_interval: float = Field(default=5.0, alias="METRICS_FLUSH_INTERVAL")
+    metrics_token: str = Field(default="", alias="METRICS_TOKEN")
+
+    # API 的 JSON 编码和请求体解析实现：orjson / json
+    api_json_backend: str = Field(default="orjson", alias="API_JSON_BACKEND")
+
+    # 列表快速路径是否按响应模型校验，未配置时跟随 DEBUG
+    fast_response_validate: Optional[bool] = Field(default=None, alias="FAST_RESPONSE_VALIDATE")
+
+    # N+1 查询检测（仅 DEBUG 模式生效）
+    n_plus_one_detection: bool = Field(default=False, alias="N_PLUS_ONE_DETECTION")
+    n_plus_one_threshold: int = Field(default=5, alias="N_PLUS_ONE_THRESHOLD")
+
+    # 生产环境服务器（gunicorn）配置，进程数、线程数为 0 时根据 CPU 数计算
+    server_worker_class: str = Field(default="gthread", alias="SERVER_WORKER_CLASS")
+    server_bind: str = Field(default="0.0.0.0:8000", alias="SERVER_BIND")
+    server_workers: int = Field(default=0, alias="SERVER_WORKERS")
+    server_threads: int = Field(default=0, alias="SERVER_THREADS")
+    server_preload: bool = Field(default=True, alias="SERVER_PRELOAD")
+    server_keepalive: int = Field(default=5, alias="SERVER_KEEPALIVE")
+    server_timeout: int = Field(default=30, alias="SERVER_TIMEOUT")
+    server_graceful_timeout: int = Field(default=30, alias="SERVER_GRACEFUL_TIMEOUT")
+    server_max_requests: int = Field(default=1000, alias="SERVER_MAX_REQUESTS")
+    server_max_requests_jitter: int = Field(default=100, alias="SERVER_MAX_REQUESTS_JITTER")
     
     @property
     def allowed_hosts_list(self) -> List[str]:
         if self.allowed_hosts:
             return [x.strip() for x in self.allowed_hosts.split(",")]
         return []
+
+    @property
+    def database_replica_urls_list(self) -> List[str]:
+        urls = [x.strip() for x in self.database_replica_urls.split(",") if x.strip()]
+        if self.database_replica_url and self.database_replica_url not in urls:
+            urls.insert(0, self.database_replica_url)
+        return urls
+
+    @property
+    def database_replica_read_paths_list(self) -> List[str]:
+        return [x.strip() for x in self.database_replica_read_paths.split(",") if x.strip()]
     
     class Config:
         env_file = ENV_FILE
@@ -0,0 +1,43 @@
+"""
+gunicorn 配置文件，配置来自 service/config.Settings 的 SERVER_* 项
+用法：gunicorn -c python:service.gunicorn_conf
+命令行参数优先于本文件，如 gunicorn -c python:service.gunicorn_conf --workers 2
+"""
+
+from service.config import settings
+from service.server import build_server_config, describe
+
+_config = build_server_config()
+
+globals().update(_config.gunicorn_options())
+
+
+def on_starting(server):
+    server.log.info(f"Server profile: {describe(_config)}")
+    if settings.metrics_multiproc_dir:
+        from app.common.metrics import clear_multiproc_dir
+
+        clear_multiproc_dir(settings.metrics_multiproc_dir)
+
+
+def post_fork(server, worker):
+    # preload 时主进程导入应用期间可能打开过数据库连接，子进程不能复用
+    from django.db import connections
+
+    connections.close_all()
+
+
+def worker_exit(server, worker):
+    # 正常退出前写入最后一次指标快照
+    if settings.metrics_multiproc_dir:
+        from app.common.metrics import get_metrics_registry
+
+        get_metrics_registry().flush()
+
+
+def child_exit(server, worker):
+    # 在主进程中把退出 worker 的指标并入归档，重启后的 worker 从零开始计数
+    if settings.metrics_multiproc_dir:
+        from app.common.metrics import archive_process
+
+        archive_process(settings.metrics_multiproc_dir, worker.pid)
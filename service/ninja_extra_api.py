@@ -6,7 +6,7 @@ API 路由配置
 """
 from loguru import logger
 from ninja_extra import NinjaExtraAPI
-from ninja_jwt.authentication import JWTAuth
+from app.api.authentication import PrincipalJWTAuth
 
 from app.api.controllers.auth import AuthController
 from app.api.controllers.health import HealthController
@@ -19,6 +19,9 @@ from app.api.controllers.menu_metas import MenuMetasController
 from app.api.controllers.system_configs import SystemConfigsController
 from app.api.controllers.login_logs import LoginLogsController
 from app.api.controllers.operation_logs import OperationLogsController
+from app.api.controllers.metrics import MetricsController
+from app.api.parsers import get_json_parser
+from app.api.renderers import get_json_renderer
 from app.common.exception.exception_handler import global_exception_handler
 from service import settings
 
@@ -29,7 +32,9 @@ ninja_extra_api = NinjaExtraAPI(
     description="基于角色的访问控制(RBAC)系统API",
     openapi_url="/openapi.json",
     docs_url="/docs",
-    auth=JWTAuth()  # 使用JWT认证
+    auth=PrincipalJWTAuth(),  # 使用JWT认证
+    renderer=get_json_renderer(),  # 按 API_JSON_BACKEND 选择 orjson 或标准库编码，统计序列化耗时
+    parser=get_json_parser(),
 )
 
 # 注册全局异常处理器
@@ -60,6 +65,7 @@ ninja_extra_api.register_controllers(
     SystemConfigsController,
     LoginLogsController,
     OperationLogsController,
+    MetricsController,
 )
 
 # 打印完整的API文档地址
@@ -0,0 +1,112 @@
+"""
+生产环境服务器配置
+根据 service/config.Settings 中的 SERVER_* 配置生成 gunicorn 参数：
+- sync: 同步worker，每个进程一次处理一个请求，进程数默认为 2 * CPU + 1
+- gthread: 线程worker，进程数默认为 CPU + 1，每个进程默认 4 个线程，适合等待数据库的同步视图
+- uvicorn: ASGI worker，异步视图在事件循环中并发处理，进程数默认为 CPU 数
+进程数、线程数配置为 0 时按上述规则根据 CPU 数计算。
+service/gunicorn_conf.py 和 `python manage.py serve` 都使用这里的配置。
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict
+
+WSGI_APPLICATION = "service.wsgi:application"
+ASGI_APPLICATION = "service.asgi:application"
+
+# 配置中的worker类型 -> (gunicorn worker_class, 应用入口)
+WORKER_CLASSES: Dict[str, tuple] = {
+    "sync": ("sync", WSGI_APPLICATION),
+    "gthread": ("gthread", WSGI_APPLICATION),
+    "uvicorn": ("uvicorn.workers.UvicornWorker", ASGI_APPLICATION),
+}
+
+DEFAULT_GTHREAD_THREADS = 4
+
+
+@dataclass
+class ServerConfig:
+    worker_class: str = "gthread"
+    bind: str = "0.0.0.0:8000"
+    workers: int = 0
+    threads: int = 0
+    preload: bool = True
+    keepalive: int = 5
+    timeout: int = 30
+    graceful_timeout: int = 30
+    max_requests: int = 1000
+    max_requests_jitter: int = 100
+    cpu_count: int = field(default_factory=lambda: os.cpu_count() or 1)
+
+    def __post_init__(self):
+        if self.worker_class not in WORKER_CLASSES:
+            raise ValueError(
+                f"Invalid worker class: {self.worker_class}, expected one of {', '.join(WORKER_CLASSES)}"
+            )
+        self.cpu_count = max(1, self.cpu_count)
+        if self.workers <= 0:
+            self.workers = self.default_workers()
+        if self.worker_class != "gthread":
+            # 只有 gthread 使用线程数，其他worker固定为 1
+            self.threads = 1
+        elif self.threads <= 0:
+            self.threads = DEFAULT_GTHREAD_THREADS
+        if self.max_requests <= 0:
+            self.max_requests_jitter = 0
+
+    def default_workers(self) -> int:
+        if self.worker_class == "sync":
+            return 2 * self.cpu_count + 1
+        if self.worker_class == "gthread":
+            return self.cpu_count + 1
+        return self.cpu_count
+
+    @property
+    def application(self) -> str:
+        return WORKER_CLASSES[self.worker_class][1]
+
+    def gunicorn_options(self) -> Dict[str, object]:
+        """gunicorn 配置项，键名与 gunicorn 配置文件中的变量名一致"""
+        return {
+            "wsgi_app": self.application,
+            "bind": self.bind,
+            "worker_class": WORKER_CLASSES[self.worker_class][0],
+            "workers": self.workers,
+            "threads": self.threads,
+            "preload_app": self.preload,
+            "keepalive": self.keepalive,
+            "timeout": self.timeout,
+            "graceful_timeout": self.graceful_timeout,
+            "max_requests": self.max_requests,
+            "max_requests_jitter": self.max_requests_jitter,
+        }
+
+
+def build_server_config(app_settings=None, **overrides) -> ServerConfig:
+    """根据 Settings 生成服务器配置，overrides 中值为 None 的项忽略"""
+    if app_settings is None:
+        from service.config import settings as app_settings
+
+    values = {
+        "worker_class": app_settings.server_worker_class,
+        "bind": app_settings.server_bind,
+        "workers": app_settings.server_workers,
+        "threads": app_settings.server_threads,
+        "preload": app_settings.server_preload,
+        "keepalive": app_settings.server_keepalive,
+        "timeout": app_settings.server_timeout,
+        "graceful_timeout": app_settings.server_graceful_timeout,
+        "max_requests": app_settings.server_max_requests,
+        "max_requests_jitter": app_settings.server_max_requests_jitter,
+    }
+    values.update({key: value for key, value in overrides.items() if value is not None})
+    return ServerConfig(**values)
+
+
+def describe(config: ServerConfig) -> str:
+    """单行描述，用于启动日志"""
+    return (
+        f"{config.worker_class} workers={config.workers} threads={config.threads} "
+        f"cpu={config.cpu_count} preload={config.preload} bind={config.bind} app={config.application}"
+    )
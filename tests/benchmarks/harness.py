@@ -0,0 +1,182 @@
+"""
+基准测试工具
+- measure: 多轮计时并汇总统计（毫秒）
+- 结果文件与基线文件格式相同：{"meta": {...}, "benchmarks": {名称: 统计}}
+- compare: 按中位数与基线比较，超过阈值判为回退
+不依赖 Django，HTTP 压测脚本也使用同一套结果格式和比较逻辑。
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baselines.json")
+DEFAULT_THRESHOLD = 0.25
+
+
+@dataclass
+class BenchmarkStats:
+    rounds: int
+    min: float
+    max: float
+    mean: float
+    median: float
+    stddev: float
+    p95: float
+    p99: float
+
+    @classmethod
+    def from_samples(cls, samples: Sequence[float]) -> "BenchmarkStats":
+        if not samples:
+            raise ValueError("At least one sample is required.")
+        ordered = sorted(samples)
+        return cls(
+            rounds=len(ordered),
+            min=ordered[0],
+            max=ordered[-1],
+            mean=statistics.fmean(ordered),
+            median=statistics.median(ordered),
+            stddev=statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+            p95=percentile(ordered, 0.95),
+            p99=percentile(ordered, 0.99),
+        )
+
+    def to_dict(self) -> dict:
+        return {key: round(value, 4) if isinstance(value, float) else value for key, value in asdict(self).items()}
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: Optional[float]
+    current: float
+
+    @property
+    def change(self) -> Optional[float]:
+        if not self.baseline:
+            return None
+        return self.current / self.baseline - 1
+
+    def status(self, threshold: float) -> str:
+        change = self.change
+        if change is None:
+            return "new"
+        if change > threshold:
+            return "regressed"
+        if change < -threshold:
+            return "improved"
+        return "ok"
+
+
+def percentile(ordered: Sequence[float], q: float) -> float:
+    """已排序样本的线性插值分位数"""
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def measure(func: Callable[[], object], rounds: int = 20, warmup: int = 2) -> BenchmarkStats:
+    """执行 warmup 轮预热后计时 rounds 轮，计时期间关闭GC减少抖动"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return BenchmarkStats.from_samples(samples)
+
+
+def environment() -> dict:
+    """记录运行环境，基线只在相同环境下有可比性"""
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def load_results(path: str) -> dict:
+    if not os.path.exists(path):
+        return {"meta": {}, "benchmarks": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_results(path: str, benchmarks: Dict[str, dict], meta: Optional[dict] = None, merge: bool = True) -> None:
+    """写入结果文件，merge 为 True 时保留文件中其他基准的数据"""
+    data = load_results(path) if merge else {"meta": {}, "benchmarks": {}}
+    data["meta"] = {**data.get("meta", {}), **environment(), **(meta or {})}
+    data["benchmarks"] = {**data.get("benchmarks", {}), **benchmarks}
+    data["benchmarks"] = dict(sorted(data["benchmarks"].items()))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def compare(current: Dict[str, dict], baseline: Dict[str, dict], metric: str = "median") -> List[Comparison]:
+    comparisons = []
+    for name, stats in sorted(current.items()):
+        base = baseline.get(name, {}).get(metric)
+        comparisons.append(Comparison(name=name, baseline=base, current=stats[metric]))
+    return comparisons
+
+
+def format_report(comparisons: Iterable[Comparison], threshold: float, metric: str = "median") -> str:
+    rows = [("benchmark", f"baseline {metric} ms", f"current {metric} ms", "change", "status")]
+    for item in comparisons:
+        change = item.change
+        rows.append((
+            item.name,
+            "-" if item.baseline is None else f"{item.baseline:.3f}",
+            f"{item.current:.3f}",
+            "-" if change is None else f"{change:+.1%}",
+            item.status(threshold),
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = ["  ".join(cell.ljust(widths[i]) for i, cell in enumerate(row)).rstrip() for row in rows]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    比较结果文件与基线，存在回退时返回1
+    python -m tests.benchmarks.harness results.json [--baseline baselines.json] [--threshold 0.25] [--metric median]
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare benchmark results with stored baselines.")
+    parser.add_argument("results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--metric", default="median")
+    args = parser.parse_args(argv)
+
+    current = load_results(args.results)["benchmarks"]
+    comparisons = compare(current, load_results(args.baseline)["benchmarks"], args.metric)
+    print(format_report(comparisons, args.threshold, args.metric))
+    return 1 if any(item.status(args.threshold) == "regressed" for item in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+HTTP 压测驱动
+多个线程各自保持一个 keep-alive 连接，在给定时长内按权重随机执行场景，统计每个场景的延迟分布、错误数和吞吐量。
+结果文件格式与 tests/benchmarks/harness.py 相同，可以直接和基线比较。
+
+准备数据并启动服务：
+    python manage.py seed_benchmark_data --users 10000 --operation-logs 100000
+    gunicorn service.wsgi:application -w 4 -b 127.0.0.1:8000
+
+运行：
+    python -m tests.benchmarks.http_load --base-url http://127.0.0.1:8000 --duration 30 --concurrency 16 \\
+        --baseline tests/benchmarks/http_baselines.json --output tests/benchmarks/results/http.json
+
+场景权重通过 --mix 指定，如 --mix login=1,get_department=10,list_users=5,list_operation_logs=5,update_department=2
+
+--concurrency 可以是逗号分隔的多个并发数（如 8,32,64），依次压测，结果名称带上 @c<并发数>。
+比较WSGI和ASGI：先对 gunicorn 同步worker运行并 --save-baseline，再对 uvicorn worker 运行同一命令与该基线比较，
+详见 docs/benchmarks.md。
+"""
+
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from tests.benchmarks.harness import (
+    BENCHMARK_DIR, DEFAULT_THRESHOLD, BenchmarkStats, compare, format_report, load_results, save_results,
+)
+
+DEFAULT_MIX = "login=1,get_department=10,list_users=5,list_operation_logs=5,update_department=2"
+DEFAULT_HTTP_BASELINE = f"{BENCHMARK_DIR}/http_baselines.json"
+
+
+class ApiClient:
+    """单个 keep-alive 连接，不是线程安全的，每个压测线程各用一个"""
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        parts = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.connection = connection_class(parts.hostname, parts.port, timeout=timeout)
+        self.prefix = parts.path.rstrip("/")
+        self.token: Optional[str] = None
+
+    def request(self, method: str, path: str, body: Optional[dict] = None) -> Tuple[int, bytes]:
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        payload = json.dumps(body).encode("utf-8") if body is not None else None
+        try:
+            self.connection.request(method, self.prefix + path, body=payload, headers=headers)
+            response = self.connection.getresponse()
+            return response.status, response.read()
+        except (http.client.HTTPException, OSError):
+            # 连接被服务端关闭（如 max-requests 重启），重连后由调用方计为一次错误
+            self.connection.close()
+            raise
+
+    def login(self, username: str, password: str) -> int:
+        status, content = self.request("POST", "/api/auth/login", {"username": username, "password": password})
+        if status == 200:
+            self.token = json.loads(content)["data"]["access"]
+        return status
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class LoadTest:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.scenarios: Dict[str, Callable[[ApiClient, random.Random], int]] = {
+            "login": self.login,
+            "get_department": self.get_department,
+            "list_users": self.list_users,
+            "list_operation_logs": self.list_operation_logs,
+            "update_department": self.update_department,
+        }
+        self.mix = parse_mix(args.mix, self.scenarios)
+        self.department_id = ""
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def setup(self) -> None:
+        client = ApiClient(self.args.base_url)
+        try:
+            if client.login(self.args.username, self.args.password) != 200:
+                raise SystemExit(f"Login failed for {self.args.username}, run seed_benchmark_data first.")
+            status, content = client.request("GET", "/api/departments/?code=bench&page_size=1")
+            items = json.loads(content)["data"]["items"] if status == 200 else []
+            if not items:
+                raise SystemExit("Benchmark department not found, run seed_benchmark_data first.")
+            self.department_id = items[0]["id"]
+        finally:
+            client.close()
+
+    # 场景：返回HTTP状态码
+    def login(self, client: ApiClient, rng: random.Random) -> int:
+        return client.request("POST", "/api/auth/login", {"username": self.args.username, "password": self.args.password})[0]
+
+    def get_department(self, client: ApiClient, rng: random.Random) -> int:
+        return client.request("GET", f"/api/departments/{self.department_id}")[0]
+
+    def list_users(self, client: ApiClient, rng: random.Random) -> int:
+        return client.request("GET", f"/api/users/?page_size=20&page={rng.randint(1, self.args.max_page)}")[0]
+
+    def list_operation_logs(self, client: ApiClient, rng: random.Random) -> int:
+        return client.request("GET", f"/api/operation-logs/?page_size=20&page={rng.randint(1, self.args.max_page)}")[0]
+
+    def update_department(self, client: ApiClient, rng: random.Random) -> int:
+        body = {"description": f"load test {rng.random():.6f}"}
+        return client.request("PUT", f"/api/departments/{self.department_id}", body)[0]
+
+    def worker(self, index: int, deadline: float) -> None:
+        rng = random.Random(self.args.seed + index)
+        names = [name for name, _ in self.mix]
+        weights = [weight for _, weight in self.mix]
+        client = ApiClient(self.args.base_url)
+        samples: Dict[str, List[float]] = defaultdict(list)
+        errors: Dict[str, int] = defaultdict(int)
+        try:
+            client.login(self.args.username, self.args.password)
+            while time.monotonic() < deadline:
+                name = rng.choices(names, weights)[0]
+                start = time.perf_counter()
+                try:
+                    status = self.scenarios[name](client, rng)
+                except (http.client.HTTPException, OSError):
+                    status = 0
+                elapsed = (time.perf_counter() - start) * 1000
+                if 200 <= status < 300:
+                    samples[name].append(elapsed)
+                else:
+                    errors[name] += 1
+        finally:
+            client.close()
+            with self._lock:
+                for name, values in samples.items():
+                    self.samples[name].extend(values)
+                for name, count in errors.items():
+                    self.errors[name] += count
+
+    def run(self, concurrency: int, suffix: str = "") -> Dict[str, dict]:
+        if not self.department_id:
+            self.setup()
+        self.samples.clear()
+        self.errors.clear()
+        deadline = time.monotonic() + self.args.duration
+        threads = [
+            threading.Thread(target=self.worker, args=(index, deadline), daemon=True)
+            for index in range(concurrency)
+        ]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        results = {}
+        for name, _ in self.mix:
+            samples = self.samples.get(name, [])
+            if not samples:
+                continue
+            stats = BenchmarkStats.from_samples(samples).to_dict()
+            stats["errors"] = self.errors.get(name, 0)
+            stats["rps"] = round(len(samples) / elapsed, 2)
+            results[f"http.{name}{suffix}"] = stats
+        return results
+
+
+def parse_mix(mix: str, scenarios: Dict[str, Callable]) -> List[Tuple[str, float]]:
+    weights = []
+    for item in mix.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name not in scenarios:
+            raise SystemExit(f"Unknown scenario: {name}, available: {', '.join(scenarios)}")
+        weights.append((name, float(weight or 1)))
+    return weights
+
+
+def parse_concurrency(value: str) -> List[int]:
+    levels = [int(item) for item in value.split(",") if item.strip()]
+    if not levels or min(levels) <= 0:
+        raise SystemExit(f"Invalid concurrency: {value}")
+    return levels
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="HTTP load driver for the API hot paths.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--username", default="bench_operator")
+    parser.add_argument("--password", default="bench123")
+    parser.add_argument("--concurrency", default="8", help="并发数，逗号分隔时依次压测每个并发数")
+    parser.add_argument("--duration", type=float, default=30.0, help="压测时长（秒）")
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--max-page", type=int, default=50, help="列表场景随机访问的最大页码")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=f"{BENCHMARK_DIR}/results/http.json")
+    parser.add_argument("--baseline", default=DEFAULT_HTTP_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--metric", default="p95", help="与基线比较的统计量")
+    parser.add_argument("--save-baseline", action="store_true", help="把本次结果写入基线文件")
+    args = parser.parse_args(argv)
+
+    levels = parse_concurrency(args.concurrency)
+    load_test = LoadTest(args)
+    results: Dict[str, dict] = {}
+    for level in levels:
+        results.update(load_test.run(level, f"@c{level}" if len(levels) > 1 else ""))
+    meta = {"base_url": args.base_url, "concurrency": args.concurrency, "duration": args.duration, "mix": args.mix}
+    save_results(args.output, results, meta, merge=False)
+    if args.save_baseline:
+        save_results(args.baseline, results, meta)
+
+    for name, stats in results.items():
+        print(f"{name}: {stats['rounds']} ok, {stats['errors']} errors, {stats['rps']} req/s, "
+              f"p50 {stats['median']:.1f}ms, p95 {stats['p95']:.1f}ms, p99 {stats['p99']:.1f}ms")
+    comparisons = compare(results, load_results(args.baseline)["benchmarks"], args.metric)
+    print(format_report(comparisons, args.threshold, args.metric))
+    return 1 if any(item.status(args.threshold) == "regressed" for item in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""
+API 热点路径基准测试
+默认跳过，设置 RUN_BENCHMARKS=1 后运行：
+    RUN_BENCHMARKS=1 python -m pytest -c tests/pytest.ini tests/benchmarks -s
+环境变量：
+- BENCHMARK_ROWS: 列表接口的数据量，逗号分隔，默认 10000,100000
+- BENCHMARK_SAVE: 为1时把本次结果写入基线文件而不做比较
+- BENCHMARK_BASELINE: 基线文件，默认 tests/benchmarks/baselines.json
+- BENCHMARK_OUTPUT: 本次结果文件，默认 tests/benchmarks/results/latest.json
+- BENCHMARK_THRESHOLD: 中位数超过基线的比例阈值，默认 0.25
+"""
+
+import json
+import os
+import unittest
+from typing import Callable, Dict, List
+from urllib.parse import quote
+from unittest import mock
+
+from django.test import Client, TestCase, override_settings
+from ninja.renderers import JSONRenderer
+from ninja_jwt.tokens import RefreshToken
+
+from app.api.renderers import ORJSONRenderer
+from app.api.schemas import ApiResponse, MenuTreeNode, OperationLogOut, PageOut
+from app.application.services.menu_service import MenuService
+from app.application.services.operation_log_service import OperationLogService
+from app.common.api_response import fast_success, success
+from app.common.middleware import operation_log_sink
+from app.common.middleware.operation_log_sink import SyncOperationLogSink
+from app.domain.models.menu import Menu
+from app.domain.models.menu_meta import MenuMeta
+from app.domain.models.user import User
+from app.domain.repositories.pagination import MAX_PAGE_SIZE, PageRequest
+from app.infrastructure.persistence.repos.operation_log_repo_impl import DjangoORMOperationLogRepository
+from app.infrastructure.management.commands.seed_benchmark_data import (
+    BENCH_PASSWORD, seed_accounts, seed_operation_logs, seed_users,
+)
+from tests.benchmarks.harness import (
+    BENCHMARK_DIR, DEFAULT_BASELINE, DEFAULT_THRESHOLD, BenchmarkStats, compare, format_report,
+    load_results, measure, save_results,
+)
+
+RUN_BENCHMARKS = os.environ.get("RUN_BENCHMARKS", "").lower() in ("1", "true", "yes")
+ROW_COUNTS = [int(n) for n in os.environ.get("BENCHMARK_ROWS", "10000,100000").split(",") if n.strip()]
+SAVE_BASELINE = os.environ.get("BENCHMARK_SAVE", "").lower() in ("1", "true", "yes")
+BASELINE_FILE = os.environ.get("BENCHMARK_BASELINE", DEFAULT_BASELINE)
+OUTPUT_FILE = os.environ.get("BENCHMARK_OUTPUT", os.path.join(BENCHMARK_DIR, "results", "latest.json"))
+THRESHOLD = float(os.environ.get("BENCHMARK_THRESHOLD", DEFAULT_THRESHOLD))
+# 渲染基准中菜单树的规模：根菜单数 x 每个根下的子菜单数
+MENU_TREE_SHAPE = (20, 25)
+
+# 本次运行的全部结果，模块结束时写入文件
+RESULTS: Dict[str, dict] = {}
+
+
+def tearDownModule():
+    if not RESULTS:
+        return
+    save_results(OUTPUT_FILE, RESULTS, merge=False)
+    if SAVE_BASELINE:
+        save_results(BASELINE_FILE, RESULTS)
+    baseline = load_results(BASELINE_FILE)["benchmarks"]
+    print("\n" + format_report(compare(RESULTS, baseline), THRESHOLD))
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, "set RUN_BENCHMARKS=1 to run benchmarks")
+class BenchmarkTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """创建压测账号，直接签发令牌避免每个用例都计算密码哈希"""
+        ids = seed_accounts()
+        cls.department_id = ids["department_id"]
+        cls.admin_token = str(RefreshToken.for_user(User.objects.get(username="bench_admin")).access_token)  # type: ignore
+        cls.operator_token = str(RefreshToken.for_user(User.objects.get(id=ids["operator_id"])).access_token)  # type: ignore
+
+    def setUp(self):
+        self.client = Client()
+
+    def get(self, path: str, token: str):
+        return self.client.get(path, HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def send(self, method: str, path: str, body: dict, token: str = ""):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"} if token else {}
+        return getattr(self.client, method)(path, json.dumps(body), content_type="application/json", **headers)
+
+    def benchmark(self, name: str, func: Callable[[], object], rounds: int = 20, warmup: int = 2) -> BenchmarkStats:
+        """计时并记录结果，中位数超过基线阈值时用例失败"""
+        stats = measure(func, rounds=rounds, warmup=warmup)
+        RESULTS[name] = stats.to_dict()
+        if not SAVE_BASELINE:
+            comparison = compare({name: RESULTS[name]}, load_results(BASELINE_FILE)["benchmarks"])[0]
+            if comparison.status(THRESHOLD) == "regressed":
+                self.fail(
+                    f"{name} regressed: median {comparison.current:.3f}ms vs baseline "
+                    f"{comparison.baseline:.3f}ms (threshold {THRESHOLD:.0%})"
+                )
+        return stats
+
+    def assertStatus(self, response, status: int = 200):
+        self.assertEqual(response.status_code, status, response.content[:300])
+        return response
+
+
+class TestAuthBenchmarks(BenchmarkTestCase):
+    def test_login(self):
+        """登录：密码哈希校验 + 签发令牌"""
+        body = {"username": "bench_operator", "password": BENCH_PASSWORD}
+        self.assertStatus(self.send("post", "/api/auth/login", body))
+        self.benchmark("auth.login", lambda: self.send("post", "/api/auth/login", body), rounds=5, warmup=1)
+
+    def test_jwt_get_superuser(self):
+        """超级用户的JWT认证GET"""
+        path = f"/api/departments/{self.department_id}"
+        self.assertStatus(self.get(path, self.admin_token))
+        self.benchmark("auth.jwt_get.superuser", lambda: self.get(path, self.admin_token), rounds=100)
+
+    def test_jwt_get_route_permission(self):
+        """普通用户的JWT认证GET，经过路由前缀树和权限缓存"""
+        path = f"/api/departments/{self.department_id}"
+        self.assertStatus(self.get(path, self.operator_token))
+        self.benchmark("auth.jwt_get.route_permission", lambda: self.get(path, self.operator_token), rounds=100)
+
+
+class TestListBenchmarks(BenchmarkTestCase):
+    def test_list_endpoints(self):
+        """列表接口在不同数据量下的首页、深分页和游标分页"""
+        for rows in sorted(ROW_COUNTS):
+            seed_users(rows)
+            seed_operation_logs(rows)
+            deep_page = max(1, rows // 20 // 2)
+
+            for resource in ("users", "operation-logs"):
+                path = f"/api/{resource}/"
+                first = self.assertStatus(self.get(f"{path}?page_size=20", self.operator_token)).json()["data"]
+                cursor = quote(first["next_cursor"])
+                self.benchmark(f"list.{resource}.{rows}.first_page", lambda: self.get(f"{path}?page_size=20", self.operator_token))
+                self.benchmark(
+                    f"list.{resource}.{rows}.deep_page",
+                    lambda: self.get(f"{path}?page_size=20&page={deep_page}", self.operator_token),
+                )
+                self.benchmark(
+                    f"list.{resource}.{rows}.cursor_page",
+                    lambda: self.get(f"{path}?page_size=20&cursor={cursor}", self.operator_token),
+                )
+                self.benchmark(
+                    f"list.{resource}.{rows}.page_size_200",
+                    lambda: self.get(f"{path}?page_size=200", self.operator_token), rounds=10,
+                )
+
+
+@override_settings(FAST_RESPONSE_VALIDATE=False)
+class TestSerializationBenchmarks(BenchmarkTestCase):
+    def test_operation_log_list_paths(self):
+        """
+        一页 200 条操作日志从查询到编码：
+        model_path 为逐行构造模型和字典，再经 ApiResponse 模型校验、ninja 渲染器编码；
+        values_path 为 values() 读取后直接用 orjson 编码（fast_success）
+        """
+        seed_operation_logs(MAX_PAGE_SIZE * 5)
+        service = OperationLogService(DjangoORMOperationLogRepository())
+        schema = ApiResponse[PageOut[OperationLogOut]]
+        renderer = JSONRenderer()
+        page_request = PageRequest(page=1, page_size=MAX_PAGE_SIZE)
+
+        def model_path():
+            response = schema.model_validate(success(service.list_operation_logs_page(page_request).to_dict()))
+            return renderer.render(None, response.model_dump(), response_status=200)
+
+        def values_path():
+            return fast_success(service.list_operation_logs_values_page(page_request).to_dict()).content
+
+        self.assertEqual(json.loads(model_path())["data"], json.loads(values_path())["data"])
+        self.benchmark(f"serialize.operation_logs.{MAX_PAGE_SIZE}.model_path", model_path)
+        self.benchmark(f"serialize.operation_logs.{MAX_PAGE_SIZE}.values_path", values_path)
+
+
+def build_menu_tree(roots: int, children: int) -> List[dict]:
+    """按菜单服务的节点格式构造菜单树，不需要数据库"""
+    service = MenuService()
+    tree = []
+    for i in range(roots):
+        root = service._menu_to_tree_node(
+            Menu(id=f"root{i}", name=f"menu{i}", code=f"menu{i}", menu_type=0, rank=i, path=f"/menu{i}"),
+            MenuMeta(title=f"Menu {i}", icon="ep:menu"),
+        )
+        for j in range(children):
+            root["children"].append(service._menu_to_tree_node(
+                Menu(
+                    id=f"node{i}_{j}", name=f"menu{i}_{j}", code=f"menu{i}_{j}", menu_type=1, rank=j,
+                    path=f"/menu{i}/{j}", component=f"menu{i}/{j}/index", method="GET", parent_id=f"root{i}",
+                ),
+                MenuMeta(title=f"Menu {i}.{j}", icon="ep:document"),
+            ))
+        tree.append(root)
+    return tree
+
+
+class TestRendererBenchmarks(BenchmarkTestCase):
+    def test_json_and_orjson_renderers(self):
+        """最大的两类响应（200 条操作日志的一页、菜单树）分别用标准库 json 和 orjson 渲染"""
+        seed_operation_logs(MAX_PAGE_SIZE * 5)
+        page = OperationLogService(DjangoORMOperationLogRepository()).list_operation_logs_page(
+            PageRequest(page=1, page_size=MAX_PAGE_SIZE)
+        )
+        roots, children = MENU_TREE_SHAPE
+        responses = {
+            f"operation_logs.{MAX_PAGE_SIZE}": ApiResponse[PageOut[OperationLogOut]].model_validate(
+                success(page.to_dict())
+            ),
+            f"menu_tree.{roots * (children + 1)}": ApiResponse[List[MenuTreeNode]].model_validate(
+                success(build_menu_tree(roots, children))
+            ),
+        }
+        for name, response in responses.items():
+            # 渲染器接收的是 ninja 校验后 model_dump 的结果
+            data = response.model_dump()
+            renderers = {"json": JSONRenderer(), "orjson": ORJSONRenderer()}
+            outputs = {backend: renderer.render(None, data, response_status=200) for backend, renderer in renderers.items()}
+            self.assertEqual(json.loads(outputs["json"]), json.loads(outputs["orjson"]))
+            for backend, renderer in renderers.items():
+                self.benchmark(
+                    f"render.{name}.{backend}",
+                    lambda: renderer.render(None, data, response_status=200),
+                    rounds=50,
+                )
+
+
+class TestMutationBenchmarks(BenchmarkTestCase):
+    def test_update_through_operation_log_middleware(self):
+        """修改请求经过操作日志中间件，同步写入日志"""
+        path = f"/api/departments/{self.department_id}"
+        with mock.patch.object(operation_log_sink, "_sink", SyncOperationLogSink(rollup=True)):
+            # 中间件在创建客户端时获取写入通道
+            self.client = Client()
+            self.assertStatus(self.send("put", path, {"description": "bench"}, self.operator_token))
+            self.benchmark(
+                "mutation.update_department.sync_log",
+                lambda: self.send("put", path, {"description": "bench"}, self.operator_token),
+                rounds=50,
+            )
@@ -0,0 +1,32 @@
+"""
+pytest 公共 fixture
+"""
+
+import pytest
+
+from app.common.query_inspector import DEFAULT_THRESHOLD, assert_no_n_plus_one
+from app.common.response_cache import invalidate_response_cache
+
+
+@pytest.fixture
+def n_plus_one(request):
+    """
+    检测测试中的 N+1 查询：同一SQL模板执行超过阈值次时测试失败
+    用法：def test_xxx(db, n_plus_one): ...，阈值可通过 @pytest.mark.n_plus_one_threshold(10) 调整
+    """
+    marker = request.node.get_closest_marker("n_plus_one_threshold")
+    threshold = marker.args[0] if marker else DEFAULT_THRESHOLD
+    with assert_no_n_plus_one(threshold) as recorder:
+        yield recorder
+
+
+@pytest.fixture(autouse=True)
+def validate_fast_responses(settings):
+    """测试中列表快速路径的输出始终按响应模型校验"""
+    settings.FAST_RESPONSE_VALIDATE = True
+
+
+@pytest.fixture(autouse=True)
+def reset_response_cache():
+    """每个测试开始前使接口响应缓存失效，避免命中其他测试中已回滚的数据"""
+    invalidate_response_cache()
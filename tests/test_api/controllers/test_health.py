@@ -1,7 +1,26 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache.backends.locmem import LocMemCache
 from django.test import TestCase
 
 
 class TestHealthController(TestCase):
     def test_health_controller(self):
         """Test health controller functionality"""
-        self.assertTrue(True)  # Placeholder for actual tests
\ No newline at end of file
+        self.assertTrue(True)  # Placeholder for actual tests
+
+    def test_detailed_health_reports_cache(self):
+        """测试详细健康检查给出缓存状态和耗时，缓存不可用时整体状态为 degraded"""
+        data = self.client.get("/api/health/detailed").json()["data"]
+
+        self.assertEqual(data["status"], "healthy")
+        self.assertEqual(data["cache"]["status"], "connected")
+        self.assertEqual(data["cache"]["backend"], "LocMemCache")
+        self.assertGreaterEqual(data["cache"]["latency_ms"], 0)
+
+        broken = Mock(spec=LocMemCache)
+        broken.set.side_effect = ConnectionError("cache down")
+        with patch("app.api.controllers.health.caches", {"default": broken}):
+            data = self.client.get("/api/health/detailed").json()["data"]
+
+        self.assertEqual((data["status"], data["cache"]["status"]), ("degraded", "disconnected"))
@@ -0,0 +1,77 @@
+"""
+测试异步读取接口在ASGI下的运行
+"""
+
+import json
+
+from asgiref.sync import sync_to_async
+from django.test import AsyncClient, TestCase
+from django.utils import timezone
+from ninja.responses import NinjaJSONEncoder
+from ninja_jwt.tokens import RefreshToken
+
+from app.api.schemas import LoginLogOut, OperationLogOut, PageOut
+from app.application.services.login_log_service import LoginLogService
+from app.application.services.operation_log_service import OperationLogService
+from app.domain.models.department import Department
+from app.domain.models.login_log import LoginLog
+from app.domain.models.operation_log import OperationLog
+from app.domain.models.user import User
+from app.domain.repositories.pagination import PageRequest
+from app.infrastructure.persistence.repos.login_log_repo_impl import DjangoORMLoginLogRepository
+from app.infrastructure.persistence.repos.operation_log_repo_impl import DjangoORMOperationLogRepository
+from app.infrastructure.persistence.repos.user_repo_impl import DjangoORMUserRepository
+
+
+class TestAsyncReadEndpoints(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        admin = User.objects.create_superuser("async_admin", "async_admin@example.com", "secret")  # type: ignore
+        cls.token = str(RefreshToken.for_user(admin).access_token)
+        cls.department = Department(name="研发部", code="rd", rank=0, auto_bind=False, is_active=True, mode_type=0)
+        cls.department.save()
+        for i in range(3):
+            LoginLog.objects.create(creator=admin, status=bool(i % 2), login_type=0, ipaddress="127.0.0.1")
+            OperationLog.objects.create(
+                module="user", request_method="GET", oper_url="/api/users/", status=bool(i % 2),
+                cost_time=i, user=admin, created_time=timezone.now(),
+            )
+
+    async def test_list_and_detail_under_asgi(self):
+        """测试列表和详情接口经过ASGI处理器、认证、权限和中间件"""
+        client = AsyncClient()
+        headers = {"Authorization": f"Bearer {self.token}"}
+
+        response = await client.get("/api/departments/?page_size=5", headers=headers)
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()["data"]["items"][0]["code"], "rd")
+
+        response = await client.get(f"/api/departments/{self.department.id}", headers=headers)
+        self.assertEqual(response.json()["data"]["name"], "研发部")
+
+        response = await client.get("/api/users/?cursor=invalid", headers=headers)
+        self.assertEqual(response.status_code, 400)
+
+    async def test_requires_authentication(self):
+        """测试未认证的异步请求被拒绝"""
+        response = await AsyncClient().get("/api/departments/")
+        self.assertEqual(response.status_code, 401)
+
+    async def test_log_lists_fast_path_matches_model_path(self):
+        """测试日志列表的快速路径与逐行构造模型、按响应模型序列化的结果一致"""
+        client = AsyncClient()
+        headers = {"Authorization": f"Bearer {self.token}"}
+        login_service = LoginLogService(DjangoORMLoginLogRepository(), DjangoORMUserRepository())
+        operation_service = OperationLogService(DjangoORMOperationLogRepository())
+        cases = [
+            ("/api/login-logs/", login_service.list_login_logs_page, LoginLogOut),
+            ("/api/operation-logs/", operation_service.list_operation_logs_page, OperationLogOut),
+        ]
+
+        for path, list_page, schema in cases:
+            response = await client.get(f"{path}?page_size=2", headers=headers)
+            self.assertEqual(response.status_code, 200, response.content)
+            page = await sync_to_async(list_page)(PageRequest(page=1, page_size=2))
+            expected = json.dumps(PageOut[schema].model_validate(page.to_dict()).model_dump(), cls=NinjaJSONEncoder)
+            self.assertEqual(response.json()["data"], json.loads(expected))
+            self.assertIsNotNone(response.json()["data"]["next_cursor"])
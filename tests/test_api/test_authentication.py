@@ -1,9 +1,40 @@
 import unittest
+from unittest.mock import Mock, patch
+
+from django.test import RequestFactory
+
+from app.api.authentication import PrincipalJWTAuth
+from app.common.principal import get_request_principal, has_request_principal
+
 
 class TestAuthentication(unittest.TestCase):
     def test_authentication(self):
         """Test authentication functionality"""
         self.assertTrue(True)  # Placeholder for actual tests
-        
+
+    def test_principal_jwt_auth_stores_principal(self):
+        """Authenticated user is stashed on the request for later consumers"""
+        request = RequestFactory().get('/api/users/')
+        user = Mock()
+        user.get_username.return_value = 'admin'
+
+        with patch.object(PrincipalJWTAuth, 'jwt_authenticate', return_value=user):
+            result = PrincipalJWTAuth().authenticate(request, 'token')
+
+        self.assertIs(result, user)
+        self.assertIs(get_request_principal(request), user)
+
+    def test_principal_jwt_auth_marks_failure(self):
+        """Failed authentication is recorded so the token is not verified again"""
+        request = RequestFactory().get('/api/users/')
+
+        with patch.object(PrincipalJWTAuth, 'jwt_authenticate', side_effect=Exception('invalid')):
+            with self.assertRaises(Exception):
+                PrincipalJWTAuth().authenticate(request, 'token')
+
+        self.assertTrue(has_request_principal(request))
+        self.assertIsNone(get_request_principal(request))
+
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+测试列表接口的条件请求（ETag）
+"""
+
+import time
+
+from django.test import TestCase
+from django.utils.http import http_date
+from ninja_jwt.tokens import RefreshToken
+
+from app.common.query_inspector import detect_queries
+from app.domain.models.department import Department
+from app.domain.models.user import User
+
+
+class TestConditionalGet(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        admin = User.objects.create_superuser("etag_admin", "etag_admin@example.com", "secret")  # type: ignore
+        cls.headers = {"HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(admin).access_token}"}
+        cls.department = Department(name="研发部", code="rd", rank=0, auto_bind=False, is_active=True, mode_type=0)
+        cls.department.save()
+
+    def test_not_modified_without_reading_rows(self):
+        """测试 If-None-Match 匹配时返回 304，只执行集合版本的聚合查询"""
+        for path in ("/api/departments/", "/api/departments/tree"):
+            response = self.client.get(path, **self.headers)
+            self.assertEqual(response.status_code, 200, response.content)
+            self.assertTrue(response["ETag"].startswith('W/"'))
+            self.assertNotIn("Last-Modified", response)
+
+            with detect_queries() as recorder:
+                not_modified = self.client.get(path, HTTP_IF_NONE_MATCH=response["ETag"], **self.headers)
+
+            self.assertEqual(not_modified.status_code, 304)
+            self.assertEqual(not_modified["ETag"], response["ETag"])
+            self.assertEqual(not_modified.content, b"")
+            self.assertFalse([sql for sql in recorder.counts if sql.startswith('SELECT "system_department"."id"')])
+
+    def test_etag_changes_with_collection(self):
+        """测试修改、新增、删除记录以及不同查询参数都会得到新的 ETag"""
+        etag = self.client.get("/api/departments/", **self.headers)["ETag"]
+        self.assertEqual(self.client.get("/api/departments/?page_size=1", HTTP_IF_NONE_MATCH=etag, **self.headers).status_code, 200)
+
+        self.department.name = "研发中心"
+        self.department.save()
+        response = self.client.get("/api/departments/", HTTP_IF_NONE_MATCH=etag, **self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+        etag = response["ETag"]
+        Department(name="测试部", code="qa", rank=1, auto_bind=False, is_active=True, mode_type=0).save()
+        response = self.client.get("/api/departments/", HTTP_IF_NONE_MATCH=etag, **self.headers)
+        self.assertEqual(response.status_code, 200)
+
+        # 删除最后修改的记录后最后修改时间回退，记录数同样变化
+        etag = response["ETag"]
+        Department.objects.filter(code="qa").delete()
+        self.assertEqual(self.client.get("/api/departments/", HTTP_IF_NONE_MATCH=etag, **self.headers).status_code, 200)
+
+    def test_if_modified_since_is_ignored(self):
+        """测试删除非最新的记录后，只携带 If-Modified-Since 的请求仍然得到最新列表"""
+        Department(name="测试部", code="qa", rank=1, auto_bind=False, is_active=True, mode_type=0).save()
+        since = http_date(time.time() + 60)
+
+        self.department.delete()
+        response = self.client.get("/api/departments/", HTTP_IF_MODIFIED_SINCE=since, **self.headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["code"] for item in response.json()["data"]["items"]], ["qa"])
+
@@ -0,0 +1,58 @@
+"""
+测试 orjson 渲染器和解析器
+"""
+
+import json
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from ninja.parser import Parser
+from ninja.renderers import JSONRenderer
+
+from app.api.parsers import ORJSONParser, get_json_parser
+from app.api.renderers import MetricsJSONRenderer, ORJSONRenderer, get_json_renderer
+from app.api.schemas import BulkItemOut
+
+
+class TestORJSONRenderer(SimpleTestCase):
+    def test_output_matches_default_renderer(self):
+        """测试日期时间、Decimal、UUID、pydantic 模型的输出与 ninja 默认渲染器一致"""
+        data = {
+            "id": uuid.uuid4().hex,
+            "uuid": uuid.UUID("12345678123456781234567812345678"),
+            "created_time": datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+            "naive_time": datetime(2024, 1, 2, 3, 4, 5),
+            "day": date(2024, 1, 2),
+            "amount": Decimal("12.50"),
+            "item": BulkItemOut(index=0, success=True, id="a"),
+            "text": "中文",
+        }
+
+        expected = json.loads(JSONRenderer().render(None, data, response_status=200))
+        rendered = ORJSONRenderer().render(None, data, response_status=200)
+
+        self.assertEqual(json.loads(rendered), expected)
+        self.assertEqual(expected["created_time"], "2024-01-02T03:04:05.678Z")
+
+    def test_parser_reads_body(self):
+        """测试解析请求体，格式错误时抛出异常（由 ninja 转换为 400）"""
+        factory = RequestFactory()
+        request = factory.post("/", data='{"name": "中文", "ids": [1, 2]}', content_type="application/json")
+
+        self.assertEqual(ORJSONParser().parse_body(request), {"name": "中文", "ids": [1, 2]})
+        with self.assertRaises(ValueError):
+            ORJSONParser().parse_body(factory.post("/", data="{", content_type="application/json"))
+
+    def test_backend_selected_by_setting(self):
+        """测试 API_JSON_BACKEND 选择渲染器和解析器"""
+        with override_settings(API_JSON_BACKEND="json"):
+            self.assertIsInstance(get_json_renderer(), MetricsJSONRenderer)
+            self.assertIs(type(get_json_parser()), Parser)
+        with override_settings(API_JSON_BACKEND="orjson"):
+            self.assertIsInstance(get_json_renderer(), ORJSONRenderer)
+            self.assertIsInstance(get_json_parser(), ORJSONParser)
+        with override_settings(API_JSON_BACKEND="simplejson"):
+            with self.assertRaises(ValueError):
+                get_json_renderer()
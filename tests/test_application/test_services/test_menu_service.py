@@ -292,4 +292,68 @@ class TestMenuService(TestCase):
             result = self.menu_service.list_menus()
             
             self.assertEqual(len(result), 3)
-            self.assertEqual(result[0]["name"], "菜单0")
\ No newline at end of file
+            self.assertEqual(result[0]["name"], "菜单0")
+
+class TestUserMenuTree(TestCase):
+    def setUp(self):
+        """测试初始化，创建 系统 -> 用户管理 两级菜单和一个只授予其中部分菜单的角色"""
+        from app.domain.models.role import Role
+        from app.domain.models.role_menu import RoleMenu
+        from app.domain.models.user import User
+        from app.domain.models.user_role import UserRole
+        from app.domain.services.permission_cache import MENU_TREE_CACHE_NAMESPACE, PermissionCache
+        from app.infrastructure.persistence.repos.menu_repo_impl import DjangoORMMenuRepository
+        from app.infrastructure.persistence.repos.user_repo_impl import DjangoORMUserRepository
+
+        self.meta = MenuMeta.objects.create(  # type: ignore
+            title="系统管理", is_show_menu=True, is_show_parent=True, is_keepalive=True,
+            frame_loading=False, is_hidden_tag=False, fixed_tag=False, dynamic_level=0,
+        )
+        self.system = self._create_menu("system", rank=2, meta_id=self.meta.id)
+        self.users = self._create_menu("users", rank=1, parent_id=self.system.id)
+        self.roles = self._create_menu("roles", rank=0, parent_id=self.system.id)
+        self.hidden = self._create_menu("hidden", rank=0)
+
+        role = Role.objects.create(name="viewer", code="viewer", is_active=True)  # type: ignore
+        for menu in (self.system, self.users, self.roles):
+            RoleMenu.objects.create(role=role, menu=menu)  # type: ignore
+        self.user = User.objects.create_user(username="viewer", password="secret")  # type: ignore
+        UserRole.objects.create(user=self.user, role=role)  # type: ignore
+        self.service = MenuService(
+            DjangoORMMenuRepository(), DjangoORMUserRepository(),
+            PermissionCache(use_shared_cache=False, namespace=MENU_TREE_CACHE_NAMESPACE),
+        )
+
+    def _create_menu(self, code, rank, parent_id=None, meta_id=""):
+        return Menu.objects.create(  # type: ignore
+            name=code, code=code, menu_type=0, rank=rank, path=f"/{code}", is_active=True,
+            meta_id=meta_id, parent_id=parent_id,
+        )
+
+    def test_tree_nested_and_sorted(self):
+        """测试菜单按父子关系嵌套、同级按 rank 排序，并带上元数据"""
+        # 角色查询、菜单查询、元数据查询
+        with self.assertNumQueries(3):
+            tree = self.service.get_user_menu_tree(self.user)
+
+        self.assertEqual([node["code"] for node in tree], ["system"])
+        self.assertEqual(tree[0]["meta"]["title"], "系统管理")
+        self.assertEqual([node["code"] for node in tree[0]["children"]], ["roles", "users"])
+        self.assertIsNone(tree[0]["children"][0]["meta"])
+
+    def test_tree_cached_per_role_set(self):
+        """测试命中缓存时只查询角色，菜单变更后缓存失效"""
+        self.service.get_user_menu_tree(self.user)
+        with self.assertNumQueries(1):
+            self.service.get_user_menu_tree(self.user)
+
+        self.users.is_active = False
+        self.users.save()
+        tree = self.service.get_user_menu_tree(self.user)
+        self.assertEqual([node["code"] for node in tree[0]["children"]], ["roles"])
+
+    def test_superuser_sees_all_active_menus(self):
+        """测试超级用户可见全部启用菜单"""
+        self.user.is_superuser = True
+        tree = self.service.get_user_menu_tree(self.user)
+        self.assertEqual([node["code"] for node in tree], ["hidden", "system"])
@@ -212,4 +212,71 @@ class TestUserService(TestCase):
         self.user_service.assign_role_to_user(user_id, role_id)
         
         # 验证方法可以被调用（不会抛出异常）
-        self.assertTrue(True)
\ No newline at end of file
+        self.assertTrue(True)
+
+class TestUserServiceBulk(TestCase):
+    def setUp(self):
+        """测试初始化，使用真实仓储"""
+        from app.infrastructure.persistence.repos.user_repo_impl import DjangoORMUserRepository
+
+        self.user_service = UserService(DjangoORMUserRepository())
+        self.existing = User.objects.create(username="existing", email="e@example.com")  # type: ignore
+
+    def test_bulk_create_users(self):
+        """测试批量创建返回逐项结果，重复和已存在的用户名判为失败"""
+        items = [
+            {"username": "bulk1", "email": "b1@example.com", "password": "pw-1"},
+            {"username": "existing", "email": "x@example.com", "password": "pw-x"},
+            {"username": "bulk2", "email": "b2@example.com", "password": "pw-2"},
+            {"username": "bulk2", "email": "b3@example.com", "password": "pw-3"},
+        ]
+
+        with self.assertNumQueries(4):
+            result = self.user_service.bulk_create_users(items)
+
+        self.assertEqual((result["total"], result["succeeded"], result["failed"]), (4, 1, 3))
+        self.assertEqual([item["success"] for item in result["items"]], [True, False, False, False])
+        self.assertIn("already exists", result["items"][1]["error"])
+        self.assertIn("Duplicate username", result["items"][3]["error"])
+        user = User.objects.get(username="bulk1")  # type: ignore
+        self.assertEqual(result["items"][0]["id"], user.id)
+        self.assertTrue(user.check_password("pw-1"))
+        self.assertIsNotNone(user.created_time)
+
+    def test_bulk_create_records_constraint_failure_per_item(self):
+        """测试唯一约束冲突（如并发写入）只使冲突的项失败，同批其他项照常写入"""
+        items = [
+            {"username": "bulk1", "email": "b1@example.com", "password": "pw-1"},
+            {"username": "existing", "email": "x@example.com", "password": "pw-x"},
+            {"username": "bulk2", "email": "b2@example.com", "password": "pw-2"},
+        ]
+
+        # 预校验之后另一个请求写入了同名用户
+        with patch.object(self.user_service.user_repo, "find_ids_by_values", return_value={}):
+            result = self.user_service.bulk_create_users(items)
+
+        self.assertEqual([item["success"] for item in result["items"]], [True, False, True])
+        self.assertIn("UNIQUE", result["items"][1]["error"].upper())
+        self.assertEqual(
+            set(User.objects.filter(username__startswith="bulk").values_list("username", flat=True)),  # type: ignore
+            {"bulk1", "bulk2"},
+        )
+
+    def test_bulk_update_and_delete_users(self):
+        """测试批量更新和删除"""
+        other = User.objects.create(username="other", email="o@example.com")  # type: ignore
+
+        result = self.user_service.bulk_update_users([
+            {"id": self.existing.id, "email": "new@example.com", "password": "changed"},
+            {"id": other.id, "username": "existing"},
+            {"id": "missing"},
+        ])
+
+        self.assertEqual([item["success"] for item in result["items"]], [True, False, False])
+        self.existing.refresh_from_db()
+        self.assertEqual(self.existing.email, "new@example.com")
+        self.assertTrue(self.existing.check_password("changed"))
+
+        result = self.user_service.bulk_delete_users([other.id, "missing"])
+        self.assertEqual([item["success"] for item in result["items"]], [True, False])
+        self.assertFalse(User.objects.filter(id=other.id).exists())  # type: ignore
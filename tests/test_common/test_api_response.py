@@ -1,9 +1,12 @@
+import json
 from datetime import datetime
 
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, override_settings
+from ninja.responses import NinjaJSONEncoder
+from pydantic import ValidationError
 
-from app.api.schemas import ApiResponse
-from app.common.api_response import success, error, not_found, unauthorized, forbidden
+from app.api.schemas import ApiResponse, LoginLogOut, PageOut
+from app.common.api_response import success, error, fast_success, not_found, unauthorized, forbidden
 
 
 class TestApiResponse(SimpleTestCase):
@@ -62,3 +65,25 @@ class TestApiResponse(SimpleTestCase):
         self.assertEqual(result.message, "Forbidden")
         self.assertIsNone(result.data)
         self.assertIsInstance(result.timestamp, datetime)
+
+    def test_fast_success_matches_success(self):
+        """测试快速路径输出与常规路径的JSON一致（日期时间格式相同）"""
+        data = {"items": [{"id": "a", "created_time": datetime(2024, 1, 2, 3, 4, 5, 678901)}]}
+
+        response = fast_success(data, "Listed")
+        expected = json.loads(json.dumps(success(data, "Listed").model_dump(), cls=NinjaJSONEncoder))
+
+        body = json.loads(response.content)
+        self.assertEqual(body["data"], expected["data"])
+        self.assertEqual(body["data"]["items"][0]["created_time"], "2024-01-02T03:04:05.678")
+        self.assertEqual((body["code"], body["message"]), (200, "Listed"))
+
+    def test_fast_success_validates_when_enabled(self):
+        """测试开启校验时按响应模型校验，关闭时不校验"""
+        schema = ApiResponse[PageOut[LoginLogOut]]
+
+        with override_settings(FAST_RESPONSE_VALIDATE=True):
+            with self.assertRaises(ValidationError):
+                fast_success({"items": [{"id": "a"}], "page_size": 20}, schema=schema)
+        with override_settings(FAST_RESPONSE_VALIDATE=False):
+            self.assertEqual(fast_success({"items": [{"id": "a"}]}, schema=schema).status_code, 200)
@@ -0,0 +1,65 @@
+"""
+测试缓存工具
+"""
+
+import unittest
+from unittest.mock import patch
+
+from django.core.cache import caches
+
+from app.common.cache import CacheStats, LRUCache, bump_cache_version, get_cache_version
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        """测试超出容量时淘汰最久未使用的条目"""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_ttl_expiry(self):
+        """测试条目过期后视为未命中"""
+        cache = LRUCache(maxsize=2, ttl=10)
+        with patch('app.common.cache.time.monotonic', return_value=100):
+            cache.set("a", 1)
+        with patch('app.common.cache.time.monotonic', return_value=105):
+            self.assertEqual(cache.get("a"), 1)
+        with patch('app.common.cache.time.monotonic', return_value=111):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["misses"], 1)
+
+
+class TestCacheVersion(unittest.TestCase):
+    def test_bump_increments_version(self):
+        """测试递增命名空间版本号"""
+        before = get_cache_version("test:namespace")
+        after = bump_cache_version("test:namespace")
+        self.assertGreater(after, before)
+        self.assertEqual(get_cache_version("test:namespace"), after)
+
+    def test_version_never_goes_back_after_eviction(self):
+        """测试版本键被淘汰后重新初始化的版本号大于此前的版本号"""
+        before = bump_cache_version("test:evicted")
+        caches["default"].delete("cache-version:test:evicted")
+        self.assertGreater(get_cache_version("test:evicted"), before)
+
+        caches["default"].delete("cache-version:test:evicted")
+        self.assertGreater(bump_cache_version("test:evicted"), before)
+
+
+class TestCacheStats(unittest.TestCase):
+    def test_hit_ratio(self):
+        """测试命中率，没有读取时为 None"""
+        stats = CacheStats()
+        self.assertIsNone(stats.stats()["hit_ratio"])
+
+        for hit in (True, True, True, False):
+            stats.record(hit)
+
+        self.assertEqual(stats.stats(), {"hits": 3, "misses": 1, "hit_ratio": 0.75})
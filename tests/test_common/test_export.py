@@ -0,0 +1,56 @@
+"""
+测试流式导出工具
+"""
+
+import json
+from datetime import datetime, timezone
+
+from django.test import TestCase
+
+from app.common.exception.exceptions import ValidationException
+from app.common.export import export_response, iter_csv, iter_ndjson
+
+
+class TestExport(TestCase):
+    def setUp(self):
+        """测试初始化"""
+        self.fields = ("id", "created_time", "status", "error_msg")
+        self.rows = [
+            {"id": "a", "created_time": datetime(2024, 1, 1, tzinfo=timezone.utc), "status": True, "error_msg": None},
+            {"id": "b", "created_time": datetime(2024, 1, 2, tzinfo=timezone.utc), "status": False, "error_msg": "失败,重试"},
+        ]
+
+    def test_iter_ndjson(self):
+        """测试每行输出一个JSON对象"""
+        lines = list(iter_ndjson(self.rows))
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])["error_msg"], "失败,重试")
+        self.assertEqual(json.loads(lines[0])["created_time"], "2024-01-01T00:00:00+00:00")
+
+    def test_iter_csv(self):
+        """测试CSV首行为表头且正确转义"""
+        lines = list(iter_csv(self.rows, self.fields))
+        self.assertEqual(lines[0], "\ufeffid,created_time,status,error_msg\r\n")
+        self.assertEqual(lines[1], "a,2024-01-01T00:00:00+00:00,True,\r\n")
+        self.assertEqual(lines[2], 'b,2024-01-02T00:00:00+00:00,False,"失败,重试"\r\n')
+
+    def test_export_response_is_lazy(self):
+        """测试响应在迭代时才读取数据"""
+        consumed = []
+
+        def rows():
+            for row in self.rows:
+                consumed.append(row["id"])
+                yield row
+
+        response = export_response(rows(), self.fields, "ndjson", "logs")
+        self.assertEqual(consumed, [])
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="logs.ndjson"')
+        body = b"".join(response.streaming_content)
+        self.assertEqual(consumed, ["a", "b"])
+        self.assertEqual(body.count(b"\n"), 2)
+
+    def test_unsupported_format(self):
+        """测试不支持的导出格式"""
+        with self.assertRaises(ValidationException):
+            export_response(iter(()), self.fields, "xml", "logs")
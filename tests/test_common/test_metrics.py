@@ -0,0 +1,95 @@
+"""
+测试接口指标
+"""
+
+import json
+import os
+import tempfile
+import threading
+
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+from ninja_jwt.tokens import RefreshToken
+
+from app.common.metrics import MetricsRegistry, archive_process, get_metrics_registry
+from app.domain.models.department import Department
+from app.domain.models.user import User
+
+
+def _sample(text: str, prefix: str) -> float:
+    return float(next(line for line in text.splitlines() if line.startswith(prefix)).rsplit(" ", 1)[1])
+
+
+class TestMetricsRegistry(SimpleTestCase):
+    def test_render_prometheus_histograms(self):
+        """测试按路由和方法输出计数和累计直方图"""
+        registry = MetricsRegistry()
+        registry.observe("users_list_users", "GET", 200, {"http_request_db_queries": 2})
+        registry.observe("users_list_users", "GET", 200, {"http_request_db_queries": 7})
+
+        text = registry.render()
+
+        self.assertIn('http_requests_total{route="users_list_users",method="GET",status="200"} 2', text)
+        self.assertIn('http_request_db_queries_bucket{route="users_list_users",method="GET",le="2"} 1', text)
+        self.assertIn('http_request_db_queries_bucket{route="users_list_users",method="GET",le="10"} 2', text)
+        self.assertIn('http_request_db_queries_sum{route="users_list_users",method="GET"} 9', text)
+
+    def test_exited_thread_shards_are_retired(self):
+        """测试线程结束后其分片合并进汇总并移除，分片数不随线程数增长且计数不丢失"""
+        registry = MetricsRegistry()
+        for _ in range(50):
+            thread = threading.Thread(target=registry.observe, args=("auth_login", "POST", 200, {}))
+            thread.start()
+            thread.join()
+
+        self.assertLessEqual(len(registry._shards), 1)
+        self.assertIn('status="200"} 50', registry.render())
+
+    def test_multiprocess_snapshots_and_archive(self):
+        """测试合并共享目录中各进程的快照，退出进程的计数并入归档后仍然保留"""
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "metrics_1.json"), "w", encoding="utf-8") as f:
+                json.dump([["auth_login", "POST", {"status": {"200": 3}, "hist": {}}]], f)
+            registry = MetricsRegistry(multiproc_dir=directory)
+            registry.observe("auth_login", "POST", 200, {})
+
+            self.assertIn('status="200"} 4', registry.render())
+
+            archive_process(directory, 1)
+            self.assertEqual(sorted(os.listdir(directory)), sorted(["metrics_archive.json", f"metrics_{os.getpid()}.json"]))
+            self.assertIn('status="200"} 4', registry.render())
+
+
+class TestMetricsEndpoint(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        admin = User.objects.create_superuser("metrics_admin", "metrics_admin@example.com", "secret")  # type: ignore
+        cls.token = str(RefreshToken.for_user(admin).access_token)
+        Department(name="研发部", code="rd", rank=0, auto_bind=False, is_active=True, mode_type=0).save()
+
+    def test_records_route_queries_and_render_time(self):
+        """测试按 operation id 统计请求，SQL查询数、序列化耗时和响应大小被记录"""
+        route = 'route="departments_list_departments",method="GET"'
+        before = get_metrics_registry().render()
+        client = Client()
+
+        response = client.get("/api/departments/", headers={"Authorization": f"Bearer {self.token}"})
+        self.assertEqual(response.status_code, 200)
+        text = client.get("/api/metrics", headers={"Authorization": f"Bearer {self.token}"}).content.decode()
+
+        count_before = _sample(before, f"http_request_db_queries_count{{{route}}}") if route in before else 0
+        self.assertEqual(_sample(text, f"http_request_db_queries_count{{{route}}}"), count_before + 1)
+        self.assertGreater(_sample(text, f"http_request_db_queries_sum{{{route}}}"), 0)
+        self.assertGreater(_sample(text, f"http_response_render_seconds_sum{{{route}}}"), 0)
+        self.assertGreater(_sample(text, f"http_response_size_bytes_sum{{{route}}}"), 0)
+
+    def test_requires_token_or_superuser(self):
+        """测试未认证的请求被拒绝，配置的抓取令牌和超级用户可以访问"""
+        client = Client()
+        self.assertEqual(client.get("/api/metrics").status_code, 401)
+        self.assertEqual(client.get("/api/metrics", headers={"Authorization": "Bearer scrape"}).status_code, 401)
+
+        with override_settings(METRICS={"ENABLED": True, "TOKEN": "scrape"}):
+            response = client.get("/api/metrics", headers={"Authorization": "Bearer scrape"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("# TYPE http_requests_total counter", response.content.decode())
+
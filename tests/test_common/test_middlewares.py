@@ -1,5 +1,13 @@
 # test_operation_log_middleware.py
-from django.test import TestCase
+from unittest.mock import Mock, patch
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import TestCase, RequestFactory
+
+from app.common.middleware.operation_log_middleware import OperationLogMiddleware
+from app.common.middleware.operation_log_sink import OperationLogSink
+from app.common.principal import set_request_principal
+from app.domain.models.user import User
 
 
 class OperationLogMiddlewareTest(TestCase):
@@ -7,4 +15,73 @@ class OperationLogMiddlewareTest(TestCase):
         """
         初始化测试环境
         """
-        self.assertTrue(True)
+        self.factory = RequestFactory()
+        self.sink = Mock(spec=OperationLogSink)
+        self.middleware = OperationLogMiddleware(lambda request: HttpResponse('{}'), sink=self.sink)
+
+    def test_get_current_user_reuses_principal(self):
+        """测试复用API层保存的认证主体，不再重复解析Token"""
+        request = self.factory.post('/api/users/', HTTP_AUTHORIZATION='Bearer token')
+        user = User(username='admin')
+        set_request_principal(request, user)
+
+        with patch('app.common.middleware.operation_log_middleware.JWTAuth') as MockJWTAuth:
+            self.assertIs(self.middleware._get_current_user(request), user)
+            MockJWTAuth.assert_not_called()
+
+    def test_get_current_user_skips_failed_authentication(self):
+        """测试API层认证失败后不再重复解析Token"""
+        request = self.factory.post('/api/users/', HTTP_AUTHORIZATION='Bearer token')
+        set_request_principal(request, None)
+
+        with patch('app.common.middleware.operation_log_middleware.JWTAuth') as MockJWTAuth:
+            self.assertIsNone(self.middleware._get_current_user(request))
+            MockJWTAuth.assert_not_called()
+
+    def test_get_current_user_falls_back_to_token(self):
+        """测试未经过API认证的请求自行解析Token并保存结果"""
+        request = self.factory.post('/api/custom/', HTTP_AUTHORIZATION='Bearer token')
+        user = User(username='admin')
+
+        with patch('app.common.middleware.operation_log_middleware.JWTAuth') as MockJWTAuth:
+            MockJWTAuth.return_value.authenticate.return_value = user
+            self.assertIs(self.middleware._get_current_user(request), user)
+            self.assertIs(self.middleware._get_current_user(request), user)
+            MockJWTAuth.return_value.authenticate.assert_called_once()
+
+    def test_record_operation_log_emits_to_sink(self):
+        """测试操作日志提交到写入通道"""
+        request = self.factory.post('/api/users/', data='{}', content_type='application/json')
+        set_request_principal(request, User(username='admin'))
+
+        self.middleware(request)
+
+        self.sink.emit.assert_called_once()
+        log = self.sink.emit.call_args.args[0]
+        self.assertEqual(log.oper_name, 'admin')
+        self.assertEqual(log.module, '用户管理')
+        self.assertIsNotNone(log.created_time)
+
+    def test_whitelist_path_not_recorded(self):
+        """测试白名单路径不记录操作日志"""
+        request = self.factory.post('/api/auth/login')
+
+        self.middleware(request)
+
+        self.sink.emit.assert_not_called()
+
+    def test_async_mode_records_response(self):
+        """测试ASGI下中间件以异步方式调用，并按实际响应记录日志"""
+        async def get_response(request):
+            return HttpResponse('{}', status=201)
+
+        middleware = OperationLogMiddleware(get_response, sink=self.sink)
+        request = self.factory.post('/api/users/', data='{}', content_type='application/json')
+        set_request_principal(request, User(username='admin'))
+
+        response = async_to_sync(middleware)(request)
+
+        self.assertEqual(response.status_code, 201)
+        log = self.sink.emit.call_args.args[0]
+        self.assertTrue(log.status)
+        self.assertEqual(log.json_result, '{}')
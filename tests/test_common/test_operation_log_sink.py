@@ -0,0 +1,113 @@
+"""
+测试操作日志写入通道
+"""
+
+from unittest.mock import patch, MagicMock
+from django.db import connection
+from django.test import TestCase
+
+from app.common.middleware.operation_log_sink import (
+    QueuedOperationLogSink,
+    SyncOperationLogSink,
+    build_operation_log_sink,
+)
+
+
+class TestQueuedOperationLogSink(TestCase):
+    def test_flush_writes_in_batches(self):
+        """测试刷新时按批次写入"""
+        sink = QueuedOperationLogSink(batch_size=2, flush_interval=0.05, queue_size=10)
+        logs = [MagicMock() for _ in range(5)]
+
+        with patch('app.domain.models.operation_log.OperationLog.objects.bulk_create') as mock_bulk:
+            with patch.object(sink, '_ensure_worker'):
+                for log in logs:
+                    sink.emit(log)
+            self.assertTrue(sink.flush(timeout=1))
+
+        self.assertEqual(mock_bulk.call_count, 3)
+        stats = sink.stats()
+        self.assertEqual(stats["enqueued"], 5)
+        self.assertEqual(stats["written"], 5)
+        self.assertEqual(stats["queued"], 0)
+
+    def test_background_worker_flushes(self):
+        """测试后台线程批量写入并在关闭时写入剩余日志"""
+        sink = QueuedOperationLogSink(batch_size=10, flush_interval=0.05, queue_size=100)
+
+        with patch('app.domain.models.operation_log.OperationLog.objects.bulk_create') as mock_bulk:
+            for _ in range(3):
+                sink.emit(MagicMock())
+            self.assertTrue(sink.flush(timeout=2))
+            sink.close()
+
+        written = sum(len(call.args[0]) for call in mock_bulk.call_args_list)
+        self.assertEqual(written, 3)
+        self.assertEqual(sink.stats()["written"], 3)
+
+    def test_drop_when_queue_full(self):
+        """测试队列满时丢弃并计数"""
+        sink = QueuedOperationLogSink(batch_size=10, queue_size=1, put_timeout=0.01)
+
+        with patch.object(sink, '_ensure_worker'):
+            sink.emit(MagicMock())
+            sink.emit(MagicMock())
+
+        stats = sink.stats()
+        self.assertEqual(stats["enqueued"], 1)
+        self.assertEqual(stats["dropped"], 1)
+        self.assertEqual(stats["blocked"], 1)
+
+    def test_bulk_failure_falls_back_to_single_save(self):
+        """测试批量写入失败时逐条保存"""
+        sink = QueuedOperationLogSink(batch_size=10)
+        good, bad = MagicMock(), MagicMock()
+        bad.save.side_effect = Exception("integrity error")
+
+        with patch('app.domain.models.operation_log.OperationLog.objects.bulk_create',
+                   side_effect=Exception("batch error")):
+            sink._write_batch([good, bad])
+
+        good.save.assert_called_once_with(force_insert=True)
+        stats = sink.stats()
+        self.assertEqual(stats["written"], 1)
+        self.assertEqual(stats["failed"], 1)
+
+    def test_written_batch_updates_rollups(self):
+        """测试写入成功的批次累加预聚合统计"""
+        sink = QueuedOperationLogSink(batch_size=10)
+        sink.rollup_repo = MagicMock()
+        batch = [MagicMock(), MagicMock()]
+
+        with patch('app.domain.models.operation_log.OperationLog.objects.bulk_create'):
+            sink._write_batch(batch)
+
+        sink.rollup_repo.record.assert_called_once_with(batch)
+
+    def test_rollups_recorded_in_insert_transaction(self):
+        """测试日志插入与预聚合累加处于同一事务，重建预聚合时不会重复计数"""
+        sink = QueuedOperationLogSink(batch_size=10)
+        sink.rollup_repo = MagicMock()
+        depth = len(connection.atomic_blocks)
+        depths = []
+        sink.rollup_repo.record.side_effect = lambda logs: depths.append(len(connection.atomic_blocks))
+
+        with patch('app.domain.models.operation_log.OperationLog.objects.bulk_create',
+                   side_effect=lambda *args, **kwargs: depths.append(len(connection.atomic_blocks))):
+            sink._write_batch([MagicMock()])
+
+        self.assertEqual(depths, [depth + 1, depth + 1])
+
+
+class TestBuildOperationLogSink(TestCase):
+    def test_build_sync_sink(self):
+        """测试根据配置创建同步通道"""
+        sink = build_operation_log_sink({"SINK": "sync"})
+        self.assertIsInstance(sink, SyncOperationLogSink)
+
+    def test_build_queued_sink_with_options(self):
+        """测试根据配置创建批量通道"""
+        sink = build_operation_log_sink({"SINK": "queued", "BATCH_SIZE": 50, "QUEUE_SIZE": 20})
+        self.assertIsInstance(sink, QueuedOperationLogSink)
+        self.assertEqual(sink.batch_size, 50)
+        self.assertEqual(sink.stats()["capacity"], 20)
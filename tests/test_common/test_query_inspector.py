@@ -0,0 +1,65 @@
+"""
+测试 N+1 查询检测
+"""
+
+import pytest
+from django.test import TestCase
+
+from app.application.services.login_log_service import LoginLogService
+from app.application.services.operation_log_service import OperationLogService
+from app.common.query_inspector import NPlusOneError, assert_no_n_plus_one, normalize_sql
+from app.domain.models.login_log import LoginLog
+from app.domain.models.operation_log import OperationLog
+from app.domain.models.user import User
+from app.domain.repositories.pagination import PageRequest
+from app.infrastructure.persistence.repos.login_log_repo_impl import DjangoORMLoginLogRepository
+from app.infrastructure.persistence.repos.operation_log_repo_impl import DjangoORMOperationLogRepository
+from app.infrastructure.persistence.repos.user_repo_impl import DjangoORMUserRepository
+
+
+class TestQueryInspector(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(8):
+            user = User.objects.create_user(f"np1_user{i}", f"np1_user{i}@example.com", "secret")  # type: ignore
+            LoginLog.objects.create(creator=user, status=True, login_type=0)
+            OperationLog.objects.create(
+                module="user", request_method="GET", oper_name=user.username, status=True, cost_time=1, user=user
+            )
+
+    def test_normalize_sql(self):
+        """测试字面量和 IN 列表归一化后得到同一个模板"""
+        self.assertEqual(
+            normalize_sql('SELECT "id" FROM "t" WHERE "id" IN (%s, %s, %s) AND "name" = \'a\' LIMIT 21'),
+            normalize_sql('SELECT "id" FROM "t"  WHERE "id" IN (%s) AND "name" = \'b\' LIMIT 5'),
+        )
+
+    def test_detects_lazy_foreign_key_access(self):
+        """测试循环中访问外键时抛出 NPlusOneError，并指出触发位置"""
+        with self.assertRaises(NPlusOneError) as ctx:
+            with assert_no_n_plus_one(threshold=5):
+                [log.creator.username for log in LoginLog.objects.all()]
+
+        self.assertIn("8x SELECT", str(ctx.exception))
+        self.assertIn("tests/test_common/test_query_inspector.py", str(ctx.exception))
+
+    def test_log_list_pages_do_not_repeat_queries(self):
+        """测试登录日志和操作日志的列表只执行固定数量的查询"""
+        login_log_service = LoginLogService(DjangoORMLoginLogRepository(), DjangoORMUserRepository())
+        operation_log_service = OperationLogService(DjangoORMOperationLogRepository())
+
+        with assert_no_n_plus_one(threshold=1) as recorder:
+            login_logs = login_log_service.list_login_logs_page(PageRequest(page=1, page_size=20))
+            operation_logs = operation_log_service.list_operation_logs_page(PageRequest(page=1, page_size=20))
+
+        self.assertEqual(len(login_logs.items), 8)
+        self.assertIsNotNone(operation_logs.items[0]["creator_id"])
+        self.assertLessEqual(recorder.total, 4)
+
+
+@pytest.mark.n_plus_one_threshold(1)
+def test_n_plus_one_fixture_records_queries(db, n_plus_one):
+    """测试 fixture 记录测试中执行的查询"""
+    User.objects.filter(username="nobody").exists()
+
+    assert n_plus_one.total == 1
@@ -0,0 +1,113 @@
+"""
+测试接口响应缓存
+"""
+
+import shutil
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from django.test import RequestFactory, TestCase, override_settings
+from ninja_jwt.tokens import RefreshToken
+
+from app.common.principal import set_request_principal
+from app.common.query_inspector import detect_queries
+from app.common.response_cache import SCOPE_USER, cache_response, make_cache_key, model_tag
+from app.domain.models.department import Department
+from app.domain.models.user import User
+from app.infrastructure.persistence.db_router import replica_for_read, replica_reads_enabled, request_scope
+
+
+class TestResponseCache(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        admin = User.objects.create_superuser("cache_admin", "cache_admin@example.com", "secret")  # type: ignore
+        cls.headers = {"HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(admin).access_token}"}
+        cls.department = Department(name="研发部", code="rd", rank=0, auto_bind=False, is_active=True, mode_type=0)
+        cls.department.save()
+
+    def setUp(self):
+        """使用多进程共享的文件缓存，locmem 下响应缓存不生效"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        shared_cache = override_settings(CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": directory},
+        })
+        shared_cache.enable()
+        self.addCleanup(shared_cache.disable)
+
+    def test_cache_key(self):
+        """测试查询参数顺序不影响缓存键，按用户缓存时不同用户的键不同"""
+        factory = RequestFactory()
+        first = factory.get("/api/roles/?page=1&name=a")
+        second = factory.get("/api/roles/?name=a&page=1")
+        self.assertEqual(make_cache_key(first, "route", ["domain.role"]), make_cache_key(second, "route", ["domain.role"]))
+
+        set_request_principal(first, SimpleNamespace(pk=1))
+        set_request_principal(second, SimpleNamespace(pk=2))
+        self.assertNotEqual(
+            make_cache_key(first, "route", ["domain.role"], SCOPE_USER),
+            make_cache_key(second, "route", ["domain.role"], SCOPE_USER),
+        )
+
+    def test_hit_and_invalidation(self):
+        """测试第二次请求命中缓存不再查询部门，部门保存和删除后缓存失效"""
+        path = f"/api/departments/{self.department.id}"
+        self.assertEqual(self.client.get(path, **self.headers).json()["data"]["name"], "研发部")
+
+        with detect_queries() as recorder:
+            response = self.client.get(path, **self.headers)
+        self.assertEqual(response.json()["data"]["name"], "研发部")
+        self.assertFalse([sql for sql in recorder.counts if 'FROM "system_department"' in sql])
+
+        self.department.name = "研发中心"
+        self.department.save()
+        self.assertEqual(self.client.get(path, **self.headers).json()["data"]["name"], "研发中心")
+
+        self.department.delete()
+        self.assertEqual(self.client.get(path, **self.headers).json()["code"], 400)
+
+    def test_rebuild_tree_invalidates(self):
+        """测试部门树重算（bulk_update 不发送 post_save）后通过 bulk_saved 信号使部门缓存失效"""
+        request = RequestFactory().get("/api/departments/")
+        before = make_cache_key(request, "route", [model_tag(Department)])
+        Department.objects.filter(pk=self.department.pk).update(tree_path="", depth=3)  # type: ignore
+
+        self.assertEqual(Department.rebuild_tree(), 1)
+        self.assertNotEqual(make_cache_key(request, "route", [model_tag(Department)]), before)
+
+    def test_disabled(self):
+        """测试关闭后每次请求都查询数据库"""
+        path = f"/api/departments/{self.department.id}"
+        with override_settings(RESPONSE_CACHE={"ENABLED": False}):
+            self.client.get(path, **self.headers)
+            with detect_queries() as recorder:
+                self.client.get(path, **self.headers)
+        self.assertTrue([sql for sql in recorder.counts if 'FROM "system_department"' in sql])
+
+    def test_disabled_without_shared_cache(self):
+        """测试缓存后端为 locmem 时不缓存，其他进程的失效无法感知"""
+        path = f"/api/departments/{self.department.id}"
+        with override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}):
+            self.client.get(path, **self.headers)
+            with detect_queries() as recorder:
+                self.client.get(path, **self.headers)
+        self.assertTrue([sql for sql in recorder.counts if 'FROM "system_department"' in sql])
+
+    def test_miss_reads_from_primary(self):
+        """测试未命中时视图不读取只读副本，避免把副本上的旧数据写入缓存"""
+        seen = []
+
+        class Controller:
+            context = SimpleNamespace(request=RequestFactory().get("/api/roles/"))
+
+            @cache_response("domain.role")
+            def list_roles(self):
+                seen.append((replica_reads_enabled(), replica_for_read()))
+                return {"items": []}
+
+        pool = Mock(choose=Mock(return_value="replica"))
+        with request_scope(replica=True), patch("app.infrastructure.persistence.db_router.get_replica_pool", return_value=pool):
+            Controller().list_roles()
+        self.assertEqual(seen, [(False, None)])
+
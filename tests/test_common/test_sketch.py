@@ -0,0 +1,42 @@
+"""
+测试可合并的分位数草图
+"""
+
+import random
+from django.test import TestCase
+
+from app.common.sketch import QuantileSketch
+
+
+class TestQuantileSketch(TestCase):
+    def test_quantile_within_relative_error(self):
+        """测试分位数的相对误差不超过设定值"""
+        values = sorted(random.Random(7).lognormvariate(3, 1) for _ in range(5000))
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            self.assertLessEqual(abs(sketch.quantile(q) - exact) / exact, 0.011)
+
+    def test_merge_equals_single_sketch(self):
+        """测试分开累加后合并与整体累加结果一致"""
+        whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in range(0, 1000):
+            whole.add(value)
+            (left if value % 2 else right).add(value)
+
+        merged = QuantileSketch.from_json(left.to_json()).merge(right)
+        self.assertEqual(merged.count, whole.count)
+        self.assertEqual(merged.to_dict(), whole.to_dict())
+        self.assertEqual(merged.quantile(0.95), whole.quantile(0.95))
+
+    def test_empty_and_zero_values(self):
+        """测试空草图和零值"""
+        sketch = QuantileSketch()
+        self.assertIsNone(sketch.quantile(0.5))
+        sketch.add(0, count=3)
+        sketch.add(10)
+        self.assertEqual(sketch.quantile(0.5), 0.0)
+        self.assertAlmostEqual(sketch.quantile(1.0), 10, delta=0.1)
@@ -0,0 +1,51 @@
+"""
+测试系统配置快照
+"""
+
+from django.test import TestCase
+
+from app.domain.models.system_config import SystemConfig
+from app.domain.services.config_snapshot import SystemConfigSnapshot, get_config, parse_config_value
+
+
+class TestSystemConfigSnapshot(TestCase):
+    def setUp(self):
+        SystemConfig.objects.create(key="feature.export", value="true")  # type: ignore
+        SystemConfig.objects.create(key="page.size", value="50")  # type: ignore
+        SystemConfig.objects.create(key="site.code", value="001")  # type: ignore
+        SystemConfig.objects.create(key="disabled", value="1", is_active=False)  # type: ignore
+        # ttl 为0时每次读取都检查版本号，相当于其他进程在 TTL 到期后的行为
+        self.snapshot = SystemConfigSnapshot(ttl=0)
+
+    def test_parse_config_value(self):
+        """测试按JSON解析配置值，无法解析时保留字符串"""
+        self.assertIs(parse_config_value("false"), False)
+        self.assertEqual(parse_config_value("1.5"), 1.5)
+        self.assertEqual(parse_config_value('{"a": [1]}'), {"a": [1]})
+        self.assertEqual(parse_config_value("hello"), "hello")
+
+    def test_typed_values_loaded_once(self):
+        """测试一次加载全部启用配置，之后读取不查询数据库"""
+        self.assertIs(self.snapshot.get("feature.export"), True)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.snapshot.get("page.size"), 50)
+            self.assertEqual(self.snapshot.get("site.code"), "001")
+            self.assertEqual(self.snapshot.get("site.code", cast=int), 1)
+            self.assertIsNone(self.snapshot.get("disabled"))
+            self.assertEqual(self.snapshot.get_many(["page.size", "missing"]), {"page.size": 50})
+
+    def test_invalidated_on_save_and_delete(self):
+        """测试配置保存、删除后快照重新加载并通知变化的键"""
+        changes = []
+        self.snapshot.add_listener(changes.append)
+        self.assertEqual(self.snapshot.get("page.size"), 50)
+
+        config = SystemConfig.objects.get(key="page.size")  # type: ignore
+        config.value = "100"
+        config.save()
+        self.assertEqual(self.snapshot.get("page.size"), 100)
+        self.assertEqual(get_config("page.size"), 100)
+
+        SystemConfig.objects.get(key="feature.export").delete()  # type: ignore
+        self.assertEqual(self.snapshot.get("feature.export", False), False)
+        self.assertEqual(changes, [{"page.size"}, {"feature.export"}])
@@ -0,0 +1,87 @@
+"""
+测试路由权限匹配器
+"""
+
+from unittest.mock import Mock, patch
+from django.test import TestCase
+from app.domain.services.route_matcher import RoutePermissionMatcher, RouteMatcherRegistry
+
+
+class TestRoutePermissionMatcher(TestCase):
+    def setUp(self):
+        self.matcher = RoutePermissionMatcher([
+            ("1", "user:list", "GET", "/api/users/"),
+            ("2", "user:detail", "GET", "/api/users/{user_id}"),
+            ("3", "user:delete", "delete", "/api/users/{user_id}"),
+            ("4", "user:me", "GET", "/api/users/me"),
+            ("5", "config:any", "GET", "/api/system-configs/*"),
+            ("6", "menu:none", None, "/api/menus/"),
+        ])
+
+    def test_match_literal_and_param(self):
+        """测试字面量和参数路径段匹配"""
+        self.assertEqual(self.matcher.match("GET", "/api/users/"), "user:list")
+        self.assertEqual(self.matcher.match("GET", "/api/users"), "user:list")
+        self.assertEqual(self.matcher.match("GET", "/api/users/42"), "user:detail")
+        self.assertEqual(self.matcher.match("delete", "/api/users/42"), "user:delete")
+
+    def test_literal_takes_precedence(self):
+        """测试字面量路径段优先于参数"""
+        self.assertEqual(self.matcher.match("GET", "/api/users/me"), "user:me")
+
+    def test_literal_dead_end_falls_back_to_param(self):
+        """测试字面量分支走不通时回退到参数分支，受保护的路由不会因为前缀冲突而漏检"""
+        self.matcher.upsert("7", "user:roles", "GET", "/api/users/{user_id}/roles")
+        self.assertEqual(self.matcher.match("GET", "/api/users/42/roles"), "user:roles")
+        self.assertEqual(self.matcher.match("GET", "/api/users/me/roles"), "user:roles")
+        self.assertEqual(self.matcher.match("GET", "/api/users/me"), "user:me")
+
+        self.matcher.upsert("8", "api:any", "GET", "/api/*")
+        self.assertEqual(self.matcher.match("GET", "/api/users/me/roles"), "user:roles")
+        self.assertEqual(self.matcher.match("GET", "/api/users/me/other"), "api:any")
+
+    def test_codes_of_shared_route_are_ordered(self):
+        """测试多个菜单配置同一路由时按排序返回全部权限码"""
+        self.matcher.upsert("9", "user:view", "GET", "/api/users/")
+        self.matcher.upsert("10", "a:user:list", "GET", "/api/users/")
+        self.assertEqual(self.matcher.match_codes("GET", "/api/users/"), ("a:user:list", "user:list", "user:view"))
+        self.assertEqual(self.matcher.match("GET", "/api/users/"), "a:user:list")
+        self.assertEqual(self.matcher.match_codes("POST", "/api/users/"), ())
+
+    def test_wildcard_matches_rest(self):
+        """测试通配符匹配剩余路径"""
+        self.assertEqual(self.matcher.match("GET", "/api/system-configs/a/b"), "config:any")
+
+    def test_unmatched_route(self):
+        """测试未配置的路由返回None"""
+        self.assertIsNone(self.matcher.match("POST", "/api/users/"))
+        self.assertIsNone(self.matcher.match("GET", "/api/menus/"))
+        self.assertIsNone(self.matcher.match("GET", "/api/users/1/roles"))
+
+    def test_incremental_update(self):
+        """测试增量更新和移除"""
+        self.matcher.upsert("7", "user:create", "POST", "/api/users/")
+        self.assertEqual(self.matcher.match("POST", "/api/users/"), "user:create")
+
+        self.matcher.upsert("2", "user:detail", "GET", "/api/users/{id}/detail")
+        self.assertIsNone(self.matcher.match("GET", "/api/users/42"))
+        self.assertEqual(self.matcher.match("GET", "/api/users/42/detail"), "user:detail")
+
+        self.matcher.remove("7")
+        self.assertIsNone(self.matcher.match("POST", "/api/users/"))
+
+
+class TestRouteMatcherRegistry(TestCase):
+    def test_menu_change_updates_matcher_incrementally(self):
+        """测试菜单变更时增量更新而不重新加载"""
+        registry = RouteMatcherRegistry(check_interval=0)
+        with patch.object(registry, '_load_routes', return_value=[]) as mock_load:
+            self.assertIsNone(registry.match("GET", "/api/roles/"))
+            menu = Mock(id="9", code="role:list", method="GET", path="/api/roles/", is_active=True)
+            registry.on_menu_saved(menu)
+            self.assertEqual(registry.match("GET", "/api/roles/"), "role:list")
+
+            menu.is_active = False
+            registry.on_menu_saved(menu)
+            self.assertIsNone(registry.match("GET", "/api/roles/"))
+            mock_load.assert_called_once()
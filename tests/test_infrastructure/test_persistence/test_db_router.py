@@ -0,0 +1,84 @@
+"""
+测试读写分离路由
+"""
+
+from unittest.mock import patch
+
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from app.common.middleware.replica_read_middleware import ReplicaReadMiddleware
+from app.domain.models.operation_log import OperationLog
+from app.infrastructure.persistence.db_router import (
+    ReplicaPool,
+    ReplicaRouter,
+    is_pinned_to_primary,
+    replica_reads_enabled,
+    request_scope,
+    use_replica,
+)
+from app.infrastructure.persistence.repos.department_repo_impl import DjangoORMDepartmentRepository
+from app.infrastructure.persistence.repos.operation_log_repo_impl import DjangoORMOperationLogRepository
+
+
+class TestReplicaRouter(SimpleTestCase):
+    def test_round_robin_skips_unhealthy_replicas(self):
+        """测试轮询选择副本，检查失败的副本被跳过，全部不可用时返回 None"""
+        healthy = {"replica_1": True, "replica_2": False, "replica_3": True}
+        pool = ReplicaPool(list(healthy), check_interval=0, checker=lambda alias: healthy[alias])
+
+        self.assertEqual([pool.choose() for _ in range(4)], ["replica_1", "replica_3", "replica_3", "replica_1"])
+        healthy.update(replica_1=False, replica_3=False)
+        self.assertIsNone(pool.choose())
+
+    def test_health_check_result_reused_within_interval(self):
+        """测试检查间隔内复用检查结果"""
+        calls = []
+        pool = ReplicaPool(["replica_1"], check_interval=60, checker=lambda alias: calls.append(alias) or True)
+
+        for _ in range(3):
+            pool.choose()
+
+        self.assertEqual(calls, ["replica_1"])
+
+    def test_write_pins_request_to_primary(self):
+        """测试请求中写入后读查询固定使用主库，写入和迁移始终使用主库"""
+        router = ReplicaRouter(ReplicaPool(["replica_1"], checker=lambda alias: True))
+
+        self.assertIsNone(router.db_for_read(OperationLog))
+        with request_scope(replica=True):
+            self.assertEqual(router.db_for_read(OperationLog), "replica_1")
+            self.assertEqual(router.db_for_write(OperationLog), "default")
+            self.assertIsNone(router.db_for_read(OperationLog))
+        with request_scope(replica=True):
+            self.assertFalse(is_pinned_to_primary())
+            self.assertEqual(router.db_for_read(OperationLog), "replica_1")
+        with use_replica():
+            # 请求范围外写入不会固定主库
+            router.db_for_write(OperationLog)
+            self.assertEqual(router.db_for_read(OperationLog), "replica_1")
+        self.assertFalse(router.allow_migrate("replica_1", "domain"))
+        self.assertTrue(router.allow_migrate("default", "domain"))
+
+    def test_log_repository_reads_from_replica(self):
+        """测试日志仓储的列表查询固定到选中的副本，未声明 replica_reads 的仓储使用路由默认值"""
+        with patch("app.infrastructure.persistence.repos.base_repository.replica_for_read", return_value="replica_1"):
+            self.assertEqual(DjangoORMOperationLogRepository().get_read_queryset().db, "replica_1")
+            self.assertEqual(DjangoORMDepartmentRepository().get_read_queryset().db, "default")
+
+    @override_settings(
+        DATABASE_REPLICAS=["replica_1"],
+        DATABASE_REPLICA_READ_PATHS=[r"^/api/(operation-logs|login-logs)/", r"^/api/[\w-]+/$"],
+    )
+    def test_middleware_marks_log_and_list_reads(self):
+        """测试中间件只把日志和列表接口的GET请求标记为副本读取"""
+        seen = []
+        middleware = ReplicaReadMiddleware(lambda request: seen.append(replica_reads_enabled()))
+        factory = RequestFactory()
+
+        middleware(factory.get("/api/operation-logs/export"))
+        middleware(factory.get("/api/users/"))
+        middleware(factory.get("/api/users/1"))
+        middleware(factory.post("/api/users/"))
+
+        self.assertEqual(seen, [True, True, False, False])
+        self.assertFalse(replica_reads_enabled())
@@ -0,0 +1,70 @@
+"""
+测试热点查询使用的索引
+通过 EXPLAIN 检查仓储实际生成的列表、过滤查询命中对应的索引，排序不需要额外的临时B树
+"""
+
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+
+from app.domain.models.menu import Menu
+from app.domain.models.role import Role
+from app.domain.models.role_menu import RoleMenu
+from app.domain.models.user import User
+from app.domain.models.user_role import UserRole
+from app.domain.repositories.pagination import PageRequest
+from app.infrastructure.persistence.repos.login_log_repo_impl import DjangoORMLoginLogRepository
+from app.infrastructure.persistence.repos.operation_log_repo_impl import DjangoORMOperationLogRepository
+from app.infrastructure.persistence.repos.user_repo_impl import DjangoORMUserRepository
+
+
+class TestHotLookupIndexes(TestCase):
+    def explain_page(self, repo, filters=None) -> str:
+        queryset, _, window = repo._prepare_page(PageRequest(page=1, page_size=20, filters=filters or {}))
+        return queryset[window].explain()
+
+    def assert_uses_index(self, plan: str, index_name: str):
+        self.assertIn(index_name, plan)
+        if connection.vendor == "sqlite":
+            self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_log_list_queries_use_indexes(self):
+        """测试日志列表按用户、操作人、模块过滤和默认排序时命中复合索引"""
+        operation_logs = DjangoORMOperationLogRepository()
+        login_logs = DjangoORMLoginLogRepository()
+
+        self.assert_uses_index(self.explain_page(operation_logs, {"user_id": "u1"}), "oper_log_user_idx")
+        self.assert_uses_index(self.explain_page(operation_logs, {"oper_name": "admin"}), "oper_log_oper_name_idx")
+        self.assert_uses_index(self.explain_page(operation_logs, {"module": "用户"}), "oper_log_module_idx")
+        self.assert_uses_index(self.explain_page(login_logs), "login_log_created_idx")
+        self.assert_uses_index(self.explain_page(login_logs, {"creator_id": "u1"}), "login_log_creator_idx")
+
+    def test_menu_lookups_use_indexes(self):
+        """测试按 parent_id、meta_id 查询菜单命中索引"""
+        self.assertIn("menu_parent_idx", Menu.objects.filter(parent_id="p1").explain())  # type: ignore
+        self.assertIn("menu_meta_idx", Menu.objects.filter(meta_id="m1").explain())  # type: ignore
+
+    def test_association_tables_are_unique(self):
+        """测试用户角色、角色菜单关联唯一，按用户查询角色ID只读唯一索引"""
+        user = User.objects.create_user("index_user", "index_user@example.com", "secret")  # type: ignore
+        role = Role.objects.create(name="索引角色", code="index_role", is_active=True)  # type: ignore
+        menu = Menu.objects.create(  # type: ignore
+            name="索引菜单", code="index_menu", menu_type=1, rank=0, is_active=True, meta_id="m1"
+        )
+        UserRole.objects.create(user=user, role=role)  # type: ignore
+        RoleMenu.objects.create(role=role, menu=menu)  # type: ignore
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            UserRole.objects.create(user=user, role=role)  # type: ignore
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            RoleMenu.objects.create(role=role, menu=menu)  # type: ignore
+
+        plan = (
+            UserRole.objects.filter(user_id=user.id, role__is_active=True)  # type: ignore
+            .values_list("role_id", flat=True).distinct().explain()
+        )
+        if connection.vendor == "sqlite":
+            # SQLite 把唯一约束创建为自动索引
+            self.assertIn("COVERING INDEX sqlite_autoindex_system_user_role", plan)
+        else:
+            self.assertIn("uniq_user_role", plan)
+        self.assertEqual(DjangoORMUserRepository().list_active_role_ids(user.id), [role.id])
@@ -0,0 +1,99 @@
+"""
+测试部门仓储的物化路径维护
+"""
+
+from django.test import TestCase
+
+from app.application.services.department_service import DepartmentService
+from app.domain.models.department import Department, build_tree_paths
+from app.infrastructure.persistence.repos.department_repo_impl import DjangoORMDepartmentRepository
+
+
+class TestDepartmentTree(TestCase):
+    def setUp(self):
+        """测试初始化，创建 a -> b -> c 和 d 两棵树"""
+        self.repo = DjangoORMDepartmentRepository()
+        self.a = self._create("a")
+        self.b = self._create("b", self.a)
+        self.c = self._create("c", self.b)
+        self.d = self._create("d")
+
+    def _create(self, code, parent=None, rank=0):
+        department = Department(
+            name=code, code=code, rank=rank, auto_bind=False, is_active=True, mode_type=0, parent=parent
+        )
+        department.save()
+        return department
+
+    def _paths(self):
+        return dict(Department.objects.values_list("code", "tree_path"))  # type: ignore
+
+    def test_paths_on_create(self):
+        """测试新增时计算路径和层级"""
+        self.assertEqual(self.c.tree_path, f"/{self.a.id}/{self.b.id}/{self.c.id}/")
+        self.assertEqual(self.c.depth, 2)
+
+    def test_move_rebases_descendants(self):
+        """测试移动部门时子孙部门的路径随之更新"""
+        self.b.parent = self.d
+        self.b.save()
+
+        self.assertEqual(self._paths()["c"], f"/{self.d.id}/{self.b.id}/{self.c.id}/")
+        self.assertEqual(Department.objects.get(code="c").depth, 2)  # type: ignore
+        with self.assertRaises(ValueError):
+            self.d.parent = Department.objects.get(code="c")  # type: ignore
+            self.d.save()
+
+    def test_delete_detaches_children(self):
+        """测试删除部门后子部门成为根部门"""
+        self.a.delete()
+
+        c = Department.objects.get(code="c")  # type: ignore
+        self.assertEqual(c.tree_path, f"/{self.b.id}/{self.c.id}/")
+        self.assertEqual(c.depth, 1)
+
+    def test_bulk_delete_parent_and_child(self):
+        """测试同一批次删除父部门和子部门后孙部门成为根部门，其子部门的路径随之更新"""
+        e = self._create("e", self.c)
+
+        self.assertEqual(self.repo.bulk_delete([self.a.id, self.b.id]), {self.a.id, self.b.id})
+
+        c, e = Department.objects.get(code="c"), Department.objects.get(code="e")  # type: ignore
+        self.assertEqual((c.parent_id, c.tree_path, c.depth), (None, f"/{self.c.id}/", 0))
+        self.assertEqual((e.tree_path, e.depth), (f"/{self.c.id}/{e.id}/", 1))
+
+    def test_list_subtree_in_one_query(self):
+        """测试一次查询获取子树"""
+        with self.assertNumQueries(1):
+            subtree = self.repo.list_subtree(self.a.id, include_self=False)
+        self.assertEqual({d.code for d in subtree}, {"b", "c"})
+
+    def test_bulk_create_and_bulk_move(self):
+        """测试批量创建时父部门可在同一批次，批量移动后全量重算"""
+        parent = Department(name="e", code="e", rank=0, auto_bind=False, is_active=True, mode_type=0, parent=self.d)
+        child = Department(name="f", code="f", rank=0, auto_bind=False, is_active=True, mode_type=0, parent=parent)
+        self.repo.bulk_create([child, parent])
+        self.assertEqual(self._paths()["f"], f"/{self.d.id}/{parent.id}/{child.id}/")
+
+        self.a.parent = self.c
+        with self.assertRaises(ValueError):
+            self.repo.bulk_update([self.a], ["parent"])
+        self.assertIsNone(Department.objects.get(code="a").parent_id)  # type: ignore
+
+    def test_department_tree(self):
+        """测试组装部门树"""
+        tree = DepartmentService(self.repo).get_department_tree()
+
+        self.assertEqual([node["code"] for node in tree], ["a", "d"])
+        self.assertEqual(tree[0]["children"][0]["children"][0]["code"], "c")
+        subtree = DepartmentService(self.repo).get_department_tree(self.b.id)
+        self.assertEqual([node["code"] for node in subtree], ["b"])
+
+    def test_build_tree_paths_breaks_cycles(self):
+        """测试存在环时按根部门处理或抛出异常"""
+        rows = [("x", "y"), ("y", "x"), ("z", None)]
+        paths = build_tree_paths(rows)
+        self.assertEqual(paths["z"], ("/z/", 0))
+        self.assertEqual(len(paths), 3)
+        with self.assertRaises(ValueError):
+            build_tree_paths(rows, strict=True)
@@ -0,0 +1,94 @@
+"""
+测试操作日志预聚合仓储和统计
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from django.db import IntegrityError
+from django.test import TestCase
+
+from app.application.services.operation_log_service import OperationLogService
+from app.common.exception.exceptions import ValidationException
+from app.domain.models.operation_log import OperationLog
+from app.domain.models.operation_log_rollup import OperationLogRollup
+from app.domain.models.user import User
+from app.infrastructure.persistence.repos.operation_log_rollup_repo_impl import (
+    DjangoORMOperationLogRollupRepository,
+)
+
+
+def make_log(created_time, module="用户管理", status=True, cost_time=10):
+    return OperationLog(
+        created_time=created_time, module=module, business_type="新增", request_method="POST",
+        status=status, cost_time=cost_time,
+    )
+
+
+class TestOperationLogRollupRepository(TestCase):
+    def setUp(self):
+        """测试初始化"""
+        self.repository = DjangoORMOperationLogRollupRepository()
+        self.base = datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc)
+
+    def test_record_merges_into_existing_rows(self):
+        """测试多次写入累加到同一聚合行"""
+        self.repository.record([make_log(self.base + timedelta(seconds=5), cost_time=10)])
+        self.repository.record([
+            make_log(self.base + timedelta(seconds=30), cost_time=30),
+            make_log(self.base + timedelta(minutes=5), cost_time=20),
+        ])
+
+        minute = OperationLogRollup.objects.get(granularity="minute", bucket=self.base)  # type: ignore
+        self.assertEqual((minute.count, minute.cost_sum, minute.cost_max), (2, 40, 30))
+        hour = OperationLogRollup.objects.get(granularity="hour", bucket=self.base)  # type: ignore
+        self.assertEqual((hour.count, hour.cost_sum), (3, 60))
+
+    def test_rebuild_replaces_rows_in_range(self):
+        """测试重建按原始日志重新计算范围内的聚合行，范围外的聚合行不受影响"""
+        self.repository.record([make_log(self.base + timedelta(seconds=5)), make_log(self.base + timedelta(hours=3))])
+        OperationLogRollup.objects.filter(bucket__lt=self.base + timedelta(hours=1)).update(count=99)  # type: ignore
+        user = User.objects.create(username="rollup", email="rollup@example.com")  # type: ignore
+        for created_time in (self.base + timedelta(seconds=5), self.base + timedelta(minutes=1)):
+            log = make_log(created_time)
+            log.user = user
+            log.save()
+            OperationLog.objects.filter(pk=log.pk).update(created_time=created_time)  # type: ignore
+
+        self.assertEqual(self.repository.rebuild(self.base, self.base + timedelta(minutes=30)), 2)
+
+        hour = OperationLogRollup.objects.get(granularity="hour", bucket=self.base)  # type: ignore
+        self.assertEqual((hour.count, hour.cost_sum), (2, 20))
+        self.assertEqual(OperationLogRollup.objects.filter(granularity="minute", bucket__lt=self.base + timedelta(hours=1)).count(), 2)  # type: ignore
+        self.assertEqual(OperationLogRollup.objects.get(granularity="hour", bucket=self.base + timedelta(hours=3)).count, 1)  # type: ignore
+
+    def test_rebuild_retries_on_key_conflict(self):
+        """测试重建与并发批次首次插入同一聚合键冲突时重试"""
+        with patch.object(self.repository, "_rebuild_range", side_effect=[IntegrityError("duplicate"), 3]) as rebuild_range:
+            self.assertEqual(self.repository.rebuild(self.base, self.base + timedelta(minutes=30)), 3)
+
+        self.assertEqual(rebuild_range.call_count, 2)
+
+    def test_stats_from_rollups(self):
+        """测试统计接口按分组汇总请求量、错误率和分位数"""
+        logs = [make_log(self.base + timedelta(minutes=i), cost_time=i + 1) for i in range(100)]
+        logs += [make_log(self.base, module="角色管理", status=False, cost_time=500)]
+        self.repository.record(logs)
+        service = OperationLogService(rollup_repo=self.repository)
+
+        stats = service.get_operation_log_stats(
+            self.base, self.base + timedelta(hours=3), "hour", ["module"]
+        )
+
+        self.assertEqual(stats["total"]["count"], 101)
+        self.assertEqual(stats["total"]["error_count"], 1)
+        groups = {group["key"]["module"]: group for group in stats["groups"]}
+        self.assertEqual(groups["角色管理"]["error_rate"], 1.0)
+        self.assertEqual(groups["用户管理"]["count"], 100)
+        self.assertAlmostEqual(groups["用户管理"]["p95"], 95, delta=95 * 0.02)
+
+    def test_stats_rejects_unknown_group(self):
+        """测试不支持的分组字段"""
+        service = OperationLogService(rollup_repo=self.repository)
+        with self.assertRaises(ValidationException):
+            service.get_operation_log_stats(self.base, self.base + timedelta(hours=1), "hour", ["oper_ip"])
@@ -0,0 +1,89 @@
+"""
+测试仓储分页查询
+"""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from app.common.exception.exceptions import ValidationException
+from app.domain.models.role import Role
+from app.domain.repositories.pagination import PageRequest, decode_cursor, encode_cursor
+from app.infrastructure.persistence.repos.role_repo_impl import DjangoORMRoleRepository
+
+
+class TestCursor(TestCase):
+    def test_encode_decode_roundtrip(self):
+        """测试游标编码后可以还原"""
+        cursor = encode_cursor(["2024-01-01 00:00:00+00:00", "abc"])
+        self.assertEqual(decode_cursor(cursor), ["2024-01-01 00:00:00+00:00", "abc"])
+
+    def test_decode_invalid_cursor(self):
+        """测试非法游标抛出 ValueError"""
+        with self.assertRaises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    def test_page_size_is_clamped(self):
+        """测试每页数量被限制在允许范围内"""
+        self.assertEqual(PageRequest(page_size=10000).page_size, 200)
+        self.assertEqual(PageRequest(page=0, page_size=0).page, 1)
+
+
+class TestListPage(TestCase):
+    def setUp(self):
+        """测试初始化，创建若干创建时间相同和不同的角色"""
+        self.repository = DjangoORMRoleRepository()
+        now = timezone.now()
+        for index in range(5):
+            # 前两条创建时间相同，用于验证主键兜底排序
+            created_time = now - timedelta(minutes=max(index, 1))
+            Role.objects.create(  # type: ignore
+                name=f"role{index}", code=f"code{index}", is_active=index % 2 == 0,
+                created_time=created_time,
+            )
+
+    def test_offset_pagination_returns_total(self):
+        """测试页码分页返回总数"""
+        page = self.repository.list_page(PageRequest(page=2, page_size=2))
+        self.assertEqual(page.total, 5)
+        self.assertEqual(page.page, 2)
+        self.assertEqual(len(page.items), 2)
+
+    def test_cursor_pagination_walks_all_rows(self):
+        """测试游标分页按默认排序遍历全部数据且不重复"""
+        expected = list(Role.objects.order_by("-created_time", "-id").values_list("id", flat=True))  # type: ignore
+        seen, cursor = [], None
+        while True:
+            page = self.repository.list_page(PageRequest(page_size=2, cursor=cursor))
+            seen.extend(role.id for role in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(seen, expected)
+
+    def test_filters_and_ordering(self):
+        """测试白名单过滤和排序"""
+        page = self.repository.list_page(PageRequest(filters={"is_active": True}, ordering="name"))
+        self.assertEqual([role.name for role in page.items], ["role0", "role2", "role4"])
+        # 非默认排序不提供游标
+        self.assertIsNone(page.next_cursor)
+
+    def test_rejects_unknown_filter_and_ordering(self):
+        """测试不在白名单中的过滤和排序字段被拒绝"""
+        with self.assertRaises(ValidationException):
+            self.repository.list_page(PageRequest(filters={"password": "x"}))
+        with self.assertRaises(ValidationException):
+            self.repository.list_page(PageRequest(ordering="description"))
+
+    def test_rejects_empty_ordering(self):
+        """测试只有分隔符的排序参数被拒绝，而不是抛出 IndexError"""
+        for ordering in (",", " , ,", "-"):
+            with self.assertRaises(ValidationException):
+                self.repository.list_page(PageRequest(ordering=ordering))
+
+    def test_cursor_requires_default_ordering(self):
+        """测试非默认排序时不允许使用游标"""
+        cursor = encode_cursor(["role0", "x"])
+        with self.assertRaises(ValidationException):
+            self.repository.list_page(PageRequest(cursor=cursor, ordering="name"))
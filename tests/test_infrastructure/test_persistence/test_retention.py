@@ -0,0 +1,93 @@
+"""
+测试操作日志保留策略
+"""
+
+import gzip
+import json
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.test import TestCase
+from django.utils import timezone
+
+from app.domain.models.operation_log import OperationLog
+from app.domain.models.operation_log_rollup import OperationLogRollup
+from app.domain.models.user import User
+from app.infrastructure.persistence.partitions import MonthlyPartitionManager, add_months, month_start
+from app.infrastructure.persistence.retention import OperationLogRetention
+
+
+class TestOperationLogRetention(TestCase):
+    def setUp(self):
+        """测试初始化，创建过期和未过期的日志"""
+        self.user = User.objects.create(username="retention", email="r@example.com")  # type: ignore
+        self.now = timezone.now()
+        for days in (400, 300, 200, 10, 1):
+            OperationLog.objects.create(  # type: ignore
+                created_time=self.now - timedelta(days=days), module="m", title="t",
+                business_type="b", method="m", request_method="POST", operator_type="o",
+                oper_name="retention", dept_name="", oper_url="/api/users/", oper_ip="127.0.0.1",
+                oper_location="", oper_param="{}", json_result="{}", status=True,
+                cost_time=days, user=self.user,
+            )
+
+    def test_run_deletes_in_batches(self):
+        """测试按批次删除过期日志"""
+        retention = OperationLogRetention(days=180, batch_size=2, archive_dir="")
+        self.assertEqual(retention.count_expired(self.now), 3)
+
+        result = retention.run(now=self.now)
+
+        self.assertEqual(result.deleted, 3)
+        self.assertEqual(result.batches, 2)
+        self.assertEqual(
+            sorted(OperationLog.objects.values_list("cost_time", flat=True)),  # type: ignore
+            [1, 10],
+        )
+
+    def test_run_purges_rollups(self):
+        """测试同时删除整个桶都已过期的预聚合行"""
+        for days in (200, 10):
+            bucket = (self.now - timedelta(days=days)).replace(minute=0, second=0, microsecond=0)
+            OperationLogRollup.objects.create(  # type: ignore
+                granularity="hour", bucket=bucket, module="m", business_type="b", request_method="POST",
+                status=True, count=1, cost_sum=days, cost_max=days, sketch="{}",
+            )
+
+        result = OperationLogRetention(days=180, batch_size=2, archive_dir="").run(now=self.now)
+
+        self.assertEqual(result.rollups_deleted, 1)
+        self.assertEqual(list(OperationLogRollup.objects.values_list("cost_sum", flat=True)), [10])  # type: ignore
+
+    def test_run_archives_before_delete(self):
+        """测试删除前写入归档文件"""
+        with tempfile.TemporaryDirectory() as archive_dir:
+            result = OperationLogRetention(days=250, batch_size=10, archive_dir=archive_dir).run(now=self.now)
+
+            self.assertEqual(result.deleted, 2)
+            self.assertEqual(result.archived, 2)
+            with gzip.open(result.archive_file, "rt", encoding="utf-8") as f:
+                rows = [json.loads(line) for line in f]
+        self.assertEqual([row["cost_time"] for row in rows], [400, 300])
+        self.assertEqual(rows[0]["user_id"], self.user.id)
+
+    def test_run_rejects_non_positive_days(self):
+        """测试保留天数必须为正数"""
+        with self.assertRaises(ValueError):
+            OperationLogRetention(days=0).run()
+
+
+class TestMonthlyPartitionManager(TestCase):
+    def test_month_helpers(self):
+        """测试月份计算"""
+        start = month_start(datetime(2024, 12, 15, 8, tzinfo=dt_timezone.utc))
+        self.assertEqual(start, datetime(2024, 12, 1, tzinfo=dt_timezone.utc))
+        self.assertEqual(add_months(start, 1), datetime(2025, 1, 1, tzinfo=dt_timezone.utc))
+        self.assertEqual(add_months(start, -12), datetime(2023, 12, 1, tzinfo=dt_timezone.utc))
+
+    def test_not_partitioned_on_sqlite(self):
+        """测试非PostgreSQL数据库不启用分区"""
+        manager = MonthlyPartitionManager(OperationLog, "created_time")
+        self.assertFalse(manager.is_partitioned())
+        self.assertEqual(manager.list_partitions(), [])
+        self.assertEqual(manager.partition_name(datetime(2024, 3, 1)), "system_operation_log_p202403")
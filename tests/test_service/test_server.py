@@ -0,0 +1,39 @@
+"""
+测试生产环境服务器配置
+"""
+
+import unittest
+
+from service.config import Settings
+from service.server import ServerConfig, build_server_config
+
+
+class TestServerConfig(unittest.TestCase):
+    def test_derives_workers_and_threads_from_cpu(self):
+        """测试进程数、线程数为0时按worker类型根据CPU数计算"""
+        sync = ServerConfig(worker_class="sync", cpu_count=4)
+        gthread = ServerConfig(worker_class="gthread", cpu_count=4)
+        uvicorn = ServerConfig(worker_class="uvicorn", cpu_count=4, threads=8)
+
+        self.assertEqual((sync.workers, sync.threads), (9, 1))
+        self.assertEqual((gthread.workers, gthread.threads), (5, 4))
+        self.assertEqual((uvicorn.workers, uvicorn.threads), (4, 1))
+        self.assertEqual(uvicorn.gunicorn_options()["worker_class"], "uvicorn.workers.UvicornWorker")
+        self.assertEqual(uvicorn.application, "service.asgi:application")
+
+    def test_build_from_settings_with_overrides(self):
+        """测试从 Settings 生成配置，命令行覆盖项优先，None 忽略"""
+        app_settings = Settings(SERVER_WORKER_CLASS="sync", SERVER_WORKERS=3, SERVER_MAX_REQUESTS=0)
+
+        config = build_server_config(app_settings, workers=None, preload=False)
+        options = config.gunicorn_options()
+
+        self.assertEqual(options["workers"], 3)
+        self.assertFalse(options["preload_app"])
+        self.assertEqual(options["max_requests_jitter"], 0)
+        self.assertEqual(options["wsgi_app"], "service.wsgi:application")
+
+    def test_rejects_unknown_worker_class(self):
+        """测试未知的worker类型"""
+        with self.assertRaises(ValueError):
+            ServerConfig(worker_class="eventlet")
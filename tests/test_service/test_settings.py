@@ -0,0 +1,72 @@
+"""
+测试数据库URL和缓存URL解析
+"""
+
+import unittest
+
+from service.settings import BASE_DIR, parse_cache_url, parse_database_url
+
+
+class TestParseDatabaseUrl(unittest.TestCase):
+    def test_mysql_connection_params(self):
+        """测试MySQL默认复用连接，查询字符串中的参数写入配置和 OPTIONS"""
+        default = parse_database_url("mysql://u:p@db/app")
+        config = parse_database_url(
+            "mysql://u:p@db:3307/app?conn_max_age=300&conn_health_checks=false&charset=utf8mb4&connect_timeout=5"
+        )
+
+        self.assertEqual((default["CONN_MAX_AGE"], default["CONN_HEALTH_CHECKS"]), (60, True))
+        self.assertNotIn("OPTIONS", default)
+        self.assertEqual(config["NAME"], "app")
+        self.assertEqual(config["PORT"], "3307")
+        self.assertEqual((config["CONN_MAX_AGE"], config["CONN_HEALTH_CHECKS"]), (300, False))
+        self.assertEqual(config["OPTIONS"], {"charset": "utf8mb4", "connect_timeout": 5})
+
+    def test_postgresql_pool(self):
+        """测试PostgreSQL连接池参数，启用连接池后不再持久化连接"""
+        config = parse_database_url("postgresql://u:p@db/app?pool_min_size=2&pool_max_size=10&conn_max_age=none")
+
+        self.assertEqual(config["OPTIONS"], {"pool": {"min_size": 2, "max_size": 10}})
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+        self.assertEqual(parse_database_url("postgresql://u:p@db/app?conn_max_age=none")["CONN_MAX_AGE"], None)
+        with self.assertRaises(ValueError):
+            parse_database_url("mysql://u:p@db/app?pool_max_size=10")
+
+    def test_sqlite_ignores_query_in_path(self):
+        """测试SQLite不复用连接，查询字符串不进入文件路径"""
+        config = parse_database_url("sqlite:///tmp/test.sqlite3?timeout=20")
+
+        self.assertEqual(config["NAME"], "tmp/test.sqlite3")
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+        self.assertEqual(config["OPTIONS"], {"timeout": 20})
+
+
+class TestParseCacheUrl(unittest.TestCase):
+    def test_backends(self):
+        """测试各后端的URL，为空时使用进程内缓存，文件缓存的相对路径相对于项目根目录"""
+        self.assertEqual(parse_cache_url("")["BACKEND"], "django.core.cache.backends.locmem.LocMemCache")
+        self.assertEqual(parse_cache_url("file://cache")["LOCATION"], str(BASE_DIR / "cache"))
+        self.assertEqual(parse_cache_url("file:///var/tmp/cache")["LOCATION"], "/var/tmp/cache")
+        self.assertEqual(parse_cache_url("db://cache_table")["LOCATION"], "cache_table")
+
+        config = parse_cache_url("redis://:secret@cache:6379/1?socket_timeout=0.5", key_prefix="app", version=2)
+        self.assertEqual(config["BACKEND"], "django.core.cache.backends.redis.RedisCache")
+        self.assertEqual(config["LOCATION"], "redis://:secret@cache:6379/1")
+        self.assertEqual((config["KEY_PREFIX"], config["VERSION"]), ("app", 2))
+        self.assertEqual(config["OPTIONS"], {"socket_timeout": 0.5})
+
+        with self.assertRaises(ValueError):
+            parse_cache_url("memcached://cache:11211")
+        with self.assertRaises(ValueError):
+            parse_cache_url("db://")
+
+    def test_query_params(self):
+        """测试查询字符串覆盖过期时间、键前缀和版本，淘汰参数写入 OPTIONS"""
+        config = parse_cache_url("locmem://a?timeout=none&key_prefix=p&version=3&max_entries=500", key_prefix="app")
+
+        self.assertEqual(config["LOCATION"], "a")
+        self.assertIsNone(config["TIMEOUT"])
+        self.assertEqual((config["KEY_PREFIX"], config["VERSION"]), ("p", 3))
+        self.assertEqual(config["OPTIONS"], {"MAX_ENTRIES": 500})
+        with self.assertRaises(ValueError):
+            parse_cache_url("redis://cache:6379/0?max_entries=500")